@@ -0,0 +1,71 @@
+"""Live diagnostics endpoints for operators."""
+
+import logging
+import os
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from app.core.profiler import (
+    PROFILE_MAX_SECONDS,
+    ProfilerBusyError,
+    get_profiler,
+)
+from app.core.limiter import limiter
+
+logger = logging.getLogger(__name__)
+
+# The profiling endpoint exposes stack frames and costs CPU while it runs,
+# so it is off unless explicitly enabled
+PROFILE_ENDPOINT_ENABLED = os.getenv("PROFILE_ENDPOINT_ENABLED", "false").lower() in {
+    "1",
+    "true",
+    "yes",
+}
+
+router = APIRouter(prefix="/api/debug", tags=["debug"])
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+@limiter.limit("5/minute")
+async def profile(
+    request: Request,
+    seconds: float = Query(
+        5.0, gt=0, le=PROFILE_MAX_SECONDS, description="Profile duration"
+    ),
+    interval_ms: float = Query(
+        10.0, ge=1, le=1000, description="Time between stack samples"
+    ),
+    include_idle: bool = Query(
+        False, description="Also count threads waiting on locks, queues or I/O"
+    ),
+) -> PlainTextResponse:
+    """
+    Sample the running service and return collapsed stacks.
+
+    Every thread's Python stack is sampled for ``seconds``; the response has
+    one ``frame;frame;... count`` line per distinct stack, ready for
+    flamegraph.pl or speedscope. Only one profile runs at a time. Disabled
+    (404) unless ``PROFILE_ENDPOINT_ENABLED`` is set.
+
+    Example:
+        curl 'http://localhost:8000/api/debug/profile?seconds=10' > tick.folded
+    """
+    if not PROFILE_ENDPOINT_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    try:
+        result = await run_in_threadpool(
+            get_profiler().run, seconds, interval_ms / 1000.0, include_idle
+        )
+    except ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    return PlainTextResponse(
+        result.collapsed(),
+        headers={
+            "X-Profile-Samples": str(result.samples),
+            "X-Profile-Duration-Seconds": f"{result.duration_seconds:g}",
+        },
+    )
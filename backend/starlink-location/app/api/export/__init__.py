@@ -1,4 +1,4 @@
-"""Export API module - CSV export of Starlink telemetry data."""
+"""Export API module - CSV and Parquet export of Starlink telemetry data."""
 
 from fastapi import APIRouter
 
@@ -1,19 +1,24 @@
-"""CSV export endpoint for Starlink telemetry data."""
+"""CSV and Parquet export endpoints for Starlink telemetry data."""
 
 import csv
 import io
-from datetime import datetime
-from typing import Optional
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterator, Optional
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from app.core.limiter import limiter
 from app.core.logging import get_logger
 from .prometheus import (
     EXPORT_METRICS,
+    MetricWindow,
     calculate_step,
-    query_all_metrics,
+    iter_metric_windows,
 )
 
 logger = get_logger(__name__)
@@ -23,31 +28,153 @@ router = APIRouter()
 # CSV column headers
 CSV_COLUMNS = ["timestamp"] + [col for _, col in EXPORT_METRICS]
 
+# Read size when streaming a finished Parquet file
+PARQUET_STREAM_CHUNK_BYTES = 1024 * 1024
 
-def generate_csv(data_by_timestamp: dict[float, dict[str, float]]) -> str:
-    """Generate CSV content from metric data.
+
+def format_timestamps(timestamps: np.ndarray) -> list[str]:
+    """Format Unix timestamps as ISO 8601 UTC strings ending in ``Z``.
+
+    Whole seconds are formatted without a fractional part, matching
+    ``datetime.isoformat()``.
+    """
+    if np.all(timestamps == np.floor(timestamps)):
+        stamps = np.datetime_as_string(timestamps.astype("datetime64[s]"))
+        return [stamp + "Z" for stamp in stamps.tolist()]
+    return [
+        datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+        for ts in timestamps.tolist()
+    ]
+
+
+def generate_csv_rows(window: MetricWindow) -> str:
+    """Format one merged window as CSV rows (no header).
 
     Args:
-        data_by_timestamp: Dict mapping timestamp -> {column_name: value}
+        window: Merged metric values
 
     Returns:
-        CSV content as string
+        CSV text with one row per timestamp; missing values are empty
     """
+    columns = []
+    for _, col in EXPORT_METRICS:
+        values = window.columns[col]
+        cells = values.astype(object)
+        cells[np.isnan(values)] = ""
+        columns.append(cells.tolist())
+
     output = io.StringIO()
-    writer = csv.writer(output)
+    csv.writer(output).writerows(zip(format_timestamps(window.timestamps), *columns))
+    return output.getvalue()
 
-    # Write header
-    writer.writerow(CSV_COLUMNS)
 
-    # Write data rows sorted by timestamp
-    for ts in sorted(data_by_timestamp.keys()):
-        row_data = data_by_timestamp[ts]
-        row = [datetime.utcfromtimestamp(ts).isoformat() + "Z"]
-        for _, col in EXPORT_METRICS:
-            row.append(row_data.get(col, ""))
-        writer.writerow(row)
+async def stream_csv(
+    first: MetricWindow, windows: AsyncIterator[MetricWindow], filename: str
+) -> AsyncIterator[str]:
+    """Stream the CSV header and rows, one chunk per window.
 
-    return output.getvalue()
+    Args:
+        first: First non-empty window (already fetched)
+        windows: Remaining windows
+        filename: Export filename, for logging
+    """
+    header = io.StringIO()
+    csv.writer(header).writerow(CSV_COLUMNS)
+    yield header.getvalue()
+
+    rows = len(first)
+    try:
+        yield generate_csv_rows(first)
+        async for window in windows:
+            rows += len(window)
+            yield generate_csv_rows(window)
+    finally:
+        # Cancels prefetched queries if the client disconnects
+        await windows.aclose()
+
+    logger.info(
+        "Starlink CSV export complete: filename=%s rows=%d",
+        filename,
+        rows,
+    )
+
+
+def _arrow_table(window: MetricWindow):
+    """Convert one merged window to a pyarrow table."""
+    import pyarrow as pa
+
+    timestamps = window.timestamps.astype("datetime64[ms]")
+    arrays = [pa.array(timestamps, pa.timestamp("ms", "UTC"))]
+    arrays.extend(
+        pa.array(window.columns[col], from_pandas=True) for _, col in EXPORT_METRICS
+    )
+    return pa.Table.from_arrays(arrays, names=CSV_COLUMNS)
+
+
+async def write_parquet(
+    first: MetricWindow, windows: AsyncIterator[MetricWindow], path: str
+) -> int:
+    """Write windows to a Parquet file, one row group per window.
+
+    Args:
+        first: First non-empty window (already fetched)
+        windows: Remaining windows
+        path: Output file path
+
+    Returns:
+        Number of rows written
+    """
+    import pyarrow.parquet as pq
+
+    table = _arrow_table(first)
+    rows = table.num_rows
+    with pq.ParquetWriter(path, table.schema, compression="zstd") as writer:
+        writer.write_table(table)
+        async for window in windows:
+            table = _arrow_table(window)
+            rows += table.num_rows
+            writer.write_table(table)
+    return rows
+
+
+def _iter_file(path: str) -> Iterator[bytes]:
+    with open(path, "rb") as handle:
+        while chunk := handle.read(PARQUET_STREAM_CHUNK_BYTES):
+            yield chunk
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _validate_range(start: datetime, end: datetime) -> None:
+    if start >= end:
+        raise HTTPException(
+            status_code=400,
+            detail="Start datetime must be before end datetime",
+        )
+
+
+async def _first_window(
+    windows: AsyncIterator[MetricWindow],
+) -> MetricWindow:
+    """Fetch the first non-empty window, or 404 if the range has no data."""
+    try:
+        return await windows.__anext__()
+    except StopAsyncIteration:
+        raise HTTPException(
+            status_code=404,
+            detail="No data found for the specified time range",
+        )
+
+
+def _export_filename(start: datetime, end: datetime, extension: str) -> str:
+    start_str = start.strftime("%Y%m%d-%H%M%S")
+    end_str = end.strftime("%Y%m%d-%H%M%S")
+    return f"starlink-export-{start_str}-{end_str}.{extension}"
 
 
 @router.get("/starlink-csv", summary="Export Starlink telemetry to CSV")
@@ -65,7 +192,8 @@ async def export_starlink_csv(
     """Export Starlink telemetry data to CSV.
 
     Queries Prometheus for historical telemetry data within the specified
-    date range and returns a CSV file with all available metrics.
+    date range and streams a CSV file with all available metrics. Rows are
+    sent window by window while later windows are still being queried.
 
     Args:
         request: FastAPI request object (required for rate limiting)
@@ -77,14 +205,10 @@ async def export_starlink_csv(
         StreamingResponse with CSV file download
 
     Raises:
-        HTTPException: 400 if start >= end, 500 on query errors
+        HTTPException: 400 if start >= end, 404 if there is no data,
+            500 on query errors
     """
-    # Validate date range
-    if start >= end:
-        raise HTTPException(
-            status_code=400,
-            detail="Start datetime must be before end datetime",
-        )
+    _validate_range(start, end)
 
     # Calculate step
     actual_step = calculate_step(start, end, step)
@@ -96,43 +220,108 @@ async def export_starlink_csv(
         actual_step,
     )
 
+    windows = iter_metric_windows(start, end, actual_step)
     try:
-        # Query all metrics from Prometheus
-        data = await query_all_metrics(start, end, actual_step)
-
-        if not data:
-            raise HTTPException(
-                status_code=404,
-                detail="No data found for the specified time range",
-            )
-
-        # Generate CSV
-        csv_content = generate_csv(data)
-
-        # Format filename
-        start_str = start.strftime("%Y%m%d-%H%M%S")
-        end_str = end.strftime("%Y%m%d-%H%M%S")
-        filename = f"starlink-export-{start_str}-{end_str}.csv"
-
-        logger.info(
-            "Starlink CSV export complete: filename=%s rows=%d",
-            filename,
-            len(data),
+        first = await _first_window(windows)
+    except HTTPException:
+        raise
+    except Exception as e:
+        await windows.aclose()
+        logger.exception("Failed to export Starlink CSV: %s", str(e))
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to query Prometheus: {str(e)}",
         )
 
-        return StreamingResponse(
-            iter([csv_content]),
-            media_type="text/csv",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-            },
+    filename = _export_filename(start, end, "csv")
+    return StreamingResponse(
+        stream_csv(first, windows, filename),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
+    )
+
+
+@router.get("/starlink-parquet", summary="Export Starlink telemetry to Parquet")
+@limiter.limit("10/minute")
+async def export_starlink_parquet(
+    request: Request,
+    start: datetime = Query(..., description="Start datetime (ISO 8601)"),
+    end: datetime = Query(..., description="End datetime (ISO 8601)"),
+    step: Optional[int] = Query(
+        None,
+        description="Step interval in seconds (auto-calculated if not provided)",
+        ge=1,
+    ),
+) -> StreamingResponse:
+    """Export Starlink telemetry data to Parquet.
+
+    Same columns as the CSV export, with a UTC timestamp column and float
+    columns (null where a metric had no sample). Each query window becomes a
+    row group in a temporary file, which is streamed and then removed.
+    Requires the optional ``pyarrow`` package.
+
+    Args:
+        request: FastAPI request object (required for rate limiting)
+        start: Start datetime for export range
+        end: End datetime for export range
+        step: Optional step interval in seconds (1s minimum, auto-calculated if not provided)
+
+    Returns:
+        StreamingResponse with Parquet file download
+
+    Raises:
+        HTTPException: 400 if start >= end, 404 if there is no data,
+            500 on query errors, 501 if pyarrow is not installed
+    """
+    _validate_range(start, end)
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        logger.warning("Parquet export requested but pyarrow is not installed")
+        raise HTTPException(
+            status_code=501,
+            detail="Parquet export requires the pyarrow package",
         )
 
+    actual_step = calculate_step(start, end, step)
+    logger.info(
+        "Starting Starlink Parquet export: start=%s end=%s step=%s",
+        start.isoformat(),
+        end.isoformat(),
+        actual_step,
+    )
+
+    filename = _export_filename(start, end, "parquet")
+    fd, path = tempfile.mkstemp(suffix=".parquet")
+    os.close(fd)
+    windows = iter_metric_windows(start, end, actual_step)
+    try:
+        first = await _first_window(windows)
+        rows = await write_parquet(first, windows, path)
     except HTTPException:
+        _remove_file(path)
         raise
     except Exception as e:
-        logger.exception("Failed to export Starlink CSV: %s", str(e))
+        await windows.aclose()
+        _remove_file(path)
+        logger.exception("Failed to export Starlink Parquet: %s", str(e))
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to query Prometheus: {str(e)}",
+            detail=f"Failed to export Parquet: {str(e)}",
         )
+
+    logger.info(
+        "Starlink Parquet export complete: filename=%s rows=%d",
+        filename,
+        rows,
+    )
+    return StreamingResponse(
+        _iter_file(path),
+        media_type="application/vnd.apache.parquet",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+        },
+        background=BackgroundTask(_remove_file, path),
+    )
@@ -1,10 +1,23 @@
-"""Prometheus HTTP API client for querying historical metrics."""
+"""Prometheus HTTP API client for querying historical metrics.
 
+Exports are read as a sequence of time windows. Each window is at most
+``PROMETHEUS_MAX_POINTS_PER_QUERY`` steps long, which keeps every
+``query_range`` call under Prometheus' 11,000-points-per-series limit. All
+metrics for a window are queried concurrently over one pooled client. The
+results are merged into columns on the window's step grid. The next windows
+are fetched while the current one is being written, and only a few windows
+are held in memory at once.
+"""
+
+import asyncio
 import os
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from typing import AsyncIterator, Optional, Sequence
 
 import httpx
+import numpy as np
 
 from app.core.logging import get_logger
 
@@ -13,6 +26,17 @@ logger = get_logger(__name__)
 # Prometheus URL - internal docker network
 PROMETHEUS_URL = os.getenv("PROMETHEUS_URL", "http://prometheus:9090")
 
+# Prometheus rejects range queries returning more than 11,000 points per series
+PROMETHEUS_MAX_POINTS_PER_QUERY = int(
+    os.getenv("PROMETHEUS_MAX_POINTS_PER_QUERY", "10000")
+)
+PROMETHEUS_QUERY_CONCURRENCY = int(os.getenv("PROMETHEUS_QUERY_CONCURRENCY", "8"))
+PROMETHEUS_QUERY_TIMEOUT_SECONDS = float(
+    os.getenv("PROMETHEUS_QUERY_TIMEOUT_SECONDS", "60")
+)
+# Windows fetched ahead of the one being written
+EXPORT_PREFETCH_WINDOWS = 2
+
 # Metrics to export
 EXPORT_METRICS = [
     ("starlink_dish_latitude_degrees", "latitude"),
@@ -28,6 +52,26 @@ EXPORT_METRICS = [
     ("starlink_signal_quality_percent", "signal_quality_percent"),
 ]
 
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@dataclass
+class MetricWindow:
+    """Merged metric values for one export window.
+
+    Attributes:
+        timestamps: Unix timestamps (seconds), ascending, one per row
+        columns: Column name -> values aligned with ``timestamps``; NaN
+            where a metric had no sample
+    """
+
+    timestamps: np.ndarray
+    columns: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
 
 def calculate_step(start: datetime, end: datetime, step: Optional[int] = None) -> int:
     """Calculate appropriate step interval based on time range.
@@ -57,48 +101,96 @@ def calculate_step(start: datetime, end: datetime, step: Optional[int] = None) -
         return 300  # 5 minutes
 
 
-async def query_metric_range(
-    metric: str,
-    start: datetime,
-    end: datetime,
+def _unix_timestamp(value: datetime) -> float:
+    """Convert a datetime to a Unix timestamp, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def chunk_time_range(
+    start_ts: float,
+    end_ts: float,
     step: int,
+    max_points: int = PROMETHEUS_MAX_POINTS_PER_QUERY,
 ) -> list[tuple[float, float]]:
-    """Query Prometheus for a metric over a time range.
+    """Split a range into windows of at most ``max_points`` steps.
+
+    Window boundaries stay on the ``start_ts + k * step`` grid that
+    Prometheus evaluates, and consecutive windows do not share a timestamp.
 
     Args:
-        metric: Prometheus metric name
-        start: Start datetime
-        end: End datetime
+        start_ts: Range start (Unix seconds)
+        end_ts: Range end (Unix seconds, inclusive)
         step: Step interval in seconds
+        max_points: Maximum evaluation timestamps per window
 
     Returns:
-        List of (timestamp, value) tuples
+        List of (window_start, window_end) Unix timestamps
     """
-    # Format timestamps for Prometheus (RFC3339 or Unix timestamp)
-    # Convert to UTC and use Unix timestamps to avoid timezone issues
-    start_ts = (
-        start.timestamp()
-        if start.tzinfo
-        else start.replace(tzinfo=timezone.utc).timestamp()
-    )
-    end_ts = (
-        end.timestamp() if end.tzinfo else end.replace(tzinfo=timezone.utc).timestamp()
-    )
+    if end_ts < start_ts:
+        return []
+    total_points = int((end_ts - start_ts) // step) + 1
+    max_points = max(max_points, 1)
+    windows = []
+    for first in range(0, total_points, max_points):
+        last = min(first + max_points, total_points) - 1
+        windows.append((start_ts + first * step, start_ts + last * step))
+    return windows
+
 
-    params = {
-        "query": metric,
-        "start": str(start_ts),
-        "end": str(end_ts),
-        "step": f"{step}s",
-    }
-
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.get(
-            f"{PROMETHEUS_URL}/api/v1/query_range",
-            params=params,
+def get_prometheus_client() -> httpx.AsyncClient:
+    """Return the shared Prometheus client for the running event loop.
+
+    A client's connection pool belongs to the loop that created it, so a new
+    client is created if the loop has changed (e.g. between test clients).
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            base_url=PROMETHEUS_URL,
+            timeout=PROMETHEUS_QUERY_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=PROMETHEUS_QUERY_CONCURRENCY,
+                max_keepalive_connections=PROMETHEUS_QUERY_CONCURRENCY,
+            ),
         )
-        response.raise_for_status()
-        data = response.json()
+        _client_loop = loop
+    return _client
+
+
+async def close_prometheus_client() -> None:
+    """Close the shared Prometheus client (called on application shutdown)."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def _query_series(
+    client: httpx.AsyncClient,
+    metric: str,
+    start_ts: float,
+    end_ts: float,
+    step: int,
+) -> np.ndarray:
+    """Run one ``query_range`` call.
+
+    Returns:
+        (n, 2) array of [timestamp, value] rows; empty if there is no data
+    """
+    response = await client.get(
+        "/api/v1/query_range",
+        params={
+            "query": metric,
+            "start": str(start_ts),
+            "end": str(end_ts),
+            "step": f"{step}s",
+        },
+    )
+    response.raise_for_status()
+    data = response.json()
 
     if data["status"] != "success":
         logger.warning(
@@ -106,43 +198,104 @@ async def query_metric_range(
             metric,
             data.get("error", "unknown"),
         )
-        return []
+        return np.empty((0, 2))
 
     results = data.get("data", {}).get("result", [])
-    if not results:
-        return []
+    # Gauges return a single series; values are [timestamp, "value"] pairs
+    values = results[0].get("values", []) if results else []
+    if not values:
+        return np.empty((0, 2))
+    return np.array(values, dtype=float)
+
 
-    # Extract values from first result (should only be one for gauge metrics)
-    values = results[0].get("values", [])
-    return [(float(ts), float(val)) for ts, val in values]
+async def _query_window(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    metrics: Sequence[tuple[str, str]],
+    window: tuple[float, float],
+    step: int,
+) -> MetricWindow:
+    """Query every metric for one window and merge them by timestamp."""
+    start_ts, end_ts = window
+
+    async def query(metric: str) -> np.ndarray:
+        async with semaphore:
+            return await _query_series(client, metric, start_ts, end_ts, step)
+
+    results = await asyncio.gather(
+        *(query(metric) for metric, _ in metrics), return_exceptions=True
+    )
+
+    # Every sample lies on the window's step grid, so merge by grid index
+    size = int(round((end_ts - start_ts) / step)) + 1
+    present = np.zeros(size, dtype=bool)
+    columns = {}
+    for (metric, column), result in zip(metrics, results):
+        values = np.full(size, np.nan)
+        if isinstance(result, BaseException):
+            logger.warning("Failed to query metric %s: %s", metric, str(result))
+        elif len(result):
+            index = np.rint((result[:, 0] - start_ts) / step).astype(np.int64)
+            valid = (index >= 0) & (index < size)
+            values[index[valid]] = result[valid, 1]
+            present[index[valid]] = True
+        columns[column] = values
+
+    timestamps = start_ts + np.arange(size, dtype=float) * step
+    return MetricWindow(
+        timestamps=timestamps[present],
+        columns={column: values[present] for column, values in columns.items()},
+    )
 
 
-async def query_all_metrics(
+async def iter_metric_windows(
     start: datetime,
     end: datetime,
     step: int,
-) -> dict[float, dict[str, float]]:
-    """Query all export metrics and join by timestamp.
+    metrics: Sequence[tuple[str, str]] = EXPORT_METRICS,
+    max_points: int = PROMETHEUS_MAX_POINTS_PER_QUERY,
+) -> AsyncIterator[MetricWindow]:
+    """Yield merged metric windows covering a time range, in time order.
+
+    Up to ``EXPORT_PREFETCH_WINDOWS`` windows are queried ahead of the one
+    being consumed, with at most ``PROMETHEUS_QUERY_CONCURRENCY`` requests in
+    flight. A failed metric query leaves that column empty for the window.
+    Windows with no samples at all are skipped.
 
     Args:
         start: Start datetime
         end: End datetime
         step: Step interval in seconds
+        metrics: (Prometheus metric, column name) pairs to query
+        max_points: Maximum timestamps per query
 
-    Returns:
-        Dict mapping timestamp -> {column_name: value}
+    Yields:
+        MetricWindow per non-empty window
     """
-    # Collect all data points by timestamp
-    data_by_timestamp: dict[float, dict[str, float]] = {}
-
-    for prom_metric, column_name in EXPORT_METRICS:
-        try:
-            values = await query_metric_range(prom_metric, start, end, step)
-            for ts, val in values:
-                if ts not in data_by_timestamp:
-                    data_by_timestamp[ts] = {}
-                data_by_timestamp[ts][column_name] = val
-        except Exception as e:
-            logger.warning("Failed to query metric %s: %s", prom_metric, str(e))
-
-    return data_by_timestamp
+    client = get_prometheus_client()
+    semaphore = asyncio.Semaphore(PROMETHEUS_QUERY_CONCURRENCY)
+    windows = iter(
+        chunk_time_range(_unix_timestamp(start), _unix_timestamp(end), step, max_points)
+    )
+    pending: deque[asyncio.Task] = deque()
+
+    def schedule_next() -> None:
+        window = next(windows, None)
+        if window is not None:
+            pending.append(
+                asyncio.ensure_future(
+                    _query_window(client, semaphore, metrics, window, step)
+                )
+            )
+
+    for _ in range(EXPORT_PREFETCH_WINDOWS + 1):
+        schedule_next()
+    try:
+        while pending:
+            merged = await pending.popleft()
+            schedule_next()
+            if len(merged):
+                yield merged
+    finally:
+        for task in pending:
+            task.cancel()
@@ -149,6 +149,13 @@ async def health():
                 if dish_connected
                 else "Live mode: waiting for dish connection"
             )
+        elif actual_mode == "replay":
+            dish_connected = None
+            message = (
+                "Replay mode: playing back recorded telemetry"
+                if _coordinator.is_connected()
+                else "Replay mode: recording finished"
+            )
         else:
             dish_connected = None
             message = "Simulation mode: generating test data"
@@ -0,0 +1,83 @@
+"""Background job status, cancellation and result endpoints."""
+
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import FileResponse
+
+from app.core.jobs import JobStatus, get_job_manager
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v2/jobs", tags=["jobs"])
+
+
+def _get_job_or_404(job_id: str):
+    """Return a retained job or raise 404."""
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found or expired",
+        )
+    return job
+
+
+@router.get("")
+async def list_jobs(
+    kind: Optional[str] = Query(None, description="Filter by job kind"),
+) -> list[dict]:
+    """List retained jobs, newest first."""
+    return [job.to_dict() for job in get_job_manager().list_jobs(kind)]
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str) -> dict:
+    """Get job status, progress and recent progress events."""
+    return _get_job_or_404(job_id).to_dict()
+
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: str):
+    """Download the result of a succeeded job.
+
+    File results (e.g. export zips) are returned as downloads; other results
+    are returned as JSON.
+    """
+    job = _get_job_or_404(job_id)
+    if job.status != JobStatus.SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} is {job.status.value}"
+            + (f": {job.error}" if job.error else ""),
+        )
+
+    if job.result_path is not None:
+        if not job.result_path.exists():
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail=f"Result for job {job_id} is no longer available",
+            )
+        return FileResponse(
+            job.result_path,
+            media_type=job.result_media_type,
+            filename=job.result_filename,
+        )
+    return job.result
+
+
+@router.delete("/{job_id}", status_code=status.HTTP_202_ACCEPTED)
+async def cancel_job(job_id: str) -> dict:
+    """Request cancellation of a queued or running job.
+
+    Running jobs stop at their next progress checkpoint.
+    """
+    job = _get_job_or_404(job_id)
+    if not get_job_manager().cancel(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job {job_id} already {job.status.value}",
+        )
+    logger.info(f"Cancellation requested for job {job_id}")
+    return job.to_dict()
@@ -6,7 +6,7 @@ from fastapi.responses import Response, JSONResponse
 from prometheus_client import generate_latest
 
 from app.api import metrics_export
-from app.core.metrics import REGISTRY, _current_position
+from app.core.metrics import REGISTRY, get_metrics_snapshot
 from app.mission.dependencies import get_route_manager, get_poi_manager
 from app.services.route_manager import RouteManager
 from app.services.poi_manager import POIManager
@@ -101,6 +101,7 @@ async def position_table():
     }
     ```
     """
+    latitude, longitude, altitude = get_metrics_snapshot().position
     return JSONResponse(
         {
             "columns": [
@@ -112,9 +113,9 @@ async def position_table():
             "rows": [
                 [
                     "starlink-dish",
-                    _current_position["latitude"],
-                    _current_position["longitude"],
-                    _current_position["altitude"],
+                    latitude,
+                    longitude,
+                    altitude,
                 ]
             ],
         }
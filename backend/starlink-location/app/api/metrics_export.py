@@ -10,6 +10,9 @@ from app.core.metrics import (
     starlink_route_departure_time_unix,
     starlink_route_arrival_time_unix,
     starlink_route_segment_count_with_timing,
+    PoiMetric,
+    publish_poi_metrics,
+    track_labels,
 )
 from app.models.flight_status import ETAMode
 from app.services.eta_calculator import ETACalculator
@@ -54,15 +57,15 @@ async def get_metrics(
             timing_profile = active_route.timing_profile
 
             # Export route timing presence
-            starlink_route_has_timing_data.labels(route_name=route_name).set(
+            track_labels(starlink_route_has_timing_data, route_name=route_name).set(
                 1 if timing_profile.has_timing_data else 0
             )
 
             # Export route timing metrics if available
             if timing_profile.total_expected_duration_seconds:
-                starlink_route_total_duration_seconds.labels(route_name=route_name).set(
-                    timing_profile.total_expected_duration_seconds
-                )
+                track_labels(
+                    starlink_route_total_duration_seconds, route_name=route_name
+                ).set(timing_profile.total_expected_duration_seconds)
 
             if timing_profile.departure_time:
                 import time as time_module
@@ -70,9 +73,9 @@ async def get_metrics(
                 departure_unix = time_module.mktime(
                     timing_profile.departure_time.timetuple()
                 )
-                starlink_route_departure_time_unix.labels(route_name=route_name).set(
-                    departure_unix
-                )
+                track_labels(
+                    starlink_route_departure_time_unix, route_name=route_name
+                ).set(departure_unix)
 
             if timing_profile.arrival_time:
                 import time as time_module
@@ -80,14 +83,14 @@ async def get_metrics(
                 arrival_unix = time_module.mktime(
                     timing_profile.arrival_time.timetuple()
                 )
-                starlink_route_arrival_time_unix.labels(route_name=route_name).set(
-                    arrival_unix
-                )
+                track_labels(
+                    starlink_route_arrival_time_unix, route_name=route_name
+                ).set(arrival_unix)
 
             # Export segment count
-            starlink_route_segment_count_with_timing.labels(route_name=route_name).set(
-                timing_profile.segment_count_with_timing
-            )
+            track_labels(
+                starlink_route_segment_count_with_timing, route_name=route_name
+            ).set(timing_profile.segment_count_with_timing)
 
         # Update POI metrics if we have telemetry samples and POIs
         pois = poi_manager.list_pois() if poi_manager else []
@@ -127,33 +130,22 @@ async def get_metrics(
                 flight_phase=flight_phase,
             )
 
-            # Update Prometheus gauges with POI metrics
+            # Publish POI metrics into the metrics snapshot
+            poi_metrics = []
             for poi_id, metric in metrics.items():
                 poi = poi_manager.get_poi(poi_id)
                 if poi:
-                    # Set POI distance gauge
-                    distance_gauge = REGISTRY._names_to_collectors.get(
-                        "starlink_distance_to_poi_meters"
-                    )
-                    eta_gauge = REGISTRY._names_to_collectors.get(
-                        "starlink_eta_poi_seconds"
-                    )
-
-                    label_kwargs = {
-                        "name": poi.name,
-                        "category": poi.category or "",
-                        "eta_type": metric.get("eta_type", "estimated"),
-                    }
-
-                    if distance_gauge:
-                        distance_gauge.labels(**label_kwargs).set(
-                            metric["distance_meters"]
+                    eta_seconds = metric["eta_seconds"]
+                    poi_metrics.append(
+                        PoiMetric(
+                            name=poi.name,
+                            category=poi.category or "",
+                            eta_type=metric.get("eta_type", "estimated"),
+                            distance_meters=metric["distance_meters"],
+                            eta_seconds=eta_seconds if eta_seconds >= 0 else None,
                         )
-
-                    if eta_gauge:
-                        eta_seconds = metric["eta_seconds"]
-                        if eta_seconds >= 0:
-                            eta_gauge.labels(**label_kwargs).set(eta_seconds)
+                    )
+            publish_poi_metrics(poi_metrics)
 
     except Exception:
         # Gracefully handle errors in POI metric calculation
@@ -3,6 +3,7 @@
 from fastapi import APIRouter
 
 from app.core.logging import get_logger
+from app.mission.exporter.image_cache import get_image_cache
 from app.services.route_eta_calculator import (
     get_eta_cache_stats,
     get_eta_accuracy_stats,
@@ -19,11 +20,15 @@ router = APIRouter()
 async def get_eta_cache_metrics() -> dict:
     """Get statistics about ETA calculation caching performance.
 
-    Retrieves current metrics about the ETA calculation cache including
-    the number of entries, time-to-live settings, and last update timestamp.
+    Retrieves current metrics about the ETA result cache consulted by route
+    progress and POI ETA calculations: entries and limits, hit/miss counters
+    and hit ratio, evictions, expirations, invalidations and approximate
+    memory use.
 
     Returns:
-        Dictionary containing cache_size, ttl_seconds, and last_updated timestamp
+        Dictionary containing cached_entries, max_entries, ttl_seconds, hits,
+        misses, hit_ratio, evictions, expirations, invalidations, memory_bytes
+        and timestamp
 
     Raises:
         No exceptions raised by this endpoint
@@ -47,6 +52,20 @@ async def get_eta_accuracy_metrics() -> dict:
     return get_eta_accuracy_stats()
 
 
+@router.get("/metrics/export-image-cache", summary="Get export image cache statistics")
+async def get_export_image_cache_metrics() -> dict:
+    """Get statistics about the rendered route map / timeline chart cache.
+
+    Returns:
+        Dictionary containing hit/miss counters (overall and per image kind),
+        hit_rate, entries, bytes, max_bytes and evictions
+
+    Raises:
+        No exceptions raised by this endpoint
+    """
+    return get_image_cache().stats()
+
+
 @router.post("/cache/cleanup", summary="Clean up expired cache entries")
 async def cleanup_eta_cache_endpoint() -> dict:
     """Remove expired entries from the ETA cache.
@@ -0,0 +1,103 @@
+"""Clock used by the telemetry pipeline.
+
+Flight phase detection, ETA speed smoothing and the departure and mission
+countdowns read the current time from here. It is the wall clock unless a
+virtual clock is installed (see app.replay), so recorded telemetry can be
+played back faster than real time with dwell times and countdowns following
+the recording rather than the host.
+"""
+
+import threading
+import time as _time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+_source: Optional[Callable[[], float]] = None
+
+
+def time() -> float:
+    """
+    Get the current time.
+
+    Returns:
+        Seconds since the epoch, from the installed clock or the wall clock
+    """
+    source = _source
+    return _time.time() if source is None else source()
+
+
+def now() -> datetime:
+    """
+    Get the current time as a datetime.
+
+    Returns:
+        Timezone-aware UTC datetime
+    """
+    return datetime.fromtimestamp(time(), timezone.utc)
+
+
+def set_clock(source: Optional[Callable[[], float]]) -> None:
+    """
+    Install a clock for the whole process.
+
+    Args:
+        source: Callable returning epoch seconds, or None for the wall clock
+    """
+    global _source
+    _source = source
+
+
+def is_virtual() -> bool:
+    """Whether a clock other than the wall clock is installed."""
+    return _source is not None
+
+
+class VirtualClock:
+    """Clock that only moves when advanced.
+
+    Instances are callables returning epoch seconds, so one can be passed to
+    set_clock directly.
+    """
+
+    def __init__(self, start: float):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Initial time in epoch seconds
+        """
+        self._now = float(start)
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        """Current virtual time in epoch seconds."""
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        """
+        Move the clock forward.
+
+        Args:
+            seconds: Seconds to advance (must not be negative)
+
+        Returns:
+            New virtual time in epoch seconds
+
+        Raises:
+            ValueError: If seconds is negative
+        """
+        if seconds < 0:
+            raise ValueError("Virtual clock cannot move backwards")
+        with self._lock:
+            self._now += seconds
+            return self._now
+
+    def set(self, epoch_seconds: float) -> None:
+        """
+        Jump to a point in time (e.g. when a replay restarts).
+
+        Args:
+            epoch_seconds: New virtual time in epoch seconds
+        """
+        with self._lock:
+            self._now = float(epoch_seconds)
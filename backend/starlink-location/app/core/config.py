@@ -184,6 +184,7 @@ class ConfigManager:
             "obstruction",
             "position",
             "heading_tracker",
+            "replay",
         ]:
             if section not in data:
                 data[section] = {}
@@ -226,6 +227,7 @@ class ConfigManager:
             "obstruction",
             "position",
             "heading_tracker",
+            "replay",
         ]:
             if section not in data:
                 data[section] = {}
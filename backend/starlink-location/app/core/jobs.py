@@ -0,0 +1,423 @@
+"""In-process background jobs for long-running mission operations.
+
+Exports, imports and bulk timeline builds can take tens of seconds. Running
+them inside ``async def`` handlers blocks the event loop, stalling the 10 Hz
+background update loop and every other endpoint. This module runs such work
+on a bounded thread pool and tracks each run as a job that clients poll for
+progress, cancel, and fetch the retained result of until it expires.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_RESULT_TTL_SECONDS = float(os.getenv("JOB_RESULT_TTL_SECONDS", "900"))
+MAX_RETAINED_JOBS = int(os.getenv("MAX_RETAINED_JOBS", "100"))
+JOB_RESULTS_DIR = Path(
+    os.getenv("JOB_RESULTS_DIR", os.path.join(tempfile.gettempdir(), "starlink-jobs"))
+)
+MAX_JOB_EVENTS = 50
+
+
+class JobStatus(str, Enum):
+    """Lifecycle state of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+TERMINAL_STATUSES = frozenset(
+    {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+)
+
+
+class JobCancelledError(Exception):
+    """Raised inside a job when cancellation was requested."""
+
+
+@dataclass
+class JobEvent:
+    """A progress update reported by a running job."""
+
+    timestamp: datetime
+    progress: float
+    message: str
+
+    def to_dict(self) -> dict:
+        """Serialize the event for API responses."""
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "progress": self.progress,
+            "message": self.message,
+        }
+
+
+@dataclass
+class Job:
+    """State of one background job."""
+
+    id: str
+    kind: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    message: str = "Queued"
+    counters: dict[str, int] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Any = None
+    result_path: Optional[Path] = None
+    result_media_type: Optional[str] = None
+    result_filename: Optional[str] = None
+    error: Optional[str] = None
+    events: deque = field(default_factory=lambda: deque(maxlen=MAX_JOB_EVENTS))
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+    future: Optional[Future] = None
+    finished_monotonic: Optional[float] = None
+    on_finish: Optional[Callable[["Job"], None]] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job reached a terminal state."""
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self) -> dict:
+        """Serialize the job for API responses (without the result payload)."""
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "progress": self.progress,
+            "message": self.message,
+            "counters": dict(self.counters),
+            "metadata": self.metadata,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "error": self.error,
+            "has_result": self.result is not None or self.result_path is not None,
+            "events": [event.to_dict() for event in self.events],
+        }
+
+
+class JobContext:
+    """Handle a job function uses to report progress and observe cancellation."""
+
+    def __init__(self, job: Job, lock: threading.Lock):
+        """Initialize the context.
+
+        Args:
+            job: Job being executed
+            lock: Manager lock guarding job state
+        """
+        self._job = job
+        self._lock = lock
+
+    @property
+    def job_id(self) -> str:
+        """ID of the running job."""
+        return self._job.id
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._job.cancel_event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise JobCancelledError if cancellation was requested."""
+        if self.cancelled:
+            raise JobCancelledError(f"Job {self._job.id} cancelled")
+
+    def report(self, progress: float, message: str) -> None:
+        """Record progress, then stop the job if it was cancelled.
+
+        Args:
+            progress: Completed fraction between 0 and 1
+            message: Human-readable description of the current stage
+        """
+        progress = min(max(progress, 0.0), 1.0)
+        with self._lock:
+            self._job.progress = progress
+            self._job.message = message
+            self._job.events.append(
+                JobEvent(datetime.now(timezone.utc), progress, message)
+            )
+        self.raise_if_cancelled()
+
+    def update_counters(self, **counters: int) -> None:
+        """Set named progress counters (e.g. routes_imported=3).
+
+        Args:
+            **counters: Counter values, merged into those already reported
+        """
+        with self._lock:
+            self._job.counters.update(counters)
+
+    def set_result_file(
+        self,
+        path: Path,
+        media_type: str,
+        filename: Optional[str] = None,
+    ) -> None:
+        """Attach a file result, deleted when the job expires.
+
+        Args:
+            path: Result file path
+            media_type: MIME type used when the result is downloaded
+            filename: Download file name (defaults to the path name)
+        """
+        with self._lock:
+            self._job.result_path = path
+            self._job.result_media_type = media_type
+            self._job.result_filename = filename or path.name
+
+
+JobFunction = Callable[[JobContext], Any]
+
+
+class JobManager:
+    """Runs jobs on a bounded thread pool and retains their results."""
+
+    def __init__(
+        self,
+        max_workers: int = JOB_WORKERS,
+        result_ttl_seconds: float = JOB_RESULT_TTL_SECONDS,
+        max_jobs: int = MAX_RETAINED_JOBS,
+    ):
+        """Initialize the manager.
+
+        Args:
+            max_workers: Maximum number of jobs running at once
+            result_ttl_seconds: How long finished jobs and their results are kept
+            max_jobs: Maximum number of finished jobs retained
+        """
+        self.max_workers = max(1, max_workers)
+        self.result_ttl_seconds = result_ttl_seconds
+        self.max_jobs = max_jobs
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        kind: str,
+        fn: JobFunction,
+        metadata: Optional[dict[str, Any]] = None,
+        on_finish: Optional[Callable[[Job], None]] = None,
+    ) -> Job:
+        """Queue a job.
+
+        Args:
+            kind: Job type (e.g. "mission_export")
+            fn: Callable receiving a JobContext; its return value is the result
+            metadata: Extra fields echoed in job status responses
+            on_finish: Called once with the job when it reaches any terminal
+                state, including cancellation before it started (e.g. to
+                remove input files the job would have consumed)
+
+        Returns:
+            The queued job
+        """
+        self.purge_expired()
+        job = Job(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            metadata=metadata or {},
+            on_finish=on_finish,
+        )
+        with self._lock:
+            self._jobs[job.id] = job
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="job"
+                )
+            job.future = self._executor.submit(self._run, job, fn)
+        logger.info(f"Queued {kind} job {job.id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by ID, or None if unknown or expired."""
+        self.purge_expired()
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self, kind: Optional[str] = None) -> list[Job]:
+        """Return retained jobs, newest first, optionally filtered by kind."""
+        self.purge_expired()
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if kind in (None, job.kind)]
+        return list(reversed(jobs))
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation of a job.
+
+        Queued jobs are cancelled immediately; running jobs stop at their next
+        progress report.
+
+        Returns:
+            True if the job exists and had not finished yet
+        """
+        job = self.get(job_id)
+        if job is None or job.done:
+            return False
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, JobStatus.CANCELLED, "Cancelled before start")
+        return True
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Block until a job finishes (used by tests and scripts)."""
+        job = self.get(job_id)
+        if job is not None and job.future is not None:
+            try:
+                job.future.result(timeout=timeout)
+            except Exception:
+                pass  # Failures are recorded on the job
+        return job
+
+    def purge_expired(self) -> int:
+        """Drop finished jobs past their TTL or beyond the retention limit.
+
+        Returns:
+            Number of jobs dropped
+        """
+        now = time.monotonic()
+        expired: list[Job] = []
+        with self._lock:
+            finished = [job for job in self._jobs.values() if job.done]
+            overflow = len(finished) - self.max_jobs
+            for job in finished:
+                if overflow > 0 or (
+                    now - (job.finished_monotonic or now) >= self.result_ttl_seconds
+                ):
+                    del self._jobs[job.id]
+                    expired.append(job)
+                    overflow -= 1
+        for job in expired:
+            _delete_result_file(job)
+        return len(expired)
+
+    def shutdown(self) -> None:
+        """Cancel outstanding jobs and stop the worker threads."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+            executor, self._executor = self._executor, None
+        for job in jobs:
+            job.cancel_event.set()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        # Queued jobs whose futures were cancelled never reach _run
+        for job in jobs:
+            if job.future is not None and job.future.cancelled():
+                self._finish(job, JobStatus.CANCELLED, "Cancelled before start")
+
+    def clear(self) -> None:
+        """Drop every retained job and its result file."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+            self._jobs.clear()
+        for job in jobs:
+            job.cancel_event.set()
+            _delete_result_file(job)
+
+    def _run(self, job: Job, fn: JobFunction) -> None:
+        """Execute a job function and record its outcome."""
+        if job.cancel_event.is_set():
+            self._finish(job, JobStatus.CANCELLED, "Cancelled before start")
+            return
+        with self._lock:
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            job.message = "Running"
+        try:
+            result = fn(JobContext(job, self._lock))
+        except JobCancelledError:
+            self._finish(job, JobStatus.CANCELLED, "Cancelled")
+        except Exception as e:
+            logger.error(f"{job.kind} job {job.id} failed: {e}", exc_info=True)
+            error = getattr(e, "detail", None) or f"{type(e).__name__}: {e}"
+            self._finish(job, JobStatus.FAILED, "Failed", error=str(error))
+        else:
+            with self._lock:
+                job.result = result
+            self._finish(job, JobStatus.SUCCEEDED, "Completed", progress=1.0)
+
+    def _finish(
+        self,
+        job: Job,
+        status: JobStatus,
+        message: str,
+        error: Optional[str] = None,
+        progress: Optional[float] = None,
+    ) -> None:
+        """Move a job to a terminal state."""
+        with self._lock:
+            if job.done:
+                return
+            job.status = status
+            job.message = message
+            job.error = error
+            if progress is not None:
+                job.progress = progress
+            job.finished_at = datetime.now(timezone.utc)
+            job.finished_monotonic = time.monotonic()
+        if status != JobStatus.SUCCEEDED:
+            _delete_result_file(job)
+        if job.on_finish is not None:
+            try:
+                job.on_finish(job)
+            except Exception as e:
+                logger.warning(f"{job.kind} job {job.id} cleanup failed: {e}")
+        logger.info(f"{job.kind} job {job.id} {status.value}")
+
+
+def _delete_result_file(job: Job) -> None:
+    """Remove a job's result file, if any."""
+    if job.result_path is None:
+        return
+    try:
+        job.result_path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to delete job result {job.result_path}: {e}")
+
+
+def job_result_path(job_id: str, suffix: str) -> Path:
+    """Return the path a job should write its file result to."""
+    JOB_RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    return JOB_RESULTS_DIR / f"{job_id}{suffix}"
+
+
+_job_manager: Optional[JobManager] = None
+
+
+def get_job_manager() -> JobManager:
+    """Return the process-wide job manager."""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = JobManager()
+    return _job_manager
+
+
+def shutdown_job_manager() -> None:
+    """Stop the process-wide job manager (called on application shutdown)."""
+    global _job_manager
+    if _job_manager is not None:
+        _job_manager.shutdown()
+        _job_manager = None
@@ -9,7 +9,7 @@ def get_mode_label(config) -> str:
         config: ConfigManager instance with mode attribute
 
     Returns:
-        str: "simulation" or "live"
+        str: "simulation", "live" or "replay"
     """
     return config.mode
 
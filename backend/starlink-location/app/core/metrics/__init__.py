@@ -1,50 +1,20 @@
 """Metrics module - Prometheus metrics registry and update functions."""
 
 # Export REGISTRY for main.py
-from app.core.metrics.prometheus_metrics import REGISTRY, _current_position
+from app.core.metrics.prometheus_metrics import REGISTRY
 
 # Export all metric objects for use in other modules
 from app.core.metrics.prometheus_metrics import (
     # Position metrics
     starlink_device_location,
-    starlink_dish_latitude_degrees,
-    starlink_dish_longitude_degrees,
-    starlink_dish_altitude_feet,
-    starlink_dish_speed_knots,
-    starlink_dish_heading_degrees,
-    # Network metrics - Current values
-    starlink_network_latency_ms_current,
-    starlink_network_throughput_down_mbps_current,
-    starlink_network_throughput_up_mbps_current,
-    starlink_network_packet_loss_percent,
-    # Network metrics - Histograms
-    starlink_network_latency_ms,
-    starlink_network_throughput_down_mbps,
-    starlink_network_throughput_up_mbps,
-    # Obstruction and signal
-    starlink_dish_obstruction_percent,
-    starlink_signal_quality_percent,
     # Status metrics
     starlink_service_info,
     starlink_mode_info,
-    starlink_uptime_seconds,
-    starlink_dish_uptime_seconds,
-    starlink_dish_thermal_throttle,
-    starlink_dish_outage_active,
     # Event counters
     starlink_connection_attempts_total,
     starlink_connection_failures_total,
     starlink_outage_events_total,
     starlink_thermal_events_total,
-    # POI and ETA metrics
-    starlink_eta_poi_seconds,
-    starlink_distance_to_poi_meters,
-    # Flight Status metrics
-    starlink_flight_phase,
-    starlink_eta_mode,
-    starlink_flight_departure_time_unix,
-    starlink_flight_arrival_time_unix,
-    starlink_time_until_departure_seconds,
     # Route following metrics
     starlink_route_progress_percent,
     starlink_current_waypoint_index,
@@ -61,6 +31,11 @@ from app.core.metrics.prometheus_metrics import (
     starlink_metrics_scrape_duration_seconds,
     starlink_metrics_generation_errors_total,
     starlink_metrics_last_update_timestamp_seconds,
+    starlink_metrics_series_active,
+    starlink_metrics_series_evictions_total,
+    starlink_tick_stage_duration_seconds,
+    starlink_tick_overruns_total,
+    starlink_tick_lag_seconds,
     # Mission planning metrics
     mission_active_info,
     mission_phase_state,
@@ -74,6 +49,29 @@ from app.core.metrics.prometheus_metrics import (
     simulation_errors_total,
 )
 
+# Export the per-tick metrics snapshot (dish, network, flight status, POI ETAs)
+from app.core.metrics.snapshot import (
+    MetricsSnapshot,
+    PoiMetric,
+    get_metrics_snapshot,
+    publish_poi_metrics,
+    reset_metrics_snapshot,
+)
+
+# Export series lifecycle management
+from app.core.metrics.series_registry import (
+    SeriesRegistry,
+    get_series_registry,
+    track_labels,
+)
+
+# Export tick stage timing
+from app.core.metrics.stage_timing import (
+    TICK_STAGES,
+    set_stage_timing_enabled,
+    stage_timer,
+)
+
 # Export update functions
 from app.core.metrics.metric_updater import (
     update_metrics_from_telemetry,
@@ -86,51 +84,21 @@ from app.core.metrics.metric_updater import (
     update_mission_comm_state_metric,
     update_mission_duration_metrics,
     update_mission_next_conflict_metric,
+    update_live_mission_metrics,
 )
 
 __all__ = [
     "REGISTRY",
-    "_current_position",
     # Position metrics
     "starlink_device_location",
-    "starlink_dish_latitude_degrees",
-    "starlink_dish_longitude_degrees",
-    "starlink_dish_altitude_feet",
-    "starlink_dish_speed_knots",
-    "starlink_dish_heading_degrees",
-    # Network metrics - Current values
-    "starlink_network_latency_ms_current",
-    "starlink_network_throughput_down_mbps_current",
-    "starlink_network_throughput_up_mbps_current",
-    "starlink_network_packet_loss_percent",
-    # Network metrics - Histograms
-    "starlink_network_latency_ms",
-    "starlink_network_throughput_down_mbps",
-    "starlink_network_throughput_up_mbps",
-    # Obstruction and signal
-    "starlink_dish_obstruction_percent",
-    "starlink_signal_quality_percent",
     # Status metrics
     "starlink_service_info",
     "starlink_mode_info",
-    "starlink_uptime_seconds",
-    "starlink_dish_uptime_seconds",
-    "starlink_dish_thermal_throttle",
-    "starlink_dish_outage_active",
     # Event counters
     "starlink_connection_attempts_total",
     "starlink_connection_failures_total",
     "starlink_outage_events_total",
     "starlink_thermal_events_total",
-    # POI and ETA metrics
-    "starlink_eta_poi_seconds",
-    "starlink_distance_to_poi_meters",
-    # Flight Status metrics
-    "starlink_flight_phase",
-    "starlink_eta_mode",
-    "starlink_flight_departure_time_unix",
-    "starlink_flight_arrival_time_unix",
-    "starlink_time_until_departure_seconds",
     # Route following metrics
     "starlink_route_progress_percent",
     "starlink_current_waypoint_index",
@@ -147,6 +115,11 @@ __all__ = [
     "starlink_metrics_scrape_duration_seconds",
     "starlink_metrics_generation_errors_total",
     "starlink_metrics_last_update_timestamp_seconds",
+    "starlink_metrics_series_active",
+    "starlink_metrics_series_evictions_total",
+    "starlink_tick_stage_duration_seconds",
+    "starlink_tick_overruns_total",
+    "starlink_tick_lag_seconds",
     # Mission planning metrics
     "mission_active_info",
     "mission_phase_state",
@@ -158,6 +131,20 @@ __all__ = [
     # Simulation metrics
     "simulation_updates_total",
     "simulation_errors_total",
+    # Metrics snapshot
+    "MetricsSnapshot",
+    "PoiMetric",
+    "get_metrics_snapshot",
+    "publish_poi_metrics",
+    "reset_metrics_snapshot",
+    # Tick stage timing
+    "TICK_STAGES",
+    "set_stage_timing_enabled",
+    "stage_timer",
+    # Series lifecycle management
+    "SeriesRegistry",
+    "get_series_registry",
+    "track_labels",
     # Update functions
     "update_metrics_from_telemetry",
     "clear_telemetry_metrics",
@@ -169,4 +156,5 @@ __all__ = [
     "update_mission_comm_state_metric",
     "update_mission_duration_metrics",
     "update_mission_next_conflict_metric",
+    "update_live_mission_metrics",
 ]
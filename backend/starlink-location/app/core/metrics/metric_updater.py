@@ -1,6 +1,6 @@
 """Metric update functions for telemetry and mission data."""
 
-# FR-004: File exceeds 300 lines (604 lines) because metric updates coordinate
+# FR-004: File exceeds 300 lines (631 lines) because metric updates coordinate
 # across telemetry calculations, mission timeline state, flight phase logic, and
 # POI ETA projections. Refactoring would split interdependent calculations into
 # separate modules creating circular dependencies. Deferred to v0.4.0.
@@ -16,34 +16,9 @@ if TYPE_CHECKING:
     from app.services.poi_manager import POIManager
     from app.core.config import ConfigManager
 
+from app.core import clock
 from app.core.metrics.prometheus_metrics import (
-    _current_position,
-    starlink_dish_latitude_degrees,
-    starlink_dish_longitude_degrees,
-    starlink_dish_altitude_feet,
-    starlink_dish_speed_knots,
-    starlink_dish_heading_degrees,
-    starlink_network_latency_ms_current,
-    starlink_network_throughput_down_mbps_current,
-    starlink_network_throughput_up_mbps_current,
-    starlink_network_packet_loss_percent,
-    starlink_network_latency_ms,
-    starlink_network_throughput_down_mbps,
-    starlink_network_throughput_up_mbps,
-    starlink_dish_obstruction_percent,
-    starlink_signal_quality_percent,
-    starlink_uptime_seconds,
-    starlink_flight_phase,
-    starlink_eta_mode,
-    starlink_flight_departure_time_unix,
-    starlink_flight_arrival_time_unix,
-    starlink_time_until_departure_seconds,
-    starlink_eta_poi_seconds,
-    starlink_distance_to_poi_meters,
     simulation_updates_total,
-    starlink_dish_uptime_seconds,
-    starlink_dish_thermal_throttle,
-    starlink_dish_outage_active,
     starlink_service_info,
     starlink_mode_info,
     mission_active_info,
@@ -54,6 +29,13 @@ from app.core.metrics.prometheus_metrics import (
     mission_degraded_seconds,
     mission_critical_seconds,
 )
+from app.core.metrics.snapshot import (
+    PoiMetric,
+    begin_metrics_snapshot,
+    clear_dish_metrics,
+    publish_metrics_snapshot,
+)
+from app.core.metrics.stage_timing import stage_timer
 
 logger = logging.getLogger(__name__)
 
@@ -102,48 +84,77 @@ def update_metrics_from_telemetry(
         telemetry.network.latency_ms, telemetry.network.packet_loss_percent
     )
 
-    # Position metrics
-    # Update custom collector's position data
-    global _current_position
-    _current_position["latitude"] = telemetry.position.latitude
-    _current_position["longitude"] = telemetry.position.longitude
-    _current_position["altitude"] = telemetry.position.altitude
+    # All values of this tick go into one snapshot, published at the end
+    snapshot = begin_metrics_snapshot()
 
-    # Also set individual metrics for backward compatibility
-    starlink_dish_latitude_degrees.set(telemetry.position.latitude)
-    starlink_dish_longitude_degrees.set(telemetry.position.longitude)
-    starlink_dish_altitude_feet.set(telemetry.position.altitude)
-    starlink_dish_speed_knots.set(telemetry.position.speed)
-    starlink_dish_heading_degrees.set(telemetry.position.heading)
+    # Position metrics (starlink_aircraft_position and individual gauges)
+    snapshot.position = (
+        telemetry.position.latitude,
+        telemetry.position.longitude,
+        telemetry.position.altitude,
+    )
+    snapshot.set("starlink_dish_latitude_degrees", telemetry.position.latitude)
+    snapshot.set("starlink_dish_longitude_degrees", telemetry.position.longitude)
+    snapshot.set("starlink_dish_altitude_feet", telemetry.position.altitude)
+    snapshot.set("starlink_dish_speed_knots", telemetry.position.speed)
+    snapshot.set("starlink_dish_heading_degrees", telemetry.position.heading)
 
     # Network metrics - Current values (Gauges)
-    starlink_network_latency_ms_current.set(telemetry.network.latency_ms)
-    starlink_network_throughput_down_mbps_current.set(
-        telemetry.network.throughput_down_mbps
+    network = telemetry.network
+    snapshot.set("starlink_network_latency_ms_current", network.latency_ms)
+    snapshot.set(
+        "starlink_network_throughput_down_mbps_current", network.throughput_down_mbps
     )
-    starlink_network_throughput_up_mbps_current.set(
-        telemetry.network.throughput_up_mbps
+    snapshot.set(
+        "starlink_network_throughput_up_mbps_current", network.throughput_up_mbps
     )
-    starlink_network_packet_loss_percent.set(telemetry.network.packet_loss_percent)
+    snapshot.set("starlink_network_packet_loss_percent", network.packet_loss_percent)
+
+    # Network metrics - Dish history aggregates (live mode only)
+    history = telemetry.history
+    if history is not None:
+        snapshot.set(
+            "starlink_network_packet_loss_percent_window",
+            history.packet_loss_percent,
+        )
+        snapshot.set(
+            "starlink_network_latency_ms_window",
+            history.latency_ms if history.latency_ms is not None else math.nan,
+        )
+        snapshot.set("starlink_network_download_bytes", history.downlink_bytes)
+        snapshot.set("starlink_network_upload_bytes", history.uplink_bytes)
+        snapshot.set(
+            "starlink_network_history_skipped_samples", history.skipped_samples
+        )
 
     # Network metrics - Histograms (for percentile analysis)
     # Record observations for histogram buckets with labels
-    starlink_network_latency_ms.labels(mode=mode_label, status=status_label).observe(
-        telemetry.network.latency_ms
+    histogram_labels = (mode_label, status_label)
+    snapshot.observe(
+        "starlink_network_latency_ms", histogram_labels, network.latency_ms
+    )
+    snapshot.observe(
+        "starlink_network_throughput_down_mbps",
+        histogram_labels,
+        network.throughput_down_mbps,
+    )
+    snapshot.observe(
+        "starlink_network_throughput_up_mbps",
+        histogram_labels,
+        network.throughput_up_mbps,
     )
-    starlink_network_throughput_down_mbps.labels(
-        mode=mode_label, status=status_label
-    ).observe(telemetry.network.throughput_down_mbps)
-    starlink_network_throughput_up_mbps.labels(
-        mode=mode_label, status=status_label
-    ).observe(telemetry.network.throughput_up_mbps)
 
     # Obstruction and signal metrics
-    starlink_dish_obstruction_percent.set(telemetry.obstruction.obstruction_percent)
-    starlink_signal_quality_percent.set(telemetry.environmental.signal_quality_percent)
+    snapshot.set(
+        "starlink_dish_obstruction_percent", telemetry.obstruction.obstruction_percent
+    )
+    snapshot.set(
+        "starlink_signal_quality_percent",
+        telemetry.environmental.signal_quality_percent,
+    )
 
     # Status metrics
-    starlink_uptime_seconds.set(telemetry.environmental.uptime_seconds)
+    snapshot.set("starlink_uptime_seconds", telemetry.environmental.uptime_seconds)
 
     # Evaluate automatic flight phase transitions and cache current status
     flight_state = None
@@ -155,7 +166,8 @@ def update_metrics_from_telemetry(
 
         # Automatic departure detection (speed-based)
         try:
-            flight_state.check_departure(telemetry.position.speed)
+            with stage_timer("flight_state"):
+                flight_state.check_departure(telemetry.position.speed)
         except Exception as departure_error:  # pragma: no cover - defensive guard
             logger.warning(f"Departure detection error: {departure_error}")
 
@@ -164,16 +176,18 @@ def update_metrics_from_telemetry(
             try:
                 from app.services.route_eta_calculator import RouteETACalculator
 
-                route_calculator = RouteETACalculator(active_route)
+                with stage_timer("route_eta_calculator"):
+                    route_calculator = RouteETACalculator(active_route)
                 progress_info = route_calculator.get_route_progress(
                     telemetry.position.latitude,
                     telemetry.position.longitude,
                 )
                 distance_remaining = progress_info.get("distance_remaining_meters")
                 if distance_remaining is not None:
-                    flight_state.check_arrival(
-                        distance_remaining, telemetry.position.speed
-                    )
+                    with stage_timer("flight_state"):
+                        flight_state.check_arrival(
+                            distance_remaining, telemetry.position.speed
+                        )
             except Exception as arrival_error:  # pragma: no cover - defensive guard
                 logger.debug(f"Arrival detection skipped: {arrival_error}")
 
@@ -200,23 +214,22 @@ def update_metrics_from_telemetry(
             flight_status.eta_mode.value, 0
         )
 
-        starlink_flight_phase.set(phase_value)
-        starlink_eta_mode.set(mode_value)
+        snapshot.set("starlink_flight_phase", phase_value)
+        snapshot.set("starlink_eta_mode", mode_value)
 
         # Set timestamp metrics (0 if not set)
-        if flight_status.departure_time:
-            starlink_flight_departure_time_unix.set(
+        snapshot.set(
+            "starlink_flight_departure_time_unix",
+            (
                 flight_status.departure_time.timestamp()
-            )
-        else:
-            starlink_flight_departure_time_unix.set(0)
-
-        if flight_status.arrival_time:
-            starlink_flight_arrival_time_unix.set(
-                flight_status.arrival_time.timestamp()
-            )
-        else:
-            starlink_flight_arrival_time_unix.set(0)
+                if flight_status.departure_time
+                else 0
+            ),
+        )
+        snapshot.set(
+            "starlink_flight_arrival_time_unix",
+            flight_status.arrival_time.timestamp() if flight_status.arrival_time else 0,
+        )
 
         # Synchronize active route timing profile with live flight status
         if active_route is not None and flight_status is not None:
@@ -241,7 +254,7 @@ def update_metrics_from_telemetry(
         # Update time-until-departure gauge
         time_until_departure = 0.0
         if flight_status is not None:
-            now = datetime.now(timezone.utc)
+            now = clock.now()
 
             departure_time = getattr(flight_status, "departure_time", None)
             if departure_time:
@@ -267,7 +280,7 @@ def update_metrics_from_telemetry(
                     delta = (scheduled_departure - now).total_seconds()
                     time_until_departure = delta
 
-        starlink_time_until_departure_seconds.set(time_until_departure)
+        snapshot.set("starlink_time_until_departure_seconds", time_until_departure)
 
     except Exception as e:
         logger.warning(f"Error updating flight status metrics: {e}")
@@ -288,40 +301,45 @@ def update_metrics_from_telemetry(
             flight_status.eta_mode if flight_status else ETAMode.ESTIMATED
         )
 
-        eta_metrics = update_eta_metrics(
-            telemetry.position.latitude,
-            telemetry.position.longitude,
-            telemetry.position.speed,
-            active_route=active_route,
-            eta_mode=current_eta_mode,
-            flight_phase=flight_status.phase if flight_status else None,
-            poi_manager=poi_manager,
-        )
+        with stage_timer("eta_metrics"):
+            eta_metrics = update_eta_metrics(
+                telemetry.position.latitude,
+                telemetry.position.longitude,
+                telemetry.position.speed,
+                active_route=active_route,
+                eta_mode=current_eta_mode,
+                flight_phase=flight_status.phase if flight_status else None,
+                poi_manager=poi_manager,
+            )
 
-        # Update Prometheus gauges with ETA data
+        # The snapshot carries exactly the current POIs, so deleted or
+        # renamed POIs disappear from the next scrape.
+        pois = []
         for poi_id, metrics_data in eta_metrics.items():
-            poi_name = metrics_data.get("poi_name", "unknown")
-            poi_category = metrics_data.get("poi_category", "")
             eta_seconds = metrics_data.get("eta_seconds", -1)
-            distance_meters = metrics_data.get("distance_meters", 0)
-            eta_type = metrics_data.get(
-                "eta_type", current_eta_mode.value if current_eta_mode else "estimated"
+            pois.append(
+                PoiMetric(
+                    name=metrics_data.get("poi_name", "unknown"),
+                    category=metrics_data.get("poi_category", "") or "",
+                    eta_type=metrics_data.get(
+                        "eta_type",
+                        current_eta_mode.value if current_eta_mode else "estimated",
+                    ),
+                    distance_meters=metrics_data.get("distance_meters", 0),
+                    # Only export valid ETA values (-1 means no speed)
+                    eta_seconds=eta_seconds if eta_seconds >= 0 else None,
+                )
             )
-
-            # Only set valid ETA values (skip -1 which means no speed)
-            if eta_seconds >= 0:
-                starlink_eta_poi_seconds.labels(
-                    name=poi_name, category=poi_category, eta_type=eta_type
-                ).set(eta_seconds)
-            starlink_distance_to_poi_meters.labels(
-                name=poi_name, category=poi_category, eta_type=eta_type
-            ).set(distance_meters)
+        snapshot.set_pois(pois)
 
     except Exception as e:
         logger.warning(f"Error updating POI/ETA metrics: {e}")
 
-    # Increment update counter
-    simulation_updates_total.inc()
+    with stage_timer("metrics_publish"):
+        publish_metrics_snapshot(snapshot)
+
+        # Increment update counter
+        simulation_updates_total.inc()
 
 
 def clear_telemetry_metrics() -> None:
@@ -346,36 +364,11 @@ def clear_telemetry_metrics() -> None:
     Raises:
         Does not raise exceptions. This is a fire-and-forget operation.
     """
-    # Position metrics
-    starlink_dish_latitude_degrees.set(math.nan)
-    starlink_dish_longitude_degrees.set(math.nan)
-    starlink_dish_altitude_feet.set(math.nan)
-    starlink_dish_speed_knots.set(math.nan)
-    starlink_dish_heading_degrees.set(math.nan)
-
-    # Network metrics (current values)
-    starlink_network_latency_ms_current.set(math.nan)
-    starlink_network_throughput_down_mbps_current.set(math.nan)
-    starlink_network_throughput_up_mbps_current.set(math.nan)
-    starlink_network_packet_loss_percent.set(math.nan)
-
-    # Obstruction and signal metrics
-    starlink_dish_obstruction_percent.set(math.nan)
-    starlink_signal_quality_percent.set(math.nan)
-
-    # Dish status metrics
-    starlink_dish_uptime_seconds.set(math.nan)
-    starlink_dish_thermal_throttle.set(math.nan)
-    starlink_dish_outage_active.set(math.nan)
-
-    # Clear route metrics when no active route (handled separately by simulator)
-    # Route metrics are only cleared when route is deactivated
-
-    # Clear custom position collector data
-    global _current_position
-    _current_position["latitude"] = math.nan
-    _current_position["longitude"] = math.nan
-    _current_position["altitude"] = math.nan
+    # Position, network, obstruction, signal and dish status metrics, plus
+    # the aircraft position collector, in one snapshot.
+    # Route metrics are only cleared when route is deactivated (handled
+    # separately by simulator).
+    clear_dish_metrics()
 
 
 def set_service_info(version: str, mode: str) -> None:
@@ -392,8 +385,8 @@ def set_service_info(version: str, mode: str) -> None:
 
     Args:
         version: Service version string (e.g., "1.0.0" or git commit hash).
-        mode: Operating mode, either "simulation" (synthetic data) or "live"
-            (connected to real Starlink dish).
+        mode: Operating mode: "simulation" (synthetic data), "live" (connected
+            to real Starlink dish) or "replay" (recorded telemetry).
 
     Returns:
         None. The function updates Prometheus metrics in-place as a side effect.
@@ -407,7 +400,7 @@ def set_service_info(version: str, mode: str) -> None:
 
     # Set mode indicator metric - only the active mode will be set to 1
     # This allows easy filtering by mode in Prometheus queries
-    for possible_mode in ["simulation", "live"]:
+    for possible_mode in ["simulation", "live", "replay"]:
         if possible_mode == mode:
             starlink_mode_info.labels(mode=possible_mode).set(1)
         else:
@@ -607,3 +600,50 @@ def update_mission_next_conflict_metric(mission_id: str, seconds: float) -> None
         mission_next_conflict_seconds.labels(mission_id=mission_id).set(seconds)
     except Exception as e:  # pragma: no cover
         logger.warning(f"Failed to update mission next conflict metric: {e}")
+
+
+def update_live_mission_metrics(now: Optional[datetime] = None) -> None:
+    """Refresh the active mission's phase, comm-state and countdown gauges.
+
+    Called on every background tick. The active mission's timeline is looked
+    up through its compiled interval index (see app.mission.timeline_index),
+    so each refresh is a few bisect lookups against the current
+    mission-relative time rather than a timeline load.
+
+    Args:
+        now: Current time (defaults to now, UTC). Exposed for tests.
+
+    Returns:
+        None. The function updates Prometheus metrics in-place as a side effect.
+
+    Raises:
+        Does not raise exceptions. Failures are logged and ignored.
+    """
+    try:
+        from app.mission.storage import (
+            get_active_mission_ids,
+            get_mission_timeline_index,
+        )
+        from app.mission.timeline_index import mission_offset_seconds
+        from app.services.flight_state import get_flight_state_manager
+
+        active_ids = get_active_mission_ids()
+        if not active_ids:
+            return
+        mission_id = active_ids[0]
+        flight_status = get_flight_state_manager().get_status()
+        update_mission_phase_metric(mission_id, flight_status.phase.value)
+
+        index = get_mission_timeline_index(mission_id)
+        if index is None or not index.starts:
+            return
+        offset = mission_offset_seconds(flight_status, now)
+        mission_next_conflict_seconds.labels(mission_id=mission_id).set(
+            index.next_conflict_seconds(offset)
+        )
+        for transport, state_value in index.states_at(offset).items():
+            mission_comm_state.labels(
+                mission_id=mission_id, transport=transport.value
+            ).set(state_value)
+    except Exception as e:  # pragma: no cover - defensive guard
+        logger.warning(f"Failed to update live mission metrics: {e}")
@@ -1,12 +1,6 @@
 """Prometheus metrics registry and definitions."""
 
-# FR-004: File exceeds 300 lines (451 lines) because metrics registry defines
-# 40+ metric instances with type-specific exports (gauges, counters, histograms)
-# and accessor functions. Splitting would fragment metric definitions reducing
-# discoverability. Deferred to v0.4.0.
-
 import logging
-from typing import Dict, Generator
 
 from prometheus_client import (
     Gauge,
@@ -14,54 +8,14 @@ from prometheus_client import (
     Histogram,
     CollectorRegistry,
 )
-from prometheus_client.core import GaugeMetricFamily
 
 logger = logging.getLogger(__name__)
 
 # Create a dedicated registry for our metrics
 REGISTRY: CollectorRegistry = CollectorRegistry()
 
-# Current position data for custom collector
-# This is updated by metric_updater functions and read by PositionCollector
-_current_position: Dict[str, float] = {
-    "latitude": 0.0,
-    "longitude": 0.0,
-    "altitude": 0.0,
-}
-
-
-class PositionCollector:
-    """Custom collector that exports position as a single metric with all values.
-
-    This collector is registered with Prometheus and yields a GaugeMetricFamily
-    containing the current aircraft position with three dimensions (latitude,
-    longitude, altitude). The position data is read from the module-level
-    _current_position dictionary which is updated by metric_updater functions.
-    """
-
-    def collect(self) -> Generator[GaugeMetricFamily, None, None]:
-        """Collect and yield position metrics for Prometheus scraping.
-
-        Returns:
-            Generator[GaugeMetricFamily, None, None]: A generator yielding a single
-                GaugeMetricFamily with position data labeled by dimension.
-        """
-        # Create a gauge metric with the position data
-        position_metric = GaugeMetricFamily(
-            "starlink_aircraft_position",
-            "Current aircraft position with latitude, longitude, and altitude",
-            labels=["dimension"],
-        )
-
-        position_metric.add_metric(["latitude"], _current_position["latitude"])
-        position_metric.add_metric(["longitude"], _current_position["longitude"])
-        position_metric.add_metric(["altitude"], _current_position["altitude"])
-
-        yield position_metric
-
-
-# Register the custom collector
-REGISTRY.register(PositionCollector())
+# Dish, network, signal, flight status and POI ETA metrics are written every
+# tick and exported from a point-in-time snapshot (see snapshot.py).
 
 # ============================================================================
 # Position metrics
@@ -76,112 +30,6 @@ starlink_device_location = Gauge(
     registry=REGISTRY,
 )
 
-starlink_dish_latitude_degrees = Gauge(
-    "starlink_dish_latitude_degrees",
-    "Dish latitude in decimal degrees",
-    registry=REGISTRY,
-)
-
-starlink_dish_longitude_degrees = Gauge(
-    "starlink_dish_longitude_degrees",
-    "Dish longitude in decimal degrees",
-    registry=REGISTRY,
-)
-
-starlink_dish_altitude_feet = Gauge(
-    "starlink_dish_altitude_feet",
-    "Dish altitude in feet above sea level",
-    registry=REGISTRY,
-)
-
-starlink_dish_speed_knots = Gauge(
-    "starlink_dish_speed_knots", "Dish speed in knots", registry=REGISTRY
-)
-
-starlink_dish_heading_degrees = Gauge(
-    "starlink_dish_heading_degrees",
-    "Dish heading in degrees (0=North, 90=East)",
-    registry=REGISTRY,
-)
-
-# ============================================================================
-# Network metrics - Current values (Gauges)
-# ============================================================================
-starlink_network_latency_ms_current = Gauge(
-    "starlink_network_latency_ms_current",
-    "Network round-trip latency in milliseconds (current value)",
-    registry=REGISTRY,
-)
-
-starlink_network_throughput_down_mbps_current = Gauge(
-    "starlink_network_throughput_down_mbps_current",
-    "Download throughput in Megabits per second (current value)",
-    registry=REGISTRY,
-)
-
-starlink_network_throughput_up_mbps_current = Gauge(
-    "starlink_network_throughput_up_mbps_current",
-    "Upload throughput in Megabits per second (current value)",
-    registry=REGISTRY,
-)
-
-starlink_network_packet_loss_percent = Gauge(
-    "starlink_network_packet_loss_percent",
-    "Packet loss as percentage (0-100)",
-    registry=REGISTRY,
-)
-
-# ============================================================================
-# Network metrics - Histograms for percentile analysis
-# ============================================================================
-# Latency histogram: buckets chosen to capture Starlink typical performance
-# Starlink latency typically ranges 25-150ms (median ~50ms)
-# Buckets: 20, 40, 60, 80, 100, 150, 200, 500 capture low/normal/degraded/poor ranges
-starlink_network_latency_ms = Histogram(
-    "starlink_network_latency_ms",
-    "Network round-trip latency in milliseconds (histogram for percentile analysis)",
-    labelnames=["mode", "status"],
-    buckets=[20, 40, 60, 80, 100, 150, 200, 500],
-    registry=REGISTRY,
-)
-
-# Download throughput histogram: buckets for typical Starlink speeds
-# Starlink download typically 50-300 Mbps depending on conditions
-# Buckets: 50, 100, 150, 200, 250, 300 capture performance ranges
-starlink_network_throughput_down_mbps = Histogram(
-    "starlink_network_throughput_down_mbps",
-    "Download throughput in Megabits per second (histogram for percentile analysis)",
-    labelnames=["mode", "status"],
-    buckets=[50, 100, 150, 200, 250, 300],
-    registry=REGISTRY,
-)
-
-# Upload throughput histogram: buckets for typical Starlink upload speeds
-# Starlink upload typically 10-50 Mbps depending on conditions
-# Buckets: 10, 20, 30, 40, 50 capture the typical performance range
-starlink_network_throughput_up_mbps = Histogram(
-    "starlink_network_throughput_up_mbps",
-    "Upload throughput in Megabits per second (histogram for percentile analysis)",
-    labelnames=["mode", "status"],
-    buckets=[10, 20, 30, 40, 50],
-    registry=REGISTRY,
-)
-
-# ============================================================================
-# Obstruction and signal metrics
-# ============================================================================
-starlink_dish_obstruction_percent = Gauge(
-    "starlink_dish_obstruction_percent",
-    "Dish obstruction as percentage (0-100)",
-    registry=REGISTRY,
-)
-
-starlink_signal_quality_percent = Gauge(
-    "starlink_signal_quality_percent",
-    "Signal quality as percentage (0-100)",
-    registry=REGISTRY,
-)
-
 # ============================================================================
 # Status metrics
 # ============================================================================
@@ -199,26 +47,6 @@ starlink_mode_info = Gauge(
     registry=REGISTRY,
 )
 
-starlink_uptime_seconds = Gauge(
-    "starlink_uptime_seconds", "Service uptime in seconds", registry=REGISTRY
-)
-
-starlink_dish_uptime_seconds = Gauge(
-    "starlink_dish_uptime_seconds", "Dish uptime in seconds", registry=REGISTRY
-)
-
-starlink_dish_thermal_throttle = Gauge(
-    "starlink_dish_thermal_throttle",
-    "Dish thermal throttle state (0=normal, 1=throttled)",
-    registry=REGISTRY,
-)
-
-starlink_dish_outage_active = Gauge(
-    "starlink_dish_outage_active",
-    "Dish outage state (0=connected, 1=outage)",
-    registry=REGISTRY,
-)
-
 # ============================================================================
 # Event counters
 # ============================================================================
@@ -244,56 +72,6 @@ starlink_thermal_events_total = Counter(
     registry=REGISTRY,
 )
 
-# ============================================================================
-# POI and ETA metrics
-# ============================================================================
-starlink_eta_poi_seconds = Gauge(
-    "starlink_eta_poi_seconds",
-    "Estimated time of arrival to point of interest in seconds (anticipated or estimated)",
-    labelnames=["name", "category", "eta_type"],
-    registry=REGISTRY,
-)
-
-starlink_distance_to_poi_meters = Gauge(
-    "starlink_distance_to_poi_meters",
-    "Distance to point of interest in meters",
-    labelnames=["name", "category", "eta_type"],
-    registry=REGISTRY,
-)
-
-# ============================================================================
-# Flight Status metrics (Phase 0 - ETA Timing Modes)
-# ============================================================================
-starlink_flight_phase = Gauge(
-    "starlink_flight_phase",
-    "Current flight phase (0=pre_departure, 1=in_flight, 2=post_arrival)",
-    registry=REGISTRY,
-)
-
-starlink_eta_mode = Gauge(
-    "starlink_eta_mode",
-    "Current ETA calculation mode (0=anticipated, 1=estimated)",
-    registry=REGISTRY,
-)
-
-starlink_flight_departure_time_unix = Gauge(
-    "starlink_flight_departure_time_unix",
-    "Detected departure time (Unix timestamp), 0 if not yet departed",
-    registry=REGISTRY,
-)
-
-starlink_flight_arrival_time_unix = Gauge(
-    "starlink_flight_arrival_time_unix",
-    "Detected arrival time (Unix timestamp), 0 if not yet arrived",
-    registry=REGISTRY,
-)
-
-starlink_time_until_departure_seconds = Gauge(
-    "starlink_time_until_departure_seconds",
-    "Seconds remaining until scheduled or detected departure (0 once departed, negative if scheduled time is in the past and departure not detected)",
-    registry=REGISTRY,
-)
-
 # ============================================================================
 # Route following metrics (Phase 5 - Simulation mode route following)
 # ============================================================================
@@ -392,6 +170,41 @@ starlink_metrics_last_update_timestamp_seconds = Gauge(
     registry=REGISTRY,
 )
 
+starlink_tick_stage_duration_seconds = Histogram(
+    "starlink_tick_stage_duration_seconds",
+    "Time spent in each stage of the background update tick in seconds",
+    labelnames=["stage"],
+    buckets=[0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.1],
+    registry=REGISTRY,
+)
+
+starlink_tick_overruns_total = Counter(
+    "starlink_tick_overruns_total",
+    "Background update ticks whose work took longer than the update interval",
+    registry=REGISTRY,
+)
+
+starlink_tick_lag_seconds = Histogram(
+    "starlink_tick_lag_seconds",
+    "Delay between a tick's scheduled and actual start in seconds",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+    registry=REGISTRY,
+)
+
+starlink_metrics_series_active = Gauge(
+    "starlink_metrics_series_active",
+    "Label sets currently exported by a series-managed metric",
+    labelnames=["metric"],
+    registry=REGISTRY,
+)
+
+starlink_metrics_series_evictions_total = Counter(
+    "starlink_metrics_series_evictions_total",
+    "Series removed from a managed metric (stale, over the cap, or not rewritten)",
+    labelnames=["metric", "reason"],
+    registry=REGISTRY,
+)
+
 # ============================================================================
 # Mission planning metrics (Phase 1 Continuation)
 # ============================================================================
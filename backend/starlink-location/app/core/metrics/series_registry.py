@@ -0,0 +1,267 @@
+"""Lifecycle management for Prometheus series keyed by waypoint and route.
+
+A labelled Gauge keeps a child series for every label set it has ever been
+given. Route gauges are labelled by route name, waypoint and segment, so over
+a multi-day flight with route swaps the /metrics payload kept growing with
+series nobody writes any more. (POI ETA series are exported from the metrics
+snapshot, which only ever holds the current POIs.)
+
+Writers go through ``track_labels(metric, **labels)`` instead of
+``metric.labels(...)``. The SeriesRegistry records when each label set was
+last written and removes series:
+
+- not written within ``METRICS_SERIES_HORIZON_SECONDS`` (reason "stale");
+- beyond the metric's cardinality cap, oldest write first (reason "cap");
+- not rewritten during a ``generation()`` block, for writers that rewrite
+  every live series on each pass (reason "generation").
+
+Evictions are counted in ``starlink_metrics_series_evictions_total`` and the
+number of live series per metric is exported as
+``starlink_metrics_series_active``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from prometheus_client.metrics import MetricWrapperBase
+
+from app.core.metrics.prometheus_metrics import (
+    starlink_current_waypoint_index,
+    starlink_device_location,
+    starlink_distance_to_waypoint_meters,
+    starlink_eta_to_waypoint_seconds,
+    starlink_metrics_series_active,
+    starlink_metrics_series_evictions_total,
+    starlink_route_arrival_time_unix,
+    starlink_route_departure_time_unix,
+    starlink_route_has_timing_data,
+    starlink_route_progress_percent,
+    starlink_route_segment_count_with_timing,
+    starlink_route_segment_speed_knots,
+    starlink_route_total_duration_seconds,
+)
+
+logger = logging.getLogger(__name__)
+
+# Series not written for this long are removed
+METRICS_SERIES_HORIZON_SECONDS = float(
+    os.getenv("METRICS_SERIES_HORIZON_SECONDS", "900")
+)
+# Hard cap on live series per managed metric
+METRICS_SERIES_MAX_PER_METRIC = int(os.getenv("METRICS_SERIES_MAX_PER_METRIC", "500"))
+
+LabelKey = Tuple[str, ...]
+
+
+class _ManagedMetric:
+    """Book-keeping for one managed metric."""
+
+    def __init__(self, metric: MetricWrapperBase, max_series: int):
+        self.metric = metric
+        self.name = metric._name
+        self.labelnames: Tuple[str, ...] = tuple(metric._labelnames)
+        self.max_series = max_series
+        # Label values -> monotonic time of the last write, oldest first
+        self.last_written: OrderedDict[LabelKey, float] = OrderedDict()
+        # Label values written during the open generation, if any
+        self.generation: Optional[set[LabelKey]] = None
+
+
+class SeriesRegistry:
+    """Track, age out and cap the child series of labelled metrics."""
+
+    def __init__(
+        self,
+        horizon_seconds: float = METRICS_SERIES_HORIZON_SECONDS,
+        max_series: int = METRICS_SERIES_MAX_PER_METRIC,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            horizon_seconds: Remove series not written for this long
+            max_series: Default cap on live series per metric
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.horizon_seconds = horizon_seconds
+        self.max_series = max_series
+        self._clock = clock
+        self._metrics: Dict[str, _ManagedMetric] = {}
+        self._lock = threading.RLock()
+        self._last_sweep = clock()
+
+    def manage(
+        self, metric: MetricWrapperBase, max_series: Optional[int] = None
+    ) -> None:
+        """
+        Put a labelled metric under lifecycle management.
+
+        Args:
+            metric: Labelled Prometheus metric
+            max_series: Cap on its live series (defaults to the registry cap)
+        """
+        with self._lock:
+            self._metrics[metric._name] = _ManagedMetric(
+                metric, max_series if max_series is not None else self.max_series
+            )
+
+    def labels(self, metric: MetricWrapperBase, **labels: object):
+        """
+        Child series for a label set, recording the write.
+
+        Unmanaged metrics are passed straight through to ``metric.labels``.
+
+        Args:
+            metric: Labelled Prometheus metric
+            **labels: Label values
+
+        Returns:
+            The child series to call ``set``/``inc``/``observe`` on
+        """
+        managed = self._metrics.get(metric._name)
+        if managed is None:
+            return metric.labels(**labels)
+
+        key = tuple(str(labels[name]) for name in managed.labelnames)
+        with self._lock:
+            now = self._clock()
+            written = managed.last_written
+            if key in written:
+                written.move_to_end(key)
+            else:
+                while len(written) >= managed.max_series:
+                    oldest, _ = written.popitem(last=False)
+                    self._remove(managed, oldest, "cap")
+            written[key] = now
+            if managed.generation is not None:
+                managed.generation.add(key)
+            child = metric.labels(*key)
+            if now - self._last_sweep >= self.horizon_seconds / 10:
+                self._sweep(now)
+            starlink_metrics_series_active.labels(metric=managed.name).set(len(written))
+            return child
+
+    @contextmanager
+    def generation(self, *metrics: MetricWrapperBase) -> Iterator[None]:
+        """
+        Remove series of ``metrics`` that the block does not write.
+
+        Use around a writer that rewrites every live series on each pass. If
+        the block raises, nothing is removed.
+
+        Args:
+            *metrics: Managed metrics the block writes
+        """
+        with self._lock:
+            managed = [self._metrics[metric._name] for metric in metrics]
+            for entry in managed:
+                entry.generation = set()
+        completed = False
+        try:
+            yield
+            completed = True
+        finally:
+            with self._lock:
+                for entry in managed:
+                    seen, entry.generation = entry.generation, None
+                    if not completed:
+                        continue
+                    for key in [k for k in entry.last_written if k not in seen]:
+                        del entry.last_written[key]
+                        self._remove(entry, key, "generation")
+                    starlink_metrics_series_active.labels(metric=entry.name).set(
+                        len(entry.last_written)
+                    )
+
+    def sweep(self) -> int:
+        """
+        Remove series not written within the horizon.
+
+        Returns:
+            Number of series removed
+        """
+        with self._lock:
+            return self._sweep(self._clock())
+
+    def clear(self, metric: Optional[MetricWrapperBase] = None) -> None:
+        """Remove every series of a managed metric (or of all of them)."""
+        with self._lock:
+            entries = (
+                [self._metrics[metric._name]]
+                if metric is not None
+                else list(self._metrics.values())
+            )
+            for entry in entries:
+                entry.metric.clear()
+                entry.last_written.clear()
+                starlink_metrics_series_active.labels(metric=entry.name).set(0)
+
+    def series_count(self, metric: MetricWrapperBase) -> int:
+        """Number of live series tracked for a managed metric."""
+        with self._lock:
+            return len(self._metrics[metric._name].last_written)
+
+    def _sweep(self, now: float) -> int:
+        self._last_sweep = now
+        cutoff = now - self.horizon_seconds
+        removed = 0
+        for entry in self._metrics.values():
+            written = entry.last_written
+            # Oldest write first, so stop at the first fresh series
+            while written:
+                key, last = next(iter(written.items()))
+                if last >= cutoff:
+                    break
+                del written[key]
+                self._remove(entry, key, "stale")
+                removed += 1
+            starlink_metrics_series_active.labels(metric=entry.name).set(len(written))
+        if removed:
+            logger.debug(f"Removed {removed} stale metric series")
+        return removed
+
+    def _remove(self, entry: _ManagedMetric, key: LabelKey, reason: str) -> None:
+        try:
+            entry.metric.remove(*key)
+        except KeyError:
+            pass
+        starlink_metrics_series_evictions_total.labels(
+            metric=entry.name, reason=reason
+        ).inc()
+
+
+_series_registry = SeriesRegistry()
+# Route gauges are labelled by route, waypoint and segment
+for _metric in (
+    starlink_route_progress_percent,
+    starlink_current_waypoint_index,
+    starlink_route_has_timing_data,
+    starlink_route_total_duration_seconds,
+    starlink_route_departure_time_unix,
+    starlink_route_arrival_time_unix,
+    starlink_route_segment_count_with_timing,
+    starlink_eta_to_waypoint_seconds,
+    starlink_distance_to_waypoint_meters,
+    starlink_route_segment_speed_knots,
+):
+    _series_registry.manage(_metric)
+# Position labels change on every fix; only the latest one is meaningful
+_series_registry.manage(starlink_device_location, max_series=1)
+
+
+def get_series_registry() -> SeriesRegistry:
+    """Get the global series registry."""
+    return _series_registry
+
+
+def track_labels(metric: MetricWrapperBase, **labels: object):
+    """``metric.labels(**labels)`` with series lifecycle tracking."""
+    return _series_registry.labels(metric, **labels)
@@ -0,0 +1,373 @@
+"""Point-in-time metrics snapshot published by the update loop.
+
+``update_metrics_from_telemetry`` used to write about twenty Gauge children
+and three Histogram children on every tick, each write taking a
+prometheus_client lock, while Prometheus reads them at most once a second.
+A scrape that landed mid-tick could also mix values from two ticks.
+
+The tick now builds one immutable MetricsSnapshot and publishes it with a
+single reference swap. SnapshotCollector, registered in REGISTRY like any
+other collector, turns the latest snapshot into metric families only when
+/metrics is scraped. Every scrape therefore shows one tick.
+
+Covered here: the dish, network and signal gauges, the flight status
+gauges, ``starlink_aircraft_position``, the POI ETA/distance gauges and the
+three network histograms. Route and mission gauges, counters and the
+meta-metrics remain regular prometheus_client metrics.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Generator, Iterable, Mapping, Optional
+
+from prometheus_client.core import (
+    GaugeMetricFamily,
+    HistogramMetricFamily,
+    Metric,
+)
+from prometheus_client.utils import floatToGoString
+
+from app.core.metrics.prometheus_metrics import REGISTRY
+
+# Unlabelled gauges carried by the snapshot: name -> help text
+SNAPSHOT_GAUGES: dict[str, str] = {
+    # Position
+    "starlink_dish_latitude_degrees": "Dish latitude in decimal degrees",
+    "starlink_dish_longitude_degrees": "Dish longitude in decimal degrees",
+    "starlink_dish_altitude_feet": "Dish altitude in feet above sea level",
+    "starlink_dish_speed_knots": "Dish speed in knots",
+    "starlink_dish_heading_degrees": "Dish heading in degrees (0=North, 90=East)",
+    # Network (current values)
+    "starlink_network_latency_ms_current": (
+        "Network round-trip latency in milliseconds (current value)"
+    ),
+    "starlink_network_throughput_down_mbps_current": (
+        "Download throughput in Megabits per second (current value)"
+    ),
+    "starlink_network_throughput_up_mbps_current": (
+        "Upload throughput in Megabits per second (current value)"
+    ),
+    "starlink_network_packet_loss_percent": "Packet loss as percentage (0-100)",
+    # Network (dish history, live mode)
+    "starlink_network_packet_loss_percent_window": (
+        "Mean packet loss over the recent dish history samples (0-100)"
+    ),
+    "starlink_network_latency_ms_window": (
+        "Mean latency over the recent dish history samples with a reply, in "
+        "milliseconds (NaN if every ping was dropped)"
+    ),
+    "starlink_network_download_bytes": (
+        "Bytes received since the last dish history resync"
+    ),
+    "starlink_network_upload_bytes": "Bytes sent since the last dish history resync",
+    "starlink_network_history_skipped_samples": (
+        "Dish history samples missed between polls since the last resync; their "
+        "bytes are not in the download/upload totals"
+    ),
+    # Obstruction and signal
+    "starlink_dish_obstruction_percent": "Dish obstruction as percentage (0-100)",
+    "starlink_signal_quality_percent": "Signal quality as percentage (0-100)",
+    # Status
+    "starlink_uptime_seconds": "Service uptime in seconds",
+    "starlink_dish_uptime_seconds": "Dish uptime in seconds",
+    "starlink_dish_thermal_throttle": (
+        "Dish thermal throttle state (0=normal, 1=throttled)"
+    ),
+    "starlink_dish_outage_active": "Dish outage state (0=connected, 1=outage)",
+    # Flight status
+    "starlink_flight_phase": (
+        "Current flight phase (0=pre_departure, 1=in_flight, 2=post_arrival)"
+    ),
+    "starlink_eta_mode": "Current ETA calculation mode (0=anticipated, 1=estimated)",
+    "starlink_flight_departure_time_unix": (
+        "Detected departure time (Unix timestamp), 0 if not yet departed"
+    ),
+    "starlink_flight_arrival_time_unix": (
+        "Detected arrival time (Unix timestamp), 0 if not yet arrived"
+    ),
+    "starlink_time_until_departure_seconds": (
+        "Seconds remaining until scheduled or detected departure (0 once "
+        "departed, negative if scheduled time is in the past and departure "
+        "not detected)"
+    ),
+}
+
+# Gauges cleared (set to NaN) while the dish is disconnected
+DISH_TELEMETRY_GAUGES = (
+    "starlink_dish_latitude_degrees",
+    "starlink_dish_longitude_degrees",
+    "starlink_dish_altitude_feet",
+    "starlink_dish_speed_knots",
+    "starlink_dish_heading_degrees",
+    "starlink_network_latency_ms_current",
+    "starlink_network_throughput_down_mbps_current",
+    "starlink_network_throughput_up_mbps_current",
+    "starlink_network_packet_loss_percent",
+    "starlink_network_packet_loss_percent_window",
+    "starlink_network_latency_ms_window",
+    "starlink_network_download_bytes",
+    "starlink_network_upload_bytes",
+    "starlink_network_history_skipped_samples",
+    "starlink_dish_obstruction_percent",
+    "starlink_signal_quality_percent",
+    "starlink_dish_uptime_seconds",
+    "starlink_dish_thermal_throttle",
+    "starlink_dish_outage_active",
+)
+
+# Histograms carried by the snapshot: name -> (help text, bucket bounds).
+# Latency: Starlink typically 25-150ms (median ~50ms). Download: 50-300 Mbps.
+# Upload: 10-50 Mbps.
+SNAPSHOT_HISTOGRAMS: dict[str, tuple[str, tuple[float, ...]]] = {
+    "starlink_network_latency_ms": (
+        "Network round-trip latency in milliseconds (histogram for percentile "
+        "analysis)",
+        (20, 40, 60, 80, 100, 150, 200, 500),
+    ),
+    "starlink_network_throughput_down_mbps": (
+        "Download throughput in Megabits per second (histogram for percentile "
+        "analysis)",
+        (50, 100, 150, 200, 250, 300),
+    ),
+    "starlink_network_throughput_up_mbps": (
+        "Upload throughput in Megabits per second (histogram for percentile "
+        "analysis)",
+        (10, 20, 30, 40, 50),
+    ),
+}
+HISTOGRAM_LABELS = ("mode", "status")
+
+POI_LABELS = ("name", "category", "eta_type")
+
+
+@dataclass(frozen=True)
+class PoiMetric:
+    """ETA and distance to one POI."""
+
+    name: str
+    category: str
+    eta_type: str
+    distance_meters: float
+    # None when there is no usable speed (the ETA series is omitted)
+    eta_seconds: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class HistogramSeries:
+    """Cumulative state of one histogram child."""
+
+    # Per-bucket (non-cumulative) counts, the last one being +Inf
+    counts: tuple[int, ...]
+    total: float
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Immutable view of the per-tick metrics at one point in time."""
+
+    created_at: float
+    gauges: Mapping[str, float]
+    # (latitude, longitude, altitude) for starlink_aircraft_position
+    position: tuple[float, float, float]
+    pois: tuple[PoiMetric, ...] = ()
+    # (histogram name, label values) -> series
+    histograms: Mapping[tuple[str, tuple[str, ...]], HistogramSeries] = field(
+        default_factory=dict
+    )
+
+
+def _initial_snapshot() -> MetricsSnapshot:
+    return MetricsSnapshot(
+        created_at=0.0,
+        gauges=MappingProxyType({name: 0.0 for name in SNAPSHOT_GAUGES}),
+        position=(0.0, 0.0, 0.0),
+        histograms=MappingProxyType({}),
+    )
+
+
+_latest: MetricsSnapshot = _initial_snapshot()
+# Serializes writers only; readers take the current reference without locking
+_publish_lock = threading.Lock()
+
+
+class SnapshotBuilder:
+    """Collects one tick's metric values on top of the previous snapshot.
+
+    Gauges not written during the tick keep their previous value, like a
+    Gauge would. Histogram observations accumulate onto the previous counts.
+    """
+
+    def __init__(self, base: MetricsSnapshot):
+        self._base = base
+        self.gauges: dict[str, float] = dict(base.gauges)
+        self.position = base.position
+        self.pois: Optional[list[PoiMetric]] = None
+        self._observations: list[tuple[str, tuple[str, ...], float]] = []
+
+    def set(self, name: str, value: float) -> None:
+        """Set an unlabelled gauge."""
+        if name not in SNAPSHOT_GAUGES:
+            raise KeyError(f"{name} is not a snapshot gauge")
+        self.gauges[name] = float(value)
+
+    def observe(self, name: str, labels: Iterable[str], value: float) -> None:
+        """Record a histogram observation."""
+        self._observations.append((name, tuple(labels), float(value)))
+
+    def set_pois(self, pois: Iterable[PoiMetric]) -> None:
+        """Replace the POI series (omit to keep the previous ones)."""
+        self.pois = list(pois)
+
+    def build(self) -> MetricsSnapshot:
+        """Freeze the tick into a snapshot."""
+        histograms = dict(self._base.histograms)
+        for name, labels, value in self._observations:
+            bounds = SNAPSHOT_HISTOGRAMS[name][1]
+            key = (name, labels)
+            series = histograms.get(key)
+            counts = list(series.counts) if series else [0] * (len(bounds) + 1)
+            counts[bisect_left(bounds, value)] += 1
+            histograms[key] = HistogramSeries(
+                counts=tuple(counts), total=(series.total if series else 0.0) + value
+            )
+        return MetricsSnapshot(
+            created_at=time.time(),
+            gauges=MappingProxyType(self.gauges),
+            position=self.position,
+            pois=tuple(self.pois) if self.pois is not None else self._base.pois,
+            histograms=MappingProxyType(histograms),
+        )
+
+
+def get_metrics_snapshot() -> MetricsSnapshot:
+    """Latest published snapshot."""
+    return _latest
+
+
+def publish_metrics_snapshot(builder: SnapshotBuilder) -> MetricsSnapshot:
+    """Publish a tick's values as the latest snapshot."""
+    global _latest
+    with _publish_lock:
+        # Rebase on whatever was published since the builder started
+        if builder._base is not _latest:
+            builder = _rebase(builder, _latest)
+        _latest = builder.build()
+        return _latest
+
+
+def begin_metrics_snapshot() -> SnapshotBuilder:
+    """Start building the next snapshot from the latest one."""
+    return SnapshotBuilder(_latest)
+
+
+def publish_poi_metrics(pois: Iterable[PoiMetric]) -> MetricsSnapshot:
+    """Replace only the POI series of the latest snapshot."""
+    builder = begin_metrics_snapshot()
+    builder.set_pois(pois)
+    return publish_metrics_snapshot(builder)
+
+
+def clear_dish_metrics() -> MetricsSnapshot:
+    """Publish NaN for every dish telemetry gauge and the aircraft position."""
+    builder = begin_metrics_snapshot()
+    for name in DISH_TELEMETRY_GAUGES:
+        builder.set(name, math.nan)
+    builder.position = (math.nan, math.nan, math.nan)
+    return publish_metrics_snapshot(builder)
+
+
+def reset_metrics_snapshot() -> None:
+    """Go back to the initial (all zero) snapshot."""
+    global _latest
+    with _publish_lock:
+        _latest = _initial_snapshot()
+
+
+def _rebase(builder: SnapshotBuilder, base: MetricsSnapshot) -> SnapshotBuilder:
+    rebased = SnapshotBuilder(base)
+    for name, value in builder.gauges.items():
+        if builder._base.gauges.get(name) != value:
+            rebased.gauges[name] = value
+    if builder.position != builder._base.position:
+        rebased.position = builder.position
+    rebased.pois = builder.pois
+    rebased._observations = builder._observations
+    return rebased
+
+
+class SnapshotCollector:
+    """Exports the latest MetricsSnapshot at scrape time."""
+
+    def describe(self) -> Generator[Metric, None, None]:
+        """Metric families without samples, for registry name checks."""
+        yield from self._families(None)
+
+    def collect(self) -> Generator[Metric, None, None]:
+        """Metric families for the latest snapshot."""
+        yield from self._families(_latest)
+
+    @staticmethod
+    def _families(
+        snapshot: Optional[MetricsSnapshot],
+    ) -> Generator[Metric, None, None]:
+        position = GaugeMetricFamily(
+            "starlink_aircraft_position",
+            "Current aircraft position with latitude, longitude, and altitude",
+            labels=["dimension"],
+        )
+        if snapshot is not None:
+            for dimension, value in zip(
+                ("latitude", "longitude", "altitude"), snapshot.position
+            ):
+                position.add_metric([dimension], value)
+        yield position
+
+        for name, documentation in SNAPSHOT_GAUGES.items():
+            if snapshot is None:
+                yield GaugeMetricFamily(name, documentation)
+            else:
+                yield GaugeMetricFamily(
+                    name, documentation, value=snapshot.gauges[name]
+                )
+
+        eta = GaugeMetricFamily(
+            "starlink_eta_poi_seconds",
+            "Estimated time of arrival to point of interest in seconds "
+            "(anticipated or estimated)",
+            labels=POI_LABELS,
+        )
+        distance = GaugeMetricFamily(
+            "starlink_distance_to_poi_meters",
+            "Distance to point of interest in meters",
+            labels=POI_LABELS,
+        )
+        for poi in snapshot.pois if snapshot is not None else ():
+            labels = [poi.name, poi.category, poi.eta_type]
+            distance.add_metric(labels, poi.distance_meters)
+            if poi.eta_seconds is not None:
+                eta.add_metric(labels, poi.eta_seconds)
+        yield eta
+        yield distance
+
+        for name, (documentation, bounds) in SNAPSHOT_HISTOGRAMS.items():
+            family = HistogramMetricFamily(name, documentation, labels=HISTOGRAM_LABELS)
+            if snapshot is not None:
+                for (series_name, labels), series in snapshot.histograms.items():
+                    if series_name != name:
+                        continue
+                    cumulative = 0
+                    buckets = []
+                    for bound, count in zip((*bounds, math.inf), series.counts):
+                        cumulative += count
+                        buckets.append((floatToGoString(bound), cumulative))
+                    family.add_metric(list(labels), buckets, series.total)
+            yield family
+
+
+REGISTRY.register(SnapshotCollector())
@@ -0,0 +1,95 @@
+"""Per-stage timers for the background update tick.
+
+Wrap a step of the tick in ``stage_timer(stage)`` to record its duration in
+``starlink_tick_stage_duration_seconds{stage}``:
+
+    with stage_timer("eta_metrics"):
+        update_eta_metrics(...)
+
+Stages can nest; ``coordinator_update`` includes ``trackers``, for example.
+Timing is on by default and can be turned off with
+``METRICS_STAGE_TIMING=false``; a disabled timer is a shared no-op context
+manager, so the cost is one function call and a flag check per stage.
+"""
+
+import os
+import time
+from contextlib import nullcontext
+from typing import ContextManager, Dict
+
+from app.core.metrics.prometheus_metrics import starlink_tick_stage_duration_seconds
+
+# Stages recorded by the update loop, in tick order
+TICK_STAGES = (
+    "coordinator_update",
+    "trackers",
+    "flight_state",
+    "route_eta_calculator",
+    "eta_metrics",
+    "metrics_publish",
+    "mission_metrics",
+)
+
+_enabled = os.getenv("METRICS_STAGE_TIMING", "true").lower() not in {
+    "0",
+    "false",
+    "no",
+}
+_DISABLED = nullcontext()
+
+
+class _StageTimer:
+    """Context manager observing elapsed time into one stage's histogram."""
+
+    __slots__ = ("_child", "_start")
+
+    def __init__(self, child):
+        self._child = child
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._child.observe(time.perf_counter() - self._start)
+        return False
+
+
+# Histogram children bound once per stage, so timing skips the label lookup
+_children: Dict[str, object] = {
+    stage: starlink_tick_stage_duration_seconds.labels(stage=stage)
+    for stage in TICK_STAGES
+}
+
+
+def stage_timer(stage: str) -> ContextManager:
+    """
+    Time a stage of the update tick.
+
+    Args:
+        stage: Stage name (normally one of TICK_STAGES)
+
+    Returns:
+        Context manager recording the stage duration, or a no-op when timing
+        is disabled
+    """
+    if not _enabled:
+        return _DISABLED
+    child = _children.get(stage)
+    if child is None:
+        child = _children[stage] = starlink_tick_stage_duration_seconds.labels(
+            stage=stage
+        )
+    return _StageTimer(child)
+
+
+def set_stage_timing_enabled(enabled: bool) -> None:
+    """Turn stage timing on or off at runtime."""
+    global _enabled
+    _enabled = enabled
+
+
+def stage_timing_enabled() -> bool:
+    """Whether stage timing is currently recorded."""
+    return _enabled
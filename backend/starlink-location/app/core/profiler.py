@@ -0,0 +1,144 @@
+"""Bounded in-process sampling profiler.
+
+Samples the Python stack of every thread at a fixed interval for a bounded
+duration and aggregates them as collapsed stacks (the input format of
+flamegraph.pl and speedscope): one line per distinct stack, frames root
+first separated by ``;``, followed by the number of samples. The sampler runs
+in its own thread and only reads ``sys._current_frames()``, so the service
+keeps running normally while it is being profiled.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Longest profile a single request may run
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "30"))
+# Shortest allowed sampling interval
+PROFILE_MIN_INTERVAL_SECONDS = 0.001
+# Deeper stacks are truncated at the leaf end
+PROFILE_MAX_DEPTH = 128
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+@dataclass
+class ProfileResult:
+    """Aggregated samples of one profiling run."""
+
+    duration_seconds: float
+    interval_seconds: float
+    samples: int = 0
+    stacks: Counter = field(default_factory=Counter)
+
+    def collapsed(self) -> str:
+        """Collapsed-stack text, most frequent stack first."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{code.co_name}:{code.co_firstlineno}"
+
+
+class SamplingProfiler:
+    """Periodically sample all thread stacks, one profile at a time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        seconds: float,
+        interval_seconds: float = 0.01,
+        include_idle: bool = False,
+    ) -> ProfileResult:
+        """
+        Profile the process for ``seconds``, blocking the calling thread.
+
+        Args:
+            seconds: Profile duration, capped at PROFILE_MAX_SECONDS
+            interval_seconds: Time between samples, at least
+                PROFILE_MIN_INTERVAL_SECONDS
+            include_idle: Also count threads parked in a wait or sleep
+
+        Returns:
+            ProfileResult with the collapsed stacks
+
+        Raises:
+            ProfilerBusyError: If another profile is already running
+        """
+        seconds = min(max(seconds, 0.0), PROFILE_MAX_SECONDS)
+        interval_seconds = max(interval_seconds, PROFILE_MIN_INTERVAL_SECONDS)
+        if not self._lock.acquire(blocking=False):
+            raise ProfilerBusyError("A profile is already running")
+        try:
+            result = ProfileResult(
+                duration_seconds=seconds, interval_seconds=interval_seconds
+            )
+            own_thread = threading.get_ident()
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline:
+                self._sample(result, own_thread, include_idle)
+                time.sleep(interval_seconds)
+            logger.info(
+                f"Profiled {result.samples} samples over {seconds:.1f}s "
+                f"({len(result.stacks)} distinct stacks)"
+            )
+            return result
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _sample(result: ProfileResult, own_thread: int, include_idle: bool) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            labels = []
+            while frame is not None and len(labels) < PROFILE_MAX_DEPTH:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if not labels:
+                continue
+            if not include_idle and _is_idle(labels[0]):
+                continue
+            labels.append(names.get(thread_id, f"thread-{thread_id}"))
+            result.stacks[";".join(reversed(labels))] += 1
+            result.samples += 1
+
+
+# Leaf frames of threads that are waiting rather than working
+_IDLE_LEAVES = (
+    "threading:wait:",
+    "selectors:select:",
+    "queue:get:",
+    "concurrent.futures.thread:_worker:",
+)
+
+
+def _is_idle(leaf: str) -> bool:
+    return leaf.startswith(_IDLE_LEAVES)
+
+
+_profiler: Optional[SamplingProfiler] = None
+
+
+def get_profiler() -> SamplingProfiler:
+    """Get the process-wide sampling profiler."""
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler()
+    return _profiler
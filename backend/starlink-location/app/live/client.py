@@ -1,6 +1,6 @@
 """Starlink gRPC client wrapper for live terminal data collection."""
 
-# FR-004: File exceeds 300 lines (336 lines) because live client handles gRPC
+# FR-004: File exceeds 300 lines (490 lines) because live client handles gRPC
 # protocol data parsing, error handling, status polling, and telemetry extraction.
 # Splitting would fragment the client implementation. Deferred to v0.4.0.
 
@@ -12,8 +12,10 @@ from typing import Dict, Optional, Tuple
 import starlink_grpc
 from grpc import RpcError
 
+from app.live.history import DishHistory, HistorySummary
 from app.models.telemetry import (
     EnvironmentalData,
+    HistoryData,
     NetworkData,
     ObstructionData,
     PositionData,
@@ -34,6 +36,102 @@ def _get_dish_target() -> str:
     return f"{host}:{port}"
 
 
+def telemetry_from_dish_data(
+    status: Dict,
+    obstruction: Dict,
+    location: Dict,
+    timestamp: Optional[datetime] = None,
+    history: Optional[HistorySummary] = None,
+) -> TelemetryData:
+    """Build TelemetryData from starlink_grpc status and location dicts.
+
+    Used for live polling and for replaying captured dish responses.
+
+    Args:
+        status: Status dict from starlink_grpc.status_data
+        obstruction: Obstruction dict from starlink_grpc.status_data
+        location: Location dict from starlink_grpc.location_data
+        timestamp: Sample time (defaults to now)
+        history: Dish history aggregates to attach, if polled
+
+    Returns:
+        TelemetryData with speed and heading left at 0 for the trackers
+
+    Raises:
+        KeyError, TypeError, ValueError: If a value cannot be converted
+    """
+    # Extract position data
+    lat = location.get("latitude")
+    lon = location.get("longitude")
+    alt = location.get("altitude", 0.0)
+
+    # Handle missing GPS data
+    if lat is None or lon is None:
+        logger.warning("GPS location data not available from dish")
+        lat = lat or 0.0
+        lon = lon or 0.0
+
+    # Convert altitude from meters to feet (1 meter = 3.28084 feet)
+    alt_feet = float(alt) * 3.28084 if alt else 0.0
+
+    position = PositionData(
+        latitude=float(lat),
+        longitude=float(lon),
+        altitude=alt_feet,
+        speed=0.0,  # Not available from Starlink API
+        heading=0.0,  # Will be populated by HeadingTracker
+    )
+
+    # Extract network metrics
+    latency_ms = status.get("pop_ping_latency_ms", 0.0)
+    downlink_bps = status.get("downlink_throughput_bps", 0.0)
+    uplink_bps = status.get("uplink_throughput_bps", 0.0)
+    packet_loss = status.get("pop_ping_drop_rate", 0.0) * 100  # Convert to percentage
+
+    network = NetworkData(
+        latency_ms=float(latency_ms),
+        throughput_down_mbps=float(downlink_bps / 1e6),
+        throughput_up_mbps=float(uplink_bps / 1e6),
+        packet_loss_percent=float(packet_loss),
+    )
+
+    # Extract obstruction data
+    obstruction_fraction = obstruction.get("fraction_obstructed", 0.0)
+    obstruction_pct = ObstructionData(
+        obstruction_percent=float(obstruction_fraction * 100)
+    )
+
+    # Extract environmental data
+    uptime = status.get("uptime", 0.0)
+    temp = status.get("temperature_c")  # May not be available
+
+    environmental = EnvironmentalData(
+        signal_quality_percent=100.0,  # Not directly available
+        uptime_seconds=float(uptime),
+        temperature_celsius=float(temp) if temp else None,
+    )
+
+    return TelemetryData(
+        timestamp=timestamp or datetime.now(),
+        position=position,
+        network=network,
+        obstruction=obstruction_pct,
+        environmental=environmental,
+        history=(
+            HistoryData(
+                samples=history.samples,
+                packet_loss_percent=history.ping_drop_rate * 100,
+                latency_ms=history.ping_latency_ms,
+                downlink_bytes=history.downlink_bytes,
+                uplink_bytes=history.uplink_bytes,
+                skipped_samples=history.skipped_samples,
+            )
+            if history is not None
+            else None
+        ),
+    )
+
+
 class StarlinkClient:
     """Wrapper for starlink-grpc-tools library for real-time dish communication.
 
@@ -73,6 +171,9 @@ class StarlinkClient:
         self._connected = False
         self.logger = logger
         self.connect_immediately = connect_immediately
+        # Dish sample counter and rolling ping/usage aggregates
+        self.history = DishHistory()
+        self._last_uptime: Optional[float] = None
 
         # Connect immediately if requested (will raise on failure)
         if connect_immediately:
@@ -286,6 +387,43 @@ class StarlinkClient:
             self.logger.error(f"Failed to get history stats: {e}")
             raise
 
+    def poll_history(self) -> int:
+        """Ingest the history samples written since the last poll.
+
+        Passes the last seen sample counter as ``start`` to
+        ``starlink_grpc.history_bulk_data`` so only new samples are parsed
+        (at most one window's worth after a long gap). A lower counter than
+        last time (reboot or wrap) makes DishHistory rebuild its aggregates.
+
+        Returns:
+            Number of new samples ingested
+
+        Raises:
+            starlink_grpc.GrpcError: If gRPC error occurs
+            RpcError: If low-level gRPC error occurs
+        """
+        if not self.context:
+            self.connect()
+
+        try:
+            general, bulk = starlink_grpc.history_bulk_data(
+                parse_samples=self.history.window_samples,
+                start=self.history.end_counter,
+                context=self.context,
+            )
+        except (starlink_grpc.GrpcError, RpcError) as e:
+            self.logger.error(f"Failed to get history samples: {e}")
+            raise
+        return self.history.ingest(general, bulk)
+
+    def get_history_summary(self) -> HistorySummary:
+        """Get rolling ping drop, latency and usage aggregates.
+
+        Returns:
+            HistorySummary as of the last poll
+        """
+        return self.history.summary()
+
     def get_telemetry(self) -> TelemetryData:
         """Get comprehensive telemetry data from Starlink dish.
 
@@ -307,69 +445,22 @@ class StarlinkClient:
             # Get all required data
             status, obstruction, alerts = self.get_status_data()
             location = self.get_location_data()
-            general, drop, run, latency, loaded, usage, power = self.get_history_stats(
-                parse_samples=10
-            )
-
-            # Extract position data
-            lat = location.get("latitude")
-            lon = location.get("longitude")
-            alt = location.get("altitude", 0.0)
-
-            # Handle missing GPS data
-            if lat is None or lon is None:
-                self.logger.warning("GPS location data not available from dish")
-                lat = lat or 0.0
-                lon = lon or 0.0
-
-            # Convert altitude from meters to feet (1 meter = 3.28084 feet)
-            alt_feet = float(alt) * 3.28084 if alt else 0.0
-
-            position = PositionData(
-                latitude=float(lat),
-                longitude=float(lon),
-                altitude=alt_feet,
-                speed=0.0,  # Not available from Starlink API
-                heading=0.0,  # Will be populated by HeadingTracker
-            )
-
-            # Extract network metrics
-            latency_ms = status.get("pop_ping_latency_ms", 0.0)
-            downlink_bps = status.get("downlink_throughput_bps", 0.0)
-            uplink_bps = status.get("uplink_throughput_bps", 0.0)
-            packet_loss = (
-                status.get("pop_ping_drop_rate", 0.0) * 100
-            )  # Convert to percentage
-
-            network = NetworkData(
-                latency_ms=float(latency_ms),
-                throughput_down_mbps=float(downlink_bps / 1e6),
-                throughput_up_mbps=float(uplink_bps / 1e6),
-                packet_loss_percent=float(packet_loss),
-            )
-
-            # Extract obstruction data
-            obstruction_fraction = obstruction.get("fraction_obstructed", 0.0)
-            obstruction_pct = ObstructionData(
-                obstruction_percent=float(obstruction_fraction * 100)
-            )
-
-            # Extract environmental data
-            uptime = status.get("uptime", 0.0)
-            temp = status.get("temperature_c")  # May not be available
-
-            environmental = EnvironmentalData(
-                signal_quality_percent=100.0,  # Not directly available
-                uptime_seconds=float(uptime),
-                temperature_celsius=float(temp) if temp else None,
-            )
 
-            return TelemetryData(
-                timestamp=datetime.now(),
-                position=position,
-                network=network,
-                obstruction=obstruction_pct,
-                environmental=environmental,
+            # A lower uptime means the dish rebooted since the last poll, even
+            # if its sample counter has already passed the old value again
+            uptime = status.get("uptime")
+            if (
+                uptime is not None
+                and self._last_uptime is not None
+                and uptime < self._last_uptime
+            ):
+                self.logger.info("Dish uptime went backwards; resyncing history")
+                self.history.reset()
+            self._last_uptime = uptime
+            self.poll_history()
+
+            return telemetry_from_dish_data(
+                status, obstruction, location, history=self.history.summary()
             )
 
         except (starlink_grpc.GrpcError, RpcError) as e:
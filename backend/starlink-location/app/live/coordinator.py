@@ -7,6 +7,7 @@ from typing import Optional
 import starlink_grpc
 from grpc import RpcError
 
+from app.core.metrics.stage_timing import stage_timer
 from app.live.client import StarlinkClient
 from app.models.config import SimulationConfig
 from app.models.telemetry import TelemetryData
@@ -122,27 +123,28 @@ class LiveCoordinator:
             Exception: If gRPC communication fails
         """
         # Get comprehensive telemetry from client
-        # This calls status_data, location_data, and history_stats internally
+        # This calls status_data, location_data and history_bulk_data internally
         telemetry = self.client.get_telemetry()
 
-        # Update heading tracker with current position
-        heading = self.heading_tracker.update(
-            latitude=telemetry.position.latitude,
-            longitude=telemetry.position.longitude,
-            timestamp=telemetry.timestamp,
-        )
+        with stage_timer("trackers"):
+            # Update heading tracker with current position
+            heading = self.heading_tracker.update(
+                latitude=telemetry.position.latitude,
+                longitude=telemetry.position.longitude,
+                timestamp=telemetry.timestamp,
+            )
 
-        # Update speed tracker with current position (GPS-based speed calculation)
-        # This replaces the hardcoded 0.0 speed from the API
-        speed = self.speed_tracker.update(
-            latitude=telemetry.position.latitude,
-            longitude=telemetry.position.longitude,
-            timestamp=(
-                telemetry.timestamp.timestamp()
-                if hasattr(telemetry.timestamp, "timestamp")
-                else time.time()
-            ),
-        )
+            # Update speed tracker with current position (GPS-based speed
+            # calculation). This replaces the hardcoded 0.0 speed from the API
+            speed = self.speed_tracker.update(
+                latitude=telemetry.position.latitude,
+                longitude=telemetry.position.longitude,
+                timestamp=(
+                    telemetry.timestamp.timestamp()
+                    if hasattr(telemetry.timestamp, "timestamp")
+                    else time.time()
+                ),
+            )
 
         # Update position with calculated heading and speed
         telemetry.position.heading = heading
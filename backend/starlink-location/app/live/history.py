@@ -0,0 +1,203 @@
+"""Incremental ingestion of the Starlink dish history ring buffer.
+
+The dish keeps one sample per second in a ring buffer and counts every
+sample it has written. ``DishHistory`` remembers the counter of the last
+sample it saw, so each poll only parses the samples written since then
+(``starlink_grpc.history_bulk_data`` with ``start``), and keeps rolling
+aggregates over the most recent ``window_samples`` of them:
+
+- ping drop rate: mean over the window
+- ping latency: mean over the window's samples that were not fully dropped
+- usage: downlink and uplink bytes since the last resync
+
+Usage only adds up the samples that were parsed. When more than
+``window_samples`` samples were written between two polls, the older ones
+are not parsed and their bytes are missing from the totals; the number of
+such samples is reported as ``skipped_samples`` so consumers can tell how
+complete the totals are.
+
+A counter lower than the last one seen means the dish rebooted (the counter
+restarts at 0) or the counter wrapped, so the window and usage totals are
+cleared and rebuilt from the samples the dish still has.
+"""
+
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Samples kept for the rolling aggregates (the dish writes one per second)
+DEFAULT_WINDOW_SAMPLES = 10
+
+# Usage totals are in bytes; throughput samples are bits per second
+_BITS_PER_BYTE = 8.0
+
+
+@dataclass(frozen=True)
+class HistorySummary:
+    """Rolling aggregates over the most recent history samples.
+
+    Attributes:
+        end_counter: Dish counter of the newest sample ingested
+        samples: Samples in the rolling window
+        ping_drop_rate: Mean fraction of pings dropped (0-1)
+        ping_latency_ms: Mean latency of samples with a reply, or None
+        downlink_bytes: Bytes received since the last resync, over the
+            ingested samples only
+        uplink_bytes: Bytes sent since the last resync, over the ingested
+            samples only
+        skipped_samples: Samples since the last resync that were written
+            between polls but never ingested (missing from the byte totals)
+    """
+
+    end_counter: Optional[int]
+    samples: int
+    ping_drop_rate: float
+    ping_latency_ms: Optional[float]
+    downlink_bytes: float
+    uplink_bytes: float
+    skipped_samples: int = 0
+
+
+class DishHistory:
+    """Tracks the dish sample counter and rolling history aggregates."""
+
+    def __init__(self, window_samples: int = DEFAULT_WINDOW_SAMPLES):
+        """
+        Initialize history tracking.
+
+        Args:
+            window_samples: Samples kept for the rolling aggregates
+
+        Raises:
+            ValueError: If window_samples is not positive
+        """
+        if window_samples <= 0:
+            raise ValueError(f"window_samples must be positive: {window_samples}")
+        self.window_samples = window_samples
+        self._end_counter: Optional[int] = None
+        # (drop rate, latency or None) per sample, oldest first
+        self._window: deque[tuple[float, Optional[float]]] = deque(
+            maxlen=window_samples
+        )
+        self._drop_sum = 0.0
+        self._latency_sum = 0.0
+        self._latency_count = 0
+        self._since_resum = 0
+        self._downlink_bytes = 0.0
+        self._uplink_bytes = 0.0
+        self._skipped_samples = 0
+        self.resyncs = 0
+
+    @property
+    def end_counter(self) -> Optional[int]:
+        """Counter of the newest sample ingested, or None before the first."""
+        return self._end_counter
+
+    def reset(self) -> None:
+        """Forget the counter and every aggregate (next poll is a full sync)."""
+        self._end_counter = None
+        self._clear()
+
+    def _clear(self) -> None:
+        self._window.clear()
+        self._drop_sum = 0.0
+        self._latency_sum = 0.0
+        self._latency_count = 0
+        self._since_resum = 0
+        self._downlink_bytes = 0.0
+        self._uplink_bytes = 0.0
+        self._skipped_samples = 0
+
+    def ingest(self, general: Dict, bulk: Dict) -> int:
+        """
+        Add the samples returned by ``history_bulk_data``.
+
+        Args:
+            general: General dict (``samples`` and ``end_counter``)
+            bulk: Bulk dict of per-sample sequences, oldest first
+
+        Returns:
+            Number of new samples ingested
+        """
+        end_counter = general.get("end_counter")
+        if end_counter is None:
+            # History without a counter is unusable; keep what we have
+            return 0
+
+        previous = self._end_counter
+        if previous is not None and end_counter < previous:
+            logger.info(
+                f"Dish history counter went from {previous} to "
+                f"{end_counter} (reboot or wrap); resyncing"
+            )
+            self._clear()
+            self.resyncs += 1
+            # The counter restarted, so every sample up to it is new
+            previous = 0
+        self._end_counter = end_counter
+
+        drops: Sequence = bulk.get("pop_ping_drop_rate") or ()
+        if previous is not None:
+            # Samples written since the last poll beyond what was parsed
+            self._skipped_samples += max(0, end_counter - previous - len(drops))
+        latencies: Sequence = bulk.get("pop_ping_latency_ms") or ()
+        downlinks: Sequence = bulk.get("downlink_throughput_bps") or ()
+        uplinks: Sequence = bulk.get("uplink_throughput_bps") or ()
+
+        for i, drop in enumerate(drops):
+            latency = latencies[i] if i < len(latencies) else None
+            self._add_sample(
+                float(drop),
+                None if latency is None else float(latency),
+            )
+            downlink = downlinks[i] if i < len(downlinks) else None
+            uplink = uplinks[i] if i < len(uplinks) else None
+            if downlink is not None:
+                self._downlink_bytes += downlink / _BITS_PER_BYTE
+            if uplink is not None:
+                self._uplink_bytes += uplink / _BITS_PER_BYTE
+        return len(drops)
+
+    def _add_sample(self, drop: float, latency: Optional[float]) -> None:
+        window = self._window
+        if len(window) == window.maxlen:
+            old_drop, old_latency = window[0]
+            self._drop_sum -= old_drop
+            if old_latency is not None:
+                self._latency_sum -= old_latency
+                self._latency_count -= 1
+        window.append((drop, latency))
+        self._drop_sum += drop
+        if latency is not None:
+            self._latency_sum += latency
+            self._latency_count += 1
+        self._since_resum += 1
+        if self._since_resum >= window.maxlen:
+            # Re-sum once per window so subtraction rounding cannot build up
+            self._drop_sum = math.fsum(d for d, _ in window)
+            self._latency_sum = math.fsum(lat for _, lat in window if lat is not None)
+            self._since_resum = 0
+
+    def summary(self) -> HistorySummary:
+        """
+        Get the current rolling aggregates.
+
+        Returns:
+            HistorySummary (zero drop rate and no latency before any sample)
+        """
+        samples = len(self._window)
+        return HistorySummary(
+            end_counter=self._end_counter,
+            samples=samples,
+            ping_drop_rate=self._drop_sum / samples if samples else 0.0,
+            ping_latency_ms=(
+                self._latency_sum / self._latency_count if self._latency_count else None
+            ),
+            downlink_bytes=self._downlink_bytes,
+            uplink_bytes=self._uplink_bytes,
+            skipped_samples=self._skipped_samples,
+        )
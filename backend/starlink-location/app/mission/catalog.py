@@ -0,0 +1,310 @@
+"""Persistent index of stored missions.
+
+Listing missions and finding the active one used to read and parse every
+mission file. The catalog keeps one small row per mission in a single JSON
+file next to the missions, so these queries read one file whatever the
+number of missions. Rows are written by the storage functions under a file
+lock, in the same critical section as the mission files themselves, and the
+catalog file is replaced atomically. A missing or unreadable catalog is
+rebuilt from the mission files.
+
+Missions copied in or removed by other means are picked up too. The catalog
+also stores a listing of the mission files (names and modification times).
+When the catalog is first loaded, when the missions directory changes, and
+when a lookup misses, that listing is compared with a fresh directory scan
+and only the rows whose files drifted are re-read. Edits that rewrite a file
+in place without touching the directory are not noticed until the next
+scan; ``MissionCatalog.rebuild`` (``rebuild_mission_catalog``) re-reads
+everything.
+
+The catalog has two tables:
+
+- ``legs``: flat single-leg missions (``<id>.json``), saved by save_mission
+- ``missions``: hierarchical missions (``<id>/mission.json`` plus
+  ``<id>/legs/*.json``), saved by save_mission_v2
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from filelock import FileLock
+
+from app.mission.models import Mission, MissionLeg
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILENAME = ".catalog.json"
+CATALOG_VERSION = 1
+CATALOG_TABLES = ("legs", "missions")
+
+Tables = dict[str, dict[str, dict]]
+# Per table, mission ID -> modification stamp of the files defining the row
+Listing = dict[str, dict[str, list[int]]]
+
+
+def leg_entry(mission: MissionLeg, path: Path, checksum: Optional[str]) -> dict:
+    """Catalog row for a flat single-leg mission."""
+    return {
+        "id": mission.id,
+        "name": mission.name,
+        "route_id": mission.route_id,
+        "is_active": mission.is_active,
+        "path": str(path),
+        "updated_at": str(mission.updated_at),
+        "leg_count": 1,
+        "checksum": checksum,
+    }
+
+
+def mission_entry(mission: Mission, path: Path, checksum: Optional[str]) -> dict:
+    """Catalog row for a hierarchical mission.
+
+    Besides the index columns, the row keeps the mission's own metadata
+    (description, created_at, metadata) and leg IDs, which is everything the
+    mission list endpoint returns.
+    """
+    return {
+        "id": mission.id,
+        "name": mission.name,
+        "route_id": None,
+        "is_active": any(leg.is_active for leg in mission.legs),
+        "path": str(path),
+        "updated_at": mission.updated_at.isoformat(),
+        "leg_count": len(mission.legs),
+        "checksum": checksum,
+        "description": mission.description,
+        "created_at": mission.created_at.isoformat(),
+        "metadata": mission.metadata,
+        "leg_ids": sorted(leg.id for leg in mission.legs),
+    }
+
+
+class MissionCatalog:
+    """Catalog file for one missions directory.
+
+    Reads are served from memory while the file is unchanged on disk.
+    """
+
+    def __init__(
+        self,
+        missions_dir: Path,
+        list_files: Callable[[], Listing],
+        load_row: Callable[[str, str], Optional[dict]],
+    ):
+        """Initialize the catalog.
+
+        Args:
+            missions_dir: Directory holding the missions and the catalog
+            list_files: Lists the mission files per table, without reading them
+            load_row: Reads one mission's files into a row, as
+                load_row(table, mission_id); None if it is missing or invalid
+        """
+        self.missions_dir = missions_dir
+        self.path = missions_dir / CATALOG_FILENAME
+        self._list_files = list_files
+        self._load_row = load_row
+        self._file_lock = FileLock(str(missions_dir / ".catalog.lock"), timeout=10)
+        self._lock = threading.RLock()
+        self._tables: Optional[Tables] = None
+        self._files: Listing = {}
+        self._stamp: Optional[tuple[int, int]] = None
+        self._dir_stamp: Optional[int] = None
+
+    def _file_stamp(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _missions_dir_stamp(self) -> Optional[int]:
+        try:
+            return self.missions_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._tables is not None
+            and self._file_stamp() == self._stamp
+            and self._missions_dir_stamp() == self._dir_stamp
+        )
+
+    def _read_file(self) -> Optional[tuple[Tables, Listing]]:
+        try:
+            with open(self.path, "r") as handle:
+                data = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f"Mission catalog {self.path} is unreadable: {exc}")
+            return None
+        if data.get("version") != CATALOG_VERSION:
+            logger.warning(
+                f"Mission catalog {self.path} has version {data.get('version')}, "
+                f"expected {CATALOG_VERSION}"
+            )
+            return None
+        tables = {table: dict(data.get(table, {})) for table in CATALOG_TABLES}
+        files = {table: dict(data.get("files", {}).get(table, {})) for table in tables}
+        return tables, files
+
+    def _write_file(self, tables: Tables, files: Optional[Listing] = None) -> None:
+        files = files if files is not None else self._list_files()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=CATALOG_FILENAME + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as handle:
+                json.dump(
+                    {"version": CATALOG_VERSION, **tables, "files": files},
+                    handle,
+                    default=str,
+                )
+            os.replace(temp_name, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+        self._tables, self._files = tables, files
+        self._stamp = self._file_stamp()
+        self._dir_stamp = self._missions_dir_stamp()
+
+    def _scan(self) -> tuple[Tables, Listing]:
+        """Read every mission file into fresh tables."""
+        files = self._list_files()
+        tables: Tables = {table: {} for table in CATALOG_TABLES}
+        for table in CATALOG_TABLES:
+            for mission_id in sorted(files.get(table, {})):
+                row = self._load_row(table, mission_id)
+                if row is not None:
+                    tables[table][mission_id] = row
+        return tables, files
+
+    def _reconcile(self, tables: Tables, files: Listing) -> bool:
+        """Re-read rows whose files changed since ``files`` (lock held).
+
+        Returns:
+            True if any row was added, updated or removed
+        """
+        current = self._list_files()
+        if current == files:
+            return False
+        changed = 0
+        for table in CATALOG_TABLES:
+            listed = current.get(table, {})
+            known = files.get(table, {})
+            rows = tables[table]
+            for mission_id in [m for m in rows if m not in listed]:
+                del rows[mission_id]
+                changed += 1
+            for mission_id, stamp in listed.items():
+                if mission_id in rows and known.get(mission_id) == stamp:
+                    continue
+                row = self._load_row(table, mission_id)
+                if row is not None:
+                    rows[mission_id] = row
+                elif rows.pop(mission_id, None) is None:
+                    continue
+                changed += 1
+        if changed:
+            logger.info(f"Reindexed {changed} mission(s) changed outside the catalog")
+        self._write_file(tables, current)
+        return True
+
+    def _load(self, reconcile: bool = False) -> Tables:
+        """Current tables, re-read only if the catalog or directory changed.
+
+        Caller holds both locks.
+        """
+        if self._is_fresh() and not reconcile:
+            return self._tables
+        dir_stamp = self._missions_dir_stamp()
+        stamp = self._file_stamp()
+        if self._tables is not None and stamp == self._stamp:
+            # Only the missions directory changed (or a lookup missed)
+            tables, files = self._tables, self._files
+        else:
+            loaded = self._read_file() if stamp is not None else None
+            if loaded is None:
+                tables, files = self._scan()
+                self._write_file(tables, files)
+                logger.info(
+                    f"Rebuilt mission catalog with {len(tables['legs'])} leg "
+                    f"mission(s) and {len(tables['missions'])} mission(s)"
+                )
+                return tables
+            tables, files = loaded
+        # Rows are copied so readers of the previous tables are not disturbed
+        tables = {table: dict(rows) for table, rows in tables.items()}
+        if not self._reconcile(tables, files):
+            self._tables, self._files = tables, files
+            self._stamp, self._dir_stamp = stamp, dir_stamp
+        return self._tables
+
+    def _current(self, reconcile: bool = False) -> Tables:
+        with self._lock:
+            if reconcile or not self._is_fresh():
+                with self._file_lock:
+                    return self._load(reconcile)
+            return self._tables
+
+    def entries(self, table: str) -> list[dict]:
+        """All rows of a table, sorted by mission ID."""
+        rows = self._current()[table]
+        return [dict(rows[mission_id]) for mission_id in sorted(rows)]
+
+    def get(self, table: str, mission_id: str) -> Optional[dict]:
+        """One row of a table, or None.
+
+        A miss re-checks the missions directory, so a mission copied in
+        since the last scan is found.
+        """
+        row = self._current()[table].get(mission_id)
+        if row is None:
+            row = self._current(reconcile=True)[table].get(mission_id)
+        return dict(row) if row is not None else None
+
+    @contextmanager
+    def transaction(self) -> Iterator[Tables]:
+        """Lock the catalog and yield its tables for modification.
+
+        Write the mission files inside the block. The catalog file is
+        rewritten when the block exits normally. If it raises, the catalog
+        file is removed so the next read rebuilds it from the mission files.
+        """
+        with self._lock, self._file_lock:
+            tables = {table: dict(rows) for table, rows in self._load().items()}
+            try:
+                yield tables
+            except BaseException:
+                # Mission files may be half written; rebuild on next read
+                self._invalidate()
+                raise
+            self._write_file(tables)
+
+    def _invalidate(self) -> None:
+        self._tables = self._stamp = self._dir_stamp = None
+        self._files = {}
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def rebuild(self) -> Tables:
+        """Rebuild the catalog from the mission files."""
+        with self._lock, self._file_lock:
+            tables, files = self._scan()
+            self._write_file(tables, files)
+            return tables
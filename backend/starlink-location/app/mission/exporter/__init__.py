@@ -9,55 +9,88 @@ This module is organized into:
 - transport_utils: Transport state and display utilities
 - excel_utils: Excel workbook manipulation utilities
 - pptx_styling: PowerPoint styling and branding utilities
+- pptx_template: Precompiled branded slide template and bulk table filler
 - pptx_builder: Reusable PPTX presentation generation functions
+- artifacts: Export formats, artifacts and errors (no rendering imports)
+- facade: Lazy export entry points and the renderer warm-up hook
 - __main__: Core export generation logic and format handlers
 """
 
 from __future__ import annotations
 
-# Public API - re-export main classes and functions
-from app.mission.exporter.__main__ import (
+import importlib
+from typing import Any
+
+# Public API. Formats, errors and the facade are imported eagerly; everything
+# that needs the plotting or PPTX stack is imported on first attribute access
+# so importing this package (e.g. for the image cache) stays cheap.
+from app.mission.exporter.artifacts import (
     ExportArtifact,
     ExportGenerationError,
     TimelineExportFormat,
+)
+from app.mission.exporter.facade import (
+    exporters_loaded,
     generate_timeline_export,
-    _generate_route_map,
-    _segment_rows,
+    preload_exporters,
 )
 from app.mission.exporter.transport_utils import (
     TRANSPORT_DISPLAY,
     STATE_COLUMNS,
 )
-from app.mission.exporter.pptx_styling import (
-    add_header_bar,
-    add_footer_bar,
-    add_slide_title,
-    add_footer_text,
-    add_content_background,
-    add_status_badge,
-    add_segment_separator,
-    add_logo,
-    BRAND_GOLD,
-    CONTENT_GRAY,
-    STATUS_NOMINAL,
-    STATUS_SOF,
-    STATUS_DEGRADED,
-    STATUS_CRITICAL,
-    TEXT_BLACK,
-    TEXT_WHITE,
-)
-from app.mission.exporter.pptx_builder import (
-    add_mission_slides_to_presentation,
-    add_route_map_slide,
-    add_timeline_table_slides,
-)
 from app.mission.models import Transport  # Re-exported for package module
 
+_MAIN = "app.mission.exporter.__main__"
+_STYLING = "app.mission.exporter.pptx_styling"
+_TEMPLATE = "app.mission.exporter.pptx_template"
+_BUILDER = "app.mission.exporter.pptx_builder"
+
+# Lazily exported name -> defining module
+_LAZY_EXPORTS = {
+    "_generate_route_map": _MAIN,
+    "_segment_rows": _MAIN,
+    "add_header_bar": _STYLING,
+    "add_footer_bar": _STYLING,
+    "add_slide_title": _STYLING,
+    "add_footer_text": _STYLING,
+    "add_content_background": _STYLING,
+    "add_status_badge": _STYLING,
+    "add_segment_separator": _STYLING,
+    "add_logo": _STYLING,
+    "BRAND_GOLD": _STYLING,
+    "CONTENT_GRAY": _STYLING,
+    "STATUS_NOMINAL": _STYLING,
+    "STATUS_SOF": _STYLING,
+    "STATUS_DEGRADED": _STYLING,
+    "STATUS_CRITICAL": _STYLING,
+    "TEXT_BLACK": _STYLING,
+    "TEXT_WHITE": _STYLING,
+    "CellStyle": _TEMPLATE,
+    "SlideTemplate": _TEMPLATE,
+    "add_styled_table": _TEMPLATE,
+    "get_slide_template": _TEMPLATE,
+    "add_mission_slides_to_presentation": _BUILDER,
+    "add_route_map_slide": _BUILDER,
+    "add_timeline_table_slides": _BUILDER,
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "ExportArtifact",
     "ExportGenerationError",
     "TimelineExportFormat",
     "generate_timeline_export",
+    "exporters_loaded",
+    "preload_exporters",
     "_generate_route_map",
     "_segment_rows",
     "TRANSPORT_DISPLAY",
@@ -81,6 +114,11 @@ __all__ = [
     "STATUS_CRITICAL",
     "TEXT_BLACK",
     "TEXT_WHITE",
+    # PPTX template
+    "CellStyle",
+    "SlideTemplate",
+    "add_styled_table",
+    "get_slide_template",
     # PPTX builder functions
     "add_mission_slides_to_presentation",
     "add_route_map_slide",
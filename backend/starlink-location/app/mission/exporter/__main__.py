@@ -20,19 +20,15 @@ import matplotlib
 matplotlib.use("Agg")  # Headless mode for Docker
 import matplotlib.pyplot as plt
 import cartopy.crs as ccrs
-import cartopy.feature as cfeature
-from adjustText import adjust_text
+from matplotlib.collections import LineCollection
 from matplotlib.lines import Line2D
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from enum import Enum
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN
 
 from app.mission.models import (
     Mission,
@@ -42,6 +38,11 @@ from app.mission.models import (
     TimelineStatus,
     Transport,
 )
+from app.mission.exporter.artifacts import (
+    ExportArtifact,
+    ExportGenerationError,
+    TimelineExportFormat,
+)
 from app.mission.exporter.formatting import (
     compose_time_block,
     ensure_timezone,
@@ -59,11 +60,14 @@ from app.mission.exporter.transport_utils import (
     segment_is_x_ku_warning,
     serialize_transport_list,
 )
-from app.mission.exporter.pptx_styling import (
-    add_header_bar,
-    add_footer_bar,
-    add_logo,
+from app.mission.exporter.basemap import draw_basemap, get_basemap_cache
+from app.mission.exporter.image_cache import get_image_cache
+from app.mission.exporter.map_overlays import (
+    RoutePolylines,
+    leader_segments,
+    place_labels,
 )
+from app.mission.exporter.pptx_template import get_slide_template
 from app.services.poi_manager import POIManager
 from app.services.route_manager import RouteManager
 
@@ -72,34 +76,12 @@ logger = logging.getLogger(__name__)
 EASTERN_TZ = ZoneInfo("America/New_York")
 LOGO_PATH = Path(__file__).parent.with_name("assets").joinpath("logo.png")
 
+# Bump when map/chart drawing changes so cached images are not reused
+ROUTE_MAP_RENDER_VERSION = 2
+TIMELINE_CHART_RENDER_VERSION = 1
 
-class ExportGenerationError(RuntimeError):
-    """Raised when timeline export generation fails."""
-
-
-class TimelineExportFormat(str, Enum):
-    """Supported export formats: CSV for data analysis, PPTX for presentations."""
-
-    CSV = "csv"
-    PPTX = "pptx"
-
-    @classmethod
-    def from_string(cls, raw: str) -> "TimelineExportFormat":
-        """Parse user-supplied format strings case-insensitively."""
-        value = (raw or "").strip().lower()
-        try:
-            return cls(value)
-        except ValueError as exc:
-            raise ExportGenerationError(f"Unsupported export format: {raw}") from exc
-
-
-@dataclass(slots=True)
-class ExportArtifact:
-    """Container describing a generated export file."""
-
-    content: bytes
-    media_type: str
-    extension: str
+# zlib level for the 4K route map PNG (1 = fastest; the default 6 is ~2x slower)
+PNG_COMPRESS_LEVEL = 1
 
 
 # Utility functions imported from exporter modules above
@@ -198,41 +180,76 @@ def _segment_at_time(
     return timeline.segments[-1] if timeline.segments else None
 
 
-def _get_detailed_segment_statuses(
-    start_time: datetime, end_time: datetime, timeline: MissionLegTimeline
-) -> list[tuple[datetime, datetime, str]]:
-    if not timeline or not timeline.segments:
-        return [(start_time, end_time, "unknown")]
-
-    intervals = []
-    current_time = start_time
+def _timeline_status_spans(
+    timeline: MissionLegTimeline,
+) -> tuple[
+    list[tuple[datetime, datetime, TimelineSegment]], list[tuple[datetime, datetime]]
+]:
+    """Parse segment and AAR block times once for repeated status lookups.
 
-    # Optimization: Filter relevant segments first
-    relevant_segments = []
-    for seg in timeline.segments:
+    Returns:
+        Tuple of (segments as (start, end, segment) sorted by start,
+        AAR blocks as (start, end))
+    """
+    segments = []
+    for seg in timeline.segments if timeline else ():
         s_start = ensure_timezone(seg.start_time)
         s_end = (
             ensure_timezone(seg.end_time)
             if seg.end_time
             else datetime.max.replace(tzinfo=timezone.utc)
         )
-        if s_end > start_time and s_start < end_time:
-            relevant_segments.append((s_start, s_end, seg))
-
-    # Sort by start time
-    relevant_segments.sort(key=lambda x: x[0])
+        segments.append((s_start, s_end, seg))
+    segments.sort(key=lambda x: x[0])
 
-    # Also check for AAR blocks
     aar_blocks = []
-    if timeline.statistics and "_aar_blocks" in timeline.statistics:
+    if timeline and timeline.statistics and "_aar_blocks" in timeline.statistics:
         for block in timeline.statistics["_aar_blocks"]:
             aar_start_raw = block.get("start")
             aar_end_raw = block.get("end")
             if aar_start_raw and aar_end_raw:
-                aar_start = _parse_iso_timestamp(aar_start_raw)
-                aar_end = _parse_iso_timestamp(aar_end_raw)
-                if aar_end > start_time and aar_start < end_time:
-                    aar_blocks.append((aar_start, aar_end))
+                aar_blocks.append(
+                    (
+                        _parse_iso_timestamp(aar_start_raw),
+                        _parse_iso_timestamp(aar_end_raw),
+                    )
+                )
+    return segments, aar_blocks
+
+
+def _get_detailed_segment_statuses(
+    start_time: datetime,
+    end_time: datetime,
+    timeline: MissionLegTimeline,
+    spans: tuple[list, list] | None = None,
+) -> list[tuple[datetime, datetime, str]]:
+    """Split [start_time, end_time) into runs of one route status.
+
+    Args:
+        start_time: Interval start
+        end_time: Interval end
+        timeline: Timeline whose segments and AAR blocks set the status
+        spans: Result of ``_timeline_status_spans(timeline)``, when the caller
+            looks up many intervals of the same timeline
+
+    Returns:
+        List of (start, end, status) tuples covering the interval
+    """
+    if not timeline or not timeline.segments:
+        return [(start_time, end_time, "unknown")]
+
+    intervals = []
+    current_time = start_time
+
+    segments, all_aar_blocks = spans or _timeline_status_spans(timeline)
+    relevant_segments = [
+        span for span in segments if span[1] > start_time and span[0] < end_time
+    ]
+    aar_blocks = [
+        block
+        for block in all_aar_blocks
+        if block[1] > start_time and block[0] < end_time
+    ]
 
     while current_time < end_time:
         # Find the segment that covers current_time
@@ -330,57 +347,220 @@ def _interpolate_position_at_time(target_time, p1, p2):
     return type("Point", (), {"latitude": lat, "longitude": lon})
 
 
-def _plot_segment_with_idl_handling(ax, lon1, lat1, lon2, lat2, color):
-    """Plot a route segment, splitting at ±180° if it crosses the IDL."""
-    if abs(lon2 - lon1) > 180:
-        d_lon_short_path = 360 - abs(lon1 - lon2)
-
-        if d_lon_short_path == 0:
-            return
-
-        fraction = (180 - abs(lon1)) / d_lon_short_path
-        lat_at_180 = lat1 + (lat2 - lat1) * fraction
-
-        # Segment 1: P1 to Meridian
-        target_lon1 = 180 if lon1 > 0 else -180
-        ax.plot(
-            [lon1, target_lon1],
-            [lat1, lat_at_180],
-            color=color,
-            linewidth=1.5,
-            transform=ccrs.PlateCarree(),
-            zorder=5,
+@dataclass(slots=True)
+class _RouteLabel:
+    """A route map label anchored at a marker."""
+
+    lon: float
+    lat: float
+    text: str
+    fontsize: float
+    pad: float  # bbox padding in points
+    alpha: float  # bbox opacity
+    markersize: float  # marker size in points, kept clear of labels
+
+
+# Gap between a marker and its nearest label candidates, in points
+ROUTE_LABEL_OFFSET_POINTS = 9
+
+
+def _draw_route_labels(fig, ax, labels: list[_RouteLabel], obstacles=()) -> None:
+    """Place route labels with the greedy grid resolver and draw them.
+
+    Labels are measured once, placed next to their markers in display space
+    (avoiding markers, other labels and ``obstacles``), then positioned in
+    axes coordinates. Labels pushed past the innermost ring get a leader
+    arrow back to their marker.
+
+    Args:
+        fig: Figure being rendered
+        ax: Map axes
+        labels: Labels in placement priority order
+        obstacles: Artists (e.g. the legend) labels should not cover
+    """
+    if not labels:
+        return
+
+    renderer = fig.canvas.get_renderer()
+    points_to_pixels = fig.dpi / 72
+    ax.apply_aspect()
+
+    projected = ax.projection.transform_points(
+        ccrs.PlateCarree(),
+        np.array([label.lon for label in labels]),
+        np.array([label.lat for label in labels]),
+    )
+    anchors = ax.transData.transform(projected[:, :2])
+
+    texts = []
+    sizes = []
+    marker_boxes = []
+    for label, (x, y) in zip(labels, anchors):
+        text = ax.text(
+            0,
+            0,
+            label.text,
+            transform=ax.transAxes,
+            ha="left",
+            va="bottom",
+            fontsize=label.fontsize,
+            fontweight="bold",
+            color="#2c3e50",
+            zorder=11,
+            bbox=dict(
+                facecolor="white", alpha=label.alpha, edgecolor="none", pad=label.pad
+            ),
+        )
+        extent = text.get_window_extent(renderer)
+        pad = label.pad * points_to_pixels
+        sizes.append((extent.width + 2 * pad, extent.height + 2 * pad))
+        texts.append(text)
+        half = label.markersize * points_to_pixels / 2
+        marker_boxes.append((x - half, y - half, x + half, y + half))
+
+    placements = place_labels(
+        [tuple(anchor) for anchor in anchors],
+        sizes,
+        tuple(ax.bbox.extents),
+        obstacles=marker_boxes
+        + [tuple(artist.get_window_extent(renderer).extents) for artist in obstacles],
+        offset=ROUTE_LABEL_OFFSET_POINTS * points_to_pixels,
+    )
+
+    to_axes = ax.transAxes.inverted()
+    leaders = []
+    for label, text, (x, y), placement in zip(labels, texts, anchors, placements):
+        x0, y0, x1, y1 = placement.box
+        pad = label.pad * points_to_pixels
+        text.set_position(to_axes.transform((x0 + pad, y0 + pad)))
+        if placement.displaced:
+            # Leader from the nearest point on the label box to the marker
+            edge = (min(max(x, x0), x1), min(max(y, y0), y1))
+            leaders.extend(
+                leader_segments(
+                    edge,
+                    (x, y),
+                    shrink=2 * points_to_pixels,
+                    head_length=4 * points_to_pixels,
+                    head_width=2 * points_to_pixels,
+                )
+            )
+
+    if leaders:
+        ax.add_collection(
+            LineCollection(
+                [to_axes.transform(np.asarray(leader)) for leader in leaders],
+                colors="gray",
+                linewidths=0.5,
+                capstyle="butt",
+                transform=ax.transAxes,
+                zorder=10,
+            ),
+            autolim=False,
         )
 
-        # Segment 2: Meridian to P2
-        target_lon2 = 180 if lon2 > 0 else -180
-        ax.plot(
-            [target_lon2, lon2],
-            [lat_at_180, lat2],
-            color=color,
-            linewidth=1.5,
-            transform=ccrs.PlateCarree(),
-            zorder=5,
+
+def _generate_route_map(
+    timeline: MissionLegTimeline,
+    mission: Mission | None = None,
+    parent_mission_id: str | None = None,
+    route_manager: RouteManager | None = None,
+    poi_manager: POIManager | None = None,
+) -> bytes:
+    """Return the 4K route map PNG, served from the image cache when possible.
+
+    The cache key covers the route geometry, the mission-event POIs drawn,
+    the timeline segments and the rendering parameters, so any change to
+    those inputs renders a fresh map.
+
+    Args:
+        timeline: The mission timeline with segments and timing data
+        mission: The mission object containing route and POI information (optional)
+        parent_mission_id: Parent mission ID when exporting legs from a multi-leg mission (optional)
+        route_manager: RouteManager instance for fetching route data
+        poi_manager: POIManager instance for fetching POI data
+
+    Returns:
+        PNG image as bytes.
+    """
+    payload = _route_map_cache_payload(
+        timeline, mission, parent_mission_id, route_manager, poi_manager
+    )
+    return get_image_cache().get_or_render(
+        "route_map",
+        payload,
+        lambda: _render_route_map(
+            timeline,
+            mission,
+            parent_mission_id=parent_mission_id,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+        ),
+    )
+
+
+def _route_map_cache_payload(
+    timeline: MissionLegTimeline,
+    mission: Mission | None,
+    parent_mission_id: str | None,
+    route_manager: RouteManager | None,
+    poi_manager: POIManager | None,
+) -> dict:
+    """Describe every input that affects the rendered route map."""
+    payload = {
+        "render_version": ROUTE_MAP_RENDER_VERSION,
+        "basemap_style": get_basemap_cache().style.key,
+    }
+    route = (
+        route_manager.get_route(mission.route_id)
+        if mission is not None and mission.route_id and route_manager
+        else None
+    )
+    if route is None:
+        # Rendered as the blank base canvas
+        return payload
+
+    payload["route"] = {
+        "points": [
+            (p.latitude, p.longitude, p.expected_arrival_time) for p in route.points
+        ],
+        "waypoints": [
+            (wp.name, wp.role, wp.latitude, wp.longitude) for wp in route.waypoints
+        ],
+    }
+    payload["segments"] = [
+        segment.model_dump(mode="json") for segment in timeline.segments
+    ]
+    statistics = timeline.statistics if isinstance(timeline.statistics, dict) else {}
+    payload["statistics"] = {
+        name: statistics.get(name)
+        for name in ("critical_seconds", "degraded_seconds", "nominal_seconds")
+    }
+    if poi_manager:
+        effective_mission_id = parent_mission_id if parent_mission_id else mission.id
+        payload["pois"] = sorted(
+            (poi.name, poi.latitude, poi.longitude)
+            for poi in poi_manager.list_pois(
+                route_id=mission.route_id, mission_id=effective_mission_id
+            )
+            if poi.category == "mission-event"
         )
     else:
-        ax.plot(
-            [lon1, lon2],
-            [lat1, lat2],
-            color=color,
-            linewidth=1.5,
-            transform=ccrs.PlateCarree(),
-            zorder=5,
+        transports = getattr(mission, "transports", None)
+        payload["transports"] = (
+            transports.model_dump(mode="json") if transports is not None else None
         )
+    return payload
 
 
-def _generate_route_map(
+def _render_route_map(
     timeline: MissionLegTimeline,
     mission: Mission | None = None,
     parent_mission_id: str | None = None,
     route_manager: RouteManager | None = None,
     poi_manager: POIManager | None = None,
 ) -> bytes:
-    """Generate a 4K PNG image of the route map.
+    """Render a 4K PNG image of the route map.
 
     Current phase: Route line drawing (Phase 9)
     - Output: 3840x2160 pixels @ 300 DPI (16:9 4K)
@@ -634,11 +814,16 @@ def _generate_route_map(
             [extent_west, extent_east, bounds_south, bounds_north], crs=projection
         )
 
-    # Add map features
-    ax.coastlines(resolution="50m", linewidth=0.5, color="#2c3e50")
-    ax.add_feature(cfeature.BORDERS, linewidth=0.5, color="#bdc3c7")
-    ax.add_feature(cfeature.LAND, facecolor="#ecf0f1", edgecolor="none")
-    ax.add_feature(cfeature.OCEAN, facecolor="#d5e8f7", edgecolor="none")
+    # Add map features (coastlines, borders, land, ocean) from cached tiles
+    draw_basemap(
+        ax,
+        central_longitude,
+        bounds_west,
+        bounds_east,
+        bounds_south,
+        bounds_north,
+        pixel_width,
+    )
 
     # Subtle gridlines without labels
     ax.gridlines(
@@ -650,11 +835,18 @@ def _generate_route_map(
     ax.set_xticks([])
     ax.set_yticks([])
 
+    # Labels drawn after the legend so placement can avoid it
+    route_labels: list[_RouteLabel] = []
+
     # Phase 10: Draw route with color-coded segments based on timeline status
     if points:
         # Default to unknown/gray if no timeline data
         default_color = STATUS_COLORS["unknown"]
 
+        # Collect IDL-split pieces into polylines, drawn as one collection
+        route_lines = RoutePolylines()
+        status_spans = _timeline_status_spans(timeline)
+
         # For each route segment (between consecutive waypoints), determine its color
         for i in range(len(points) - 1):
             p1 = points[i]
@@ -693,8 +885,7 @@ def _generate_route_map(
                     else:
                         fallback_color = STATUS_COLORS["nominal"]
 
-                _plot_segment_with_idl_handling(
-                    ax,
+                route_lines.add_segment(
                     p1.longitude,
                     p1.latitude,
                     p2.longitude,
@@ -707,7 +898,9 @@ def _generate_route_map(
             t2 = ensure_timezone(p2.expected_arrival_time)
 
             # Get sub-segments based on status
-            sub_segments = _get_detailed_segment_statuses(t1, t2, timeline)
+            sub_segments = _get_detailed_segment_statuses(
+                t1, t2, timeline, status_spans
+            )
 
             for sub_start, sub_end, status in sub_segments:
                 # Interpolate positions
@@ -716,15 +909,17 @@ def _generate_route_map(
 
                 color = STATUS_COLORS.get(status, default_color)
 
-                # Draw this sub-segment (with IDL handling)
-                _plot_segment_with_idl_handling(
-                    ax, sp1.longitude, sp1.latitude, sp2.longitude, sp2.latitude, color
+                # Add this sub-segment (split at the IDL if it crosses)
+                route_lines.add_segment(
+                    sp1.longitude, sp1.latitude, sp2.longitude, sp2.latitude, color
                 )
 
-            # Add rounded caps for smooth joins (optional, but matplotlib lines usually join well)
-            # For individual segments, we might see gaps if linewidth is large.
-            # Adding a point marker at p1 can help smooth it, but might be overkill.
-            # With linewidth 6, simple plot is usually fine.
+        ax.add_collection(
+            route_lines.to_collection(
+                linewidth=1.5, transform=ccrs.PlateCarree(), zorder=5
+            ),
+            autolim=False,
+        )
 
     # Phase 11: Add POI Markers (Start, End, Waypoints)
     if points:
@@ -919,81 +1114,36 @@ def _generate_route_map(
 
                         current_ka = next_ka
 
-        # 3. Plot Departure Point (Start)
+        # 3. Plot Departure (Start) and Arrival (End) Points
         start_point = points[0]
-        ax.plot(
-            start_point.longitude,
-            start_point.latitude,
-            marker="o",
-            color="#2ecc71",
-            markersize=12,
-            markeredgecolor="white",
-            markeredgewidth=2,
-            transform=ccrs.PlateCarree(),
-            zorder=10,
-        )
-
-        # Collect all labels and marker positions for collision avoidance.
-        # Use geographic coordinates with transform=PlateCarree so adjustText
-        # can properly measure bounding boxes via Cartopy's transform pipeline.
-        label_texts = []
-        marker_x = []
-        marker_y = []
-
-        # Label for Departure
-        label_texts.append(
-            ax.text(
-                start_point.longitude,
-                start_point.latitude,
-                start_label,
+        end_point = points[-1]
+        for point, marker_color in ((start_point, "#2ecc71"), (end_point, "#e74c3c")):
+            ax.plot(
+                point.longitude,
+                point.latitude,
+                marker="o",
+                color=marker_color,
+                markersize=12,
+                markeredgecolor="white",
+                markeredgewidth=2,
                 transform=ccrs.PlateCarree(),
-                fontsize=10,
-                fontweight="bold",
-                color="#2c3e50",
-                zorder=11,
-                bbox=dict(facecolor="white", alpha=0.7, edgecolor="none", pad=1),
+                zorder=10,
             )
-        )
-        marker_x.append(start_point.longitude)
-        marker_y.append(start_point.latitude)
-
-        # 4. Plot Arrival Point (End)
-        end_point = points[-1]
-        ax.plot(
-            end_point.longitude,
-            end_point.latitude,
-            marker="o",
-            color="#e74c3c",
-            markersize=12,
-            markeredgecolor="white",
-            markeredgewidth=2,
-            transform=ccrs.PlateCarree(),
-            zorder=10,
-        )
 
-        # Label for Arrival
-        label_texts.append(
-            ax.text(
-                end_point.longitude,
-                end_point.latitude,
-                end_label,
-                transform=ccrs.PlateCarree(),
-                fontsize=10,
-                fontweight="bold",
-                color="#2c3e50",
-                zorder=11,
-                bbox=dict(facecolor="white", alpha=0.7, edgecolor="none", pad=1),
+        # Departure and arrival labels come first so they win placement
+        for point, text in ((start_point, start_label), (end_point, end_label)):
+            route_labels.append(
+                _RouteLabel(
+                    point.longitude, point.latitude, text, 10, 1, 0.7, markersize=12
+                )
             )
-        )
-        marker_x.append(end_point.longitude)
-        marker_y.append(end_point.latitude)
 
-        # 5. Plot Mission Event POIs
-        for poi in mission_event_pois:
-            # Plot waypoint marker (Blue Diamond)
+        # 4. Plot Mission Event POIs (Blue Diamonds) as a single marker artist
+        if mission_event_pois:
             ax.plot(
-                poi["lon"],
-                poi["lat"],
+                [poi["lon"] for poi in mission_event_pois],
+                [poi["lat"] for poi in mission_event_pois],
+                linestyle="None",
                 marker="D",
                 color="#3498db",
                 markersize=8,
@@ -1003,40 +1153,14 @@ def _generate_route_map(
                 zorder=10,
             )
 
-            # Label with waypoint name
+        # Label with waypoint name
+        for poi in mission_event_pois:
             if poi["label"]:
-                label_texts.append(
-                    ax.text(
-                        poi["lon"],
-                        poi["lat"],
-                        poi["label"],
-                        transform=ccrs.PlateCarree(),
-                        fontsize=8,
-                        fontweight="bold",
-                        color="#2c3e50",
-                        zorder=11,
-                        bbox=dict(
-                            facecolor="white", alpha=0.6, edgecolor="none", pad=0.5
-                        ),
+                route_labels.append(
+                    _RouteLabel(
+                        poi["lon"], poi["lat"], poi["label"], 8, 0.5, 0.6, markersize=8
                     )
                 )
-                marker_x.append(poi["lon"])
-                marker_y.append(poi["lat"])
-
-        # Resolve label overlaps using force-directed repulsion
-        if label_texts:
-            adjust_text(
-                label_texts,
-                x=marker_x,
-                y=marker_y,
-                ax=ax,
-                force_text=(1.0, 1.0),
-                force_points=(1.0, 1.0),
-                expand=(1.3, 1.5),
-                force_explode=(0.3, 1.0),
-                lim=1000,
-                arrowprops=dict(arrowstyle="->", color="gray", lw=0.5),
-            )
 
     # Phase 12: Add legend inset to map
     legend_elements = [
@@ -1093,15 +1217,48 @@ def _generate_route_map(
     # Ensure legend is drawn on top and doesn't extend beyond axes
     legend.set_zorder(100)
 
-    # Save to PNG bytes
+    # Resolve label overlaps (markers and the legend are obstacles)
+    _draw_route_labels(fig, ax, route_labels, obstacles=[legend])
+
+    # Save to PNG bytes. The axes fill the figure, so the canvas is saved
+    # as is; a tight bbox would cost a second full draw for the same image.
     buf = io.BytesIO()
-    plt.savefig(buf, format="png", dpi=dpi, bbox_inches="tight", pad_inches=0)
+    fig.savefig(
+        buf, format="png", dpi=dpi, pil_kwargs={"compress_level": PNG_COMPRESS_LEVEL}
+    )
     plt.close(fig)
     buf.seek(0)
     return buf.read()
 
 
 def _generate_timeline_chart(timeline: MissionLegTimeline) -> bytes:
+    """Return the timeline chart PNG, served from the image cache when possible.
+
+    Args:
+        timeline: The mission timeline with segments containing transport states
+
+    Returns:
+        PNG image as bytes.
+    """
+    payload = {
+        "render_version": TIMELINE_CHART_RENDER_VERSION,
+        "segments": [
+            (
+                segment.start_time,
+                segment.end_time,
+                segment.x_state,
+                segment.ka_state,
+                segment.ku_state,
+            )
+            for segment in timeline.segments
+        ],
+    }
+    return get_image_cache().get_or_render(
+        "timeline_chart", payload, lambda: _render_timeline_chart(timeline)
+    )
+
+
+def _render_timeline_chart(timeline: MissionLegTimeline) -> bytes:
     """Generate a PNG image of a horizontal bar chart showing transport timeline.
 
     Args:
@@ -1416,19 +1573,12 @@ def generate_pptx_export(
     parent_mission_id: str | None = None,
     route_manager: RouteManager | None = None,
     poi_manager: POIManager | None = None,
-    map_cache: dict[str, bytes] | None = None,
 ) -> bytes:
     """Generate a PowerPoint presentation with map and timeline table.
 
     This function has been refactored to use the shared pptx_builder module,
     eliminating code duplication with package/__main__.py::generate_mission_combined_pptx().
-
-    Args:
-        map_cache: Optional cache for generated maps (route_id -> bytes). If provided,
-            will check cache before generating maps and store newly generated maps.
     """
-    from app.mission.exporter.pptx_styling import TEXT_BLACK
-
     # Logo path
     logo_path = Path(__file__).parent.with_name("assets").joinpath("logo.png")
 
@@ -1441,60 +1591,12 @@ def generate_pptx_export(
     # Check if mission is a Mission (has .legs) or MissionLeg (no .legs)
     leg_count = len(mission.legs) if (mission and hasattr(mission, "legs")) else 1
 
-    # Create presentation with standard dimensions
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(5.62)
-
-    # Use a blank layout (usually index 6 in default template)
-    blank_slide_layout = prs.slide_layouts[6]
+    # Branded presentation (standard dimensions, chrome on the slide layouts)
+    template = get_slide_template()
+    prs = template.new_presentation()
 
     # Slide 1: Title Slide
-    title_slide = prs.slides.add_slide(blank_slide_layout)
-
-    # Add header and footer bars first
-    add_header_bar(title_slide, 0, 0, 10, 0.15)
-    add_footer_bar(title_slide, 0, 5.47, 10, 0.15)
-
-    # Add logo on top of header (added after so it appears on top)
-    add_logo(title_slide, logo_path, 0.2, 0.02, 0.6, 0.6)
-
-    # Add mission title
-    title_box = title_slide.shapes.add_textbox(
-        Inches(1.5), Inches(2.0), Inches(7.0), Inches(1.0)
-    )
-    text_frame = title_box.text_frame
-    text_frame.text = mission_name
-
-    paragraph = text_frame.paragraphs[0]
-    paragraph.alignment = PP_ALIGN.CENTER
-    paragraph.font.size = Pt(28)
-    paragraph.font.bold = True
-    paragraph.font.color.rgb = TEXT_BLACK
-
-    # Add mission ID
-    id_box = title_slide.shapes.add_textbox(
-        Inches(1.5), Inches(3.0), Inches(7.0), Inches(0.5)
-    )
-    id_frame = id_box.text_frame
-    id_frame.text = f"Mission ID: {mission_id}"
-
-    id_paragraph = id_frame.paragraphs[0]
-    id_paragraph.alignment = PP_ALIGN.CENTER
-    id_paragraph.font.size = Pt(14)
-    id_paragraph.font.color.rgb = TEXT_BLACK
-
-    # Add leg count and organization
-    info_box = title_slide.shapes.add_textbox(
-        Inches(1.5), Inches(3.5), Inches(7.0), Inches(0.5)
-    )
-    info_frame = info_box.text_frame
-    info_frame.text = f"{leg_count} Leg{'s' if leg_count != 1 else ''} | {organization}"
-
-    info_paragraph = info_frame.paragraphs[0]
-    info_paragraph.alignment = PP_ALIGN.CENTER
-    info_paragraph.font.size = Pt(14)
-    info_paragraph.font.color.rgb = TEXT_BLACK
+    template.add_title_slide(prs, mission_name, mission_id, leg_count, organization)
 
     # Add remaining slides using shared builder (adds directly to prs)
     from app.mission.exporter.pptx_builder import add_mission_slides_to_presentation
@@ -1507,7 +1609,6 @@ def generate_pptx_export(
         route_manager=route_manager,
         poi_manager=poi_manager,
         logo_path=logo_path,
-        map_cache=map_cache,
     )
 
     buffer = io.BytesIO()
@@ -1525,10 +1626,7 @@ def _base_map_canvas() -> bytes:
     ax = fig.add_subplot(111, projection=ccrs.PlateCarree())
     fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
     ax.set_extent([-180, 180, -90, 90], crs=ccrs.PlateCarree())
-    ax.coastlines(resolution="50m", linewidth=0.5, color="#2c3e50")
-    ax.add_feature(cfeature.BORDERS, linewidth=0.5, color="#bdc3c7")
-    ax.add_feature(cfeature.LAND, facecolor="#ecf0f1", edgecolor="none")
-    ax.add_feature(cfeature.OCEAN, facecolor="#d5e8f7", edgecolor="none")
+    draw_basemap(ax, 0.0, -180.0, 180.0, -90.0, 90.0, 3840)
     ax.gridlines(
         draw_labels=False, alpha=0.1, linestyle="-", linewidth=0.3, color="#95a5a6"
     )
@@ -1550,14 +1648,8 @@ def generate_timeline_export(
     parent_mission_id: str | None = None,
     route_manager: RouteManager | None = None,
     poi_manager: POIManager | None = None,
-    map_cache: dict[str, bytes] | None = None,
 ) -> ExportArtifact:
-    """Generate the requested export artifact (CSV or PPTX only).
-
-    Args:
-        map_cache: Optional cache for generated maps (route_id -> bytes). If provided,
-            will check cache before generating maps and store newly generated maps.
-    """
+    """Generate the requested export artifact (CSV or PPTX only)."""
     if export_format is TimelineExportFormat.CSV:
         content = generate_csv_export(timeline, mission)
         return ExportArtifact(content=content, media_type="text/csv", extension="csv")
@@ -1568,7 +1660,6 @@ def generate_timeline_export(
             parent_mission_id=parent_mission_id,
             route_manager=route_manager,
             poi_manager=poi_manager,
-            map_cache=map_cache,
         )
         return ExportArtifact(
             content=content,
@@ -0,0 +1,40 @@
+"""Export formats, artifacts and errors.
+
+Kept free of the rendering stack (matplotlib, cartopy, pandas, python-pptx)
+so API routes can validate formats and handle export errors without loading
+it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class ExportGenerationError(RuntimeError):
+    """Raised when timeline export generation fails."""
+
+
+class TimelineExportFormat(str, Enum):
+    """Supported export formats: CSV for data analysis, PPTX for presentations."""
+
+    CSV = "csv"
+    PPTX = "pptx"
+
+    @classmethod
+    def from_string(cls, raw: str) -> "TimelineExportFormat":
+        """Parse user-supplied format strings case-insensitively."""
+        value = (raw or "").strip().lower()
+        try:
+            return cls(value)
+        except ValueError as exc:
+            raise ExportGenerationError(f"Unsupported export format: {raw}") from exc
+
+
+@dataclass(slots=True)
+class ExportArtifact:
+    """Container describing a generated export file."""
+
+    content: bytes
+    media_type: str
+    extension: str
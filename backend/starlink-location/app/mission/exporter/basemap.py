@@ -0,0 +1,605 @@
+"""Pre-rendered basemap tiles for route map exports.
+
+Rasterizing Natural Earth coastlines, borders, land and ocean at 4K/300 DPI
+dominates route map generation, yet the result only depends on the visible
+region and pixel density. Route maps use equirectangular (PlateCarree)
+projections, so the background is rendered once into a global tile pyramid:
+each zoom level halves the degrees per pixel, and tiles are cached in memory
+and on disk (bounded by evicting the least-recently-used tile files). A map
+request picks the level matching its pixel density,
+mosaics the covering tiles (wrapping across the antimeridian), crops to the
+map bounds and draws the raster under the per-leg route/POI overlay.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+from matplotlib.artist import Artist
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Default under the service's data directory, wherever the process starts
+BASEMAP_TILE_DIR = Path(
+    os.getenv(
+        "BASEMAP_TILE_DIR",
+        str(Path(__file__).resolve().parents[3] / "data" / "basemap_tiles"),
+    )
+)
+BASEMAP_MEMORY_TILES = int(os.getenv("BASEMAP_MEMORY_TILES", "96"))
+BASEMAP_TILE_CACHE_MAX_BYTES = int(
+    os.getenv("BASEMAP_TILE_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+)
+TILE_SIZE = 512
+MAX_LEVEL = 10
+# Accept tiles up to this much coarser than the requested density before
+# moving to the next level (4x the pixels) - the upscaling is imperceptible
+LEVEL_TOLERANCE = 1.25
+# Borders/land/ocean pick their Natural Earth scale from the map extent like
+# cartopy's default features do; tiles use the extent of a reference 4K map
+# drawn at the tile's density so detail matches a directly rendered map
+REFERENCE_MAP_PIXELS = (3840, 2160)
+FEATURE_SCALE_LIMITS = (("50m", 50), ("10m", 15))
+
+
+@dataclass(frozen=True)
+class BasemapStyle:
+    """Visual parameters of the background layers (part of the tile key)."""
+
+    coastline_resolution: str = "50m"
+    feature_scale: Optional[str] = None  # None = adaptive (cartopy default)
+    coastline_color: str = "#2c3e50"
+    coastline_width: float = 0.5
+    border_color: str = "#bdc3c7"
+    border_width: float = 0.5
+    land_color: str = "#ecf0f1"
+    ocean_color: str = "#d5e8f7"
+    dpi: int = 300
+
+    @property
+    def key(self) -> str:
+        """Short digest identifying tiles rendered with this style."""
+        encoded = json.dumps(asdict(self), sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()[:12]
+
+
+DEFAULT_STYLE = BasemapStyle()
+
+# Renders (style, west, east, south, north, width_px, height_px) to an RGB array
+RegionRenderer = Callable[
+    [BasemapStyle, float, float, float, float, int, int], np.ndarray
+]
+
+
+def render_region(
+    style: BasemapStyle,
+    west: float,
+    east: float,
+    south: float,
+    north: float,
+    width_px: int,
+    height_px: int,
+) -> np.ndarray:
+    """Rasterize the background layers for a geographic window with cartopy.
+
+    Longitudes may run past +/-180 (the projection is re-centered on the
+    window); latitudes outside [-90, 90] are left blank.
+
+    Args:
+        style: Layer colors, line widths and Natural Earth scales
+        west, east: Window longitudes in degrees (east > west)
+        south, north: Window latitudes in degrees
+        width_px, height_px: Output raster size
+
+    Returns:
+        uint8 array of shape (height_px, width_px, 3)
+    """
+    import cartopy.crs as ccrs
+    import cartopy.feature as cfeature
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    # Object-oriented figure (no pyplot state) so export threads can render
+    fig = Figure(
+        figsize=(width_px / style.dpi, height_px / style.dpi),
+        dpi=style.dpi,
+        facecolor="white",
+    )
+    canvas = FigureCanvasAgg(fig)
+
+    # Rows beyond the poles stay blank; shrink the axes to the valid band
+    clamped_north = min(north, 90.0)
+    clamped_south = max(south, -90.0)
+    height_deg = north - south
+    bottom = (clamped_south - south) / height_deg
+    top = (clamped_north - south) / height_deg
+
+    degrees_per_pixel = (east - west) / width_px
+    scale = style.feature_scale or cfeature.AdaptiveScaler(
+        "110m", FEATURE_SCALE_LIMITS
+    ).scale_from_extent(
+        [
+            0,
+            degrees_per_pixel * REFERENCE_MAP_PIXELS[0],
+            0,
+            degrees_per_pixel * REFERENCE_MAP_PIXELS[1],
+        ]
+    )
+
+    central_longitude = (west + east) / 2
+    projection = ccrs.PlateCarree(central_longitude=central_longitude)
+    ax = fig.add_axes([0, bottom, 1, top - bottom], projection=projection)
+    ax.set_extent(
+        [
+            west - central_longitude,
+            east - central_longitude,
+            clamped_south,
+            clamped_north,
+        ],
+        crs=projection,
+    )
+    ax.set_aspect("auto")
+    ax.coastlines(
+        resolution=style.coastline_resolution,
+        linewidth=style.coastline_width,
+        color=style.coastline_color,
+    )
+    ax.add_feature(
+        cfeature.BORDERS.with_scale(scale),
+        linewidth=style.border_width,
+        color=style.border_color,
+    )
+    ax.add_feature(
+        cfeature.LAND.with_scale(scale),
+        facecolor=style.land_color,
+        edgecolor="none",
+    )
+    ax.add_feature(
+        cfeature.OCEAN.with_scale(scale),
+        facecolor=style.ocean_color,
+        edgecolor="none",
+    )
+    ax.spines["geo"].set_visible(False)
+    ax.set_xticks([])
+    ax.set_yticks([])
+
+    canvas.draw()
+    rgba = np.asarray(canvas.buffer_rgba())
+    return np.ascontiguousarray(rgba[:height_px, :width_px, :3])
+
+
+class BasemapTileCache:
+    """Global equirectangular tile pyramid with memory and disk layers."""
+
+    def __init__(
+        self,
+        tile_dir: Optional[Path] = None,
+        style: BasemapStyle = DEFAULT_STYLE,
+        tile_size: int = TILE_SIZE,
+        max_memory_tiles: int = BASEMAP_MEMORY_TILES,
+        renderer: Optional[RegionRenderer] = None,
+        max_disk_bytes: int = BASEMAP_TILE_CACHE_MAX_BYTES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            tile_dir: Directory for persisted tiles (None keeps tiles in memory only)
+            style: Background layer style
+            tile_size: Tile edge length in pixels
+            max_memory_tiles: Decoded tiles kept in memory
+            renderer: Region rasterizer (defaults to the cartopy renderer)
+            max_disk_bytes: Size limit of the tile files under ``tile_dir``;
+                0 keeps tiles in memory only
+        """
+        self.tile_dir = tile_dir
+        self.style = style
+        self.tile_size = tile_size
+        self.max_memory_tiles = max_memory_tiles
+        self.renderer = renderer or render_region
+        self.max_disk_bytes = max_disk_bytes
+        self._tiles: OrderedDict[tuple[int, int, int], np.ndarray] = OrderedDict()
+        # Tile files on disk by path, least recently used first (built lazily)
+        self._disk_entries: Optional[OrderedDict[Path, int]] = None
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.disk_evictions = 0
+        self.rendered_tiles = 0
+        self.render_calls = 0
+
+    def degrees_per_pixel(self, level: int) -> float:
+        """Resolution of a pyramid level."""
+        return 360.0 / (self.tile_size * 2**level)
+
+    def level_for(self, degrees_per_pixel: float) -> int:
+        """Pick the coarsest level at least as detailed as the requested density."""
+        if degrees_per_pixel <= 0:
+            return MAX_LEVEL
+        level = math.ceil(
+            math.log2(360.0 / (self.tile_size * degrees_per_pixel * LEVEL_TOLERANCE))
+        )
+        return min(max(level, 0), MAX_LEVEL)
+
+    def compose(
+        self,
+        west: float,
+        east: float,
+        south: float,
+        north: float,
+        degrees_per_pixel: float,
+    ) -> tuple[np.ndarray, tuple[float, float, float, float]]:
+        """Return the background raster covering a geographic window.
+
+        Args:
+            west, east: Window longitudes (may extend past +/-180; east > west)
+            south, north: Window latitudes
+            degrees_per_pixel: Target density of the output map
+
+        Returns:
+            Tuple of (RGB array, (west, east, south, north) extent of the array).
+            The extent covers the window to within one tile pixel.
+        """
+        level = self.level_for(degrees_per_pixel)
+        res = self.degrees_per_pixel(level)
+        span = res * self.tile_size
+        columns = 2**level
+        rows = math.ceil(180.0 / span)
+
+        south = max(south, -90.0)
+        north = min(north, 90.0)
+        x0 = math.floor((west + 180.0) / span)
+        x1 = math.ceil((east + 180.0) / span) - 1
+        y0 = min(max(math.floor((90.0 - north) / span), 0), rows - 1)
+        y1 = min(max(math.ceil((90.0 - south) / span) - 1, y0), rows - 1)
+
+        tiles = self._get_tiles(level, range(x0, x1 + 1), range(y0, y1 + 1))
+        size = self.tile_size
+        mosaic = np.empty(((y1 - y0 + 1) * size, (x1 - x0 + 1) * size, 3), np.uint8)
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                mosaic[
+                    (y - y0) * size : (y - y0 + 1) * size,
+                    (x - x0) * size : (x - x0 + 1) * size,
+                ] = tiles[(x % columns, y)]
+
+        # Crop to whole pixels around the window
+        mosaic_west = -180.0 + x0 * span
+        mosaic_north = 90.0 - y0 * span
+        c0 = max(math.floor((west - mosaic_west) / res), 0)
+        c1 = min(math.ceil((east - mosaic_west) / res), mosaic.shape[1])
+        r0 = max(math.floor((mosaic_north - north) / res), 0)
+        r1 = min(math.ceil((mosaic_north - south) / res), mosaic.shape[0])
+        extent = (
+            mosaic_west + c0 * res,
+            mosaic_west + c1 * res,
+            mosaic_north - r1 * res,
+            mosaic_north - r0 * res,
+        )
+        return mosaic[r0:r1, c0:c1], extent
+
+    def stats(self) -> dict:
+        """Return cache counters."""
+        with self._lock:
+            disk_entries = self._load_disk_index()
+            return {
+                "memory_tiles": len(self._tiles),
+                "memory_hits": self.memory_hits,
+                "disk_tiles": len(disk_entries),
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+                "disk_hits": self.disk_hits,
+                "disk_evictions": self.disk_evictions,
+                "rendered_tiles": self.rendered_tiles,
+                "render_calls": self.render_calls,
+            }
+
+    def clear_memory(self) -> None:
+        """Drop decoded tiles held in memory."""
+        with self._lock:
+            self._tiles.clear()
+
+    def _get_tiles(
+        self, level: int, xs: range, ys: range
+    ) -> dict[tuple[int, int], np.ndarray]:
+        """Fetch tiles from memory or disk, rendering missing ones in batches."""
+        columns = 2**level
+        found: dict[tuple[int, int], np.ndarray] = {}
+        missing_columns: set[int] = set()
+        for x in xs:
+            for y in ys:
+                key = (x % columns, y)
+                if key in found:
+                    continue
+                tile = self._load(level, *key)
+                if tile is None:
+                    missing_columns.add(x)
+                else:
+                    found[key] = tile
+
+        if missing_columns:
+            for start, end in _contiguous_runs(sorted(missing_columns)):
+                found.update(self._render_run(level, start, end, ys))
+        return found
+
+    def _render_run(
+        self, level: int, x_start: int, x_end: int, ys: range
+    ) -> dict[tuple[int, int], np.ndarray]:
+        """Render a block of tiles in one pass and store each tile."""
+        res = self.degrees_per_pixel(level)
+        span = res * self.tile_size
+        size = self.tile_size
+        width = (x_end - x_start + 1) * size
+        height = len(ys) * size
+        raster = self.renderer(
+            self.style,
+            -180.0 + x_start * span,
+            -180.0 + (x_end + 1) * span,
+            90.0 - (ys.stop) * span,
+            90.0 - ys.start * span,
+            width,
+            height,
+        )
+        columns = 2**level
+        tiles = {}
+        for x in range(x_start, x_end + 1):
+            for row, y in enumerate(ys):
+                tile = np.ascontiguousarray(
+                    raster[
+                        row * size : (row + 1) * size,
+                        (x - x_start) * size : (x - x_start + 1) * size,
+                    ]
+                )
+                key = (x % columns, y)
+                tiles[key] = tile
+                self._store(level, *key, tile)
+        with self._lock:
+            self.render_calls += 1
+            self.rendered_tiles += len(tiles)
+        logger.info(
+            f"Rendered {len(tiles)} basemap tiles at level {level} "
+            f"(columns {x_start}-{x_end}, rows {ys.start}-{ys.stop - 1})"
+        )
+        return tiles
+
+    def _tile_path(self, level: int, x: int, y: int) -> Optional[Path]:
+        if self.tile_dir is None or self.max_disk_bytes <= 0:
+            return None
+        return self.tile_dir / self.style.key / str(level) / f"{x}_{y}.png"
+
+    def _load(self, level: int, x: int, y: int) -> Optional[np.ndarray]:
+        key = (level, x, y)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                self.memory_hits += 1
+                return tile
+
+        path = self._tile_path(level, x, y)
+        if path is None or not path.exists():
+            return None
+        try:
+            with Image.open(path) as image:
+                tile = np.asarray(image.convert("RGB"))
+            size = path.stat().st_size
+            os.utime(path)
+        except OSError as e:
+            # Unreadable, or removed by another process's eviction
+            logger.warning(f"Discarding unreadable basemap tile {path}: {e}")
+            with self._lock:
+                self._forget_file(path)
+            return None
+        with self._lock:
+            self.disk_hits += 1
+            # Files written by export worker processes are adopted here
+            self._record_file(path, size)
+        self._remember(key, tile)
+        return tile
+
+    def _store(self, level: int, x: int, y: int, tile: np.ndarray) -> None:
+        self._remember((level, x, y), tile)
+        path = self._tile_path(level, x, y)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            Image.fromarray(tile).save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except OSError as e:
+            logger.warning(f"Failed to persist basemap tile {path}: {e}")
+            return
+        with self._lock:
+            self._record_file(path, size)
+
+    def _record_file(self, path: Path, size: int) -> None:
+        """Mark a tile file most recently used and evict over the size limit.
+
+        Caller holds ``self._lock``.
+        """
+        entries = self._load_disk_index()
+        self._disk_bytes += size - entries.pop(path, 0)
+        entries[path] = size
+        while self._disk_bytes > self.max_disk_bytes and len(entries) > 1:
+            oldest, oldest_size = entries.popitem(last=False)
+            self._disk_bytes -= oldest_size
+            self.disk_evictions += 1
+            try:
+                oldest.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _forget_file(self, path: Path) -> None:
+        """Drop a tile file from the index (caller holds ``self._lock``)."""
+        entries = self._load_disk_index()
+        if path in entries:
+            self._disk_bytes -= entries.pop(path)
+
+    def _load_disk_index(self) -> OrderedDict[Path, int]:
+        """Build the LRU index from tile files on disk (oldest mtime first), once.
+
+        Caller holds ``self._lock``. Every style's tiles under ``tile_dir``
+        count towards the limit.
+        """
+        if self._disk_entries is None:
+            self._disk_entries = OrderedDict()
+            self._disk_bytes = 0
+            if self.tile_dir is not None and self.tile_dir.is_dir():
+                files = []
+                for path in self.tile_dir.rglob("*.png"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, path, stat.st_size))
+                for _, path, size in sorted(files):
+                    self._disk_entries[path] = size
+                    self._disk_bytes += size
+        return self._disk_entries
+
+    def _remember(self, key: tuple[int, int, int], tile: np.ndarray) -> None:
+        with self._lock:
+            self._tiles[key] = tile
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > self.max_memory_tiles:
+                self._tiles.popitem(last=False)
+
+
+def _contiguous_runs(values: list[int]) -> list[tuple[int, int]]:
+    """Group sorted integers into (start, end) runs of consecutive values."""
+    runs: list[tuple[int, int]] = []
+    for value in values:
+        if runs and value == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], value)
+        else:
+            runs.append((value, value))
+    return runs
+
+
+class BasemapArtist(Artist):
+    """Blits a pre-rendered background raster into the axes bounding box.
+
+    The raster is resized to the axes' pixel size once and reused by every
+    subsequent draw (tight-bbox saving and label placement redraw the figure
+    several times), avoiding matplotlib's per-draw image resampling.
+    """
+
+    def __init__(
+        self,
+        image: np.ndarray,
+        extent: tuple[float, float, float, float],
+    ):
+        """Initialize the artist.
+
+        Args:
+            image: RGB raster (north-up)
+            extent: (west, east, south, north) of the raster in axes data coords
+        """
+        super().__init__()
+        self.image = Image.fromarray(image)
+        self.extent = extent
+        self.set_zorder(0)
+        self._cached_key: Optional[tuple] = None
+        self._cached_pixels: Optional[np.ndarray] = None
+
+    def _pixels_for(self, width: int, height: int, view: tuple) -> np.ndarray:
+        key = (width, height, view)
+        if key != self._cached_key:
+            west, east, south, north = self.extent
+            res_x = (east - west) / self.image.width
+            res_y = (north - south) / self.image.height
+            box = (
+                (view[0] - west) / res_x,
+                (north - view[3]) / res_y,
+                (view[1] - west) / res_x,
+                (north - view[2]) / res_y,
+            )
+            resized = self.image.resize(
+                (width, height), Image.Resampling.LANCZOS, box=box
+            ).convert("RGBA")
+            # Agg expects rows bottom-up
+            self._cached_pixels = np.ascontiguousarray(np.asarray(resized)[::-1])
+            self._cached_key = key
+        return self._cached_pixels
+
+    def draw(self, renderer) -> None:
+        """Draw the raster filling the axes bounding box."""
+        if not self.get_visible() or self.axes is None:
+            return
+        bbox = self.axes.bbox
+        width, height = round(bbox.width), round(bbox.height)
+        if width <= 0 or height <= 0:
+            return
+        x0, x1 = self.axes.get_xlim()
+        y0, y1 = self.axes.get_ylim()
+        pixels = self._pixels_for(width, height, (x0, x1, y0, y1))
+        gc = renderer.new_gc()
+        gc.set_clip_rectangle(bbox)
+        renderer.draw_image(gc, round(bbox.x0), round(bbox.y0), pixels)
+        gc.restore()
+
+
+def draw_basemap(
+    ax,
+    central_longitude: float,
+    west: float,
+    east: float,
+    south: float,
+    north: float,
+    pixel_width: int,
+    cache: Optional[BasemapTileCache] = None,
+) -> BasemapArtist:
+    """Draw the cached background raster on a PlateCarree map axes.
+
+    The axes extent is unchanged; the raster sits below every overlay.
+
+    Args:
+        ax: Cartopy GeoAxes using PlateCarree(central_longitude)
+        central_longitude: Projection center of the axes
+        west, east, south, north: Geographic map bounds (east > west)
+        pixel_width: Rendered map width in pixels (sets the tile level)
+        cache: Tile cache (defaults to the process-wide cache)
+
+    Returns:
+        The artist added to the axes
+    """
+    cache = cache or get_basemap_cache()
+    image, (img_west, img_east, img_south, img_north) = cache.compose(
+        west, east, south, north, (east - west) / pixel_width
+    )
+
+    # Bounds may be in 0-360 space while the center is in -180..180
+    wrap = 360.0 * round(((img_west + img_east) / 2 - central_longitude) / 360.0)
+    x_west = img_west - central_longitude - wrap
+
+    artist = BasemapArtist(
+        image, (x_west, x_west + (img_east - img_west), img_south, img_north)
+    )
+    ax.add_artist(artist)
+    return artist
+
+
+_basemap_cache: Optional[BasemapTileCache] = None
+_basemap_cache_lock = threading.Lock()
+
+
+def get_basemap_cache() -> BasemapTileCache:
+    """Return the process-wide basemap tile cache."""
+    global _basemap_cache
+    with _basemap_cache_lock:
+        if _basemap_cache is None:
+            _basemap_cache = BasemapTileCache(tile_dir=BASEMAP_TILE_DIR)
+        return _basemap_cache
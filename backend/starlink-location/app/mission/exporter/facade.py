@@ -0,0 +1,75 @@
+"""Lazy entry points into the export renderer.
+
+The renderer (``__main__``, ``pptx_builder``) pulls in matplotlib, cartopy,
+pandas and python-pptx, which take seconds and hundreds of MB to import.
+Only exports need them, so callers go through this module and the renderer
+is imported on the first export. ``preload_exporters`` imports it ahead of
+time (the service runs it off the event loop at startup when
+``EXPORT_PRELOAD`` is set).
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from app.mission.exporter.artifacts import ExportArtifact, TimelineExportFormat
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
+    from app.mission.models import Mission, MissionLegTimeline
+    from app.services.poi_manager import POIManager
+    from app.services.route_manager import RouteManager
+
+logger = logging.getLogger(__name__)
+
+# Modules that import the plotting and document stack
+RENDERER_MODULES = (
+    "app.mission.exporter.__main__",
+    "app.mission.exporter.pptx_builder",
+)
+
+
+def generate_timeline_export(
+    export_format: TimelineExportFormat,
+    mission: "Mission",
+    timeline: "MissionLegTimeline",
+    parent_mission_id: str | None = None,
+    route_manager: "RouteManager | None" = None,
+    poi_manager: "POIManager | None" = None,
+) -> ExportArtifact:
+    """Generate the requested export artifact, loading the renderer if needed."""
+    from app.mission.exporter.__main__ import generate_timeline_export as generate
+
+    return generate(
+        export_format,
+        mission,
+        timeline,
+        parent_mission_id=parent_mission_id,
+        route_manager=route_manager,
+        poi_manager=poi_manager,
+    )
+
+
+def exporters_loaded() -> bool:
+    """Whether the renderer modules have been imported in this process."""
+    return all(name in sys.modules for name in RENDERER_MODULES)
+
+
+def preload_exporters() -> float:
+    """
+    Import the renderer modules so the first export does not pay for it.
+
+    Returns:
+        Seconds spent importing (0 if they were already loaded)
+    """
+    if exporters_loaded():
+        return 0.0
+    start = time.perf_counter()
+    for name in RENDERER_MODULES:
+        importlib.import_module(name)
+    elapsed = time.perf_counter() - start
+    logger.info(f"Export renderer preloaded in {elapsed:.2f}s")
+    return elapsed
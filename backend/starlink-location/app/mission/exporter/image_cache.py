@@ -0,0 +1,210 @@
+"""Persistent, content-addressed cache for rendered export images.
+
+Route maps and timeline charts are deterministic functions of their inputs:
+route geometry, the mission-event POIs drawn, timeline segments and the
+rendering parameters. Each render is keyed by a digest of those inputs and
+stored as a PNG on disk, so repeat exports, previews and PPTX downloads of an
+unchanged mission skip matplotlib entirely, while any input change produces a
+new key instead of a stale image. Disk usage is bounded by evicting the
+least-recently-used images.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from app.mission.timeline_builder.incremental import digest_payload
+
+logger = logging.getLogger(__name__)
+
+EXPORT_IMAGE_CACHE_DIR = Path(
+    os.getenv("EXPORT_IMAGE_CACHE_DIR", "data/export_image_cache")
+)
+EXPORT_IMAGE_CACHE_MAX_BYTES = int(
+    os.getenv("EXPORT_IMAGE_CACHE_MAX_BYTES", str(512 * 1024 * 1024))
+)
+
+
+class RenderedImageCache:
+    """Size-bounded LRU cache of rendered PNG images on disk.
+
+    Entries are files named ``<kind>-<digest>.png``. Recency is tracked in
+    memory and mirrored into file mtimes so LRU order survives restarts.
+    Several processes (API server, export workers) may share a directory;
+    each adopts files the others wrote when it reads them.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cached images (created on first write)
+            max_bytes: Total size limit; 0 disables caching
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] | None = None
+        self._total_bytes = 0
+        self._hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether images are cached at all."""
+        return self.max_bytes > 0
+
+    def get_or_render(
+        self, kind: str, payload: Any, render: Callable[[], bytes]
+    ) -> bytes:
+        """Return the cached image for ``payload`` or render and store it.
+
+        Args:
+            kind: Image kind (e.g. "route_map"); part of the file name and metrics
+            payload: JSON-serializable description of every rendering input
+            render: Produces the PNG bytes on a miss
+
+        Returns:
+            PNG image bytes
+        """
+        key = digest_payload(payload)
+        image = self.get(kind, key)
+        if image is not None:
+            return image
+        image = render()
+        self.put(kind, key, image)
+        return image
+
+    def get(self, kind: str, key: str) -> Optional[bytes]:
+        """Return a cached image and mark it most recently used."""
+        if not self.enabled:
+            return None
+        name = self._entry_name(kind, key)
+        path = self.cache_dir / name
+        with self._lock:
+            entries = self._load_index()
+            try:
+                # Files written by export worker processes are adopted here
+                image = path.read_bytes()
+                os.utime(path)
+            except OSError:
+                # Never cached, or removed by another process's eviction
+                if name in entries:
+                    self._total_bytes -= entries.pop(name)
+            else:
+                self._total_bytes += len(image) - entries.pop(name, 0)
+                entries[name] = len(image)
+                self._hits[kind] = self._hits.get(kind, 0) + 1
+                return image
+            self._misses[kind] = self._misses.get(kind, 0) + 1
+            return None
+
+    def put(self, kind: str, key: str, image: bytes) -> None:
+        """Store an image, evicting least-recently-used entries over the limit."""
+        if not self.enabled or len(image) > self.max_bytes:
+            return
+        name = self._entry_name(kind, key)
+        with self._lock:
+            entries = self._load_index()
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(image)
+                os.replace(tmp_name, self.cache_dir / name)
+            except OSError as e:
+                logger.warning(f"Failed to cache rendered image {name}: {e}")
+                return
+
+            self._total_bytes += len(image) - entries.pop(name, 0)
+            entries[name] = len(image)
+            while self._total_bytes > self.max_bytes and len(entries) > 1:
+                oldest, size = entries.popitem(last=False)
+                self._total_bytes -= size
+                self._evictions += 1
+                try:
+                    (self.cache_dir / oldest).unlink()
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict:
+        """Return hit/miss counters per image kind and disk usage."""
+        with self._lock:
+            entries = self._load_index()
+            hits = sum(self._hits.values())
+            misses = sum(self._misses.values())
+            return {
+                "enabled": self.enabled,
+                "entries": len(entries),
+                "bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                "evictions": self._evictions,
+                "by_kind": {
+                    kind: {
+                        "hits": self._hits.get(kind, 0),
+                        "misses": self._misses.get(kind, 0),
+                    }
+                    for kind in sorted(set(self._hits) | set(self._misses))
+                },
+            }
+
+    def clear(self) -> None:
+        """Delete every cached image and reset counters."""
+        with self._lock:
+            for path in self.cache_dir.glob("*.png"):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._entries = OrderedDict()
+            self._total_bytes = 0
+            self._hits.clear()
+            self._misses.clear()
+            self._evictions = 0
+
+    @staticmethod
+    def _entry_name(kind: str, key: str) -> str:
+        return f"{kind}-{key}.png"
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        """Build the LRU index from files on disk (oldest mtime first), once."""
+        if self._entries is None:
+            self._entries = OrderedDict()
+            self._total_bytes = 0
+            if self.cache_dir.is_dir():
+                files = []
+                for path in self.cache_dir.glob("*.png"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, path.name, stat.st_size))
+                for _, name, size in sorted(files):
+                    self._entries[name] = size
+                    self._total_bytes += size
+        return self._entries
+
+
+_image_cache: Optional[RenderedImageCache] = None
+_image_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> RenderedImageCache:
+    """Return the process-wide rendered image cache."""
+    global _image_cache
+    with _image_cache_lock:
+        if _image_cache is None:
+            _image_cache = RenderedImageCache(
+                EXPORT_IMAGE_CACHE_DIR, EXPORT_IMAGE_CACHE_MAX_BYTES
+            )
+        return _image_cache
@@ -0,0 +1,320 @@
+"""Route and label overlays for export route maps.
+
+Route maps used to draw every timeline sub-segment as its own ``Line2D``
+(each projected and rasterized separately) and resolve label overlaps with
+``adjustText``, whose force-directed iterations grow quadratically with the
+number of POI labels. This module provides the vector-first replacements:
+
+- RoutePolylines splits the route at the International Date Line once and
+  merges consecutive same-colored pieces into polylines, drawn as a single
+  ``LineCollection`` so Agg rasterizes the whole route in one draw call.
+- place_labels positions labels greedily around their anchors, checking
+  collisions through a uniform grid so each placement only inspects nearby
+  boxes, and stops searching once its time budget is spent.
+- leader_segments builds leader arrows as plain polylines so they too are
+  drawn as one collection instead of an annotation per label.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+logger = logging.getLogger(__name__)
+
+ROUTE_LABEL_BUDGET_SECONDS = float(os.getenv("ROUTE_LABEL_BUDGET_SECONDS", "0.25"))
+
+Point = tuple[float, float]
+Box = tuple[float, float, float, float]  # x0, y0, x1, y1 in display pixels
+
+# Candidate directions around an anchor, in preference order
+_DIRECTIONS = (
+    (1, 1),
+    (1, -1),
+    (-1, 1),
+    (-1, -1),
+    (1, 0),
+    (-1, 0),
+    (0, 1),
+    (0, -1),
+)
+_DIAGONAL = 0.7071
+
+
+def split_at_idl(lon1: float, lat1: float, lon2: float, lat2: float) -> list[tuple]:
+    """Split a segment at ±180° if it crosses the International Date Line.
+
+    Args:
+        lon1, lat1: Segment start
+        lon2, lat2: Segment end
+
+    Returns:
+        One or two ((lon, lat), (lon, lat)) pieces; empty for a degenerate
+        crossing
+    """
+    if abs(lon2 - lon1) <= 180:
+        return [((lon1, lat1), (lon2, lat2))]
+
+    d_lon_short_path = 360 - abs(lon1 - lon2)
+    if d_lon_short_path == 0:
+        return []
+
+    fraction = (180 - abs(lon1)) / d_lon_short_path
+    lat_at_180 = lat1 + (lat2 - lat1) * fraction
+    target_lon1 = 180 if lon1 > 0 else -180
+    target_lon2 = 180 if lon2 > 0 else -180
+    return [
+        ((lon1, lat1), (target_lon1, lat_at_180)),
+        ((target_lon2, lat_at_180), (lon2, lat2)),
+    ]
+
+
+class RoutePolylines:
+    """Colored route pieces merged into IDL-safe polylines."""
+
+    def __init__(self):
+        self._lines: list[list[Point]] = []
+        self._colors: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def add_segment(
+        self, lon1: float, lat1: float, lon2: float, lat2: float, color: str
+    ) -> None:
+        """Append a segment, extending the current polyline when contiguous."""
+        for start, end in split_at_idl(lon1, lat1, lon2, lat2):
+            line = self._lines[-1] if self._lines else None
+            if line and self._colors[-1] == color and line[-1] == start:
+                line.append(end)
+            else:
+                self._lines.append([start, end])
+                self._colors.append(color)
+
+    def to_collection(self, **kwargs) -> LineCollection:
+        """Return all polylines as one LineCollection.
+
+        Args:
+            **kwargs: Collection properties (transform, linewidth, zorder, ...)
+        """
+        # Match Line2D's default solid cap and join styles
+        kwargs.setdefault("capstyle", "projecting")
+        kwargs.setdefault("joinstyle", "round")
+        return LineCollection(
+            [np.asarray(line, dtype=float) for line in self._lines],
+            colors=self._colors,
+            **kwargs,
+        )
+
+
+@dataclass(frozen=True)
+class LabelPlacement:
+    """Where a label box was placed.
+
+    Attributes:
+        box: Label box (x0, y0, x1, y1) in display pixels
+        displaced: Placed beyond the innermost ring (draw a leader line)
+    """
+
+    box: Box
+    displaced: bool
+
+
+class _BoxGrid:
+    """Uniform grid of occupied boxes for near-constant-time overlap queries."""
+
+    def __init__(self, cell_size: float):
+        self.cell_size = max(cell_size, 1.0)
+        self._cells: dict[tuple[int, int], list[Box]] = {}
+
+    def _cell_range(self, box: Box):
+        size = self.cell_size
+        for i in range(int(box[0] // size), int(box[2] // size) + 1):
+            for j in range(int(box[1] // size), int(box[3] // size) + 1):
+                yield i, j
+
+    def insert(self, box: Box) -> None:
+        for cell in self._cell_range(box):
+            self._cells.setdefault(cell, []).append(box)
+
+    def collides(self, box: Box) -> bool:
+        return any(
+            _intersects(box, other)
+            for cell in self._cell_range(box)
+            for other in self._cells.get(cell, ())
+        )
+
+    def overlaps(self, box: Box, limit: int) -> int:
+        """Count distinct boxes overlapping ``box``, stopping at ``limit``."""
+        seen: set[Box] = set()
+        for cell in self._cell_range(box):
+            for other in self._cells.get(cell, ()):
+                if other not in seen and _intersects(box, other):
+                    seen.add(other)
+                    if len(seen) >= limit:
+                        return limit
+        return len(seen)
+
+
+def _intersects(a: Box, b: Box) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _inside(box: Box, bounds: Box) -> bool:
+    return (
+        box[0] >= bounds[0]
+        and box[1] >= bounds[1]
+        and box[2] <= bounds[2]
+        and box[3] <= bounds[3]
+    )
+
+
+def _candidates(
+    anchor: Point, size: Point, offset: float, rings: int
+) -> list[tuple[Box, int]]:
+    """Boxes around ``anchor``, nearest ring first, with their ring index."""
+    x, y = anchor
+    width, height = size
+    step = height * 1.5
+    boxes = []
+    for ring in range(rings):
+        distance = offset + ring * step
+        for ux, uy in _DIRECTIONS:
+            scale = distance * (_DIAGONAL if ux and uy else 1.0)
+            x0 = x + ux * scale - (width if ux < 0 else width / 2 if ux == 0 else 0)
+            y0 = y + uy * scale - (height if uy < 0 else height / 2 if uy == 0 else 0)
+            boxes.append(((x0, y0, x0 + width, y0 + height), ring))
+    return boxes
+
+
+def _clamp(box: Box, bounds: Box) -> Box:
+    width, height = box[2] - box[0], box[3] - box[1]
+    x0 = min(max(box[0], bounds[0]), bounds[2] - width)
+    y0 = min(max(box[1], bounds[1]), bounds[3] - height)
+    return (x0, y0, x0 + width, y0 + height)
+
+
+def leader_segments(
+    start: Point,
+    end: Point,
+    shrink: float,
+    head_length: float,
+    head_width: float,
+) -> list[list[Point]]:
+    """Shaft and open arrowhead of a leader line pointing from start to end.
+
+    Mirrors the geometry of a ``->`` arrow annotation so all leaders can be
+    drawn together as one LineCollection.
+
+    Args:
+        start: Tail point (on the label box)
+        end: Head point (the marker)
+        shrink: Gap kept at both ends
+        head_length: Arrowhead length along the shaft
+        head_width: Arrowhead half-width
+
+    Returns:
+        Shaft and head polylines; empty if the ends are too close
+    """
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length = float(np.hypot(dx, dy))
+    if length <= 2 * shrink:
+        return []
+    ux, uy = dx / length, dy / length
+    tail = (start[0] + ux * shrink, start[1] + uy * shrink)
+    tip = (end[0] - ux * shrink, end[1] - uy * shrink)
+    back = (tip[0] - ux * head_length, tip[1] - uy * head_length)
+    head = [
+        (back[0] - uy * head_width, back[1] + ux * head_width),
+        tip,
+        (back[0] + uy * head_width, back[1] - ux * head_width),
+    ]
+    return [[tail, tip], head]
+
+
+def place_labels(
+    anchors: Sequence[Point],
+    sizes: Sequence[Point],
+    bounds: Box,
+    obstacles: Sequence[Box] = (),
+    offset: float = 10.0,
+    rings: int = 6,
+    budget_seconds: Optional[float] = None,
+) -> list[LabelPlacement]:
+    """Place label boxes next to their anchors without overlapping.
+
+    Labels are placed in the order given (put the most important first).
+    Each takes the nearest candidate position that is inside ``bounds`` and
+    free of already placed labels and obstacles; if none is free, the
+    candidate with the fewest overlaps. Once ``budget_seconds`` is spent the
+    remaining labels take their nearest in-bounds candidate unchecked.
+
+    Args:
+        anchors: Anchor points in display pixels
+        sizes: (width, height) of each label box in display pixels
+        bounds: Area labels must stay inside
+        obstacles: Boxes labels should avoid (markers, legend)
+        offset: Distance from anchor to the innermost ring of candidates
+        rings: Number of candidate rings around each anchor
+        budget_seconds: Search time budget (ROUTE_LABEL_BUDGET_SECONDS)
+
+    Returns:
+        One placement per anchor, in input order
+    """
+    if budget_seconds is None:
+        budget_seconds = ROUTE_LABEL_BUDGET_SECONDS
+    if not anchors:
+        return []
+
+    grid = _BoxGrid(float(np.median([height for _, height in sizes])) * 2)
+    for obstacle in obstacles:
+        grid.insert(obstacle)
+
+    deadline = time.perf_counter() + budget_seconds
+    placements = []
+    unchecked = 0
+    for anchor, size in zip(anchors, sizes):
+        candidates = [
+            (box, ring)
+            for box, ring in _candidates(anchor, size, offset, rings)
+            if _inside(box, bounds)
+        ]
+        if not candidates:
+            box, ring = _candidates(anchor, size, offset, 1)[0]
+            candidates = [(_clamp(box, bounds), ring)]
+
+        if time.perf_counter() > deadline:
+            best = candidates[0]
+            unchecked += 1
+        else:
+            best = next(
+                (
+                    candidate
+                    for candidate in candidates
+                    if not grid.collides(candidate[0])
+                ),
+                None,
+            )
+            if best is None:
+                # Every candidate collides: take the least crowded one
+                fewest = len(anchors) + len(obstacles) + 1
+                for candidate in candidates:
+                    count = grid.overlaps(candidate[0], fewest)
+                    if count < fewest:
+                        best, fewest = candidate, count
+
+        grid.insert(best[0])
+        placements.append(LabelPlacement(box=best[0], displaced=best[1] > 0))
+
+    if unchecked:
+        logger.warning(
+            f"Label placement budget of {budget_seconds:.2f}s exhausted; "
+            f"{unchecked} of {len(anchors)} labels placed without collision checks"
+        )
+    return placements
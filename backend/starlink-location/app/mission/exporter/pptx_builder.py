@@ -19,9 +19,7 @@ from typing import TYPE_CHECKING
 
 import pandas as pd
 from pptx import Presentation
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
-from pptx.util import Inches, Pt
+from pptx.util import Inches
 
 from app.mission.exporter.formatting import mission_start_timestamp
 from app.mission.exporter.pptx_styling import (
@@ -29,12 +27,11 @@ from app.mission.exporter.pptx_styling import (
     STATUS_DEGRADED,
     STATUS_NOMINAL,
     STATUS_SOF,
-    TEXT_WHITE,
-    add_footer_bar,
-    add_footer_text,
-    add_header_bar,
-    add_logo,
-    add_slide_title,
+)
+from app.mission.exporter.pptx_template import (
+    CellStyle,
+    add_styled_table,
+    get_slide_template,
 )
 from app.mission.exporter.transport_utils import STATE_COLUMNS, TRANSPORT_DISPLAY
 from app.mission.models import Transport
@@ -48,6 +45,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Timeline table column weights (total width 9 inches)
+TABLE_COLUMN_WEIGHTS = [0.6, 1.0, 1.75, 1.75, 1.0, 1.0, 1.0, 1.0, 1.5]
+
+# Timeline table cell styles
+HEADER_CELL = CellStyle(fill="3366B2", align="ctr", bold=True, color="FFFFFF")
+ROW_CELLS = (
+    CellStyle(fill="F0F0F0"),  # Even rows: light gray
+    CellStyle(fill="FFFFFF"),  # Odd rows: white
+)
+STATUS_CELLS = {
+    status: CellStyle(fill=str(color), bold=True, color="FFFFFF")
+    for status, color in (
+        ("critical", STATUS_CRITICAL),
+        ("sof", STATUS_SOF),
+        ("degraded", STATUS_DEGRADED),
+        ("nominal", STATUS_NOMINAL),
+    )
+}
+WARNING_STATE_CELL = CellStyle(fill="FFFFCC")  # Light yellow
+OFFLINE_STATE_CELL = CellStyle(fill="FFCCCC")  # Light red
+
 
 def _get_footer_metadata(
     mission: Mission | MissionLeg | None,
@@ -107,12 +125,11 @@ def add_mission_slides_to_presentation(
     route_manager: RouteManager | None = None,
     poi_manager: POIManager | None = None,
     logo_path: Path | None = None,
-    map_cache: dict[str, bytes] | None = None,
 ) -> None:
     """Add mission slides (route map and timeline tables) to an existing presentation.
 
     This function adds slides directly to the provided presentation object:
-    - Route map slide with optional caching
+    - Route map slide
     - Paginated timeline table slides with status coloring
 
     Args:
@@ -123,7 +140,6 @@ def add_mission_slides_to_presentation(
         route_manager: Route manager for map generation
         poi_manager: POI manager for map markers
         logo_path: Path to logo image file
-        map_cache: Optional cache for generated maps (route_id -> bytes)
     """
     # Import _generate_route_map here to avoid circular imports
     from app.mission.exporter import _generate_route_map
@@ -137,7 +153,6 @@ def add_mission_slides_to_presentation(
         route_manager=route_manager,
         poi_manager=poi_manager,
         logo_path=logo_path,
-        map_cache=map_cache,
         _generate_route_map=_generate_route_map,
     )
 
@@ -159,7 +174,6 @@ def add_route_map_slide(
     route_manager: RouteManager | None,
     poi_manager: POIManager | None,
     logo_path: Path | None,
-    map_cache: dict[str, bytes] | None,
     _generate_route_map,  # Injected to avoid circular import
 ) -> None:
     """Add route map slide to presentation.
@@ -172,26 +186,13 @@ def add_route_map_slide(
         route_manager: Route manager for map generation
         poi_manager: POI manager for map markers
         logo_path: Path to logo image
-        map_cache: Optional cache for generated maps (route_id -> bytes)
         _generate_route_map: Map generation function (injected)
     """
-    blank_slide_layout = prs.slide_layouts[6]
-    slide_map = prs.slides.add_slide(blank_slide_layout)
-
-    # Add header and footer bars
-    add_header_bar(slide_map, 0, 0, 10, 0.15)
-    add_footer_bar(slide_map, 0, 5.47, 10, 0.15)
-
-    # Add logo
-    if logo_path:
-        add_logo(slide_map, logo_path, 0.2, 0.02, 0.5, 0.5)
-
     # Add slide title - use mission name if available, otherwise fall back to leg ID
     if mission and hasattr(mission, "name") and mission.name:
         leg_name = mission.name
     else:
         leg_name = timeline.mission_leg_id if timeline else "Route"
-    add_slide_title(slide_map, f"{leg_name} - Route Map", top=0.2)
 
     # Get footer metadata using helper
     footer_metadata = _get_footer_metadata(mission, parent_mission_id)
@@ -199,31 +200,23 @@ def add_route_map_slide(
         # Fallback if mission is None
         footer_metadata = timeline.mission_leg_id if timeline else "Organization"
 
-    # Generate map image (with caching support)
-    route_id = mission.route_id if mission else None
-    map_image_bytes = None
-
-    # Check cache first
-    if route_id and map_cache is not None and route_id in map_cache:
-        map_image_bytes = map_cache[route_id]
-        logger.info(f"Cache hit for route {route_id}")
-    else:
-        # Generate map
-        try:
-            map_image_bytes = _generate_route_map(
-                timeline,
-                mission,
-                parent_mission_id=parent_mission_id,
-                route_manager=route_manager,
-                poi_manager=poi_manager,
-            )
-            logger.info(f"Cache miss for route {route_id}, generated map")
+    # Header/footer bars and logo come from the branded layout
+    slide_map = get_slide_template().add_content_slide(
+        prs, f"{leg_name} - Route Map", footer_metadata, logo_path=logo_path
+    )
 
-            # Store in cache if available
-            if route_id and map_cache is not None:
-                map_cache[route_id] = map_image_bytes
-        except Exception as e:
-            logger.error("Failed to generate map: %s", e, exc_info=True)
+    # Generate map image (served from the persistent image cache when unchanged)
+    map_image_bytes = None
+    try:
+        map_image_bytes = _generate_route_map(
+            timeline,
+            mission,
+            parent_mission_id=parent_mission_id,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+        )
+    except Exception as e:
+        logger.error("Failed to generate map: %s", e, exc_info=True)
 
     # Add map to slide
     if map_image_bytes:
@@ -251,15 +244,6 @@ def add_route_map_slide(
             )
             textbox.text = f"Map generation failed: {str(e)}"
 
-    # Add footer text (centered within gold bar with white text)
-    add_footer_text(
-        slide_map,
-        footer_metadata,
-        bottom=5.45,
-        font_size=7,
-        color=TEXT_WHITE,
-    )
-
 
 def add_timeline_table_slides(
     prs: Presentation,
@@ -322,31 +306,19 @@ def add_timeline_table_slides(
     mission_start = mission_start_timestamp(timeline)
     mission_date = mission_start.strftime("%Y-%m-%d")
 
-    blank_slide_layout = prs.slide_layouts[6]
+    template = get_slide_template()
+    footer_text = f"Date: {mission_date} | {footer_metadata}"
 
     for chunk_idx, chunk in enumerate(chunks):
-        # Add new slide for each chunk
-        slide = prs.slides.add_slide(blank_slide_layout)
-
-        # Add header and footer bars
-        add_header_bar(slide, 0, 0, 10, 0.15)
-        add_footer_bar(slide, 0, 5.47, 10, 0.15)
-
-        # Add logo
-        if logo_path:
-            add_logo(slide, logo_path, 0.2, 0.02, 0.5, 0.5)
-
-        # Add slide title
+        # Add new slide for each chunk (chrome comes from the branded layout)
         title_text = (
             f"{leg_name} - Timeline"
             if chunk_idx == 0
             else f"{leg_name} - Timeline (cont.)"
         )
-        add_slide_title(slide, title_text, top=0.2)
-
-        # Add footer text
-        footer_text = f"Date: {mission_date} | {footer_metadata}"
-        add_footer_text(slide, footer_text, bottom=5.45, font_size=7, color=TEXT_WHITE)
+        slide = template.add_content_slide(
+            prs, title_text, footer_text, logo_path=logo_path
+        )
 
         # Add timeline table for this chunk
         _add_timeline_table(slide, chunk, columns_to_show)
@@ -425,131 +397,88 @@ def _add_timeline_table(
     - Status badge coloring (NOMINAL, SOF, DEGRADED, CRITICAL)
     - Transport state coloring (yellow/red for warnings)
 
+    Cell text and styles are resolved here; the table XML is written in one
+    pass by add_styled_table.
+
     Args:
         slide: Slide object to add table to
         chunk: DataFrame chunk with timeline rows
         columns_to_show: List of column names to display
     """
-    rows = len(chunk) + 1  # +1 for header
-    cols = len(columns_to_show)
-
-    # Create table
-    left = Inches(0.5)
-    top = Inches(0.9)
+    # Total width 9 inches, column widths adjusted for wider times
     width = Inches(9.0)
-    # Use a minimal height so rows don't stretch to fill a large area
-    height = Inches(1.0)
-
-    shape = slide.shapes.add_table(rows, cols, left, top, width, height)
-    table = shape.table
-
-    # Set column widths (adjusted for wider times)
-    # Total width 9 inches
-    col_weights = [0.6, 1.0, 1.75, 1.75, 1.0, 1.0, 1.0, 1.0, 1.5]
-    total_weight = sum(col_weights)
-    for i, weight in enumerate(col_weights):
-        table.columns[i].width = int(width * (weight / total_weight))
-
-    # Header row style
-    for i, col_name in enumerate(columns_to_show):
-        cell = table.cell(0, i)
-        cell.text = "" if col_name == "Segment #" else col_name
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(51, 102, 178)  # Dark Blue
-        paragraph = cell.text_frame.paragraphs[0]
-        paragraph.font.color.rgb = RGBColor(255, 255, 255)  # White
-        paragraph.font.bold = True
-        paragraph.font.size = Pt(8)
-        paragraph.alignment = PP_ALIGN.CENTER
-
-    # Data rows
-    for row_idx, (_, row_data) in enumerate(chunk.iterrows(), start=1):
-        # Pre-calculate bad transports for this row
-        bad_transports = []
-        for col_name in STATE_COLUMNS:
-            val = str(row_data[col_name] if row_data[col_name] else "").lower()
-            if val in ("degraded", "warning", "offline"):
-                bad_transports.append(col_name)
-
-        is_critical_row = len(bad_transports) >= 2
-
-        for col_idx, col_name in enumerate(columns_to_show):
-            cell = table.cell(row_idx, col_idx)
-            val = str(row_data[col_name] if row_data[col_name] is not None else "")
+    total_weight = sum(TABLE_COLUMN_WEIGHTS)
+    col_widths = [
+        int(width * (weight / total_weight)) for weight in TABLE_COLUMN_WEIGHTS
+    ]
 
-            # Override Status text if critical
-            if col_name == "Status" and is_critical_row:
-                val = "CRITICAL"
+    rows = [
+        [
+            ("" if col_name == "Segment #" else col_name, HEADER_CELL)
+            for col_name in columns_to_show
+        ]
+    ]
 
-            cell.text = val
+    for row_idx, row_data in enumerate(chunk.to_dict("records"), start=1):
+        # Pre-calculate bad transports for this row
+        bad_transports = [
+            col_name
+            for col_name in STATE_COLUMNS
+            if str(row_data[col_name] if row_data[col_name] else "").lower()
+            in ("degraded", "warning", "offline")
+        ]
+        is_critical_row = len(bad_transports) >= 2
 
-            for paragraph in cell.text_frame.paragraphs:
-                paragraph.font.size = Pt(8)
-                paragraph.alignment = PP_ALIGN.LEFT
+        # Alternating row colors
+        row_style = ROW_CELLS[row_idx % 2]
 
-            # Alternating row colors
-            cell.fill.solid()
-            if row_idx % 2 == 0:
-                cell.fill.fore_color.rgb = RGBColor(240, 240, 240)  # Light Gray
-            else:
-                cell.fill.fore_color.rgb = RGBColor(255, 255, 255)  # White
+        cells = []
+        for col_name in columns_to_show:
+            value = row_data[col_name]
+            val = str(value if value is not None else "")
+            style = row_style
 
-            # Status coloring for Status column with new color palette
             if col_name == "Status":
+                # Override Status text if critical
+                if is_critical_row:
+                    val = "CRITICAL"
                 val_lower = val.lower()
 
                 # Check for Safety-of-Flight in reasons
-                is_sof = False
                 reasons = str(row_data.get("Reasons", "")).lower()
-                if "safety-of-flight" in reasons or "aar" in reasons:
-                    is_sof = True
+                is_sof = "safety-of-flight" in reasons or "aar" in reasons
 
                 # Override Status text to "SOF" if it's a safety window
                 if is_sof and val_lower in ("available", "nominal", "warning"):
-                    cell.text = "SOF"
-                    # Re-apply font size since setting text resets it
-                    for paragraph in cell.text_frame.paragraphs:
-                        paragraph.font.size = Pt(8)
-                        paragraph.alignment = PP_ALIGN.LEFT
+                    val = "SOF"
 
                 # Apply status badge colors
                 if is_critical_row and not is_sof:
-                    # Critical status
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = STATUS_CRITICAL
-                    for paragraph in cell.text_frame.paragraphs:
-                        paragraph.font.color.rgb = RGBColor(255, 255, 255)
-                        paragraph.font.bold = True
+                    style = STATUS_CELLS["critical"]
                 elif is_sof:
-                    # Safety of Flight
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = STATUS_SOF
-                    for paragraph in cell.text_frame.paragraphs:
-                        paragraph.font.color.rgb = RGBColor(255, 255, 255)
-                        paragraph.font.bold = True
+                    style = STATUS_CELLS["sof"]
                 elif val_lower in ("degraded", "warning"):
-                    # Degraded status
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = STATUS_DEGRADED
-                    for paragraph in cell.text_frame.paragraphs:
-                        paragraph.font.color.rgb = RGBColor(255, 255, 255)
-                        paragraph.font.bold = True
+                    style = STATUS_CELLS["degraded"]
                 elif val_lower in ("nominal", "available"):
-                    # Nominal status
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = STATUS_NOMINAL
-                    for paragraph in cell.text_frame.paragraphs:
-                        paragraph.font.color.rgb = RGBColor(255, 255, 255)
-                        paragraph.font.bold = True
+                    style = STATUS_CELLS["nominal"]
 
             # Keep existing coloring for transport state columns
             elif col_name in STATE_COLUMNS:
                 val_lower = val.lower()
-                if val_lower in ("degraded", "warning", "offline"):
-                    cell.fill.solid()
-                    if val_lower in ("degraded", "warning"):
-                        cell.fill.fore_color.rgb = RGBColor(
-                            255, 255, 204
-                        )  # Light Yellow
-                    else:
-                        cell.fill.fore_color.rgb = RGBColor(255, 204, 204)  # Light Red
+                if val_lower in ("degraded", "warning"):
+                    style = WARNING_STATE_CELL
+                elif val_lower == "offline":
+                    style = OFFLINE_STATE_CELL
+
+            cells.append((val, style))
+        rows.append(cells)
+
+    # Use a minimal height so rows don't stretch to fill a large area
+    add_styled_table(
+        slide,
+        rows,
+        left=Inches(0.5),
+        top=Inches(0.9),
+        col_widths=col_widths,
+        height=Inches(1.0),
+    )
@@ -0,0 +1,417 @@
+"""Precompiled slide template and bulk table filler for mission PPTX exports.
+
+Every exported slide carries the same chrome: gold header and footer bars and
+the organization logo, plus a styled title and footer line. Building those
+shapes through python-pptx proxies for every slide (re-reading and re-hashing
+the logo each time) and styling timeline tables cell by cell dominated deck
+generation for long missions.
+
+The template is built once per process:
+- The chrome lives on two branded slide layouts (title and content), so it
+  is drawn by the layout and the logo image is embedded once per deck.
+- Title and footer text boxes are styled once and cloned as XML per slide.
+- Timeline tables are emitted as a single ``a:tbl`` XML document with
+  per-style fragments computed once, instead of thousands of proxy calls.
+
+Functions:
+    get_slide_template: Process-wide SlideTemplate
+    add_styled_table: Add a table from pre-styled cells in one XML pass
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from pptx import Presentation
+from pptx.enum.text import PP_ALIGN
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
+from pptx.shapes.autoshape import Shape
+from pptx.util import Inches, Pt
+
+from app.mission.exporter.pptx_styling import (
+    BRAND_GOLD,
+    TEXT_BLACK,
+    TEXT_WHITE,
+    add_footer_bar,
+    add_footer_text,
+    add_header_bar,
+    add_logo,
+    add_slide_title,
+)
+
+if TYPE_CHECKING:
+    from pptx.oxml.xmlchemy import BaseOxmlElement
+    from pptx.presentation import Presentation as PresentationType
+    from pptx.slide import Slide, SlideLayout
+
+logger = logging.getLogger(__name__)
+
+LOGO_PATH = Path(__file__).parent.with_name("assets").joinpath("logo.png")
+
+SLIDE_WIDTH = Inches(10)
+SLIDE_HEIGHT = Inches(5.62)
+
+# Layout indices in python-pptx's default template that carry the chrome.
+# "Title Slide" is stripped of its placeholders; "Blank" has none.
+TITLE_LAYOUT_INDEX = 0
+CONTENT_LAYOUT_INDEX = 6
+TITLE_LAYOUT_NAME = "Branded Title"
+CONTENT_LAYOUT_NAME = "Branded Content"
+
+GRAPHIC_DATA_URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+# python-pptx's default table style ("Medium Style 2 - Accent 1")
+DEFAULT_TABLE_STYLE_ID = "{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}"
+
+# Same escaping python-pptx applies to run text
+_CONTROL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+
+@dataclass(frozen=True)
+class CellStyle:
+    """Visual style of one table cell.
+
+    Attributes:
+        fill: Background color as hex RRGGBB
+        align: Paragraph alignment ("l", "ctr", "r")
+        bold: Bold text
+        color: Text color as hex RRGGBB (None inherits the table style)
+        size: Font size in points
+    """
+
+    fill: str
+    align: str = "l"
+    bold: bool = False
+    color: Optional[str] = None
+    size: int = 8
+
+
+class SlideTemplate:
+    """Branded base deck plus prototype shapes, built once and cloned per slide."""
+
+    def __init__(self, logo_path: Path | None = LOGO_PATH):
+        """Build the template.
+
+        Args:
+            logo_path: Logo image placed on every slide (skipped if missing)
+        """
+        self.logo_path = logo_path
+        self._deck_bytes = self._build_deck(logo_path)
+
+        self._slide_title = _capture_shapes(
+            lambda slide: add_slide_title(slide, "Title", top=0.2)
+        )[0]
+        self._footer_text = _capture_shapes(
+            lambda slide: add_footer_text(
+                slide, "Footer", bottom=5.45, font_size=7, color=TEXT_WHITE
+            )
+        )[0]
+        self._title_slide_text = _capture_shapes(_add_title_slide_text)
+
+    def new_presentation(self) -> PresentationType:
+        """Return a fresh presentation with the branded layouts."""
+        return Presentation(io.BytesIO(self._deck_bytes))
+
+    def add_title_slide(
+        self,
+        prs: PresentationType,
+        mission_name: str,
+        mission_id: str,
+        leg_count: int,
+        organization: str,
+    ) -> Slide:
+        """Add the mission title slide.
+
+        Args:
+            prs: Presentation created by new_presentation()
+            mission_name: Large centered title
+            mission_id: Shown as "Mission ID: ..."
+            leg_count: Number of legs in the mission
+            organization: Shown after the leg count
+
+        Returns:
+            The new slide
+        """
+        slide = self._add_slide(prs, TITLE_LAYOUT_NAME, self.logo_path, logo_size=0.6)
+        texts = (
+            mission_name,
+            f"Mission ID: {mission_id}",
+            f"{leg_count} Leg{'s' if leg_count != 1 else ''} | {organization}",
+        )
+        for prototype, text in zip(self._title_slide_text, texts):
+            clone_text_shape(slide, prototype, text)
+        return slide
+
+    def add_content_slide(
+        self,
+        prs: PresentationType,
+        title: str,
+        footer: str,
+        logo_path: Path | None = None,
+    ) -> Slide:
+        """Add a branded content slide with its title and footer line.
+
+        Args:
+            prs: Presentation, normally created by new_presentation()
+            title: Slide title (24pt bold, centered)
+            footer: Footer text drawn in white on the gold footer bar
+            logo_path: Logo drawn on the slide itself when ``prs`` lacks the
+                branded layouts
+
+        Returns:
+            The new slide
+        """
+        slide = self._add_slide(prs, CONTENT_LAYOUT_NAME, logo_path, logo_size=0.5)
+        clone_text_shape(slide, self._slide_title, title)
+        clone_text_shape(slide, self._footer_text, footer)
+        return slide
+
+    @staticmethod
+    def _add_slide(
+        prs: PresentationType,
+        layout_name: str,
+        logo_path: Path | None,
+        logo_size: float,
+    ) -> Slide:
+        layout = prs.slide_layouts.get_by_name(layout_name)
+        if layout is not None:
+            return prs.slides.add_slide(layout)
+
+        # Presentation not created from the template: draw the chrome per slide
+        slide = prs.slides.add_slide(prs.slide_layouts[CONTENT_LAYOUT_INDEX])
+        add_header_bar(slide, 0, 0, 10, 0.15)
+        add_footer_bar(slide, 0, 5.47, 10, 0.15)
+        if logo_path:
+            add_logo(slide, logo_path, 0.2, 0.02, logo_size, logo_size)
+        return slide
+
+    @staticmethod
+    def _build_deck(logo_path: Path | None) -> bytes:
+        prs = Presentation()
+        prs.slide_width = SLIDE_WIDTH
+        prs.slide_height = SLIDE_HEIGHT
+
+        logo = None
+        if logo_path and logo_path.exists():
+            logo = logo_path.read_bytes()
+        elif logo_path:
+            logger.warning(f"Logo not found at {logo_path}, slides will omit it")
+
+        for index, name, logo_size in (
+            (TITLE_LAYOUT_INDEX, TITLE_LAYOUT_NAME, 0.6),
+            (CONTENT_LAYOUT_INDEX, CONTENT_LAYOUT_NAME, 0.5),
+        ):
+            layout = prs.slide_layouts[index]
+            _brand_layout(layout, name, logo, logo_size)
+
+        buffer = io.BytesIO()
+        prs.save(buffer)
+        return buffer.getvalue()
+
+
+def _brand_layout(
+    layout: SlideLayout, name: str, logo: bytes | None, logo_size: float
+) -> None:
+    """Replace a layout's placeholders with the gold bars and logo."""
+    spTree = layout.shapes._spTree
+    for placeholder in list(layout.placeholders):
+        spTree.remove(placeholder._element)
+    layout._element.cSld.name = name
+
+    for shape_name, top in (("Header Bar", 0), ("Footer Bar", 5.47)):
+        sp = spTree.add_autoshape(
+            layout.shapes._next_shape_id,
+            shape_name,
+            "rect",
+            Inches(0),
+            Inches(top),
+            Inches(10),
+            Inches(0.15),
+        )
+        bar = Shape(sp, layout.shapes)
+        bar.fill.solid()
+        bar.fill.fore_color.rgb = BRAND_GOLD
+        bar.line.fill.background()  # No border
+
+    if logo is not None:
+        image_part, rId = layout.part.get_or_add_image_part(io.BytesIO(logo))
+        cx, cy = image_part.scale(None, Inches(logo_size))
+        spTree.add_pic(
+            layout.shapes._next_shape_id,
+            "Logo",
+            image_part.desc,
+            rId,
+            Inches(0.2),
+            Inches(0.02),
+            cx,
+            cy,
+        )
+
+
+def _add_title_slide_text(slide: Slide) -> None:
+    """Title slide text boxes: mission name, mission ID, legs/organization."""
+    for top, height, size, bold in (
+        (2.0, 1.0, 28, True),
+        (3.0, 0.5, 14, False),
+        (3.5, 0.5, 14, False),
+    ):
+        box = slide.shapes.add_textbox(
+            Inches(1.5), Inches(top), Inches(7.0), Inches(height)
+        )
+        box.text_frame.text = "Text"
+        paragraph = box.text_frame.paragraphs[0]
+        paragraph.alignment = PP_ALIGN.CENTER
+        paragraph.font.size = Pt(size)
+        if bold:
+            paragraph.font.bold = True
+        paragraph.font.color.rgb = TEXT_BLACK
+
+
+def _capture_shapes(build: Callable[[Slide], None]) -> list[BaseOxmlElement]:
+    """Run a shape builder on a scratch slide and keep its shape XML."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[CONTENT_LAYOUT_INDEX])
+    build(slide)
+    return [copy.deepcopy(el) for el in slide.shapes._spTree.iter_shape_elms()]
+
+
+def clone_text_shape(slide: Slide, prototype: BaseOxmlElement, text: str) -> None:
+    """Append a copy of a styled text box with new text.
+
+    The first paragraph keeps the prototype's paragraph properties; like
+    ``TextFrame.text``, each line feed starts a new (unstyled) paragraph.
+
+    Args:
+        slide: Slide to add the shape to
+        prototype: ``p:sp`` text box captured from a styled shape
+        text: Replacement text
+    """
+    sp = copy.deepcopy(prototype)
+    shape_id = slide.shapes._next_shape_id
+    sp.nvSpPr.cNvPr.id = shape_id
+    sp.nvSpPr.cNvPr.name = f"TextBox {shape_id - 1}"
+
+    txBody = sp.txBody
+    pPr = txBody.p_lst[0].pPr
+    txBody.clear_content()
+    for line in text.split("\n"):
+        txBody.add_p().append_text(line)
+    if pPr is not None:
+        txBody.p_lst[0].insert(0, pPr)
+
+    slide.shapes._spTree.insert_element_before(sp, "p:extLst")
+
+
+def add_styled_table(
+    slide: Slide,
+    rows: Sequence[Sequence[tuple[str, CellStyle]]],
+    left: int,
+    top: int,
+    col_widths: Sequence[int],
+    height: int,
+) -> None:
+    """Add a table whose cell XML is generated in a single pass.
+
+    Produces the same markup as ``shapes.add_table`` followed by per-cell
+    text, fill and font assignments, without going through the proxies.
+
+    Args:
+        slide: Slide to add the table to
+        rows: Rows of (text, style) cells; the first row is the header
+        left: Left offset in EMU
+        top: Top offset in EMU
+        col_widths: Column widths in EMU
+        height: Total table height in EMU, divided evenly between rows
+    """
+    row_height = height // len(rows)
+    parts = [
+        f"<a:tbl {nsdecls('a')}>",
+        '<a:tblPr firstRow="1" bandRow="1">',
+        f"<a:tableStyleId>{DEFAULT_TABLE_STYLE_ID}</a:tableStyleId>",
+        "</a:tblPr><a:tblGrid>",
+    ]
+    parts.extend(f'<a:gridCol w="{width}"/>' for width in col_widths)
+    parts.append("</a:tblGrid>")
+    for row in rows:
+        parts.append(f'<a:tr h="{row_height}">')
+        for text, style in row:
+            open_cell, close_cell = _cell_markup(style)
+            parts.append(open_cell)
+            parts.append(_paragraphs_markup(text, _paragraph_properties(style)))
+            parts.append(close_cell)
+        parts.append("</a:tr>")
+    parts.append("</a:tbl>")
+
+    shape_id = slide.shapes._next_shape_id
+    frame = CT_GraphicalObjectFrame.new_graphicFrame(
+        shape_id, f"Table {shape_id - 1}", left, top, sum(col_widths), height
+    )
+    frame.graphic.graphicData.uri = GRAPHIC_DATA_URI_TABLE
+    frame.graphic.graphicData.append(parse_xml("".join(parts)))
+    slide.shapes._spTree.insert_element_before(frame, "p:extLst")
+
+
+@lru_cache(maxsize=64)
+def _cell_markup(style: CellStyle) -> tuple[str, str]:
+    """Opening and closing ``a:tc`` markup around a cell's paragraphs."""
+    return (
+        "<a:tc><a:txBody><a:bodyPr/><a:lstStyle/>",
+        f'</a:txBody><a:tcPr><a:solidFill><a:srgbClr val="{style.fill}"/>'
+        "</a:solidFill></a:tcPr></a:tc>",
+    )
+
+
+@lru_cache(maxsize=64)
+def _paragraph_properties(style: CellStyle) -> str:
+    """``a:pPr`` markup applying a cell's alignment and font."""
+    bold = ' b="1"' if style.bold else ""
+    if style.color is None:
+        font = f'<a:defRPr sz="{style.size * 100}"{bold}/>'
+    else:
+        font = (
+            f'<a:defRPr sz="{style.size * 100}"{bold}><a:solidFill>'
+            f'<a:srgbClr val="{style.color}"/></a:solidFill></a:defRPr>'
+        )
+    return f'<a:pPr algn="{style.align}">{font}</a:pPr>'
+
+
+def _paragraphs_markup(text: str, pPr: str) -> str:
+    """One styled paragraph per line; empty lines get no run (as in python-pptx)."""
+    paragraphs = []
+    for line in text.split("\n"):
+        runs = []
+        for index, run_text in enumerate(line.split("\v")):
+            if index:
+                runs.append("<a:br/>")
+            if run_text:
+                escaped = escape(_CONTROL_CHARS.sub(_escape_control_char, run_text))
+                runs.append(f"<a:r><a:t>{escaped}</a:t></a:r>")
+        paragraphs.append(f"<a:p>{pPr}{''.join(runs)}</a:p>")
+    return "".join(paragraphs)
+
+
+def _escape_control_char(match: re.Match) -> str:
+    return "_x%04X_" % ord(match.group(1))
+
+
+_slide_template: SlideTemplate | None = None
+_slide_template_lock = threading.Lock()
+
+
+def get_slide_template() -> SlideTemplate:
+    """Return the process-wide slide template, building it on first use."""
+    global _slide_template
+    with _slide_template_lock:
+        if _slide_template is None:
+            _slide_template = SlideTemplate()
+        return _slide_template
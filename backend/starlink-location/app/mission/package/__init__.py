@@ -7,6 +7,7 @@ Exported functionality includes:
 - Package creation and validation
 - XLSX workbook assembly from multiple leg exports
 - Archive creation (ZIP format)
+- Streaming package import (importer)
 """
 
 from __future__ import annotations
@@ -15,9 +16,25 @@ from __future__ import annotations
 from app.mission.package.__main__ import (
     ExportPackageError,
     export_mission_package,
+    stream_mission_package,
+)
+from app.mission.package.importer import (
+    ImportPackageError,
+    PackageContents,
+    UploadTooLargeError,
+    import_mission_package,
+    read_package,
+    spool_upload,
 )
 
 __all__ = [
     "ExportPackageError",
+    "ImportPackageError",
+    "PackageContents",
+    "UploadTooLargeError",
     "export_mission_package",
+    "import_mission_package",
+    "read_package",
+    "spool_upload",
+    "stream_mission_package",
 ]
@@ -10,16 +10,26 @@ import json
 import logging
 import zipfile
 import tempfile
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import IO
+from typing import IO, Callable, Iterator, Optional
 
-from app.mission.models import Mission
+from app.mission.models import Mission, MissionLeg, MissionLegTimeline
 from app.mission.storage import load_mission_v2, load_mission_timeline
 from app.mission.exporter import (
     generate_timeline_export,
     TimelineExportFormat,
 )
+from app.mission.package.render_pool import (
+    SnapshotPOIManager,
+    SnapshotRouteManager,
+    get_export_render_pool,
+)
+from app.mission.timeline_pool import get_timeline_worker_pool
+from app.mission.timeline_service import build_mission_timeline
+from app.models.poi import POI
+from app.models.route import ParsedRoute
 from app.services.route_manager import RouteManager
 from app.services.poi_manager import POIManager
 
@@ -30,6 +40,13 @@ class ExportPackageError(RuntimeError):
     """Raised when mission package export fails."""
 
 
+# Receives (completed fraction 0-1, stage message); may raise to abort the export
+ExportProgressCallback = Callable[[float, str], None]
+
+# Archive entries already compressed by their format are stored, not deflated
+STORED_SUFFIXES = frozenset({".pptx", ".xlsx", ".png", ".jpg", ".jpeg", ".pdf", ".zip"})
+
+
 def generate_mission_combined_csv(
     mission: Mission, output_path: str | None = None
 ) -> bytes | None:
@@ -66,7 +83,7 @@ def generate_mission_combined_csv(
         for leg in mission.legs:
             try:
                 # Load timeline for this leg
-                timeline = load_mission_timeline(leg.id)
+                timeline = load_mission_timeline(leg.id, include_samples=False)
                 if not timeline:
                     continue
 
@@ -135,7 +152,6 @@ def generate_mission_combined_pptx(
     route_manager: RouteManager | None = None,
     poi_manager: POIManager | None = None,
     output_path: str | None = None,
-    map_cache: dict[str, bytes] | None = None,
 ) -> bytes | None:
     """Generate combined PPTX slides for entire mission.
 
@@ -145,16 +161,11 @@ def generate_mission_combined_pptx(
 
     This function has been refactored to use the shared pptx_builder module,
     eliminating code duplication with exporter/__main__.py::generate_pptx_export().
-
-    Args:
-        map_cache: Optional cache for generated maps (route_id -> bytes)
     """
     import io
 
     try:
-        from pptx import Presentation
-        from pptx.util import Inches, Pt
-        from pptx.enum.text import PP_ALIGN
+        import pptx  # noqa: F401
     except ImportError:
         logger.error("python-pptx not installed")
         return b""
@@ -163,16 +174,11 @@ def generate_mission_combined_pptx(
     from pathlib import Path
 
     from app.mission.exporter.pptx_builder import add_mission_slides_to_presentation
-    from app.mission.exporter.pptx_styling import (
-        TEXT_BLACK,
-        add_footer_bar,
-        add_header_bar,
-        add_logo,
-    )
+    from app.mission.exporter.pptx_template import get_slide_template
 
-    prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(5.62)
+    # Branded presentation (standard dimensions, chrome on the slide layouts)
+    template = get_slide_template()
+    prs = template.new_presentation()
 
     # Logo path
     logo_path = Path(__file__).parent.parent.joinpath("assets").joinpath("logo.png")
@@ -184,57 +190,12 @@ def generate_mission_combined_pptx(
     leg_count = len(mission.legs)
 
     # Title slide with styling
-    blank_slide_layout = prs.slide_layouts[6]
-    title_slide = prs.slides.add_slide(blank_slide_layout)
-
-    # Add header and footer bars
-    add_header_bar(title_slide, 0, 0, 10, 0.15)
-    add_footer_bar(title_slide, 0, 5.47, 10, 0.15)
-
-    # Add logo if available
-    add_logo(title_slide, logo_path, 0.2, 0.02, 0.6, 0.6)
-
-    # Add mission title
-    title_box = title_slide.shapes.add_textbox(
-        Inches(1.5), Inches(2.0), Inches(7.0), Inches(1.0)
-    )
-    text_frame = title_box.text_frame
-    text_frame.text = mission_name
-
-    paragraph = text_frame.paragraphs[0]
-    paragraph.alignment = PP_ALIGN.CENTER
-    paragraph.font.size = Pt(28)
-    paragraph.font.bold = True
-    paragraph.font.color.rgb = TEXT_BLACK
-
-    # Add mission ID
-    id_box = title_slide.shapes.add_textbox(
-        Inches(1.5), Inches(3.0), Inches(7.0), Inches(0.5)
-    )
-    id_frame = id_box.text_frame
-    id_frame.text = f"Mission ID: {mission_id}"
-
-    id_paragraph = id_frame.paragraphs[0]
-    id_paragraph.alignment = PP_ALIGN.CENTER
-    id_paragraph.font.size = Pt(14)
-    id_paragraph.font.color.rgb = TEXT_BLACK
-
-    # Add leg count and organization
-    info_box = title_slide.shapes.add_textbox(
-        Inches(1.5), Inches(3.5), Inches(7.0), Inches(0.5)
-    )
-    info_frame = info_box.text_frame
-    info_frame.text = f"{leg_count} Leg{'s' if leg_count != 1 else ''} | {organization}"
-
-    info_paragraph = info_frame.paragraphs[0]
-    info_paragraph.alignment = PP_ALIGN.CENTER
-    info_paragraph.font.size = Pt(14)
-    info_paragraph.font.color.rgb = TEXT_BLACK
+    template.add_title_slide(prs, mission_name, mission_id, leg_count, organization)
 
     # For each leg, generate slides using shared builder
     for leg_idx, leg in enumerate(mission.legs):
         # Load timeline for this leg
-        leg_timeline = load_mission_timeline(leg.id)
+        leg_timeline = load_mission_timeline(leg.id, include_samples=False)
         if not leg_timeline:
             logger.warning(
                 f"No timeline found for leg {leg.id}, adding summary slide only"
@@ -268,7 +229,6 @@ def generate_mission_combined_pptx(
                 route_manager=route_manager,
                 poi_manager=poi_manager,
                 logo_path=logo_path,
-                map_cache=map_cache,
             )
 
         except Exception as e:
@@ -432,27 +392,161 @@ def _add_pois_to_zip(
         logger.error(f"Failed to add satellite POI data: {e}")
 
 
+def _ensure_leg_timelines(
+    mission: Mission,
+    route_manager: RouteManager | None,
+    poi_manager: POIManager | None,
+) -> None:
+    """Generate timelines for legs that have none stored, in parallel.
+
+    Args:
+        mission: Mission being exported
+        route_manager: RouteManager instance
+        poi_manager: POIManager instance
+    """
+    if route_manager is None:
+        return
+    missing = [
+        leg
+        for leg in mission.legs
+        if leg.route_id
+        and load_mission_timeline(leg.id) is None
+        and isinstance(route_manager.get_route(leg.route_id), ParsedRoute)
+    ]
+    if not missing:
+        return
+
+    logger.info(f"Generating {len(missing)} missing leg timelines before export")
+    outcomes = get_timeline_worker_pool().build_legs(
+        missing,
+        route_manager,
+        poi_manager,
+        lambda leg: build_mission_timeline(
+            mission=leg,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+            parent_mission_id=mission.id,
+        ),
+        parent_mission_id=mission.id,
+    )
+    for outcome in outcomes:
+        if not outcome.ok:
+            logger.warning(
+                f"Could not generate timeline for leg {outcome.leg_id}: {outcome.error}"
+            )
+
+
+@dataclass
+class _LegExportTask:
+    """Everything needed to render one leg's exports away from the managers."""
+
+    leg: MissionLeg
+    timeline: MissionLegTimeline
+    parent_mission_id: str
+    route: Optional[ParsedRoute]
+    pois: list[POI]
+
+
+@dataclass
+class _LegExportResult:
+    """Rendered files for one leg, as (archive path, content) in write order."""
+
+    files: list[tuple[str, bytes]] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+def _render_leg_exports(task: _LegExportTask) -> _LegExportResult:
+    """Render one leg's CSV and PPTX (map, chart and slides).
+
+    Runs in an export worker process or inline, against snapshots of the
+    leg's route and POIs. A failing format is recorded and the others still
+    render.
+    """
+    leg = task.leg
+    route_manager = SnapshotRouteManager(
+        {leg.route_id: task.route} if leg.route_id and task.route else {}
+    )
+    poi_manager = SnapshotPOIManager(task.pois)
+    result = _LegExportResult()
+
+    try:
+        csv_export = generate_timeline_export(
+            export_format=TimelineExportFormat.CSV,
+            mission=leg,  # Pass the leg as mission (MissionLeg has same fields)
+            timeline=task.timeline,
+        )
+        result.files.append((f"exports/legs/{leg.id}/timeline.csv", csv_export.content))
+    except Exception as e:
+        result.errors.append(f"Failed to generate CSV for leg {leg.id}: {e}")
+
+    try:
+        pptx_export = generate_timeline_export(
+            export_format=TimelineExportFormat.PPTX,
+            mission=leg,
+            timeline=task.timeline,
+            parent_mission_id=task.parent_mission_id,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+        )
+        result.files.append((f"exports/legs/{leg.id}/slides.pptx", pptx_export.content))
+    except Exception as e:
+        result.errors.append(f"Failed to generate PPTX for leg {leg.id}: {e}")
+
+    return result
+
+
 def _add_per_leg_exports_to_zip(
     zf: zipfile.ZipFile,
     mission: Mission,
     route_manager: RouteManager | None,
     poi_manager: POIManager | None,
     manifest_files: dict,
-    map_cache: dict[str, bytes] | None = None,
+    progress: Optional[ExportProgressCallback] = None,
 ):
     """Generate and add per-leg exports (CSV, PPTX) to zip archive.
 
+    Legs render in parallel on the export render pool; their files are
+    written to the archive in leg order as each leg completes.
+
+    Args:
+        zf: ZipFile to add files to
+        mission: Mission object with legs
+        route_manager: RouteManager instance
+        poi_manager: POIManager instance
+        manifest_files: Manifest dictionary to update
+        progress: Optional callback receiving (fraction, message) per leg
+    """
+    for _ in _iter_per_leg_exports_to_zip(
+        zf, mission, route_manager, poi_manager, manifest_files, progress
+    ):
+        pass
+
+
+def _iter_per_leg_exports_to_zip(
+    zf: zipfile.ZipFile,
+    mission: Mission,
+    route_manager: RouteManager | None,
+    poi_manager: POIManager | None,
+    manifest_files: dict,
+    progress: Optional[ExportProgressCallback] = None,
+) -> Iterator[str]:
+    """Add per-leg exports to the archive, yielding each leg ID once written.
+
     Args:
         zf: ZipFile to add files to
         mission: Mission object with legs
         route_manager: RouteManager instance
         poi_manager: POIManager instance
         manifest_files: Manifest dictionary to update
-        map_cache: Optional cache for generated maps (route_id -> bytes)
+        progress: Optional callback receiving (fraction, message) per leg
+
+    Yields:
+        Leg IDs, in leg order, after their files were added
     """
+    tasks: list[_LegExportTask] = []
     for leg in mission.legs:
         # Load timeline for this specific leg
-        leg_timeline = load_mission_timeline(leg.id)
+        leg_timeline = load_mission_timeline(leg.id, include_samples=False)
         if not leg_timeline:
             logger.warning(
                 f"No timeline found for leg {leg.id}, skipping exports for this leg"
@@ -468,37 +562,44 @@ def _add_per_leg_exports_to_zip(
                 f"leg.adjusted_departure_time={leg.adjusted_departure_time}"
             )
 
-        try:
-            # CSV export
-            csv_export = generate_timeline_export(
-                export_format=TimelineExportFormat.CSV,
-                mission=leg,  # Pass the leg as mission (MissionLeg has same fields)
+        route = (
+            route_manager.get_route(leg.route_id)
+            if route_manager and leg.route_id
+            else None
+        )
+        pois = (
+            poi_manager.list_pois(route_id=leg.route_id, mission_id=mission.id)
+            if poi_manager and leg.route_id
+            else []
+        )
+        tasks.append(
+            _LegExportTask(
+                leg=leg,
                 timeline=leg_timeline,
+                parent_mission_id=mission.id,
+                route=route if isinstance(route, ParsedRoute) else None,
+                pois=pois,
             )
-            csv_path = f"exports/legs/{leg.id}/timeline.csv"
-            zf.writestr(csv_path, csv_export.content)
-            manifest_files["per_leg_exports"].append(csv_path)
-            logger.info(f"Generated CSV for leg {leg.id}")
-        except Exception as e:
-            logger.error(f"Failed to generate CSV for leg {leg.id}: {e}")
+        )
 
-        try:
-            # PPTX export
-            pptx_export = generate_timeline_export(
-                export_format=TimelineExportFormat.PPTX,
-                mission=leg,
-                timeline=leg_timeline,
-                parent_mission_id=mission.id,
-                route_manager=route_manager,
-                poi_manager=poi_manager,
-                map_cache=map_cache,
+    outcomes = get_export_render_pool().run_ordered(_render_leg_exports, tasks)
+    for index, (task, result, error) in enumerate(outcomes):
+        leg = task.leg
+        if progress:
+            progress(
+                index / len(tasks),
+                f"Exporting leg {index + 1} of {len(tasks)}: {leg.name}",
             )
-            pptx_path = f"exports/legs/{leg.id}/slides.pptx"
-            zf.writestr(pptx_path, pptx_export.content)
-            manifest_files["per_leg_exports"].append(pptx_path)
-            logger.info(f"Generated PPTX for leg {leg.id}")
-        except Exception as e:
-            logger.error(f"Failed to generate PPTX for leg {leg.id}: {e}")
+        if error is not None:
+            logger.error(f"Failed to render exports for leg {leg.id}: {error}")
+            continue
+        for message in result.errors:
+            logger.error(message)
+        for path, content in result.files:
+            zf.writestr(path, content)
+            manifest_files["per_leg_exports"].append(path)
+            logger.info(f"Added {path} for leg {leg.id}")
+        yield leg.id
 
 
 def _add_combined_mission_exports_to_zip(
@@ -507,7 +608,6 @@ def _add_combined_mission_exports_to_zip(
     route_manager: RouteManager | None,
     poi_manager: POIManager | None,
     manifest_files: dict,
-    map_cache: dict[str, bytes] | None = None,
 ):
     """Generate and add combined mission-level exports (CSV, PPTX) to zip archive.
 
@@ -517,7 +617,6 @@ def _add_combined_mission_exports_to_zip(
         route_manager: RouteManager instance
         poi_manager: POIManager instance
         manifest_files: Manifest dictionary to update
-        map_cache: Optional cache for generated maps (route_id -> bytes)
     """
     try:
         logger.info(f"Generating combined mission-level exports for {mission.id}")
@@ -537,7 +636,6 @@ def _add_combined_mission_exports_to_zip(
                 route_manager=route_manager,
                 poi_manager=poi_manager,
                 output_path=tmp_pptx.name,
-                map_cache=map_cache,
             )
             zf.write(tmp_pptx.name, "exports/mission/mission-slides.pptx")
             manifest_files["mission_exports"].append(
@@ -593,10 +691,164 @@ def _create_export_manifest(mission: Mission, manifest_files: dict) -> dict:
     }
 
 
+class _ZipStreamSink(io.RawIOBase):
+    """Unseekable write target that buffers zip output until drained.
+
+    ZipFile falls back to data descriptors on unseekable streams, so entries
+    can be emitted as soon as they are written.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and forget everything written since the last drain."""
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class _PackageZipFile(zipfile.ZipFile):
+    """ZipFile choosing STORED or DEFLATED per entry from its file type."""
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if compress_type is None and isinstance(zinfo_or_arcname, str):
+            compress_type = _compress_type_for(zinfo_or_arcname)
+        super().writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        if compress_type is None:
+            compress_type = _compress_type_for(str(arcname or filename))
+        super().write(filename, arcname, compress_type, compresslevel)
+
+
+def _compress_type_for(path: str) -> int:
+    """Store already-compressed formats; deflate text (JSON, CSV, KML)."""
+    if Path(path).suffix.lower() in STORED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def stream_mission_package(
+    mission_id: str,
+    route_manager: RouteManager,
+    poi_manager: POIManager,
+    progress: Optional[ExportProgressCallback] = None,
+) -> Iterator[bytes]:
+    """Export complete mission as a zip archive streamed in chunks.
+
+    The mission is loaded up front (so a missing mission fails before any
+    bytes are sent); the returned iterator then renders lazily, yielding
+    each part of the archive as soon as it is written. Mission data and
+    routes come first, each leg's exports follow as they finish rendering,
+    and manifest.json is written last. See export_mission_package for the
+    archive layout.
+
+    Args:
+        mission_id: Mission to export
+        route_manager: RouteManager instance for fetching route KML files
+        poi_manager: POIManager instance for fetching mission POIs
+        progress: Optional callback receiving (fraction, message) as stages
+            complete. Exceptions it raises abort the export.
+
+    Returns:
+        Iterator of zip archive byte chunks
+
+    Raises:
+        ExportPackageError: If the mission does not exist
+    """
+    mission = load_mission_v2(mission_id)
+    if not mission:
+        raise ExportPackageError(f"Mission {mission_id} not found")
+    return _iter_mission_package(mission, route_manager, poi_manager, progress)
+
+
+def _iter_mission_package(
+    mission: Mission,
+    route_manager: RouteManager,
+    poi_manager: POIManager,
+    progress: Optional[ExportProgressCallback],
+) -> Iterator[bytes]:
+    """Write the package into a streaming zip, yielding output per stage."""
+
+    def report(fraction: float, message: str) -> None:
+        if progress:
+            progress(fraction, message)
+
+    def flush() -> Iterator[bytes]:
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+
+    manifest_files = {
+        "mission_data": ["mission.json", "manifest.json"],
+        "legs": [],
+        "routes": [],
+        "pois": [],
+        "mission_exports": [],
+        "per_leg_exports": [],
+    }
+
+    sink = _ZipStreamSink()
+    with _PackageZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+        # Mission metadata, leg files and route KMLs need no rendering
+        report(0.0, "Packaging mission data and routes")
+        _add_mission_metadata_to_zip(zf, mission, manifest_files)
+        _add_route_kmls_to_zip(zf, mission, route_manager, manifest_files)
+        yield from flush()
+
+        # Legs without a stored timeline would otherwise be skipped; building
+        # them also syncs the mission-event POIs packaged next
+        report(0.05, "Generating missing leg timelines")
+        _ensure_leg_timelines(mission, route_manager, poi_manager)
+
+        report(0.1, "Packaging POIs")
+        _add_pois_to_zip(zf, mission, poi_manager, manifest_files)
+        yield from flush()
+
+        # Generate and add per-leg exports, streaming each leg as it completes
+        for _ in _iter_per_leg_exports_to_zip(
+            zf,
+            mission,
+            route_manager,
+            poi_manager,
+            manifest_files,
+            progress=lambda fraction, message: report(0.15 + 0.55 * fraction, message),
+        ):
+            yield from flush()
+
+        # Generate and add combined mission-level exports (reuses cached maps)
+        report(0.7, "Generating combined mission exports")
+        _add_combined_mission_exports_to_zip(
+            zf, mission, route_manager, poi_manager, manifest_files
+        )
+        yield from flush()
+
+        # Create and add manifest
+        report(0.95, "Writing manifest")
+        manifest = _create_export_manifest(mission, manifest_files)
+        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+        logger.info(
+            f"Created manifest.json with {manifest['statistics']['total_files']} files"
+        )
+
+    # Central directory
+    yield from flush()
+
+
 def export_mission_package(
     mission_id: str,
     route_manager: RouteManager,
     poi_manager: POIManager,
+    progress: Optional[ExportProgressCallback] = None,
 ) -> IO[bytes]:
     """Export complete mission as zip archive.
 
@@ -631,64 +883,29 @@ def export_mission_package(
         │           ├── slides.pptx
         │           └── report.pdf
 
+    Already-compressed entries (pptx, xlsx, png) are STORED; JSON, CSV and
+    KML are DEFLATED. Use stream_mission_package to send the archive while
+    it is being generated instead of buffering it in a temp file.
+
     Args:
         mission_id: Mission to export
         route_manager: RouteManager instance for fetching route KML files
         poi_manager: POIManager instance for fetching mission POIs
+        progress: Optional callback receiving (fraction, message) as stages
+            complete. Exceptions it raises abort the export.
 
     Returns:
         File-like object containing the zip archive. Caller must close it to delete the temp file.
     """
-    mission = load_mission_v2(mission_id)
-
-    if not mission:
-        raise ExportPackageError(f"Mission {mission_id} not found")
+    chunks = stream_mission_package(
+        mission_id, route_manager, poi_manager, progress=progress
+    )
 
-    # Create a temporary file for the zip archive
-    # delete=True ensures it's deleted when closed by the caller (StreamingResponse)
+    # delete=True ensures it's deleted when closed by the caller
     zip_temp = tempfile.NamedTemporaryFile(delete=True)
-
-    manifest_files = {
-        "mission_data": ["mission.json", "manifest.json"],
-        "legs": [],
-        "routes": [],
-        "pois": [],
-        "mission_exports": [],
-        "per_leg_exports": [],
-    }
-
-    # Create map cache for this export operation to avoid regenerating same maps
-    map_cache: dict[str, bytes] = {}
-
     try:
-        with zipfile.ZipFile(zip_temp, "w", zipfile.ZIP_DEFLATED) as zf:
-            # Add mission metadata and leg files
-            _add_mission_metadata_to_zip(zf, mission, manifest_files)
-
-            # Add route KML files
-            _add_route_kmls_to_zip(zf, mission, route_manager, manifest_files)
-
-            # Add POI data (leg-specific and satellites)
-            _add_pois_to_zip(zf, mission, poi_manager, manifest_files)
-
-            # Generate and add per-leg exports (will populate map_cache)
-            _add_per_leg_exports_to_zip(
-                zf, mission, route_manager, poi_manager, manifest_files, map_cache
-            )
-
-            # Generate and add combined mission-level exports (will reuse cached maps)
-            _add_combined_mission_exports_to_zip(
-                zf, mission, route_manager, poi_manager, manifest_files, map_cache
-            )
-
-            # Create and add manifest
-            manifest = _create_export_manifest(mission, manifest_files)
-            manifest_json = json.dumps(manifest, indent=2)
-            zf.writestr("manifest.json", manifest_json)
-            logger.info(
-                f"Created manifest.json with {manifest['statistics']['total_files']} files"
-            )
-
+        for chunk in chunks:
+            zip_temp.write(chunk)
     except Exception:
         # If anything fails, close and delete the temp file
         zip_temp.close()
@@ -0,0 +1,420 @@
+"""Streaming import of mission packages.
+
+Imports used to read the whole upload (up to 100 MB) into memory, write the
+mission before checking the rest of the package, copy route KMLs for the
+file watcher to parse later, rewrite the POI file once per imported POI and
+build every leg timeline before responding. This module imports a package
+as a pipeline instead:
+
+1. spool_upload streams the upload to disk in fixed-size chunks
+2. read_package validates mission.json and the manifest before anything is
+   written
+3. route KMLs are parsed in parallel on the export worker pool and registered
+   with the route manager as soon as they parse
+4. POIs are inserted in one POI manager batch, i.e. a single file write
+
+Timeline generation is left to the caller (the API hands it to a background
+job). Progress counters are reported after each stage.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Optional
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+
+from app.mission.models import Mission
+from app.mission.package.render_pool import get_export_render_pool
+from app.mission.storage import save_mission_v2
+from app.models.poi import POI
+from app.services.kml_parser import parse_kml_file
+from app.services.poi_manager import POIManager
+from app.services.route_manager import RouteManager
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_SIZE = 100 * 1024 * 1024  # 100 MB
+IMPORT_SPOOL_CHUNK_BYTES = int(os.getenv("IMPORT_SPOOL_CHUNK_BYTES", str(1024 * 1024)))
+SATELLITE_POI_FILE = "pois/satellites.json"
+
+# Receives (completed fraction 0-1, stage message); may raise to abort the import
+ImportProgressCallback = Callable[[float, str], None]
+# Receives named counters, e.g. routes_imported=3
+ImportCounterCallback = Callable[..., None]
+
+
+class ImportPackageError(ValueError):
+    """Raised when an uploaded mission package is invalid."""
+
+
+class UploadTooLargeError(ImportPackageError):
+    """Raised when an upload exceeds the size limit."""
+
+
+@dataclass
+class PackageContents:
+    """Validated contents of a mission package.
+
+    Attributes:
+        mission: Mission parsed from mission.json
+        route_files: Route KML entries (routes/*.kml)
+        poi_files: Leg POI entries (pois/*.json, without satellites)
+        has_satellites: Whether the package carries pois/satellites.json
+        manifest: Parsed manifest.json, if the package has one
+    """
+
+    mission: Mission
+    route_files: list[str] = field(default_factory=list)
+    poi_files: list[str] = field(default_factory=list)
+    has_satellites: bool = False
+    manifest: Optional[dict[str, Any]] = None
+
+
+async def spool_upload(
+    upload: UploadFile,
+    destination: Path,
+    max_bytes: int = MAX_UPLOAD_SIZE,
+    chunk_size: int = IMPORT_SPOOL_CHUNK_BYTES,
+) -> int:
+    """Copy an upload to disk chunk by chunk, enforcing the size limit.
+
+    Args:
+        upload: Uploaded file
+        destination: File to write
+        max_bytes: Largest accepted upload
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        UploadTooLargeError: If the upload exceeds ``max_bytes`` (the partial
+            file is removed)
+    """
+    written = 0
+    try:
+        with open(destination, "wb") as out:
+            while chunk := await upload.read(chunk_size):
+                written += len(chunk)
+                if written > max_bytes:
+                    raise UploadTooLargeError("File too large")
+                out.write(chunk)
+    except UploadTooLargeError:
+        destination.unlink(missing_ok=True)
+        raise
+    return written
+
+
+def _is_safe_member(name: str) -> bool:
+    """Whether a zip entry stays inside the extraction root."""
+    path = PurePosixPath(name)
+    return not path.is_absolute() and ".." not in path.parts and "\\" not in name
+
+
+def read_package(zf: zipfile.ZipFile) -> PackageContents:
+    """Validate a package's mission and manifest before importing anything.
+
+    Args:
+        zf: Open package archive
+
+    Returns:
+        Validated package contents
+
+    Raises:
+        ImportPackageError: If mission.json is missing or invalid, the
+            manifest does not match the archive, or an entry escapes the
+            archive root
+    """
+    names = set(zf.namelist())
+    if "mission.json" not in names:
+        raise ImportPackageError("Invalid package: missing mission.json")
+
+    unsafe = sorted(name for name in names if not _is_safe_member(name))
+    if unsafe:
+        raise ImportPackageError(
+            f"Invalid path in zip: {unsafe[0]} (directory traversal attempt)"
+        )
+
+    try:
+        mission = Mission(**json.loads(zf.read("mission.json")))
+    except (json.JSONDecodeError, UnicodeDecodeError, TypeError) as e:
+        raise ImportPackageError(f"Invalid mission.json: {e}") from e
+    except ValidationError as e:
+        raise ImportPackageError(
+            f"Invalid mission.json: {e.error_count()} validation errors"
+        ) from e
+
+    manifest = None
+    if "manifest.json" in names:
+        try:
+            manifest = json.loads(zf.read("manifest.json"))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise ImportPackageError(f"Invalid manifest.json: {e}") from e
+        _check_manifest(manifest, mission, names)
+
+    route_files = sorted(
+        name for name in names if name.startswith("routes/") and name.endswith(".kml")
+    )
+    poi_files = sorted(
+        name
+        for name in names
+        if name.startswith("pois/")
+        and name.endswith(".json")
+        and name != SATELLITE_POI_FILE
+    )
+    return PackageContents(
+        mission=mission,
+        route_files=route_files,
+        poi_files=poi_files,
+        has_satellites=SATELLITE_POI_FILE in names,
+        manifest=manifest,
+    )
+
+
+def _check_manifest(manifest: Any, mission: Mission, names: set[str]) -> None:
+    """Check that a manifest describes this mission and archive."""
+    if not isinstance(manifest, dict):
+        raise ImportPackageError("Invalid manifest.json: expected an object")
+
+    manifest_mission_id = manifest.get("mission_id")
+    if manifest_mission_id and manifest_mission_id != mission.id:
+        raise ImportPackageError(
+            f"Manifest is for mission {manifest_mission_id}, "
+            f"but mission.json is {mission.id}"
+        )
+
+    listed = [
+        path
+        for paths in (manifest.get("file_structure") or {}).values()
+        if isinstance(paths, list)
+        for path in paths
+    ]
+    missing = [path for path in listed if path not in names]
+    if missing:
+        shown = ", ".join(missing[:5])
+        more = f" and {len(missing) - 5} more" if len(missing) > 5 else ""
+        raise ImportPackageError(f"Package is missing files: {shown}{more}")
+
+
+def _import_routes(
+    zf: zipfile.ZipFile,
+    route_files: list[str],
+    route_manager: RouteManager,
+    scratch_dir: Path,
+    counters: ImportCounterCallback,
+) -> tuple[int, list[str]]:
+    """Parse route KMLs in parallel, then install and register the valid ones.
+
+    Returns:
+        Tuple of (routes_imported, warnings)
+    """
+    staging = scratch_dir / "routes"
+    staging.mkdir(parents=True, exist_ok=True)
+    staged = []
+    for route_file in route_files:
+        path = staging / PurePosixPath(route_file).name
+        with zf.open(route_file) as src, open(path, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        staged.append(str(path))
+
+    routes_dir = Path(route_manager.routes_dir)
+    routes_dir.mkdir(parents=True, exist_ok=True)
+    imported = 0
+    warnings = []
+    outcomes = get_export_render_pool().run_ordered(parse_kml_file, staged)
+    for route_file, (path, parsed_route, error) in zip(route_files, outcomes):
+        route_id = Path(path).stem
+        if error is not None or parsed_route is None:
+            logger.error(f"Failed to import route {route_file}: {error}")
+            warnings.append(f"Route {route_file}: {error or 'no route found'}")
+            continue
+        shutil.copyfile(path, routes_dir / f"{route_id}.kml")
+        route_manager.add_route(route_id, parsed_route)
+        imported += 1
+        counters(routes_imported=imported)
+        logger.info(f"Imported route: {route_id}")
+    return imported, warnings
+
+
+def _read_poi_entries(
+    zf: zipfile.ZipFile, poi_file: str, warnings: list[str]
+) -> list[dict]:
+    """Return the POI dicts of one package file, recording a warning on failure."""
+    try:
+        entries = json.loads(zf.read(poi_file)).get("pois", [])
+    except Exception as e:
+        logger.error(f"Failed to process POI file {poi_file}: {e}")
+        warnings.append(f"POI file {poi_file}: {str(e)}")
+        return []
+    return entries
+
+
+def _import_pois(
+    zf: zipfile.ZipFile,
+    contents: PackageContents,
+    poi_manager: POIManager,
+    counters: ImportCounterCallback,
+) -> dict[str, Any]:
+    """Insert satellite and leg POIs in a single POI manager batch.
+
+    Satellites are deduplicated by name: an existing satellite is updated
+    only if its orbital position (longitude) changed.
+
+    Returns:
+        Counts (pois_imported, satellites_imported, satellites_updated) and
+        warnings
+    """
+    warnings: list[str] = []
+    satellites: list[POI] = []
+    if contents.has_satellites:
+        for poi_dict in _read_poi_entries(zf, SATELLITE_POI_FILE, warnings):
+            try:
+                satellites.append(POI(**poi_dict))
+            except Exception as e:
+                logger.error(f"Failed to import satellite POI: {e}")
+                warnings.append(f"Satellite POI: {str(e)}")
+
+    leg_pois: list[POI] = []
+    for poi_file in contents.poi_files:
+        for poi_dict in _read_poi_entries(zf, poi_file, warnings):
+            # Satellites are shared across missions and imported above
+            if poi_dict.get("category") == "satellite":
+                continue
+            try:
+                leg_pois.append(POI(**poi_dict))
+            except Exception as e:
+                logger.error(f"Failed to import POI from {poi_file}: {e}")
+                warnings.append(f"POI in {poi_file}: {str(e)}")
+
+    counters(pois_total=len(leg_pois), satellites_total=len(satellites))
+
+    existing_satellites = {
+        poi.name: poi for poi in poi_manager.list_pois() if poi.category == "satellite"
+    }
+    satellites_imported = satellites_updated = pois_imported = 0
+    with poi_manager.batch():
+        for poi in satellites:
+            existing = existing_satellites.get(poi.name)
+            try:
+                if existing is None:
+                    existing_satellites[poi.name] = poi_manager.create_poi(poi)
+                    satellites_imported += 1
+                elif existing.longitude != poi.longitude:
+                    poi_manager.update_poi(existing.id, poi)
+                    satellites_updated += 1
+            except Exception as e:
+                logger.error(f"Failed to import satellite POI: {e}")
+                warnings.append(f"Satellite POI: {str(e)}")
+
+        for poi in leg_pois:
+            try:
+                poi_manager.create_poi(poi)
+                pois_imported += 1
+            except Exception as e:
+                logger.error(f"Failed to import POI {poi.name}: {e}")
+                warnings.append(f"POI {poi.name}: {str(e)}")
+
+    counters(
+        pois_imported=pois_imported,
+        satellites_imported=satellites_imported,
+        satellites_updated=satellites_updated,
+    )
+    logger.info(
+        f"Imported {pois_imported} POIs and {satellites_imported} satellites "
+        f"({satellites_updated} updated) in one batch"
+    )
+    return {
+        "pois_imported": pois_imported,
+        "satellites_imported": satellites_imported,
+        "satellites_updated": satellites_updated,
+        "warnings": warnings,
+    }
+
+
+def import_mission_package(
+    zip_path: Path,
+    scratch_dir: Path,
+    route_manager: Optional[RouteManager],
+    poi_manager: Optional[POIManager],
+    progress: Optional[ImportProgressCallback] = None,
+    counters: Optional[ImportCounterCallback] = None,
+) -> dict:
+    """Import a mission package that has been spooled to disk.
+
+    Leg timelines are not generated here; callers schedule them once the
+    import result is available.
+
+    Args:
+        zip_path: Spooled package archive
+        scratch_dir: Working directory for extracted route files
+        route_manager: RouteManager instance (routes are skipped without one)
+        poi_manager: POIManager instance (POIs are skipped without one)
+        progress: Optional callback receiving (fraction, message) per stage
+        counters: Optional callback receiving named progress counters
+
+    Returns:
+        Import result with success status, mission ID, counts and warnings
+
+    Raises:
+        ImportPackageError: If the package fails validation
+        zipfile.BadZipFile: If the upload is not a zip archive
+    """
+
+    def report(fraction: float, message: str) -> None:
+        if progress:
+            progress(fraction, message)
+
+    def count(**values: int) -> None:
+        if counters:
+            counters(**values)
+
+    warnings: list[str] = []
+    routes_imported = 0
+    poi_counts = {"pois_imported": 0, "satellites_imported": 0, "satellites_updated": 0}
+
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        report(0.05, "Validating package")
+        contents = read_package(zf)
+        mission = contents.mission
+        count(legs=len(mission.legs), routes_total=len(contents.route_files))
+
+        save_mission_v2(mission)
+        logger.info(f"Mission {mission.id} imported successfully")
+
+        report(0.2, f"Parsing {len(contents.route_files)} routes")
+        if route_manager:
+            routes_imported, route_warnings = _import_routes(
+                zf, contents.route_files, route_manager, scratch_dir, count
+            )
+            warnings.extend(route_warnings)
+        else:
+            warnings.append("Route manager not available, routes not imported")
+
+        report(0.7, "Importing POIs")
+        if poi_manager:
+            poi_result = _import_pois(zf, contents, poi_manager, count)
+            warnings.extend(poi_result.pop("warnings"))
+            poi_counts.update(poi_result)
+        else:
+            warnings.append("POI manager not available, POIs not imported")
+
+    if warnings:
+        logger.warning(f"Import completed with {len(warnings)} warnings")
+
+    return {
+        "success": True,
+        "mission_id": mission.id,
+        "mission_name": mission.name,
+        "leg_count": len(mission.legs),
+        "routes_imported": routes_imported,
+        **poi_counts,
+        "warnings": warnings,
+    }
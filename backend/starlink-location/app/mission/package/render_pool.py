@@ -0,0 +1,194 @@
+"""Process pool for rendering mission export artifacts in parallel.
+
+Route maps, charts and slide decks are rendered with matplotlib/cartopy,
+which is CPU-bound and not thread-safe under pyplot's global state, so
+independent render tasks run in worker processes. Results are yielded back
+in task order so the zip writer stays deterministic no matter which worker
+finishes first.
+
+Workers do not share the API process's managers: each task carries a
+read-only snapshot of the route and POIs it needs. Rendered images land in
+the shared on-disk image cache, so later steps in the parent (e.g. the
+combined mission deck) reuse them instead of rendering again.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import threading
+from typing import Any, Callable, Iterator, Optional, Sequence, TypeVar
+
+from app.models.poi import POI
+from app.models.route import ParsedRoute
+
+logger = logging.getLogger(__name__)
+
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", "0"))  # 0 = one per CPU, max 8
+EXPORT_TASK_TIMEOUT_SECONDS = float(os.getenv("EXPORT_TASK_TIMEOUT_SECONDS", "300"))
+# spawn avoids forking the threaded API server with locks (and pyplot state) held
+EXPORT_POOL_START_METHOD = os.getenv("EXPORT_POOL_START_METHOD", "spawn")
+
+TaskT = TypeVar("TaskT")
+ResultT = TypeVar("ResultT")
+
+
+class SnapshotRouteManager:
+    """Read-only stand-in for RouteManager holding a fixed set of routes."""
+
+    def __init__(self, routes: dict[str, ParsedRoute]):
+        self._routes = dict(routes)
+
+    def get_route(self, route_id: str) -> Optional[ParsedRoute]:
+        """Return a snapshotted route by ID."""
+        return self._routes.get(route_id)
+
+    def list_routes(self) -> dict[str, ParsedRoute]:
+        """Return all snapshotted routes."""
+        return dict(self._routes)
+
+
+class SnapshotPOIManager:
+    """Read-only stand-in for POIManager holding a fixed list of POIs."""
+
+    def __init__(self, pois: Sequence[POI]):
+        self._pois = list(pois)
+
+    def list_pois(
+        self, route_id: Optional[str] = None, mission_id: Optional[str] = None
+    ) -> list[POI]:
+        """Return POIs matching the same route/mission filters as POIManager."""
+        return [
+            poi
+            for poi in self._pois
+            if (route_id is None or poi.route_id == route_id)
+            and (mission_id is None or poi.mission_id == mission_id)
+        ]
+
+
+class ExportRenderPool:
+    """Runs independent render tasks in a lazily started worker pool."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        task_timeout_seconds: float | None = None,
+        start_method: str | None = None,
+    ):
+        """Initialize the pool (workers start on first use).
+
+        Args:
+            max_workers: Worker process count (defaults to EXPORT_WORKERS)
+            task_timeout_seconds: Per-task timeout in seconds
+            start_method: multiprocessing start method ("spawn", "fork", ...)
+        """
+        configured = max_workers if max_workers is not None else EXPORT_WORKERS
+        self.max_workers = configured or min(os.cpu_count() or 1, 8)
+        self.task_timeout_seconds = (
+            task_timeout_seconds
+            if task_timeout_seconds is not None
+            else EXPORT_TASK_TIMEOUT_SECONDS
+        )
+        self.start_method = start_method or EXPORT_POOL_START_METHOD
+        self._pool: multiprocessing.pool.Pool | None = None
+        self._lock = threading.Lock()
+
+    def run_ordered(
+        self,
+        render: Callable[[TaskT], ResultT],
+        tasks: Sequence[TaskT],
+    ) -> Iterator[tuple[TaskT, Optional[ResultT], Optional[BaseException]]]:
+        """Run ``render`` over ``tasks`` and yield outcomes in task order.
+
+        Two or more tasks are dispatched to worker processes (``render`` must
+        be a picklable module-level function); a single task, a one-worker
+        pool, or a pool that fails to start renders inline. A task that times
+        out recycles the pool, and the remaining tasks render inline.
+
+        Args:
+            render: Function producing one task's result
+            tasks: Picklable task descriptions
+
+        Yields:
+            (task, result, error) with exactly one of result/error set
+        """
+        handles: list[Any] = []
+        if len(tasks) >= 2 and self.max_workers > 1:
+            try:
+                pool = self._ensure_pool()
+                handles = [pool.apply_async(render, (task,)) for task in tasks]
+                logger.info(f"Dispatched {len(tasks)} export render tasks to workers")
+            except (OSError, ValueError) as exc:
+                logger.warning(
+                    f"Export render pool unavailable, rendering inline: {exc}"
+                )
+                handles = []
+
+        for index, task in enumerate(tasks):
+            if index < len(handles):
+                try:
+                    result = handles[index].get(timeout=self.task_timeout_seconds)
+                except multiprocessing.TimeoutError:
+                    logger.error(
+                        f"Export render task timed out after "
+                        f"{self.task_timeout_seconds:.0f}s; rendering the rest inline"
+                    )
+                    # A stuck worker cannot be cancelled individually; recycle the pool
+                    self.shutdown()
+                    handles = []
+                except Exception as exc:
+                    yield task, None, exc
+                    continue
+                else:
+                    yield task, result, None
+                    continue
+
+            try:
+                result = render(task)
+            except Exception as exc:
+                yield task, None, exc
+            else:
+                yield task, result, None
+
+    def shutdown(self) -> None:
+        """Stop worker processes."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    def _ensure_pool(self) -> multiprocessing.pool.Pool:
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context(self.start_method)
+                self._pool = context.Pool(processes=self.max_workers)
+                logger.info(
+                    f"Started export render pool ({self.max_workers} workers, "
+                    f"{self.start_method})"
+                )
+            return self._pool
+
+
+_render_pool: ExportRenderPool | None = None
+_render_pool_lock = threading.Lock()
+
+
+def get_export_render_pool() -> ExportRenderPool:
+    """Return the process-wide export render pool."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ExportRenderPool()
+        return _render_pool
+
+
+def shutdown_export_render_pool() -> None:
+    """Stop the process-wide export render pool, if it was started."""
+    global _render_pool
+    with _render_pool_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown()
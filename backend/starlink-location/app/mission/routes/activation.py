@@ -15,7 +15,7 @@ from app.mission.models import MissionLeg, MissionPhase, MissionLegTimeline
 from app.mission.storage import (
     load_mission,
     mission_exists,
-    list_missions,
+    get_active_mission_ids,
     save_mission,
     load_mission_timeline,
 )
@@ -123,11 +123,9 @@ async def activate_mission(
                 detail=f"Mission {mission_id} is already active",
             )
 
-        # Deactivate all other missions
-        all_missions = list_missions()
-        for m_metadata in all_missions:
-            m_id = m_metadata.get("id")
-            if m_id and m_id != mission_id:
+        # Deactivate all other missions (the catalog knows which are active)
+        for m_id in get_active_mission_ids():
+            if m_id != mission_id:
                 try:
                     other_mission = load_mission(m_id)
                     if other_mission.is_active:
@@ -351,15 +349,11 @@ async def get_active_mission() -> MissionLeg:
                 # Stale reference, clear it
                 _active_mission_id = None
 
-        # Otherwise, search for any mission marked as active
-        all_missions = list_missions()
-        for m_metadata in all_missions:
-            if m_metadata.get("is_active"):
-                m_id = m_metadata.get("id")
-                if m_id:
-                    mission = load_mission(m_id)
-                    _active_mission_id = m_id  # Update in-memory reference
-                    return mission
+        # Otherwise, look up any mission marked as active
+        for m_id in get_active_mission_ids():
+            mission = load_mission(m_id)
+            _active_mission_id = m_id  # Update in-memory reference
+            return mission
 
         # No active mission found
         logger.debug("No active mission found")
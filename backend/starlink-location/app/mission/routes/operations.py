@@ -112,6 +112,7 @@ async def recompute_mission_timeline_endpoint(
             refresh_metrics=mission.is_active,
             route_manager=route_manager,
             poi_manager=poi_manager,
+            force=True,
         )
     except TimelineComputationError as exc:
         logger.error("Failed to recompute timeline for %s", mission_id, exc_info=True)
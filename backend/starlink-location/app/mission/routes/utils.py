@@ -13,6 +13,8 @@ from app.mission.timeline_service import (
     build_mission_timeline,
 )
 from app.mission.storage import save_mission_timeline
+from app.mission.timeline_index import TRANSPORT_STATE_METRIC_VALUES
+from app.mission.timeline_cache import get_or_build_timeline
 from app.core.metrics import (
     update_mission_duration_metrics,
     update_mission_next_conflict_metric,
@@ -65,14 +67,19 @@ def compute_and_store_timeline_for_mission(
     refresh_metrics: bool,
     route_manager: RouteManager,
     poi_manager: POIManager | None = None,
+    force: bool = False,
 ) -> tuple[MissionLegTimeline, TimelineSummary]:
     """Build, persist, and optionally publish metrics for a mission timeline.
 
+    The stored timeline is reused when none of its inputs changed since the
+    last build (see app.mission.timeline_cache).
+
     Args:
         mission: Mission to compute timeline for
         refresh_metrics: Whether to update Prometheus metrics
         route_manager: Route manager instance
         poi_manager: Optional POI manager instance
+        force: Rebuild even if a cached timeline matches
 
     Returns:
         Tuple of (timeline, summary)
@@ -86,12 +93,19 @@ def compute_and_store_timeline_for_mission(
             detail="Route manager unavailable for timeline computation",
         )
 
-    timeline, summary = build_mission_timeline(
+    route = route_manager.get_route(mission.route_id) if mission.route_id else None
+    timeline, summary = get_or_build_timeline(
         mission,
-        route_manager,
-        poi_manager,
+        route,
+        lambda: build_mission_timeline(
+            mission,
+            route_manager,
+            poi_manager,
+        ),
+        poi_manager=poi_manager,
+        save=save_mission_timeline,
+        force=force,
     )
-    save_mission_timeline(mission.id, timeline)
     generated_ts = datetime.now(timezone.utc).timestamp()
     update_mission_timeline_timestamp(mission.id, generated_ts)
 
@@ -159,12 +173,7 @@ def _state_to_metric_value(state: TransportState) -> int:
     Returns:
         Numeric metric value (0, 1, or 2)
     """
-    mapping = {
-        TransportState.AVAILABLE: 0,
-        TransportState.DEGRADED: 1,
-        TransportState.OFFLINE: 2,
-    }
-    return mapping.get(state, 0)
+    return TRANSPORT_STATE_METRIC_VALUES.get(state, 0)
 
 
 def build_satellite_geojson(mission: MissionLeg) -> dict:
@@ -5,13 +5,13 @@
 # coordinate across storage, KML parsing, and state machines. Separation would
 # create circular imports. Deferred to v0.4.0.
 
-import json
 import logging
+import shutil
 import tempfile
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from fastapi import (
     APIRouter,
     HTTPException,
@@ -22,7 +22,9 @@ from fastapi import (
     Depends,
     Request,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
+from app.core.jobs import JobContext, get_job_manager, job_result_path
 from app.core.limiter import limiter
 
 from app.mission.models import Mission, MissionLeg, MissionUpdate, TransportConfig
@@ -32,9 +34,20 @@ from app.mission.storage import (
     save_mission_timeline,
     get_mission_lock,
     load_mission_metadata_v2,
+    list_mission_summaries_v2,
+    delete_mission_v2,
+)
+from app.mission.package import (
+    ImportPackageError,
+    UploadTooLargeError,
+    export_mission_package,
+    import_mission_package,
+    spool_upload,
+    stream_mission_package,
 )
-from app.mission.package import export_mission_package
 from app.mission.timeline_service import build_mission_timeline
+from app.mission.timeline_cache import get_or_build_timeline, get_timeline_cache
+from app.mission.timeline_pool import LegTimelineOutcome, get_timeline_worker_pool
 from app.mission.validation import validate_adjusted_departure_time
 from app.services.route_manager import RouteManager
 from app.services.poi_manager import POIManager
@@ -60,6 +73,89 @@ def set_coverage_sampler(coverage_sampler: CoverageSampler) -> None:
     _coverage_sampler = coverage_sampler
 
 
+def _build_leg_timeline(
+    leg: MissionLeg,
+    mission_id: str,
+    route_manager: RouteManager,
+    poi_manager: Optional[POIManager],
+    coverage_sampler: Optional[CoverageSampler] = None,
+    include_samples: bool = False,
+    persist: bool = True,
+):
+    """Build and store a leg timeline, reusing the cached one if inputs are unchanged.
+
+    Args:
+        leg: Leg to compute the timeline for
+        mission_id: Parent mission ID (POI scoping)
+        route_manager: RouteManager instance
+        poi_manager: Optional POIManager instance
+        coverage_sampler: Coverage sampler override (defaults to the global one)
+        include_samples: Include route samples for preview rendering
+        persist: Save the timeline to disk
+
+    Returns:
+        Tuple of (timeline, summary)
+    """
+    sampler = coverage_sampler or _coverage_sampler
+    route = route_manager.get_route(leg.route_id) if leg.route_id else None
+    return get_or_build_timeline(
+        leg,
+        route,
+        lambda: build_mission_timeline(
+            mission=leg,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+            coverage_sampler=sampler,
+            parent_mission_id=mission_id,
+            include_samples=include_samples,
+        ),
+        coverage_sampler=sampler,
+        poi_manager=poi_manager,
+        parent_mission_id=mission_id,
+        include_samples=include_samples,
+        save=save_mission_timeline if persist else None,
+    )
+
+
+def _build_leg_timelines(
+    legs: list[MissionLeg],
+    mission_id: str,
+    route_manager: RouteManager,
+    poi_manager: Optional[POIManager],
+    coverage_sampler: Optional[CoverageSampler] = None,
+    force: bool = False,
+) -> list[LegTimelineOutcome]:
+    """Build and store timelines for several legs on the timeline worker pool.
+
+    Args:
+        legs: Legs to compute timelines for
+        mission_id: Parent mission ID (POI scoping)
+        route_manager: RouteManager instance
+        poi_manager: Optional POIManager instance
+        coverage_sampler: Coverage sampler override (defaults to the global one)
+        force: Rebuild even if cached timelines are current
+
+    Returns:
+        One outcome per leg with a route
+    """
+    sampler = coverage_sampler or _coverage_sampler
+    return get_timeline_worker_pool().build_legs(
+        legs,
+        route_manager,
+        poi_manager,
+        lambda leg: build_mission_timeline(
+            mission=leg,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+            coverage_sampler=sampler,
+            parent_mission_id=mission_id,
+        ),
+        coverage_sampler=sampler,
+        parent_mission_id=mission_id,
+        force=force,
+    )
+
+
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=Mission)
 async def create_mission(
     mission: Mission,
@@ -85,14 +181,7 @@ async def create_mission(
                 if leg.route_id:
                     try:
                         logger.info(f"Generating timeline for leg {leg.id}")
-                        timeline, summary = build_mission_timeline(
-                            mission=leg,
-                            route_manager=route_manager,
-                            poi_manager=poi_manager,
-                            coverage_sampler=_coverage_sampler,
-                            parent_mission_id=mission.id,
-                        )
-                        save_mission_timeline(leg.id, timeline)
+                        _build_leg_timeline(leg, mission.id, route_manager, poi_manager)
                         logger.info(f"Timeline generated and saved for leg {leg.id}")
                     except Exception as e:
                         logger.error(
@@ -123,21 +212,8 @@ async def list_missions(
         List of missions with metadata only (empty legs arrays)
     """
     try:
-        from pathlib import Path
-
-        missions_dir = Path("data/missions")
-
-        if not missions_dir.exists():
-            return []
-
-        missions = []
-        for mission_dir in sorted(missions_dir.iterdir()):
-            if mission_dir.is_dir():
-                # Use metadata-only loading for efficiency
-                mission = load_mission_metadata_v2(mission_dir.name)
-                if mission:
-                    missions.append(mission)
-
+        # Served from the mission catalog; no mission file is read
+        missions = list_mission_summaries_v2()
         return missions[offset : offset + limit]
     except Exception as e:
         logger.error(f"Failed to list missions: {e}", exc_info=True)
@@ -244,7 +320,6 @@ async def delete_mission_endpoint(
         HTTPException: 404 if mission not found, 500 on deletion failure
     """
     try:
-        import shutil
         from pathlib import Path
 
         logger.info(f"Deleting mission {mission_id}")
@@ -325,19 +400,14 @@ async def delete_mission_endpoint(
                         # Don't fail entire mission deletion if POI deletion fails
 
             # Delete entire mission directory
-            mission_dir = Path("data/missions") / mission_id
-            if mission_dir.exists():
-                try:
-                    shutil.rmtree(mission_dir)
-                    logger.info(f"Deleted mission directory: {mission_dir}")
-                except OSError as e:
-                    logger.error(
-                        f"Failed to delete mission directory {mission_dir}: {e}"
-                    )
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="Failed to delete mission directory",
-                    )
+            try:
+                delete_mission_v2(mission_id)
+            except OSError as e:
+                logger.error(f"Failed to delete mission directory {mission_id}: {e}")
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to delete mission directory",
+                )
 
             logger.info(
                 f"Mission {mission_id} deleted successfully with {leg_count} leg(s), "
@@ -362,19 +432,21 @@ async def export_mission(
     route_manager: RouteManager = Depends(get_route_manager),
     poi_manager: POIManager = Depends(get_poi_manager),
 ) -> StreamingResponse:
-    """Export mission as zip package."""
+    """Export mission as zip package.
+
+    The archive is streamed while it is generated: mission data and routes
+    are sent immediately and each leg's exports follow as they finish
+    rendering, with no temp file on the server. Generation runs in worker
+    threads so the event loop keeps serving other requests. For large
+    missions prefer ``POST /{mission_id}/export/jobs``.
+    """
     try:
-        zip_file = export_mission_package(
+        chunks = await run_in_threadpool(
+            stream_mission_package,
             mission_id,
             route_manager=route_manager,
             poi_manager=poi_manager,
         )
-
-        return StreamingResponse(
-            zip_file,
-            media_type="application/zip",
-            headers={"Content-Disposition": f'attachment; filename="{mission_id}.zip"'},
-        )
     except Exception as e:
         logger.error(f"Export failed: {e}")
         raise HTTPException(
@@ -382,194 +454,66 @@ async def export_mission(
             detail=str(e),
         )
 
-
-def safe_extract_path(zip_path: str, base_path: Path) -> Path:
-    """Validate that a zip extraction path is safe (prevents directory traversal attacks).
-
-    Args:
-        zip_path: Path from zip file
-        base_path: Base directory for extraction
-
-    Returns:
-        Validated absolute path
-
-    Raises:
-        HTTPException: If path attempts directory traversal
-    """
-    # Resolve the absolute path
-    absolute_path = (base_path / zip_path).resolve()
-
-    # Ensure the path is within the base directory
-    if not str(absolute_path).startswith(str(base_path.resolve())):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid path in zip: {zip_path} (directory traversal attempt)",
-        )
-
-    return absolute_path
-
-
-def _import_routes_from_zip(
-    zf: zipfile.ZipFile,
-    route_manager: RouteManager,
-    tmppath: Path,
-) -> tuple[int, list[str]]:
-    """Import route KML files from zip archive.
-
-    Args:
-        zf: ZipFile to read from
-        route_manager: RouteManager instance
-        tmppath: Temporary directory path
-
-    Returns:
-        Tuple of (routes_imported, warnings)
-    """
-    routes_imported = 0
-    warnings = []
-
-    route_files = [
-        f for f in zf.namelist() if f.startswith("routes/") and f.endswith(".kml")
-    ]
-    for route_file in route_files:
+    def stream() -> Iterator[bytes]:
         try:
-            # Validate path safety
-            safe_extract_path(route_file, tmppath)
-
-            route_id = Path(route_file).stem
-            kml_content = zf.read(route_file)
-
-            # Save route KML to routes directory
-            routes_dir = Path(route_manager.routes_dir)
-            kml_path = routes_dir / f"{route_id}.kml"
-            with open(kml_path, "wb") as f:
-                f.write(kml_content)
-
-            routes_imported += 1
-            logger.info(f"Imported route: {route_id}")
+            yield from chunks
         except Exception as e:
-            logger.error(f"Failed to import route {route_file}: {e}")
-            warnings.append(f"Route {route_file}: {str(e)}")
-
-    return routes_imported, warnings
-
-
-def _import_satellite_pois(
-    zf: zipfile.ZipFile,
-    poi_manager: POIManager,
-) -> tuple[int, int, list[str]]:
-    """Import and deduplicate satellite POIs from zip archive.
+            # Headers are already sent; the client sees a truncated archive
+            logger.error(f"Export of mission {mission_id} failed mid-stream: {e}")
+            raise
 
-    Args:
-        zf: ZipFile to read from
-        poi_manager: POIManager instance
+    return StreamingResponse(
+        stream(),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{mission_id}.zip"'},
+    )
 
-    Returns:
-        Tuple of (satellites_imported, satellites_updated, warnings)
-    """
-    from app.models.poi import POI
-
-    satellites_imported = 0
-    satellites_updated = 0
-    warnings = []
-
-    satellite_file = "pois/satellites.json"
-    if satellite_file not in zf.namelist():
-        return satellites_imported, satellites_updated, warnings
-
-    try:
-        satellite_data = json.loads(zf.read(satellite_file))
-        for poi_dict in satellite_data.get("pois", []):
-            try:
-                poi = POI(**poi_dict)
-
-                # Check if satellite already exists by name
-                existing_pois = poi_manager.list_pois()
-                existing_satellite = next(
-                    (
-                        p
-                        for p in existing_pois
-                        if p.name == poi.name and p.category == "satellite"
-                    ),
-                    None,
-                )
-
-                if existing_satellite:
-                    # Update if orbital position (longitude) is different
-                    if existing_satellite.longitude != poi.longitude:
-                        poi_manager.update_poi(existing_satellite.id, poi)
-                        satellites_updated += 1
-                        logger.info(
-                            f"Updated satellite POI: {poi.name} (orbital position changed)"
-                        )
-                    else:
-                        logger.info(
-                            f"Satellite POI already exists with same position: {poi.name}"
-                        )
-                else:
-                    # Create new satellite POI
-                    poi_manager.create_poi(poi)
-                    satellites_imported += 1
-                    logger.info(f"Imported satellite POI: {poi.name}")
-            except Exception as e:
-                logger.error(f"Failed to import satellite POI: {e}")
-                warnings.append(f"Satellite POI: {str(e)}")
-    except Exception as e:
-        logger.error(f"Failed to process satellite POIs: {e}")
-        warnings.append(f"Satellites file: {str(e)}")
-
-    return satellites_imported, satellites_updated, warnings
 
+@router.post("/{mission_id}/export/jobs", status_code=status.HTTP_202_ACCEPTED)
+@limiter.limit("10/minute")
+async def create_export_job(
+    request: Request,
+    mission_id: str,
+    route_manager: RouteManager = Depends(get_route_manager),
+    poi_manager: POIManager = Depends(get_poi_manager),
+) -> dict:
+    """Start a background mission export.
 
-def _import_leg_pois(
-    zf: zipfile.ZipFile,
-    poi_manager: POIManager,
-    poi_files: list[str],
-    satellite_file: str,
-    tmppath: Path,
-) -> tuple[int, list[str]]:
-    """Import leg-specific POIs from zip archive.
+    Poll ``GET /api/v2/jobs/{job_id}`` for progress and download the zip from
+    ``GET /api/v2/jobs/{job_id}/result`` once the job has succeeded.
 
     Args:
-        zf: ZipFile to read from
-        poi_manager: POIManager instance
-        poi_files: List of POI file paths in zip
-        satellite_file: Path to satellite POI file (to skip)
-        tmppath: Temporary directory path
+        mission_id: Mission to export
 
     Returns:
-        Tuple of (pois_imported, warnings)
+        Queued job status
     """
-    from app.models.poi import POI
-
-    pois_imported = 0
-    warnings = []
+    if not load_mission_metadata_v2(mission_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Mission {mission_id} not found",
+        )
 
-    # Process leg-specific POI files
-    leg_poi_files = [f for f in poi_files if f != satellite_file]
-    for poi_file in leg_poi_files:
+    def run_export(context: JobContext) -> dict:
+        zip_file = export_mission_package(
+            mission_id,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+            progress=context.report,
+        )
+        result_path = job_result_path(context.job_id, ".zip")
         try:
-            # Validate path safety
-            safe_extract_path(poi_file, tmppath)
-
-            poi_data = json.loads(zf.read(poi_file))
-            for poi_dict in poi_data.get("pois", []):
-                try:
-                    # Skip if this is a satellite POI (already processed)
-                    if poi_dict.get("category") == "satellite":
-                        continue
-
-                    poi = POI(**poi_dict)
-                    poi_manager.create_poi(poi)
-                    pois_imported += 1
-                    logger.info(f"Imported POI: {poi.name}")
-                except Exception as e:
-                    logger.error(f"Failed to import POI from {poi_file}: {e}")
-                    warnings.append(f"POI in {poi_file}: {str(e)}")
-        except Exception as e:
-            logger.error(f"Failed to process POI file {poi_file}: {e}")
-            warnings.append(f"POI file {poi_file}: {str(e)}")
+            with open(result_path, "wb") as out:
+                shutil.copyfileobj(zip_file, out)
+        finally:
+            zip_file.close()
+        context.set_result_file(result_path, "application/zip", f"{mission_id}.zip")
+        return {"mission_id": mission_id, "size_bytes": result_path.stat().st_size}
 
-    return pois_imported, warnings
+    job = get_job_manager().submit(
+        "mission_export", run_export, metadata={"mission_id": mission_id}
+    )
+    return job.to_dict()
 
 
 def _generate_timelines_for_imported_legs(
@@ -591,30 +535,83 @@ def _generate_timelines_for_imported_legs(
     """
     warnings = []
 
-    for leg in mission.legs:
-        if leg.route_id:
-            try:
-                logger.info(f"Generating timeline for imported leg {leg.id}")
-                timeline, summary = build_mission_timeline(
-                    mission=leg,
-                    route_manager=route_manager,
-                    poi_manager=poi_manager,
-                    coverage_sampler=coverage_sampler,
-                    parent_mission_id=mission.id,
-                )
-                save_mission_timeline(leg.id, timeline)
-                logger.info(f"Timeline generated and saved for imported leg {leg.id}")
-            except Exception as e:
-                logger.error(
-                    f"Failed to generate timeline for imported leg {leg.id}: {e}"
-                )
-                warnings.append(
-                    f"Timeline generation failed for leg {leg.id}: {str(e)}"
-                )
+    outcomes = _build_leg_timelines(
+        mission.legs,
+        mission.id,
+        route_manager,
+        poi_manager,
+        coverage_sampler=coverage_sampler,
+    )
+    for outcome in outcomes:
+        if outcome.ok:
+            logger.info(
+                f"Timeline generated and saved for imported leg {outcome.leg_id} "
+                f"({outcome.source})"
+            )
+        else:
+            logger.error(
+                f"Failed to generate timeline for imported leg {outcome.leg_id}: "
+                f"{outcome.error}"
+            )
+            warnings.append(
+                f"Timeline generation failed for leg {outcome.leg_id}: {outcome.error}"
+            )
 
     return warnings
 
 
+def _submit_import_timeline_job(
+    mission_id: str,
+    route_manager: RouteManager,
+    poi_manager: Optional[POIManager],
+) -> str:
+    """Generate an imported mission's leg timelines in a background job.
+
+    Imported legs need timelines for derived data such as Ka transitions;
+    building them is the slowest part of an import, so it runs after the
+    import has been reported.
+
+    Args:
+        mission_id: Imported mission
+        route_manager: RouteManager instance
+        poi_manager: POIManager instance
+
+    Returns:
+        Timeline job ID
+    """
+
+    def run_timelines(context: JobContext) -> dict:
+        mission = load_mission_v2(mission_id)
+        if mission is None:
+            raise ValueError(f"Mission {mission_id} not found")
+        context.update_counters(legs=len(mission.legs))
+        context.report(0.0, f"Generating timelines for {len(mission.legs)} legs")
+        warnings = _generate_timelines_for_imported_legs(
+            mission, route_manager, poi_manager, _coverage_sampler
+        )
+        context.update_counters(
+            timelines_built=len(mission.legs) - len(warnings),
+            timelines_failed=len(warnings),
+        )
+        return {"mission_id": mission_id, "warnings": warnings}
+
+    job = get_job_manager().submit(
+        "mission_timelines", run_timelines, metadata={"mission_id": mission_id}
+    )
+    return job.id
+
+
+async def _spool_import_upload(file: UploadFile, zip_path: Path) -> int:
+    """Spool an uploaded package to disk, mapping size errors to 413."""
+    try:
+        return await spool_upload(file, zip_path)
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File too large",
+        )
+
+
 @router.post("/import")
 @limiter.limit("5/minute")
 async def import_mission(
@@ -625,6 +622,9 @@ async def import_mission(
 ) -> dict:
     """Import mission from zip package.
 
+    Leg timelines are generated afterwards by a background job whose ID is
+    returned as ``timeline_job_id``.
+
     Args:
         file: Uploaded zip file containing mission package
 
@@ -632,109 +632,25 @@ async def import_mission(
         Import result with success status and mission ID
     """
     try:
-        warnings = []
-        routes_imported = 0
-        pois_imported = 0
-        satellites_imported = 0
-        satellites_updated = 0
-
         # Create temp directory for extraction
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
             zip_path = tmppath / "upload.zip"
+            await _spool_import_upload(file, zip_path)
 
-            # Save uploaded file
-            contents = await file.read()
-
-            MAX_UPLOAD_SIZE = 100 * 1024 * 1024  # 100 MB
-            if len(contents) > MAX_UPLOAD_SIZE:
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail="File too large",
-                )
-
-            with open(zip_path, "wb") as f:
-                f.write(contents)
-
-            # Extract and validate
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                # Check for required files
-                if "mission.json" not in zf.namelist():
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Invalid package: missing mission.json",
-                    )
-
-                # Extract mission.json
-                mission_data = json.loads(zf.read("mission.json"))
-
-                # Create Mission object
-                mission = Mission(**mission_data)
-
-                # Save mission
-                save_mission_v2(mission)
-                logger.info(f"Mission {mission.id} imported successfully")
-
-                # Import route KML files from routes/ folder
-                if route_manager:
-                    routes_imported, route_warnings = _import_routes_from_zip(
-                        zf, route_manager, tmppath
-                    )
-                    warnings.extend(route_warnings)
-                else:
-                    warnings.append("Route manager not available, routes not imported")
-
-                # Import POIs from pois/ folder
-                if poi_manager:
-                    poi_files = [
-                        f
-                        for f in zf.namelist()
-                        if f.startswith("pois/") and f.endswith(".json")
-                    ]
-                    satellite_file = "pois/satellites.json"
-
-                    # Process satellite POIs first (for deduplication)
-                    satellites_imported, satellites_updated, sat_warnings = (
-                        _import_satellite_pois(zf, poi_manager)
-                    )
-                    warnings.extend(sat_warnings)
-
-                    # Process leg-specific POI files
-                    pois_imported, poi_warnings = _import_leg_pois(
-                        zf, poi_manager, poi_files, satellite_file, tmppath
-                    )
-                    warnings.extend(poi_warnings)
-                else:
-                    warnings.append("POI manager not available, POIs not imported")
-
-                result = {
-                    "success": True,
-                    "mission_id": mission.id,
-                    "mission_name": mission.name,
-                    "leg_count": len(mission.legs),
-                    "routes_imported": routes_imported,
-                    "pois_imported": pois_imported,
-                    "satellites_imported": satellites_imported,
-                    "satellites_updated": satellites_updated,
-                    "warnings": warnings,
-                }
-
-                # Generate timelines for all imported legs to ensure derived data (like Ka transitions) is present
-                if route_manager:
-                    timeline_warnings = _generate_timelines_for_imported_legs(
-                        mission, route_manager, poi_manager, _coverage_sampler
-                    )
-                    warnings.extend(timeline_warnings)
-
-                if warnings:
-                    logger.warning(f"Import completed with {len(warnings)} warnings")
-
-                return result
+            # Parsing and POI import run off the event loop
+            result = await run_in_threadpool(
+                import_mission_package, zip_path, tmppath, route_manager, poi_manager
+            )
 
     except zipfile.BadZipFile:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid zip file"
         )
+    except ImportPackageError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Import failed: {e}")
         raise HTTPException(
@@ -742,6 +658,73 @@ async def import_mission(
             detail=f"Import failed: {str(e)}",
         )
 
+    if route_manager:
+        result["timeline_job_id"] = _submit_import_timeline_job(
+            result["mission_id"], route_manager, poi_manager
+        )
+    return result
+
+
+@router.post("/import/jobs", status_code=status.HTTP_202_ACCEPTED)
+@limiter.limit("5/minute")
+async def create_import_job(
+    request: Request,
+    file: UploadFile = File(...),
+    route_manager: RouteManager = Depends(get_route_manager),
+    poi_manager: POIManager = Depends(get_poi_manager),
+) -> dict:
+    """Start a background mission import.
+
+    The upload is spooled to disk and the job handle returned immediately;
+    validation, route parsing and POI import run as a job whose counters
+    (routes_total, routes_imported, pois_imported, ...) advance per stage.
+    The import result is available from ``GET /api/v2/jobs/{job_id}/result``
+    once the job has succeeded and names the follow-up ``timeline_job_id``.
+
+    Args:
+        file: Uploaded zip file containing mission package
+
+    Returns:
+        Queued job status
+    """
+    tmppath = Path(tempfile.mkdtemp(prefix="mission-import-"))
+    zip_path = tmppath / "upload.zip"
+    try:
+        size_bytes = await _spool_import_upload(file, zip_path)
+    except HTTPException:
+        shutil.rmtree(tmppath, ignore_errors=True)
+        raise
+
+    def run_import(context: JobContext) -> dict:
+        try:
+            result = import_mission_package(
+                zip_path,
+                tmppath,
+                route_manager,
+                poi_manager,
+                progress=context.report,
+                counters=context.update_counters,
+            )
+        except zipfile.BadZipFile:
+            raise ValueError("Invalid zip file")
+        finally:
+            # Free the spooled upload before the follow-up timeline job
+            shutil.rmtree(tmppath, ignore_errors=True)
+        if route_manager:
+            result["timeline_job_id"] = _submit_import_timeline_job(
+                result["mission_id"], route_manager, poi_manager
+            )
+        return result
+
+    job = get_job_manager().submit(
+        "mission_import",
+        run_import,
+        metadata={"filename": file.filename, "size_bytes": size_bytes},
+        # Also covers jobs cancelled (or shut down) before run_import starts
+        on_finish=lambda job: shutil.rmtree(tmppath, ignore_errors=True),
+    )
+    return job.to_dict()
+
 
 @router.post(
     "/{mission_id}/legs", status_code=status.HTTP_201_CREATED, response_model=MissionLeg
@@ -788,14 +771,7 @@ async def add_leg_to_mission(
             if route_manager:
                 try:
                     logger.info(f"Generating timeline for new leg {leg.id}")
-                    timeline, summary = build_mission_timeline(
-                        mission=leg,
-                        route_manager=route_manager,
-                        poi_manager=poi_manager,
-                        coverage_sampler=_coverage_sampler,
-                        parent_mission_id=mission_id,
-                    )
-                    save_mission_timeline(leg.id, timeline)
+                    _build_leg_timeline(leg, mission_id, route_manager, poi_manager)
                     logger.info(f"Timeline generated and saved for new leg {leg.id}")
                 except Exception as e:
                     logger.error(
@@ -900,12 +876,8 @@ async def update_leg(
                         f"Generating timeline for leg {leg_id} with "
                         f"adjusted_departure_time={updated_leg.adjusted_departure_time}"
                     )
-                    timeline, summary = build_mission_timeline(
-                        mission=updated_leg,
-                        route_manager=route_manager,
-                        poi_manager=poi_manager,
-                        coverage_sampler=_coverage_sampler,
-                        parent_mission_id=mission_id,
+                    timeline, summary = _build_leg_timeline(
+                        updated_leg, mission_id, route_manager, poi_manager
                     )
                     # Log the timeline start time to verify it was adjusted
                     if timeline.segments:
@@ -916,7 +888,6 @@ async def update_leg(
                             f"ends at {last_end}, "
                             f"{len(timeline.segments)} segments"
                         )
-                    save_mission_timeline(leg_id, timeline)
                     logger.info(f"Timeline saved to disk for leg {leg_id}")
                 except Exception as e:
                     logger.error(
@@ -1071,6 +1042,9 @@ async def activate_leg(
 ) -> dict:
     """Activate a specific leg (deactivates all others in the mission).
 
+    Activation builds the leg timeline, so it runs in a worker thread to keep
+    the event loop responsive.
+
     Args:
         mission_id: Mission ID
         leg_id: Leg ID to activate
@@ -1078,6 +1052,18 @@ async def activate_leg(
     Returns:
         Success response with active leg ID
     """
+    return await run_in_threadpool(
+        _activate_leg, mission_id, leg_id, route_manager, poi_manager
+    )
+
+
+def _activate_leg(
+    mission_id: str,
+    leg_id: str,
+    route_manager: RouteManager,
+    poi_manager: POIManager,
+) -> dict:
+    """Activate a leg and build its timeline (blocking implementation)."""
     try:
         with get_mission_lock(mission_id):
             # Load mission
@@ -1125,14 +1111,9 @@ async def activate_leg(
             if active_leg and route_manager:
                 try:
                     logger.info(f"Generating timeline for leg {leg_id}")
-                    timeline, summary = build_mission_timeline(
-                        mission=active_leg,
-                        route_manager=route_manager,
-                        poi_manager=poi_manager,
-                        coverage_sampler=_coverage_sampler,
-                        parent_mission_id=mission_id,
+                    _build_leg_timeline(
+                        active_leg, mission_id, route_manager, poi_manager
                     )
-                    save_mission_timeline(leg_id, timeline)
                     logger.info(f"Timeline generated and saved for leg {leg_id}")
                 except Exception as e:
                     logger.error(f"Failed to generate timeline for leg {leg_id}: {e}")
@@ -1481,14 +1462,7 @@ async def update_leg_route(
             if route_manager:
                 try:
                     logger.info(f"Regenerating timeline for leg {leg_id}")
-                    timeline, summary = build_mission_timeline(
-                        mission=leg,
-                        route_manager=route_manager,
-                        poi_manager=poi_manager,
-                        coverage_sampler=_coverage_sampler,
-                        parent_mission_id=mission_id,
-                    )
-                    save_mission_timeline(leg_id, timeline)
+                    _build_leg_timeline(leg, mission_id, route_manager, poi_manager)
                     logger.info(
                         f"Timeline regenerated and saved for leg {leg_id} with new route"
                     )
@@ -1560,6 +1534,96 @@ async def get_leg_timeline(mission_id: str, leg_id: str) -> dict:
         )
 
 
+@router.post("/{mission_id}/timelines/recompute")
+async def recompute_mission_timelines(
+    mission_id: str,
+    force: bool = Query(False, description="Rebuild even if inputs are unchanged"),
+    route_manager: RouteManager = Depends(get_route_manager),
+    poi_manager: POIManager = Depends(get_poi_manager),
+) -> dict:
+    """Recompute timelines for every leg of a mission in parallel.
+
+    Legs whose inputs are unchanged are served from the timeline cache unless
+    ``force`` is set; the remaining legs are built on the timeline worker pool.
+
+    Args:
+        mission_id: Mission ID
+        force: Ignore cached timelines
+
+    Returns:
+        Per-leg outcome (source, error, runtime) and total elapsed time
+    """
+    mission = load_mission_v2(mission_id)
+    if not mission:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Mission {mission_id} not found",
+        )
+
+    try:
+        started = datetime.now()
+        outcomes = await run_in_threadpool(
+            _build_leg_timelines,
+            mission.legs,
+            mission.id,
+            route_manager,
+            poi_manager,
+            force=force,
+        )
+        elapsed_ms = (datetime.now() - started).total_seconds() * 1000.0
+    except Exception as e:
+        logger.error(
+            f"Failed to recompute timelines for mission {mission_id}: {e}",
+            exc_info=True,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to recompute timelines: {type(e).__name__}: {str(e)}",
+        )
+
+    return {
+        "mission_id": mission_id,
+        "legs": [outcome.to_dict() for outcome in outcomes],
+        "elapsed_ms": round(elapsed_ms, 1),
+    }
+
+
+@router.get("/{mission_id}/legs/{leg_id}/timeline/cache")
+async def get_leg_timeline_cache_status(mission_id: str, leg_id: str) -> dict:
+    """Report whether the leg's last timeline request was served from cache.
+
+    On a recompute, ``changed_inputs`` lists which fingerprinted inputs (route,
+    transports, adjusted_departure_time, satellite_catalog, coverage, ...)
+    differed from the previous build.
+
+    Args:
+        mission_id: Mission ID
+        leg_id: Leg ID
+
+    Returns:
+        Last recompute report for the leg plus global cache statistics
+    """
+    mission = load_mission_v2(mission_id)
+    if not mission:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Mission {mission_id} not found",
+        )
+    if not any(leg.id == leg_id for leg in mission.legs):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Leg {leg_id} not found in mission {mission_id}",
+        )
+
+    cache = get_timeline_cache()
+    report = cache.last_report(leg_id)
+    return {
+        "leg_id": leg_id,
+        "last_request": report.to_dict() if report else None,
+        "cache": cache.stats(),
+    }
+
+
 @router.post("/{mission_id}/legs/{leg_id}/timeline/preview")
 async def preview_leg_timeline(
     mission_id: str,
@@ -1638,13 +1702,14 @@ async def preview_leg_timeline(
         logger.info(
             f"Generating timeline preview for leg {leg_id} in mission {mission_id}"
         )
-        timeline, summary = build_mission_timeline(
-            mission=preview_leg,
-            route_manager=route_manager,
-            poi_manager=poi_manager,
-            coverage_sampler=_coverage_sampler,
-            parent_mission_id=mission_id,
+        timeline, summary = await run_in_threadpool(
+            _build_leg_timeline,
+            preview_leg,
+            mission_id,
+            route_manager,
+            poi_manager,
             include_samples=True,
+            persist=False,
         )
 
         return timeline.model_dump(mode="json")
@@ -4,25 +4,52 @@ Missions are stored as JSON files under data/missions/ with optional assets.
 This design allows mission plans to be portable across instances and systems.
 """
 
-# FR-004: File exceeds 300 lines (445 lines) because mission storage handles
+# FR-004: File exceeds 300 lines (694 lines) because mission storage handles
 # v1/v2 format compatibility, JSON serialization, timeline building, and file I/O
 # operations. Refactoring would fragment format handling logic. Deferred to v0.4.0.
 
 import hashlib
 import json
 import logging
+import os
+import shutil
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from app.mission.catalog import (
+    Listing,
+    MissionCatalog,
+    leg_entry,
+    mission_entry,
+)
 from app.mission.models import Mission, MissionLeg, MissionLegTimeline
+from app.mission.timeline_index import (
+    TimelineIndex,
+    drop_timeline_index,
+    get_timeline_index,
+    store_timeline_index,
+)
+from app.mission.timeline_store import (
+    TimelineFile,
+    forget_timeline_file,
+    open_timeline_file,
+    write_timeline_file,
+)
 from filelock import FileLock
 
 logger = logging.getLogger(__name__)
 
 # Base directory for mission storage
 MISSIONS_DIR = Path("data/missions")
-TIMELINE_SUFFIX = ".timeline.json"
+TIMELINE_SUFFIX = ".timeline.json"  # Legacy JSON timelines, migrated on load
+TIMELINE_BINARY_SUFFIX = ".timeline.bin"
+TIMELINE_META_SUFFIX = ".timeline-meta.json"
+
+# Catalog per missions directory (tests point MISSIONS_DIR elsewhere)
+_catalogs: dict[Path, MissionCatalog] = {}
+_catalogs_lock = threading.Lock()
 
 
 def ensure_missions_directory():
@@ -55,10 +82,20 @@ def get_mission_checksum_path(mission_id: str) -> Path:
 
 
 def get_mission_timeline_path(mission_id: str) -> Path:
-    """Get the file path for a mission's cached timeline."""
+    """Get the file path for a mission's stored timeline."""
+    return MISSIONS_DIR / f"{mission_id}{TIMELINE_BINARY_SUFFIX}"
+
+
+def get_mission_legacy_timeline_path(mission_id: str) -> Path:
+    """Get the file path of a timeline stored in the old JSON format."""
     return MISSIONS_DIR / f"{mission_id}{TIMELINE_SUFFIX}"
 
 
+def get_mission_timeline_meta_path(mission_id: str) -> Path:
+    """Get the file path for a mission timeline's cache metadata."""
+    return MISSIONS_DIR / f"{mission_id}{TIMELINE_META_SUFFIX}"
+
+
 def get_mission_directory(mission_id: str) -> Path:
     """Get the directory path for a mission (for hierarchical v2 storage)."""
     return MISSIONS_DIR / mission_id
@@ -79,6 +116,91 @@ def get_mission_leg_file_path(mission_id: str, leg_id: str) -> Path:
     return get_mission_legs_dir(mission_id) / f"{leg_id}.json"
 
 
+def get_mission_catalog() -> MissionCatalog:
+    """Get the catalog for the current missions directory."""
+    ensure_missions_directory()
+    with _catalogs_lock:
+        catalog = _catalogs.get(MISSIONS_DIR)
+        if catalog is None:
+            catalog = MissionCatalog(
+                MISSIONS_DIR, _list_mission_files, _load_catalog_row
+            )
+            _catalogs[MISSIONS_DIR] = catalog
+        return catalog
+
+
+def _is_leg_mission_file(name: str) -> bool:
+    return (
+        name.endswith(".json")
+        and not name.startswith(".")
+        and not name.endswith((TIMELINE_SUFFIX, TIMELINE_META_SUFFIX))
+    )
+
+
+def _list_mission_files() -> Listing:
+    """List mission files and their modification times, without reading them."""
+    files: Listing = {"legs": {}, "missions": {}}
+    try:
+        entries = list(os.scandir(MISSIONS_DIR))
+    except FileNotFoundError:
+        return files
+
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                mission_file = Path(entry.path) / "mission.json"
+                legs_dir = Path(entry.path) / "legs"
+                stamp = [mission_file.stat().st_mtime_ns]
+                if legs_dir.is_dir():
+                    stamp.append(legs_dir.stat().st_mtime_ns)
+                files["missions"][entry.name] = stamp
+            elif _is_leg_mission_file(entry.name):
+                files["legs"][entry.name[: -len(".json")]] = [entry.stat().st_mtime_ns]
+        except OSError:
+            # Not a mission directory, or removed while listing
+            continue
+    return files
+
+
+def _load_catalog_row(table: str, mission_id: str) -> Optional[dict]:
+    """Read one mission's files into its catalog row."""
+    if table == "legs":
+        mission_path = get_mission_path(mission_id)
+        try:
+            with open(mission_path, "r") as f:
+                mission = MissionLeg(**json.load(f))
+        except Exception as e:
+            logger.warning(f"Skipping invalid mission file {mission_path}: {e}")
+            return None
+        checksum_path = get_mission_checksum_path(mission.id)
+        checksum = checksum_path.read_text().strip() if checksum_path.exists() else None
+        return leg_entry(mission, mission_path, checksum)
+
+    mission_dir = get_mission_directory(mission_id)
+    try:
+        mission = load_mission_v2(mission_id)
+    except Exception as e:
+        logger.warning(f"Skipping invalid mission directory {mission_dir}: {e}")
+        return None
+    if mission is None:
+        return None
+    return mission_entry(mission, mission_dir, compute_mission_checksum(mission))
+
+
+def rebuild_mission_catalog() -> int:
+    """Rebuild the mission catalog from the mission files.
+
+    Missions copied in or removed by other means are also picked up
+    automatically (see app.mission.catalog); this re-reads every file,
+    including ones edited in place.
+
+    Returns:
+        Number of missions indexed
+    """
+    tables = get_mission_catalog().rebuild()
+    return sum(len(rows) for rows in tables.values())
+
+
 def compute_file_checksum(file_path: Path) -> str:
     """Compute SHA256 checksum of a file."""
     sha256 = hashlib.sha256()
@@ -117,14 +239,17 @@ def save_mission(mission: MissionLeg) -> dict:
         # Update timestamp
         mission.updated_at = datetime.now(timezone.utc)
 
-        # Write mission JSON
-        with open(mission_path, "w") as f:
-            json.dump(mission.model_dump(), f, indent=2, default=str)
+        with get_mission_catalog().transaction() as catalog:
+            # Write mission JSON
+            with open(mission_path, "w") as f:
+                json.dump(mission.model_dump(), f, indent=2, default=str)
+
+            # Compute and save checksum
+            checksum = compute_mission_checksum(mission)
+            with open(checksum_path, "w") as f:
+                f.write(checksum)
 
-        # Compute and save checksum
-        checksum = compute_mission_checksum(mission)
-        with open(checksum_path, "w") as f:
-            f.write(checksum)
+            catalog["legs"][mission.id] = leg_entry(mission, mission_path, checksum)
 
         logger.info(f"Mission {mission.id} saved to {mission_path}")
 
@@ -150,23 +275,29 @@ def save_mission_v2(mission: Mission) -> dict:
         Dictionary with save metadata
     """
     mission_dir = get_mission_directory(mission.id)
-    mission_dir.mkdir(parents=True, exist_ok=True)
 
-    legs_dir = get_mission_legs_dir(mission.id)
-    legs_dir.mkdir(parents=True, exist_ok=True)
+    with get_mission_catalog().transaction() as catalog:
+        mission_dir.mkdir(parents=True, exist_ok=True)
+
+        legs_dir = get_mission_legs_dir(mission.id)
+        legs_dir.mkdir(parents=True, exist_ok=True)
 
-    # Save mission metadata (without legs to avoid duplication)
-    mission_meta = mission.model_copy(update={"legs": []})
-    mission_file = get_mission_file_path(mission.id)
+        # Save mission metadata (without legs to avoid duplication)
+        mission_meta = mission.model_copy(update={"legs": []})
+        mission_file = get_mission_file_path(mission.id)
 
-    with open(mission_file, "w") as f:
-        json.dump(mission_meta.model_dump(), f, indent=2, default=str)
+        with open(mission_file, "w") as f:
+            json.dump(mission_meta.model_dump(), f, indent=2, default=str)
 
-    # Save each leg separately
-    for leg in mission.legs:
-        leg_file = get_mission_leg_file_path(mission.id, leg.id)
-        with open(leg_file, "w") as f:
-            json.dump(leg.model_dump(), f, indent=2, default=str)
+        # Save each leg separately
+        for leg in mission.legs:
+            leg_file = get_mission_leg_file_path(mission.id, leg.id)
+            with open(leg_file, "w") as f:
+                json.dump(leg.model_dump(), f, indent=2, default=str)
+
+        catalog["missions"][mission.id] = mission_entry(
+            mission, mission_dir, compute_mission_checksum(mission)
+        )
 
     logger.info(f"Mission {mission.id} saved with {len(mission.legs)} legs")
 
@@ -214,6 +345,36 @@ def load_mission_v2(mission_id: str) -> Optional[Mission]:
     return mission
 
 
+def _leg_stub(leg_id: str) -> MissionLeg:
+    """Minimal leg with only its ID, for listing leg counts."""
+    return MissionLeg(
+        id=leg_id,
+        name=leg_id,  # Use ID as placeholder name
+        route_id="",  # Empty placeholder
+        transports={"initial_x_satellite_id": ""},  # Minimal placeholder
+    )
+
+
+def list_mission_summaries_v2() -> list[Mission]:
+    """List hierarchical missions from the catalog, without reading them.
+
+    Returns:
+        Missions sorted by ID, with metadata and leg stubs (ID only)
+    """
+    return [
+        Mission(
+            id=entry["id"],
+            name=entry["name"],
+            description=entry["description"],
+            created_at=entry["created_at"],
+            updated_at=entry["updated_at"],
+            metadata=entry["metadata"],
+            legs=[_leg_stub(leg_id) for leg_id in entry["leg_ids"]],
+        )
+        for entry in get_mission_catalog().entries("missions")
+    ]
+
+
 def load_mission_metadata_v2(mission_id: str) -> Optional[Mission]:
     """Load mission metadata with leg count but without full leg data.
 
@@ -245,20 +406,9 @@ def load_mission_metadata_v2(mission_id: str) -> Optional[Mission]:
         if legs_dir.exists():
             for leg_file in sorted(legs_dir.glob("*.json")):
                 # Extract leg ID from filename (e.g., "leg-1.json" -> "leg-1")
-                leg_id = leg_file.stem
-                # Create minimal leg stub with only required fields
-                leg_stubs.append(
-                    {
-                        "id": leg_id,
-                        "name": leg_id,  # Use ID as placeholder name
-                        "route_id": "",  # Empty placeholder
-                        "transports": {
-                            "initial_x_satellite_id": ""
-                        },  # Minimal placeholder
-                    }
-                )
+                leg_stubs.append(_leg_stub(leg_file.stem))
 
-        mission_data["legs"] = [MissionLeg(**stub) for stub in leg_stubs]
+        mission_data["legs"] = leg_stubs
         mission = Mission(**mission_data)
 
         logger.debug(
@@ -328,37 +478,31 @@ def load_mission(mission_id: str) -> Optional[MissionLeg]:
 def list_missions() -> list[dict]:
     """List all saved missions.
 
+    Served from the mission catalog, so no mission file is read.
+
     Returns:
         List of mission metadata dictionaries (id, name, path, updated_at)
     """
-    ensure_missions_directory()
-
-    missions = []
-    for mission_path in sorted(MISSIONS_DIR.glob("*.json")):
-        if mission_path.name.endswith(TIMELINE_SUFFIX):
-            continue
-        try:
-            with open(mission_path, "r") as f:
-                mission_data = json.load(f)
-
-            mission_id = mission_data.get("id") or mission_path.stem
-
-            missions.append(
-                {
-                    "id": mission_id,
-                    "name": mission_data.get("name"),
-                    "route_id": mission_data.get("route_id"),
-                    "is_active": mission_data.get("is_active", False),
-                    "path": str(mission_path),
-                    "updated_at": mission_data.get("updated_at"),
-                }
-            )
+    return [
+        {
+            "id": entry["id"],
+            "name": entry["name"],
+            "route_id": entry["route_id"],
+            "is_active": entry["is_active"],
+            "path": entry["path"],
+            "updated_at": entry["updated_at"],
+        }
+        for entry in get_mission_catalog().entries("legs")
+    ]
 
-        except json.JSONDecodeError as e:
-            logger.warning(f"Skipping invalid mission file {mission_path}: {e}")
-            continue
 
-    return missions
+def get_active_mission_ids() -> list[str]:
+    """IDs of saved missions marked active, from the mission catalog."""
+    return [
+        entry["id"]
+        for entry in get_mission_catalog().entries("legs")
+        if entry["is_active"]
+    ]
 
 
 def delete_mission(mission_id: str) -> bool:
@@ -372,34 +516,51 @@ def delete_mission(mission_id: str) -> bool:
     """
     mission_path = get_mission_path(mission_id)
     checksum_path = get_mission_checksum_path(mission_id)
-    timeline_path = get_mission_timeline_path(mission_id)
+    timeline_meta_path = get_mission_timeline_meta_path(mission_id)
 
     deleted = False
 
-    if mission_path.exists():
-        try:
-            mission_path.unlink()
-            logger.info(f"Deleted mission file {mission_path}")
-            deleted = True
-        except OSError as e:
-            logger.error(f"Failed to delete mission file {mission_path}: {e}")
-            raise
+    with get_mission_catalog().transaction() as catalog:
+        catalog["legs"].pop(mission_id, None)
 
-    if checksum_path.exists():
-        try:
-            checksum_path.unlink()
-            logger.info(f"Deleted checksum file {checksum_path}")
-        except OSError as e:
-            logger.error(f"Failed to delete checksum file {checksum_path}: {e}")
-            raise
+        if mission_path.exists():
+            try:
+                mission_path.unlink()
+                logger.info(f"Deleted mission file {mission_path}")
+                deleted = True
+            except OSError as e:
+                logger.error(f"Failed to delete mission file {mission_path}: {e}")
+                raise
 
-    if timeline_path.exists():
+        if checksum_path.exists():
+            try:
+                checksum_path.unlink()
+                logger.info(f"Deleted checksum file {checksum_path}")
+            except OSError as e:
+                logger.error(f"Failed to delete checksum file {checksum_path}: {e}")
+                raise
+
+    drop_timeline_index(mission_id)
+    for timeline_path in (
+        get_mission_timeline_path(mission_id),
+        get_mission_legacy_timeline_path(mission_id),
+    ):
+        if timeline_path.exists():
+            forget_timeline_file(timeline_path)
+            try:
+                timeline_path.unlink()
+                logger.info(f"Deleted timeline file {timeline_path}")
+            except OSError as e:
+                logger.error(f"Failed to delete timeline file {timeline_path}: {e}")
+                raise
+
+    if timeline_meta_path.exists():
         try:
-            timeline_path.unlink()
-            logger.info(f"Deleted timeline file {timeline_path}")
+            timeline_meta_path.unlink()
         except OSError as e:
-            logger.error(f"Failed to delete timeline file {timeline_path}: {e}")
-            raise
+            logger.warning(
+                f"Failed to delete timeline metadata {timeline_meta_path}: {e}"
+            )
 
     if not deleted:
         logger.warning(f"Mission {mission_id} not found for deletion")
@@ -407,34 +568,147 @@ def delete_mission(mission_id: str) -> bool:
     return deleted
 
 
+def delete_mission_v2(mission_id: str) -> bool:
+    """Delete a hierarchical mission directory and its catalog entry.
+
+    Args:
+        mission_id: ID of the mission to delete
+
+    Returns:
+        True if the mission directory existed and was deleted
+
+    Raises:
+        OSError: If the directory cannot be removed
+    """
+    mission_dir = get_mission_directory(mission_id)
+
+    with get_mission_catalog().transaction() as catalog:
+        catalog["missions"].pop(mission_id, None)
+        if not mission_dir.exists():
+            return False
+        shutil.rmtree(mission_dir)
+
+    logger.info(f"Deleted mission directory: {mission_dir}")
+    return True
+
+
 def save_mission_timeline(mission_id: str, timeline: MissionLegTimeline) -> Path:
-    """Persist a mission timeline to disk."""
+    """Persist a mission timeline to disk in the binary timeline format."""
     ensure_missions_directory()
-    timeline_path = get_mission_timeline_path(mission_id)
-    with open(timeline_path, "w") as handle:
-        json.dump(timeline.model_dump(), handle, indent=2, default=str)
+    timeline_path = write_timeline_file(get_mission_timeline_path(mission_id), timeline)
+    legacy_path = get_mission_legacy_timeline_path(mission_id)
+    if legacy_path.exists():
+        legacy_path.unlink()
+    store_timeline_index(mission_id, timeline)
     logger.info("Saved mission timeline for %s", mission_id)
     return timeline_path
 
 
-def load_mission_timeline(mission_id: str) -> MissionLegTimeline | None:
-    """Load a previously computed mission timeline."""
+def _migrate_legacy_timeline(mission_id: str) -> None:
+    """Convert a JSON timeline to the binary format and remove the JSON file."""
+    legacy_path = get_mission_legacy_timeline_path(mission_id)
+    with open(legacy_path, "r") as handle:
+        timeline = MissionLegTimeline(**json.load(handle))
+    write_timeline_file(get_mission_timeline_path(mission_id), timeline)
+    legacy_path.unlink()
+    logger.info("Migrated mission timeline for %s to the binary format", mission_id)
+
+
+def open_mission_timeline(mission_id: str) -> TimelineFile | None:
+    """Open a stored timeline for lazy access.
+
+    Timelines still in the old JSON format are migrated first.
+
+    Args:
+        mission_id: Mission (or leg) ID the timeline was saved under
+
+    Returns:
+        Memory-mapped TimelineFile, or None if no timeline is stored
+    """
     timeline_path = get_mission_timeline_path(mission_id)
     if not timeline_path.exists():
+        if not get_mission_legacy_timeline_path(mission_id).exists():
+            return None
+        with get_mission_lock(mission_id):
+            if not timeline_path.exists():
+                _migrate_legacy_timeline(mission_id)
+    return open_timeline_file(timeline_path)
+
+
+def load_mission_timeline(
+    mission_id: str, include_samples: bool = True
+) -> MissionLegTimeline | None:
+    """Load a previously computed mission timeline.
+
+    Args:
+        mission_id: Mission (or leg) ID the timeline was saved under
+        include_samples: Also load the preview samples (if stored)
+    """
+    timeline_file = open_mission_timeline(mission_id)
+    if timeline_file is None:
         return None
-    with open(timeline_path, "r") as handle:
-        data = json.load(handle)
-    return MissionLegTimeline(**data)
+    return timeline_file.to_timeline(include_samples=include_samples)
+
+
+def get_mission_timeline_index(mission_id: str) -> TimelineIndex | None:
+    """Interval index for a mission's stored timeline.
+
+    Indexes are compiled when timelines are saved. After a restart the
+    stored timeline is loaded once (without samples) and compiled.
+
+    Args:
+        mission_id: Mission (or leg) ID the timeline was saved under
+
+    Returns:
+        TimelineIndex, or None if no timeline is stored
+    """
+    index = get_timeline_index(mission_id)
+    if index is not None:
+        return index
+    timeline = load_mission_timeline(mission_id, include_samples=False)
+    if timeline is None:
+        return None
+    return store_timeline_index(mission_id, timeline)
 
 
 def delete_mission_timeline(mission_id: str) -> None:
     """Remove cached mission timeline without touching mission data."""
-    timeline_path = get_mission_timeline_path(mission_id)
-    if timeline_path.exists():
-        try:
-            timeline_path.unlink()
-        except OSError as exc:
-            logger.warning("Failed to delete mission timeline %s: %s", mission_id, exc)
+    drop_timeline_index(mission_id)
+    for path in (
+        get_mission_timeline_path(mission_id),
+        get_mission_legacy_timeline_path(mission_id),
+        get_mission_timeline_meta_path(mission_id),
+    ):
+        if path.exists():
+            forget_timeline_file(path)
+            try:
+                path.unlink()
+            except OSError as exc:
+                logger.warning(
+                    "Failed to delete mission timeline %s: %s", mission_id, exc
+                )
+
+
+def save_mission_timeline_meta(mission_id: str, meta: dict) -> Path:
+    """Persist cache metadata (input fingerprint, summary) for a stored timeline."""
+    ensure_missions_directory()
+    meta_path = get_mission_timeline_meta_path(mission_id)
+    with open(meta_path, "w") as handle:
+        json.dump(meta, handle, indent=2, default=str)
+    return meta_path
+
+
+def load_mission_timeline_meta(mission_id: str) -> dict | None:
+    """Load cache metadata for a stored timeline, if present and readable."""
+    meta_path = get_mission_timeline_meta_path(mission_id)
+    if not meta_path.exists():
+        return None
+    try:
+        with open(meta_path, "r") as handle:
+            return json.load(handle)
+    except (OSError, json.JSONDecodeError) as exc:
+        logger.warning("Ignoring unreadable timeline metadata %s: %s", mission_id, exc)
+        return None
 
 
 def mission_exists(mission_id: str) -> bool:
@@ -6,6 +6,7 @@ This module provides comprehensive timeline generation capabilities including:
 - X-band azimuth violation detection
 - AAR window resolution
 - POI synchronization for mission events
+- Incremental rebuilds reusing artifacts of the previous build
 - Timeline statistics and summaries
 """
 
@@ -28,13 +29,22 @@ from app.mission.timeline_builder.events import (
     apply_ka_events,
     apply_x_azimuth_events,
     apply_manual_outages,
+    resolve_satellite_longitude,
 )
 from app.mission.timeline_builder.aar import (
     ResolvedAARWindow,
     resolve_aar_windows,
     apply_x_transitions,
 )
+from app.mission.timeline_builder.incremental import (
+    EVENT_SOURCES,
+    IncrementalEventCollector,
+    TimelineArtifactStore,
+    TimelineBuildArtifacts,
+    get_timeline_artifact_store,
+)
 from app.mission.timeline_builder.pois import (
+    collect_synced_poi_ids,
     sync_ka_pois,
     sync_x_aar_pois,
 )
@@ -74,11 +84,19 @@ __all__ = [
     "apply_ka_events",
     "apply_x_azimuth_events",
     "apply_manual_outages",
+    "resolve_satellite_longitude",
     # AAR
     "ResolvedAARWindow",
     "resolve_aar_windows",
     "apply_x_transitions",
+    # Incremental rebuilds
+    "EVENT_SOURCES",
+    "IncrementalEventCollector",
+    "TimelineArtifactStore",
+    "TimelineBuildArtifacts",
+    "get_timeline_artifact_store",
     # POIs
+    "collect_synced_poi_ids",
     "sync_ka_pois",
     "sync_x_aar_pois",
     # Stats
@@ -1,6 +1,6 @@
 """Event application logic for mission timeline generation."""
 
-# FR-004: File exceeds 300 lines (392 lines) because event application coordinates
+# FR-004: File exceeds 300 lines (426 lines) because event application coordinates
 # multiple timeline event types (SAT transitions, AAR windows, coverage events,
 # altitude changes) with state machine logic. Splitting would create circular
 # dependencies with resolver modules. Deferred to v0.4.0.
@@ -11,6 +11,8 @@ import logging
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Sequence
 
+import numpy as np
+
 if TYPE_CHECKING:
     from app.mission.timeline_builder.aar import ResolvedAARWindow
 from app.mission.models import MissionLeg, Transport, KaOutage, KuOutageOverride
@@ -109,7 +111,11 @@ def apply_x_azimuth_events(
     mission_start: datetime,
     mission_end: datetime,
 ) -> None:
-    """Apply X-band azimuth violation events."""
+    """Apply X-band azimuth violation events.
+
+    Look angles and cone checks run once over the whole sample array; debug
+    metadata and nearest-waypoint lookups are only built at violation edges.
+    """
     if not mission.transports.initial_x_satellite_id:
         return
 
@@ -121,56 +127,58 @@ def apply_x_azimuth_events(
         assignments = [(mission_start, mission.transports.initial_x_satellite_id)]
     assignments = sorted(assignments, key=lambda item: item[0])
 
-    schedule_idx = 0
-    current_satellite = assignments[0][1]
-    violation_active = False
+    evaluated = _collect_x_azimuth_inputs(samples, assignments, poi_manager)
+    if not evaluated:
+        return
 
-    for sample in samples:
-        if sample.heading is None:
-            continue
-        in_aar_window = _falls_within_window(sample.timestamp, aar_windows)
+    lats = np.fromiter((s.latitude for s, _, _ in evaluated), dtype=float)
+    lons = np.fromiter((s.longitude for s, _, _ in evaluated), dtype=float)
+    alts = np.fromiter(
+        (
+            s.altitude if s.altitude is not None else DEFAULT_CRUISE_ALTITUDE_M
+            for s, _, _ in evaluated
+        ),
+        dtype=float,
+    )
+    headings = np.fromiter((s.heading for s, _, _ in evaluated), dtype=float)
+    sat_lons = np.fromiter((lon for _, _, lon in evaluated), dtype=float)
+    in_aar = np.fromiter(
+        (_falls_within_window(s.timestamp, aar_windows) for s, _, _ in evaluated),
+        dtype=bool,
+    )
 
-        while (
-            schedule_idx + 1 < len(assignments)
-            and sample.timestamp >= assignments[schedule_idx + 1][0]
-        ):
-            schedule_idx += 1
-            current_satellite = assignments[schedule_idx][1]
+    result = rule_engine.evaluate_x_azimuth_batch(
+        lats, lons, alts, sat_lons, headings_deg=headings
+    )
+    aft_mask = result.normal_violation
+    forward_mask = result.aar_violation & in_aar
+    violation_mask = aft_mask | forward_mask
 
-        satellite_longitude = _resolve_satellite_longitude(
-            current_satellite, poi_manager
-        )
-        if satellite_longitude is None:
-            continue
+    previous = np.concatenate(([False], violation_mask[:-1]))
+    edges = np.flatnonzero(violation_mask != previous)
 
-        altitude = (
-            sample.altitude
-            if sample.altitude is not None
-            else DEFAULT_CRUISE_ALTITUDE_M
-        )
-        aft_violation, relative_azimuth, debug = rule_engine.evaluate_x_azimuth_window(
-            aircraft_lat=sample.latitude,
-            aircraft_lon=sample.longitude,
-            aircraft_alt=altitude,
-            satellite_lon=satellite_longitude,
-            timestamp=sample.timestamp,
-            heading_deg=sample.heading,
-            is_aar_mode=False,
-        )
-        forward_violation = False
-        if in_aar_window:
-            forward_violation, _, _ = rule_engine.evaluate_x_azimuth_window(
-                aircraft_lat=sample.latitude,
-                aircraft_lon=sample.longitude,
-                aircraft_alt=altitude,
-                satellite_lon=satellite_longitude,
-                timestamp=sample.timestamp,
-                heading_deg=sample.heading,
-                is_aar_mode=True,
+    for idx in edges:
+        sample, current_satellite, satellite_longitude = evaluated[idx]
+        if not violation_mask[idx]:
+            rule_engine.events.append(
+                MissionEvent(
+                    timestamp=sample.timestamp,
+                    event_type=EventType.X_AZIMUTH_VIOLATION,
+                    transport=Transport.X,
+                    affected_transport=Transport.X,
+                    severity="info",
+                    reason="X azimuth clear",
+                    satellite_id=current_satellite,
+                )
             )
+            continue
 
-        violation_reason = debug.get("violation_reason")
-        is_elevation_blocked = violation_reason == "elevation"
+        aft_violation = bool(aft_mask[idx])
+        forward_violation = bool(forward_mask[idx])
+        in_aar_window = bool(in_aar[idx])
+        relative_azimuth = float(result.relative_azimuth[idx])
+        debug = result.debug_metadata(idx)
+        is_elevation_blocked = debug.get("violation_reason") == "elevation"
 
         nearest_wp = nearest_waypoint_name(route, sample.latitude, sample.longitude)
         debug.update(
@@ -184,78 +192,60 @@ def apply_x_azimuth_events(
             }
         )
 
-        is_violation = forward_violation or aft_violation
-        if is_violation and not violation_active:
-            if is_elevation_blocked:
-                reason = _format_elevation_reason(
-                    current_satellite,
-                    float(debug.get("elevation_degrees", 0.0)),
-                    float(debug.get("min_elevation_degrees", 0.0)),
-                    debug_metadata=debug,
-                )
-            else:
-                reason = _format_azimuth_reason(
-                    current_satellite,
-                    forward_violation,
-                    aft_violation,
-                    relative_azimuth,
-                    in_aar_window,
-                    debug_metadata=debug,
-                )
-            metadata: dict[str, float | bool | str | None] = {
-                "relative_azimuth_degrees": round(relative_azimuth, 1),
-                "absolute_azimuth_degrees": round(
-                    float(debug.get("absolute_azimuth_degrees", relative_azimuth)), 1
-                ),
-                "elevation_degrees": round(
-                    float(debug.get("elevation_degrees", 0.0)), 1
-                ),
-                "elevation_below_min": bool(debug.get("elevation_below_min", False)),
-                "line_of_sight_blocked": is_elevation_blocked,
-            }
-            if sample.heading is not None:
-                metadata["aircraft_heading_degrees"] = round(sample.heading, 1)
-                metadata["absolute_azimuth_degrees"] = round(
-                    (relative_azimuth + sample.heading) % 360.0, 1
-                )
-            metadata.update(
-                {
-                    "sample_latitude": round(sample.latitude, 5),
-                    "sample_longitude": round(sample.longitude, 5),
-                    "sample_timestamp": sample.timestamp.isoformat(),
-                    "satellite_longitude": satellite_longitude,
-                    "in_aar_window": in_aar_window,
-                    "nearest_waypoint_name": nearest_wp,
-                }
+        if is_elevation_blocked:
+            reason = _format_elevation_reason(
+                current_satellite,
+                float(debug.get("elevation_degrees", 0.0)),
+                float(debug.get("min_elevation_degrees", 0.0)),
+                debug_metadata=debug,
             )
-            rule_engine.events.append(
-                MissionEvent(
-                    timestamp=sample.timestamp,
-                    event_type=EventType.X_AZIMUTH_VIOLATION,
-                    transport=Transport.X,
-                    affected_transport=Transport.X,
-                    severity="warning",
-                    reason=reason,
-                    satellite_id=current_satellite,
-                    metadata=metadata,
-                )
+        else:
+            reason = _format_azimuth_reason(
+                current_satellite,
+                forward_violation,
+                aft_violation,
+                relative_azimuth,
+                in_aar_window,
+                debug_metadata=debug,
             )
-            violation_active = True
-        elif not is_violation and violation_active:
-            rule_engine.events.append(
-                MissionEvent(
-                    timestamp=sample.timestamp,
-                    event_type=EventType.X_AZIMUTH_VIOLATION,
-                    transport=Transport.X,
-                    affected_transport=Transport.X,
-                    severity="info",
-                    reason="X azimuth clear",
-                    satellite_id=current_satellite,
-                )
+        metadata: dict[str, float | bool | str | None] = {
+            "relative_azimuth_degrees": round(relative_azimuth, 1),
+            "absolute_azimuth_degrees": round(
+                float(debug.get("absolute_azimuth_degrees", relative_azimuth)), 1
+            ),
+            "elevation_degrees": round(float(debug.get("elevation_degrees", 0.0)), 1),
+            "elevation_below_min": bool(debug.get("elevation_below_min", False)),
+            "line_of_sight_blocked": is_elevation_blocked,
+        }
+        if sample.heading is not None:
+            metadata["aircraft_heading_degrees"] = round(sample.heading, 1)
+            metadata["absolute_azimuth_degrees"] = round(
+                (relative_azimuth + sample.heading) % 360.0, 1
+            )
+        metadata.update(
+            {
+                "sample_latitude": round(sample.latitude, 5),
+                "sample_longitude": round(sample.longitude, 5),
+                "sample_timestamp": sample.timestamp.isoformat(),
+                "satellite_longitude": satellite_longitude,
+                "in_aar_window": in_aar_window,
+                "nearest_waypoint_name": nearest_wp,
+            }
+        )
+        rule_engine.events.append(
+            MissionEvent(
+                timestamp=sample.timestamp,
+                event_type=EventType.X_AZIMUTH_VIOLATION,
+                transport=Transport.X,
+                affected_transport=Transport.X,
+                severity="warning",
+                reason=reason,
+                satellite_id=current_satellite,
+                metadata=metadata,
             )
-            violation_active = False
+        )
 
-    if violation_active:
+    if violation_mask[-1]:
         rule_engine.events.append(
             MissionEvent(
                 timestamp=mission_end,
@@ -264,11 +254,50 @@ def apply_x_azimuth_events(
                 affected_transport=Transport.X,
                 severity="info",
                 reason="X azimuth clear",
-                satellite_id=current_satellite,
+                satellite_id=evaluated[-1][1],
             )
         )
 
 
+def _collect_x_azimuth_inputs(
+    samples: Sequence[RouteSample],
+    assignments: Sequence[tuple[datetime, str]],
+    poi_manager: POIManager | None,
+) -> list[tuple[RouteSample, str, float]]:
+    """Pair each evaluable sample with its scheduled X satellite and longitude.
+
+    Samples without a heading or whose satellite cannot be located are
+    skipped, matching the per-sample evaluation they replace.
+    """
+    longitude_cache: dict[str, float | None] = {}
+    evaluated: list[tuple[RouteSample, str, float]] = []
+    schedule_idx = 0
+    current_satellite = assignments[0][1]
+
+    for sample in samples:
+        if sample.heading is None:
+            continue
+
+        while (
+            schedule_idx + 1 < len(assignments)
+            and sample.timestamp >= assignments[schedule_idx + 1][0]
+        ):
+            schedule_idx += 1
+            current_satellite = assignments[schedule_idx][1]
+
+        if current_satellite not in longitude_cache:
+            longitude_cache[current_satellite] = resolve_satellite_longitude(
+                current_satellite, poi_manager
+            )
+        satellite_longitude = longitude_cache[current_satellite]
+        if satellite_longitude is None:
+            continue
+
+        evaluated.append((sample, current_satellite, satellite_longitude))
+
+    return evaluated
+
+
 def apply_manual_outages(
     rule_engine: RuleEngine,
     outages: Sequence[KaOutage | KuOutageOverride] | None,
@@ -372,7 +401,7 @@ def _format_elevation_reason(
     return reason
 
 
-def _resolve_satellite_longitude(
+def resolve_satellite_longitude(
     satellite_id: str, poi_manager: POIManager | None
 ) -> float | None:
     """Resolve satellite longitude from catalog or POI manager."""
@@ -0,0 +1,256 @@
+"""Reusable build artifacts for incremental timeline recomputation.
+
+A leg build keeps its route samples, Ka coverage analysis, the rule-engine
+events emitted by each event source and the POI sync state. The next build
+of the same leg reuses every artifact whose inputs hash identically, so an
+edit that only adds a Ka outage, AAR window or X transition re-runs just the
+affected sources before the interval/assembly stages.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from app.mission.timeline_builder.coverage import CoverageAnalysisResult, RouteSample
+from app.models.route import ParsedRoute
+from app.satellites.rules import MissionEvent, RuleEngine
+from app.services.poi_manager import POIManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ARTIFACT_SETS = 32
+
+# Event sources in the order build_mission_timeline applies them
+EVENT_SOURCES = (
+    "takeoff_landing",
+    "aar_windows",
+    "x_transitions",
+    "ka_coverage",
+    "x_azimuth",
+    "ka_outages",
+    "ku_overrides",
+)
+
+
+def digest_payload(payload: Any) -> str:
+    """Return a stable SHA-256 digest of a JSON-serializable payload."""
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def route_payload(route: ParsedRoute) -> dict:
+    """Extract the route geometry and timing fields a timeline depends on."""
+    timing = route.timing_profile
+    return {
+        "points": [
+            (
+                point.latitude,
+                point.longitude,
+                point.altitude,
+                point.expected_arrival_time,
+            )
+            for point in route.points
+        ],
+        "waypoints": [
+            (
+                waypoint.name,
+                waypoint.latitude,
+                waypoint.longitude,
+                waypoint.order,
+                waypoint.expected_arrival_time,
+            )
+            for waypoint in route.waypoints
+        ],
+        "departure_time": timing.departure_time if timing else None,
+        "arrival_time": timing.arrival_time if timing else None,
+    }
+
+
+@dataclass
+class EventSourceResult:
+    """Events one source emitted for a given input digest."""
+
+    key: str
+    events: tuple[MissionEvent, ...]
+    value: Any = None  # Auxiliary return value (e.g. X transition schedule)
+
+
+@dataclass
+class POISyncRecord:
+    """POIs created by one sync pass and the inputs that produced them."""
+
+    key: str
+    poi_manager_id: int
+    poi_ids: frozenset[str]
+
+
+@dataclass
+class TimelineBuildArtifacts:
+    """Intermediate results of one leg build, reusable by the next build."""
+
+    geometry_key: str
+    samples: list[RouteSample]
+    coverage: CoverageAnalysisResult
+    event_sources: dict[str, EventSourceResult] = field(default_factory=dict)
+    poi_syncs: dict[str, POISyncRecord] = field(default_factory=dict)
+    reused_sources: list[str] = field(default_factory=list)
+    recomputed_sources: list[str] = field(default_factory=list)
+
+
+class TimelineArtifactStore:
+    """Bounded LRU of build artifacts keyed by leg and parent mission."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ARTIFACT_SETS):
+        """Initialize the store.
+
+        Args:
+            max_entries: Maximum number of legs whose artifacts are retained
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str | None], TimelineBuildArtifacts] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(
+        self, mission_id: str, parent_mission_id: str | None = None
+    ) -> TimelineBuildArtifacts | None:
+        """Return the artifacts of the last build for a leg, if retained."""
+        scope = (mission_id, parent_mission_id)
+        with self._lock:
+            artifacts = self._entries.get(scope)
+            if artifacts is not None:
+                self._entries.move_to_end(scope)
+            return artifacts
+
+    def put(
+        self,
+        mission_id: str,
+        parent_mission_id: str | None,
+        artifacts: TimelineBuildArtifacts,
+    ) -> None:
+        """Retain the artifacts of a completed build."""
+        scope = (mission_id, parent_mission_id)
+        with self._lock:
+            self._entries[scope] = artifacts
+            self._entries.move_to_end(scope)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, mission_id: str) -> None:
+        """Drop retained artifacts for a leg under every parent mission."""
+        with self._lock:
+            for scope in [scope for scope in self._entries if scope[0] == mission_id]:
+                del self._entries[scope]
+
+    def clear(self) -> None:
+        """Drop all retained artifacts."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_artifact_store = TimelineArtifactStore()
+
+
+def get_timeline_artifact_store() -> TimelineArtifactStore:
+    """Return the process-wide timeline artifact store."""
+    return _artifact_store
+
+
+class IncrementalEventCollector:
+    """Applies event sources to a rule engine, replaying unchanged ones."""
+
+    def __init__(
+        self,
+        rule_engine: RuleEngine,
+        artifacts: TimelineBuildArtifacts,
+        previous: TimelineBuildArtifacts | None = None,
+    ):
+        """Initialize the collector.
+
+        Args:
+            rule_engine: Rule engine receiving events for the current build
+            artifacts: Artifacts being assembled for the current build
+            previous: Artifacts of the previous build of the same leg
+        """
+        self.rule_engine = rule_engine
+        self.artifacts = artifacts
+        self.previous = previous
+
+    def apply(
+        self,
+        source: str,
+        inputs: Any,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Emit events for one source, reusing the previous build when possible.
+
+        Args:
+            source: Event source name (one of EVENT_SOURCES)
+            inputs: JSON-serializable description of everything the source reads
+            compute: Callable that appends the source's events to the rule engine
+
+        Returns:
+            The value returned by compute (or its cached equivalent)
+        """
+        key = digest_payload(inputs)
+        cached = self.previous.event_sources.get(source) if self.previous else None
+        if cached is not None and cached.key == key:
+            self.rule_engine.events.extend(cached.events)
+            self.artifacts.event_sources[source] = cached
+            self.artifacts.reused_sources.append(source)
+            return cached.value
+
+        start = len(self.rule_engine.events)
+        value = compute()
+        self.artifacts.event_sources[source] = EventSourceResult(
+            key=key,
+            events=tuple(self.rule_engine.events[start:]),
+            value=value,
+        )
+        self.artifacts.recomputed_sources.append(source)
+        return value
+
+    def sync_pois(
+        self,
+        name: str,
+        inputs: Any,
+        poi_manager: POIManager,
+        sync: Callable[[], None],
+        collect_ids: Callable[[], frozenset[str]],
+    ) -> None:
+        """Run a POI sync pass unless the previous pass is still in place.
+
+        Args:
+            name: Sync pass name ("ka" or "x_aar")
+            inputs: JSON-serializable description of the POIs' inputs
+            poi_manager: POI manager the pass writes to
+            sync: Callable performing the delete/recreate sync
+            collect_ids: Callable returning IDs of the POIs the pass owns
+        """
+        key = digest_payload(inputs)
+        cached = self.previous.poi_syncs.get(name) if self.previous else None
+        if (
+            cached is not None
+            and cached.key == key
+            and cached.poi_manager_id == id(poi_manager)
+            and all(poi_manager.get_poi(poi_id) for poi_id in cached.poi_ids)
+        ):
+            self.artifacts.poi_syncs[name] = cached
+            return
+
+        sync()
+        self.artifacts.poi_syncs[name] = POISyncRecord(
+            key=key,
+            poi_manager_id=id(poi_manager),
+            poi_ids=collect_ids(),
+        )
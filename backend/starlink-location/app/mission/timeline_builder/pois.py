@@ -195,6 +195,25 @@ def sync_x_aar_pois(
             )
 
 
+def collect_synced_poi_ids(
+    mission: MissionLeg,
+    poi_manager: POIManager,
+    prefixes: tuple[str, ...],
+    parent_mission_id: str | None = None,
+) -> frozenset[str]:
+    """Return IDs of this leg's mission-event POIs whose names match prefixes."""
+    if not mission.route_id:
+        return frozenset()
+    return frozenset(
+        poi.id
+        for poi in poi_manager.list_pois(
+            route_id=mission.route_id,
+            mission_id=parent_mission_id or mission.id,
+        )
+        if poi.category == MISSION_EVENT_CATEGORY and poi.name.startswith(prefixes)
+    )
+
+
 def _format_commka_exit_entry(kind: str, satellite: str | None) -> str:
     """Format Ka coverage exit/entry POI name."""
     # Simplified: no satellite name, just Exit or Entry
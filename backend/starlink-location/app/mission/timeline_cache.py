@@ -0,0 +1,689 @@
+"""Content-addressed cache for computed mission leg timelines.
+
+A timeline is a pure function of the leg's route geometry/timing, its
+TransportConfig, the adjusted departure time, the satellite catalog, the
+longitudes its scheduled satellites resolve to and the Ka coverage file.
+Each of those inputs is hashed into a fingerprint; when the fingerprint
+matches a previous build the stored MissionLegTimeline and TimelineSummary
+are served instead of regenerating every sample.
+
+Builds also synchronize mission-event POIs, so a hit is only served when the
+POIs created by the original build still exist in the POI manager.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from app.mission.models import (
+    MissionLeg,
+    MissionLegTimeline,
+    Transport,
+    TransportState,
+)
+from app.mission.storage import (
+    load_mission_timeline,
+    load_mission_timeline_meta,
+    save_mission_timeline_meta,
+)
+from app.mission.timeline_builder.calculator import TIMELINE_SAMPLE_INTERVAL_SECONDS
+from app.mission.timeline_builder.events import resolve_satellite_longitude
+from app.mission.timeline_builder.incremental import digest_payload, route_payload
+from app.mission.timeline_builder.pois import (
+    KA_POI_NAME_PREFIXES,
+    X_AAR_POI_PREFIXES,
+    collect_synced_poi_ids,
+)
+from app.mission.timeline_builder.stats import TimelineSummary
+from app.mission.timeline_service import resolve_coverage_sampler
+from app.models.route import ParsedRoute
+from app.satellites.catalog import get_satellite_catalog
+from app.satellites.coverage import CoverageSampler
+from app.services.poi_manager import POIManager
+
+logger = logging.getLogger(__name__)
+
+# Bump when timeline generation changes in a way that invalidates stored output
+TIMELINE_CACHE_SCHEMA_VERSION = 1
+DEFAULT_MAX_ENTRIES = 64
+
+TimelineResult = tuple[MissionLegTimeline, TimelineSummary]
+
+
+@dataclass(frozen=True)
+class TimelineFingerprint:
+    """Per-input digests for one timeline build plus the combined cache key."""
+
+    components: dict[str, str]
+    key: str
+
+    def changed_components(self, previous: dict[str, str] | None) -> list[str]:
+        """Return the names of inputs that differ from a previous fingerprint."""
+        if previous is None:
+            return sorted(self.components)
+        names = set(self.components) | set(previous)
+        return sorted(
+            name for name in names if self.components.get(name) != previous.get(name)
+        )
+
+
+@dataclass
+class TimelineRecomputeReport:
+    """Explains whether a timeline request was served from cache, and why not."""
+
+    mission_id: str
+    cache_hit: bool
+    reason: (
+        str  # "hit", "cold", "inputs_changed", "pois_missing", "forced", "uncacheable"
+    )
+    changed_inputs: list[str] = field(default_factory=list)
+    cache_key: Optional[str] = None
+    source: Optional[str] = None  # "memory" or "disk" on a hit
+    evaluated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_dict(self) -> dict:
+        """Serialize report for API responses."""
+        return {
+            "mission_id": self.mission_id,
+            "cache_hit": self.cache_hit,
+            "reason": self.reason,
+            "changed_inputs": list(self.changed_inputs),
+            "cache_key": self.cache_key,
+            "source": self.source,
+            "evaluated_at": self.evaluated_at.isoformat(),
+        }
+
+
+@dataclass
+class _CacheEntry:
+    timeline: MissionLegTimeline
+    summary: TimelineSummary
+    synced_poi_ids: Optional[frozenset[str]]  # None when built without POI manager
+
+
+class TimelineCache:
+    """Bounded LRU of computed timelines keyed by input fingerprint."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of timelines kept in memory
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._last_components: dict[str, dict[str, str]] = {}
+        self._reports: dict[str, TimelineRecomputeReport] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(
+        self,
+        mission: MissionLeg,
+        route: ParsedRoute,
+        coverage_sampler: CoverageSampler | None,
+        parent_mission_id: str | None = None,
+        include_samples: bool = False,
+        poi_manager: POIManager | None = None,
+    ) -> TimelineFingerprint:
+        """Hash every input that influences the generated timeline.
+
+        Satellites missing from the catalog resolve their longitude through
+        global POIs, so the resolved longitudes are hashed alongside the
+        catalog; moving such a POI invalidates the cached timeline.
+        """
+        components = {
+            "leg": digest_payload(
+                {
+                    "id": mission.id,
+                    "route_id": mission.route_id,
+                    "parent_mission_id": parent_mission_id,
+                }
+            ),
+            "route": digest_payload(route_payload(route)),
+            "transports": digest_payload(mission.transports.model_dump(mode="json")),
+            "adjusted_departure_time": digest_payload(
+                mission.adjusted_departure_time.isoformat()
+                if mission.adjusted_departure_time
+                else None
+            ),
+            "satellite_catalog": digest_payload(_catalog_payload()),
+            "satellite_longitudes": digest_payload(
+                _satellite_longitudes_payload(mission, poi_manager)
+            ),
+            "coverage": digest_payload(
+                getattr(coverage_sampler, "version", None)
+                if coverage_sampler is not None
+                else None
+            ),
+            "parameters": digest_payload(
+                {
+                    "schema": TIMELINE_CACHE_SCHEMA_VERSION,
+                    "sample_interval_seconds": TIMELINE_SAMPLE_INTERVAL_SECONDS,
+                    "include_samples": include_samples,
+                }
+            ),
+        }
+        return TimelineFingerprint(
+            components=components, key=digest_payload(components)
+        )
+
+    def lookup(
+        self,
+        mission_id: str,
+        fingerprint: TimelineFingerprint,
+        poi_manager: POIManager | None,
+        allow_disk: bool = True,
+    ) -> tuple[TimelineResult | None, TimelineRecomputeReport]:
+        """Return a cached timeline for the fingerprint, if still valid.
+
+        Args:
+            mission_id: Leg/mission ID the timeline belongs to
+            fingerprint: Fingerprint of the current inputs
+            poi_manager: POI manager whose synced POIs must still exist
+            allow_disk: Also consider the persisted timeline + metadata
+
+        Returns:
+            Tuple of ((timeline, summary) or None, recompute report)
+        """
+        with self._lock:
+            entry = self._entries.get(fingerprint.key)
+            if entry is not None:
+                self._entries.move_to_end(fingerprint.key)
+        source = "memory"
+
+        if entry is None and allow_disk:
+            entry = _load_persisted_entry(mission_id, fingerprint.key)
+            source = "disk"
+
+        with self._lock:
+            previous = self._last_components.get(mission_id)
+        if entry is None:
+            if previous is None and allow_disk:
+                meta = load_mission_timeline_meta(mission_id)
+                previous = (meta or {}).get("components")
+            changed = fingerprint.changed_components(previous)
+            report = TimelineRecomputeReport(
+                mission_id=mission_id,
+                cache_hit=False,
+                reason="cold" if previous is None else "inputs_changed",
+                changed_inputs=[] if previous is None else changed,
+                cache_key=fingerprint.key,
+            )
+            return None, self._record(mission_id, report, hit=False)
+
+        if not _synced_pois_present(entry.synced_poi_ids, poi_manager):
+            report = TimelineRecomputeReport(
+                mission_id=mission_id,
+                cache_hit=False,
+                reason="pois_missing",
+                changed_inputs=["synced_pois"],
+                cache_key=fingerprint.key,
+            )
+            return None, self._record(mission_id, report, hit=False)
+
+        with self._lock:
+            if source == "disk":
+                self._put(fingerprint.key, entry)
+            self._last_components[mission_id] = dict(fingerprint.components)
+        report = TimelineRecomputeReport(
+            mission_id=mission_id,
+            cache_hit=True,
+            reason="hit",
+            cache_key=fingerprint.key,
+            source=source,
+        )
+        result = (entry.timeline.model_copy(deep=True), _copy_summary(entry.summary))
+        return result, self._record(mission_id, report, hit=True)
+
+    def store(
+        self,
+        mission_id: str,
+        fingerprint: TimelineFingerprint,
+        timeline: MissionLegTimeline,
+        summary: TimelineSummary,
+        synced_poi_ids: Optional[frozenset[str]],
+        persist: bool = False,
+    ) -> None:
+        """Record a freshly built timeline under its fingerprint.
+
+        Args:
+            mission_id: Leg/mission ID the timeline belongs to
+            fingerprint: Fingerprint of the inputs used for the build
+            timeline: Built timeline
+            summary: Built summary
+            synced_poi_ids: IDs of mission-event POIs created by the build
+            persist: Write fingerprint metadata next to the stored timeline
+        """
+        entry = _CacheEntry(
+            timeline=timeline.model_copy(deep=True),
+            summary=_copy_summary(summary),
+            synced_poi_ids=synced_poi_ids,
+        )
+        with self._lock:
+            self._put(fingerprint.key, entry)
+            self._last_components[mission_id] = dict(fingerprint.components)
+
+        if persist:
+            try:
+                save_mission_timeline_meta(
+                    mission_id,
+                    {
+                        "cache_key": fingerprint.key,
+                        "components": fingerprint.components,
+                        "summary": _summary_to_dict(summary),
+                        "synced_poi_ids": (
+                            sorted(synced_poi_ids)
+                            if synced_poi_ids is not None
+                            else None
+                        ),
+                    },
+                )
+            except (OSError, TypeError, ValueError, AttributeError) as exc:
+                logger.warning(
+                    "Failed to persist timeline cache metadata for %s: %s",
+                    mission_id,
+                    exc,
+                )
+
+    def is_persisted(self, mission_id: str, fingerprint: TimelineFingerprint) -> bool:
+        """Check whether the stored timeline on disk matches the fingerprint."""
+        meta = load_mission_timeline_meta(mission_id)
+        return bool(meta) and meta.get("cache_key") == fingerprint.key
+
+    def last_report(self, mission_id: str) -> TimelineRecomputeReport | None:
+        """Return the most recent lookup report for a leg/mission."""
+        with self._lock:
+            return self._reports.get(mission_id)
+
+    def record_forced(
+        self, mission_id: str, fingerprint: TimelineFingerprint | None
+    ) -> TimelineRecomputeReport:
+        """Record a recompute that bypassed the cache."""
+        report = TimelineRecomputeReport(
+            mission_id=mission_id,
+            cache_hit=False,
+            reason="forced" if fingerprint is not None else "uncacheable",
+            cache_key=fingerprint.key if fingerprint is not None else None,
+        )
+        return self._record(mission_id, report, hit=False)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and reports."""
+        with self._lock:
+            self._entries.clear()
+            self._last_components.clear()
+            self._reports.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return cache statistics."""
+        with self._lock:
+            entries, hits, misses = len(self._entries), self.hits, self.misses
+        total = hits + misses
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": (hits / total) if total else 0.0,
+        }
+
+    def _put(self, key: str, entry: _CacheEntry) -> None:
+        """Insert an entry, evicting the oldest (caller holds ``self._lock``)."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _record(
+        self, mission_id: str, report: TimelineRecomputeReport, hit: bool
+    ) -> TimelineRecomputeReport:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._reports[mission_id] = report
+        return report
+
+
+_timeline_cache = TimelineCache()
+
+
+def get_timeline_cache() -> TimelineCache:
+    """Return the process-wide timeline cache."""
+    return _timeline_cache
+
+
+def get_or_build_timeline(
+    mission: MissionLeg,
+    route: ParsedRoute | None,
+    build: Callable[[], TimelineResult],
+    *,
+    coverage_sampler: CoverageSampler | None = None,
+    poi_manager: POIManager | None = None,
+    parent_mission_id: str | None = None,
+    include_samples: bool = False,
+    save: Callable[[str, MissionLegTimeline], Any] | None = None,
+    force: bool = False,
+) -> TimelineResult:
+    """Serve a cached timeline when inputs are unchanged, otherwise build it.
+
+    Args:
+        mission: Leg being computed
+        route: Parsed route for the leg (None disables caching)
+        build: Callable performing the actual build_mission_timeline call
+        coverage_sampler: Coverage sampler the build will use
+        poi_manager: POI manager the build synchronizes POIs into
+        parent_mission_id: Parent mission ID used for POI scoping
+        include_samples: Whether the build includes preview samples
+        save: Optional persistence callable, invoked as save(mission.id, timeline)
+            whenever the stored timeline does not already match
+        force: Bypass the cache and always rebuild
+
+    Returns:
+        Tuple of (timeline, summary)
+    """
+    options = dict(
+        coverage_sampler=coverage_sampler,
+        poi_manager=poi_manager,
+        parent_mission_id=parent_mission_id,
+        include_samples=include_samples,
+        save=save,
+    )
+    if force:
+        cache = get_timeline_cache()
+        cache.record_forced(
+            mission.id,
+            _safe_fingerprint(
+                cache,
+                mission,
+                route,
+                resolve_coverage_sampler(coverage_sampler),
+                parent_mission_id,
+                include_samples,
+                poi_manager,
+            ),
+        )
+    else:
+        cached = lookup_cached_timeline(mission, route, **options)
+        if cached is not None:
+            return cached
+
+    return store_built_timeline(mission, route, build(), **options)
+
+
+def lookup_cached_timeline(
+    mission: MissionLeg,
+    route: ParsedRoute | None,
+    *,
+    coverage_sampler: CoverageSampler | None = None,
+    poi_manager: POIManager | None = None,
+    parent_mission_id: str | None = None,
+    include_samples: bool = False,
+    save: Callable[[str, MissionLegTimeline], Any] | None = None,
+) -> TimelineResult | None:
+    """Return the cached timeline for unchanged inputs, recording why on a miss.
+
+    Args:
+        mission: Leg being computed
+        route: Parsed route for the leg (None disables caching)
+        coverage_sampler: Coverage sampler the build would use
+        poi_manager: POI manager whose synced POIs must still exist
+        parent_mission_id: Parent mission ID used for POI scoping
+        include_samples: Whether the build would include preview samples
+        save: Optional persistence callable; the cached timeline is re-saved
+            through it when the stored copy does not match
+
+    Returns:
+        Tuple of (timeline, summary), or None when the leg must be rebuilt
+    """
+    cache = get_timeline_cache()
+    fingerprint = _safe_fingerprint(
+        cache,
+        mission,
+        route,
+        resolve_coverage_sampler(coverage_sampler),
+        parent_mission_id,
+        include_samples,
+        poi_manager,
+    )
+    if fingerprint is None:
+        cache.record_forced(mission.id, None)
+        return None
+
+    cached, report = cache.lookup(
+        mission.id, fingerprint, poi_manager, allow_disk=save is not None
+    )
+    if cached is None:
+        logger.info(
+            "Recomputing timeline for %s (reason=%s, changed=%s)",
+            mission.id,
+            report.reason,
+            ", ".join(report.changed_inputs) or "-",
+        )
+        return None
+
+    logger.info("Serving cached timeline for %s (source=%s)", mission.id, report.source)
+    if save is not None and not cache.is_persisted(mission.id, fingerprint):
+        save(mission.id, cached[0])
+        cache.store(
+            mission.id,
+            fingerprint,
+            cached[0],
+            cached[1],
+            _collect_synced_poi_ids(mission, poi_manager, parent_mission_id),
+            persist=True,
+        )
+    return cached
+
+
+def store_built_timeline(
+    mission: MissionLeg,
+    route: ParsedRoute | None,
+    result: TimelineResult,
+    *,
+    coverage_sampler: CoverageSampler | None = None,
+    poi_manager: POIManager | None = None,
+    parent_mission_id: str | None = None,
+    include_samples: bool = False,
+    save: Callable[[str, MissionLegTimeline], Any] | None = None,
+) -> TimelineResult:
+    """Persist a freshly built timeline and record it in the cache.
+
+    Args:
+        mission: Leg the timeline was built for
+        route: Parsed route used for the build (None disables caching)
+        result: Tuple of (timeline, summary) from build_mission_timeline
+        coverage_sampler: Coverage sampler used for the build
+        poi_manager: POI manager the build synchronized POIs into
+        parent_mission_id: Parent mission ID used for POI scoping
+        include_samples: Whether the build included preview samples
+        save: Optional persistence callable, invoked as save(mission.id, timeline)
+
+    Returns:
+        The given (timeline, summary) tuple
+    """
+    timeline, summary = result
+    if save is not None:
+        save(mission.id, timeline)
+
+    cache = get_timeline_cache()
+    fingerprint = _safe_fingerprint(
+        cache,
+        mission,
+        route,
+        resolve_coverage_sampler(coverage_sampler),
+        parent_mission_id,
+        include_samples,
+        poi_manager,
+    )
+    if (
+        fingerprint is not None
+        and isinstance(timeline, MissionLegTimeline)
+        and isinstance(summary, TimelineSummary)
+    ):
+        cache.store(
+            mission.id,
+            fingerprint,
+            timeline,
+            summary,
+            _collect_synced_poi_ids(mission, poi_manager, parent_mission_id),
+            persist=save is not None,
+        )
+    return timeline, summary
+
+
+def _safe_fingerprint(
+    cache: TimelineCache,
+    mission: MissionLeg,
+    route: ParsedRoute | None,
+    coverage_sampler: CoverageSampler | None,
+    parent_mission_id: str | None,
+    include_samples: bool,
+    poi_manager: POIManager | None,
+) -> TimelineFingerprint | None:
+    """Fingerprint inputs, or return None when they cannot be hashed."""
+    if not isinstance(route, ParsedRoute) or not isinstance(mission, MissionLeg):
+        return None
+    try:
+        return cache.fingerprint(
+            mission,
+            route,
+            coverage_sampler,
+            parent_mission_id,
+            include_samples,
+            poi_manager,
+        )
+    except (TypeError, ValueError, AttributeError) as exc:
+        logger.debug("Timeline inputs for %s not cacheable: %s", mission.id, exc)
+        return None
+
+
+def _catalog_payload() -> list:
+    catalog = get_satellite_catalog()
+    return sorted(
+        (sat.satellite_id, sat.transport, sat.longitude) for sat in catalog.list_all()
+    )
+
+
+def _satellite_longitudes_payload(
+    mission: MissionLeg, poi_manager: POIManager | None
+) -> list:
+    """Resolve the longitude of every X/Ka satellite the leg schedules."""
+    transports = mission.transports
+    satellite_ids = {transports.initial_x_satellite_id}
+    satellite_ids.update(transports.initial_ka_satellite_ids)
+    satellite_ids.update(
+        transition.target_satellite_id
+        for transition in transports.x_transitions
+        if transition.target_satellite_id
+    )
+    return [
+        (satellite_id, resolve_satellite_longitude(satellite_id, poi_manager))
+        for satellite_id in sorted(satellite_ids)
+    ]
+
+
+def _collect_synced_poi_ids(
+    mission: MissionLeg,
+    poi_manager: POIManager | None,
+    parent_mission_id: str | None,
+) -> Optional[frozenset[str]]:
+    """Collect IDs of the mission-event POIs a build synchronized for this leg."""
+    if poi_manager is None:
+        return None
+    return collect_synced_poi_ids(
+        mission,
+        poi_manager,
+        KA_POI_NAME_PREFIXES + X_AAR_POI_PREFIXES,
+        parent_mission_id,
+    )
+
+
+def _synced_pois_present(
+    synced_poi_ids: Optional[frozenset[str]], poi_manager: POIManager | None
+) -> bool:
+    if poi_manager is None:
+        return True
+    if synced_poi_ids is None:
+        # Entry was built without POI sync; the caller needs POIs now
+        return False
+    return all(poi_manager.get_poi(poi_id) is not None for poi_id in synced_poi_ids)
+
+
+def _load_persisted_entry(mission_id: str, key: str) -> _CacheEntry | None:
+    """Rebuild a cache entry from the stored timeline and its metadata."""
+    meta = load_mission_timeline_meta(mission_id)
+    if not meta or meta.get("cache_key") != key or not meta.get("summary"):
+        return None
+    try:
+        timeline = load_mission_timeline(mission_id)
+        if timeline is None:
+            return None
+        summary = _summary_from_dict(meta["summary"])
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("Ignoring stored timeline for %s: %s", mission_id, exc)
+        return None
+    poi_ids = meta.get("synced_poi_ids")
+    return _CacheEntry(
+        timeline=timeline,
+        summary=summary,
+        synced_poi_ids=frozenset(poi_ids) if poi_ids is not None else None,
+    )
+
+
+def _summary_to_dict(summary: TimelineSummary) -> dict:
+    return {
+        "mission_start": summary.mission_start.isoformat(),
+        "mission_end": summary.mission_end.isoformat(),
+        "degraded_seconds": summary.degraded_seconds,
+        "critical_seconds": summary.critical_seconds,
+        "next_conflict_seconds": summary.next_conflict_seconds,
+        "transport_states": {
+            transport.value: state.value
+            for transport, state in summary.transport_states.items()
+        },
+        "sample_count": summary.sample_count,
+        "sample_interval_seconds": summary.sample_interval_seconds,
+        "generation_runtime_ms": summary.generation_runtime_ms,
+    }
+
+
+def _summary_from_dict(data: dict) -> TimelineSummary:
+    return TimelineSummary(
+        mission_start=datetime.fromisoformat(data["mission_start"]),
+        mission_end=datetime.fromisoformat(data["mission_end"]),
+        degraded_seconds=float(data["degraded_seconds"]),
+        critical_seconds=float(data["critical_seconds"]),
+        next_conflict_seconds=float(data["next_conflict_seconds"]),
+        transport_states={
+            Transport(transport): TransportState(state)
+            for transport, state in data["transport_states"].items()
+        },
+        sample_count=int(data["sample_count"]),
+        sample_interval_seconds=int(data["sample_interval_seconds"]),
+        generation_runtime_ms=float(data["generation_runtime_ms"]),
+    )
+
+
+def _copy_summary(summary: TimelineSummary) -> TimelineSummary:
+    return TimelineSummary(
+        mission_start=summary.mission_start,
+        mission_end=summary.mission_end,
+        degraded_seconds=summary.degraded_seconds,
+        critical_seconds=summary.critical_seconds,
+        next_conflict_seconds=summary.next_conflict_seconds,
+        transport_states=dict(summary.transport_states),
+        sample_count=summary.sample_count,
+        sample_interval_seconds=summary.sample_interval_seconds,
+        generation_runtime_ms=summary.generation_runtime_ms,
+    )
@@ -0,0 +1,209 @@
+"""Interval index over a mission leg timeline for per-tick lookups.
+
+The mission countdown and comm-state gauges used to be written only when a
+timeline was rebuilt, so they went stale for the rest of the flight. A
+TimelineIndex compiles a MissionLegTimeline once, when it is stored, into
+sorted segment offsets (seconds since the first segment), per-transport
+state values and merged conflict intervals. The background loop then
+answers "what is the state now" and "how long until the next conflict" with
+bisect lookups, without loading or validating the timeline again.
+
+Indexes are immutable. Storing a new timeline replaces the mission's index.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional
+
+from app.core import clock
+from app.mission.models import (
+    MissionLegTimeline,
+    TimelineStatus,
+    Transport,
+    TransportState,
+)
+
+if TYPE_CHECKING:
+    from app.models.flight_status import FlightStatus
+
+# Compiled indexes kept in memory (the active mission plus recent saves)
+TIMELINE_INDEX_CACHE_SIZE = 8
+
+# Gauge encoding of transport states (mission_comm_state)
+TRANSPORT_STATE_METRIC_VALUES = {
+    TransportState.AVAILABLE: 0,
+    TransportState.DEGRADED: 1,
+    TransportState.OFFLINE: 2,
+}
+TRANSPORTS = (Transport.X, Transport.KA, Transport.KU)
+
+_indexes: OrderedDict[str, "TimelineIndex"] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class TimelineIndex:
+    """Immutable lookup structure for one mission leg timeline.
+
+    All times are seconds relative to ``mission_start`` (the start of the
+    first segment).
+    """
+
+    mission_id: str
+    mission_start: datetime
+    starts: tuple[float, ...]
+    ends: tuple[float, ...]
+    # One tuple of metric values per segment, ordered like TRANSPORTS
+    states: tuple[tuple[int, ...], ...]
+    # Merged runs of non-nominal segments
+    conflict_starts: tuple[float, ...]
+    conflict_ends: tuple[float, ...]
+
+    @property
+    def duration_seconds(self) -> float:
+        """Seconds from the first segment start to the last segment end."""
+        return self.ends[-1] if self.ends else 0.0
+
+    def segment_at(self, offset: float) -> Optional[int]:
+        """Index of the segment covering ``offset``.
+
+        Offsets before the first segment map to the first segment and
+        offsets after the last one map to the last segment.
+        """
+        if not self.starts:
+            return None
+        return max(bisect_right(self.starts, offset) - 1, 0)
+
+    def states_at(self, offset: float) -> dict[Transport, int]:
+        """Metric value of each transport's state at ``offset``."""
+        index = self.segment_at(offset)
+        if index is None:
+            return {}
+        return dict(zip(TRANSPORTS, self.states[index]))
+
+    def next_conflict_seconds(self, offset: float) -> float:
+        """Seconds from ``offset`` until the next degraded/critical segment.
+
+        Returns 0 while a conflict is in progress and -1 if none is left.
+        """
+        index = bisect_right(self.conflict_starts, offset)
+        if index and offset < self.conflict_ends[index - 1]:
+            return 0.0
+        if index < len(self.conflict_starts):
+            return self.conflict_starts[index] - offset
+        return -1.0
+
+
+def compile_timeline_index(
+    mission_id: str, timeline: MissionLegTimeline
+) -> TimelineIndex:
+    """Compile a timeline into a TimelineIndex.
+
+    Args:
+        mission_id: Mission (or leg) ID the timeline belongs to
+        timeline: Computed timeline
+
+    Returns:
+        Compiled index
+    """
+    segments = sorted(timeline.segments, key=lambda segment: segment.start_time)
+    mission_start = segments[0].start_time if segments else timeline.created_at
+
+    starts: list[float] = []
+    ends: list[float] = []
+    states: list[tuple[int, ...]] = []
+    conflict_starts: list[float] = []
+    conflict_ends: list[float] = []
+    for segment in segments:
+        start = (segment.start_time - mission_start).total_seconds()
+        end = (
+            (segment.end_time - mission_start).total_seconds()
+            if segment.end_time
+            else start
+        )
+        starts.append(start)
+        ends.append(end)
+        states.append(
+            tuple(
+                TRANSPORT_STATE_METRIC_VALUES[state]
+                for state in (segment.x_state, segment.ka_state, segment.ku_state)
+            )
+        )
+        if segment.status == TimelineStatus.NOMINAL or end <= start:
+            continue
+        if conflict_ends and start <= conflict_ends[-1]:
+            conflict_ends[-1] = max(conflict_ends[-1], end)
+        else:
+            conflict_starts.append(start)
+            conflict_ends.append(end)
+
+    return TimelineIndex(
+        mission_id=mission_id,
+        mission_start=mission_start,
+        starts=tuple(starts),
+        ends=tuple(ends),
+        states=tuple(states),
+        conflict_starts=tuple(conflict_starts),
+        conflict_ends=tuple(conflict_ends),
+    )
+
+
+def mission_offset_seconds(
+    flight_status: "FlightStatus", now: Optional[datetime] = None
+) -> float:
+    """Current position in the mission timeline, in seconds from its start.
+
+    The timeline starts at departure. The offset counts from the actual
+    departure once known, otherwise from the scheduled departure (negative
+    before it). With neither, the mission is held at its start.
+
+    Args:
+        flight_status: Current flight status
+        now: Current time (defaults to now, UTC)
+
+    Returns:
+        Mission-relative time in seconds
+    """
+    departure = flight_status.departure_time or flight_status.scheduled_departure_time
+    if departure is None:
+        return 0.0
+    if departure.tzinfo is None:
+        departure = departure.replace(tzinfo=timezone.utc)
+    now = now or clock.now()
+    return (now - departure).total_seconds()
+
+
+def store_timeline_index(
+    mission_id: str, timeline: MissionLegTimeline
+) -> TimelineIndex:
+    """Compile a timeline and make it the mission's current index."""
+    index = compile_timeline_index(mission_id, timeline)
+    with _indexes_lock:
+        _indexes[mission_id] = index
+        _indexes.move_to_end(mission_id)
+        while len(_indexes) > TIMELINE_INDEX_CACHE_SIZE:
+            _indexes.popitem(last=False)
+    return index
+
+
+def get_timeline_index(mission_id: str) -> Optional[TimelineIndex]:
+    """Compiled index for a mission, or None if none is held in memory."""
+    with _indexes_lock:
+        index = _indexes.get(mission_id)
+        if index is not None:
+            _indexes.move_to_end(mission_id)
+        return index
+
+
+def drop_timeline_index(mission_id: Optional[str] = None) -> None:
+    """Forget a mission's index (or all indexes if no ID is given)."""
+    with _indexes_lock:
+        if mission_id is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(mission_id, None)
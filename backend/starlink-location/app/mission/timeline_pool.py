@@ -0,0 +1,655 @@
+"""Process pool for generating several mission leg timelines in parallel.
+
+Timeline generation is CPU-bound Python, so legs are built in worker
+processes rather than threads. Routes, the parsed Ka coverage polygons and
+the satellite catalog are pickled into a private (0700) temporary directory
+that the pool removes on shutdown; each worker unpickles a given input at
+most once and keeps a few recent ones for later jobs. The directory holds
+the inputs of in-flight jobs plus the latest value of each input type, so
+it does not grow with the number of routes or catalog versions seen.
+
+Every leg is one job with its own timeout. Workers build against an
+in-memory copy of the leg's POIs; the parent merges the synchronized POIs,
+persists the timeline and records it in the timeline cache, so callers see
+the same side effects as a serial build.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from app.mission.models import MissionLeg, MissionLegTimeline
+from app.mission.storage import save_mission_timeline
+from app.mission.timeline_builder.incremental import (
+    TimelineBuildArtifacts,
+    digest_payload,
+    get_timeline_artifact_store,
+    route_payload,
+)
+from app.mission.timeline_builder.stats import TimelineSummary
+from app.mission.timeline_builder.pois import (
+    KA_POI_NAME_PREFIXES,
+    X_AAR_POI_PREFIXES,
+)
+from app.mission.timeline_cache import lookup_cached_timeline, store_built_timeline
+from app.mission.timeline_service import (
+    build_mission_timeline,
+    resolve_coverage_sampler,
+)
+from app.models.poi import POI, POICreate
+from app.models.route import ParsedRoute
+from app.satellites.catalog import get_satellite_catalog, set_satellite_catalog
+from app.satellites.coverage import CoverageSampler
+from app.services.poi_manager import POIManager
+from app.services.route_manager import RouteManager
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_WORKERS = int(os.getenv("TIMELINE_WORKERS", "0"))  # 0 = one per CPU, max 8
+TIMELINE_JOB_TIMEOUT_SECONDS = float(os.getenv("TIMELINE_JOB_TIMEOUT_SECONDS", "120"))
+# spawn avoids forking the threaded API server with locks held
+TIMELINE_POOL_START_METHOD = os.getenv("TIMELINE_POOL_START_METHOD", "spawn")
+# Unpickled inputs each worker keeps (catalog, coverage and recent routes)
+TIMELINE_WORKER_INPUT_CACHE_SIZE = int(
+    os.getenv("TIMELINE_WORKER_INPUT_CACHE_SIZE", "16")
+)
+
+TimelineResult = tuple[MissionLegTimeline, TimelineSummary]
+
+
+@dataclass
+class LegTimelineOutcome:
+    """Result of generating one leg's timeline as part of a batch."""
+
+    leg_id: str
+    timeline: Optional[MissionLegTimeline] = None
+    summary: Optional[TimelineSummary] = None
+    source: str = "inline"  # "cache", "worker" or "inline"
+    error: Optional[str] = None
+    runtime_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether a timeline was produced."""
+        return self.error is None and self.timeline is not None
+
+    def to_dict(self) -> dict:
+        """Serialize outcome (without the timeline body) for API responses."""
+        return {
+            "leg_id": self.leg_id,
+            "ok": self.ok,
+            "source": self.source,
+            "error": self.error,
+            "runtime_ms": round(self.runtime_ms, 1),
+        }
+
+
+@dataclass
+class _LegJob:
+    leg: MissionLeg
+    parent_mission_id: Optional[str]
+    route_path: str
+    coverage_path: Optional[str]
+    catalog_path: str
+    seed_pois: list[POI]
+
+
+@dataclass
+class _LegJobResult:
+    timeline: MissionLegTimeline
+    summary: TimelineSummary
+    synced_prefixes: list[tuple[str, ...]]
+    pois: list[POI]
+    artifacts: Optional[TimelineBuildArtifacts]
+    runtime_ms: float
+
+
+@dataclass
+class _PendingLeg:
+    leg: MissionLeg
+    route: ParsedRoute
+    job: _LegJob
+    handle: Any = None
+
+
+class TimelineWorkerPool:
+    """Builds leg timelines in a lazily started pool of worker processes."""
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        job_timeout_seconds: float | None = None,
+        start_method: str | None = None,
+    ):
+        """Initialize the pool (workers start on first use).
+
+        Args:
+            max_workers: Worker process count (defaults to TIMELINE_WORKERS)
+            job_timeout_seconds: Per-leg timeout in seconds
+            start_method: multiprocessing start method ("spawn", "fork", ...)
+        """
+        configured = max_workers if max_workers is not None else TIMELINE_WORKERS
+        self.max_workers = configured or min(os.cpu_count() or 1, 8)
+        self.job_timeout_seconds = (
+            job_timeout_seconds
+            if job_timeout_seconds is not None
+            else TIMELINE_JOB_TIMEOUT_SECONDS
+        )
+        self.start_method = start_method or TIMELINE_POOL_START_METHOD
+        self._pool: multiprocessing.pool.Pool | None = None
+        self._lock = threading.Lock()
+        # Private directory for pickled job inputs and the files written to it
+        self._input_dir: Path | None = None
+        self._published: dict[str, str] = {}
+        # Published paths still used by dispatched jobs, and the latest path
+        # per input type (kept on disk for the next batch)
+        self._input_refs: dict[str, int] = {}
+        self._latest_inputs: dict[str, str] = {}
+
+    def build_legs(
+        self,
+        legs: Sequence[MissionLeg],
+        route_manager: RouteManager,
+        poi_manager: POIManager | None,
+        build: Callable[[MissionLeg], TimelineResult],
+        *,
+        coverage_sampler: CoverageSampler | None = None,
+        parent_mission_id: str | None = None,
+        persist: bool = True,
+        force: bool = False,
+    ) -> list[LegTimelineOutcome]:
+        """Generate timelines for several legs, in parallel where it pays off.
+
+        Legs whose inputs are unchanged are served from the timeline cache.
+        When two or more legs need a rebuild they are dispatched to worker
+        processes; otherwise (or if the pool cannot start) they are built
+        inline with ``build``.
+
+        Args:
+            legs: Legs to generate timelines for (legs without a route are skipped)
+            route_manager: RouteManager with the legs' routes loaded
+            poi_manager: POI manager receiving synchronized mission-event POIs
+            build: In-process builder, called as build(leg), for inline builds
+            coverage_sampler: Coverage sampler override
+            parent_mission_id: Parent mission ID used for POI scoping
+            persist: Save generated timelines to disk
+            force: Ignore cached timelines
+
+        Returns:
+            One outcome per leg with a route_id, in input order
+        """
+        save = save_mission_timeline if persist else None
+        sampler = resolve_coverage_sampler(coverage_sampler)
+        options = dict(
+            coverage_sampler=sampler,
+            poi_manager=poi_manager,
+            parent_mission_id=parent_mission_id,
+            save=save,
+        )
+        outcomes: dict[str, LegTimelineOutcome] = {}
+        pending: list[tuple[MissionLeg, Optional[ParsedRoute]]] = []
+
+        for leg in legs:
+            if not leg.route_id:
+                continue
+            route = route_manager.get_route(leg.route_id)
+            cached = None
+            if not force:
+                try:
+                    cached = lookup_cached_timeline(leg, route, **options)
+                except Exception as exc:
+                    logger.warning(
+                        "Timeline cache lookup failed for %s: %s", leg.id, exc
+                    )
+            if cached is not None:
+                outcomes[leg.id] = LegTimelineOutcome(
+                    leg_id=leg.id,
+                    timeline=cached[0],
+                    summary=cached[1],
+                    source="cache",
+                )
+            else:
+                pending.append((leg, route))
+
+        parallel = [
+            (leg, route) for leg, route in pending if isinstance(route, ParsedRoute)
+        ]
+        dispatched: list[_PendingLeg] = []
+        if len(parallel) >= 2 and self.max_workers > 1:
+            dispatched = self._dispatch(
+                parallel, poi_manager, sampler, parent_mission_id
+            )
+
+        collected_ids = set()
+        recycled = False
+        try:
+            for item in dispatched:
+                if recycled and not item.handle.ready():
+                    # Lost with the recycled pool; rebuilt inline below
+                    continue
+                outcome = self._collect(item, poi_manager, options)
+                if outcome.error and outcome.error.startswith("Timed out"):
+                    recycled = True
+                outcomes[item.leg.id] = outcome
+                collected_ids.add(item.leg.id)
+        finally:
+            self._release_inputs(
+                path for item in dispatched for path in _job_input_paths(item.job)
+            )
+
+        for leg, route in pending:
+            if leg.id in collected_ids:
+                continue
+            start = time.perf_counter()
+            try:
+                result = store_built_timeline(leg, route, build(leg), **options)
+                outcomes[leg.id] = LegTimelineOutcome(
+                    leg_id=leg.id,
+                    timeline=result[0],
+                    summary=result[1],
+                    source="inline",
+                    runtime_ms=(time.perf_counter() - start) * 1000.0,
+                )
+            except Exception as exc:
+                logger.error("Failed to generate timeline for leg %s: %s", leg.id, exc)
+                outcomes[leg.id] = LegTimelineOutcome(
+                    leg_id=leg.id, source="inline", error=str(exc)
+                )
+
+        return [outcomes[leg.id] for leg in legs if leg.id in outcomes]
+
+    def shutdown(self) -> None:
+        """Stop worker processes and remove their published inputs."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            input_dir, self._input_dir = self._input_dir, None
+            self._published = {}
+            self._input_refs = {}
+            self._latest_inputs = {}
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        if input_dir is not None:
+            shutil.rmtree(input_dir, ignore_errors=True)
+
+    def _publish_input(self, value: Any, key: str) -> str:
+        """Pickle value into the pool's private input directory once per key.
+
+        Every call takes a reference on the returned path; callers hand it
+        back through ``_release_inputs`` once the job using it has finished.
+        """
+        kind = type(value).__name__
+        name = f"{kind}-{key}"
+        with self._lock:
+            path = self._published.get(name)
+            if path is None:
+                if self._input_dir is None:
+                    # mkdtemp creates the directory with mode 0700
+                    self._input_dir = Path(
+                        tempfile.mkdtemp(prefix="starlink-timeline-")
+                    )
+                path = str(self._input_dir / f"{name}.pickle")
+                # "x" refuses to reuse any file this pool did not just create
+                with open(path, "xb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._published[name] = path
+            self._input_refs[path] = self._input_refs.get(path, 0) + 1
+            self._latest_inputs[kind] = path
+            self._prune_inputs()
+            return path
+
+    def _retain_inputs(self, paths: Iterable[str]) -> None:
+        """Take another reference on already published inputs."""
+        with self._lock:
+            for path in paths:
+                if path in self._input_refs:
+                    self._input_refs[path] += 1
+
+    def _release_inputs(self, paths: Iterable[str]) -> None:
+        """Drop job references and delete inputs nothing uses any more."""
+        with self._lock:
+            for path in paths:
+                refs = self._input_refs.get(path)
+                if refs is None:
+                    # Published before a shutdown; already removed
+                    continue
+                if refs > 1:
+                    self._input_refs[path] = refs - 1
+                else:
+                    del self._input_refs[path]
+            self._prune_inputs()
+
+    def _prune_inputs(self) -> None:
+        """Delete published files that are unreferenced and superseded.
+
+        Caller holds ``self._lock``.
+        """
+        keep = set(self._input_refs) | set(self._latest_inputs.values())
+        for name, path in list(self._published.items()):
+            if path in keep:
+                continue
+            del self._published[name]
+            try:
+                os.unlink(path)
+            except OSError as exc:
+                logger.debug("Could not remove timeline input %s: %s", path, exc)
+
+    def _ensure_pool(self) -> multiprocessing.pool.Pool:
+        with self._lock:
+            if self._pool is None:
+                context = multiprocessing.get_context(self.start_method)
+                self._pool = context.Pool(processes=self.max_workers)
+                logger.info(
+                    "Started timeline worker pool (%d workers, %s)",
+                    self.max_workers,
+                    self.start_method,
+                )
+            return self._pool
+
+    def _dispatch(
+        self,
+        legs: Sequence[tuple[MissionLeg, ParsedRoute]],
+        poi_manager: POIManager | None,
+        sampler: CoverageSampler | None,
+        parent_mission_id: str | None,
+    ) -> list[_PendingLeg]:
+        """Publish shared inputs and submit one job per leg."""
+        catalog_path = coverage_path = None
+        try:
+            pool = self._ensure_pool()
+            catalog = get_satellite_catalog()
+            catalog_path = self._publish_input(
+                catalog,
+                digest_payload(
+                    sorted(
+                        (sat.satellite_id, sat.transport, sat.longitude, sat.slot)
+                        for sat in catalog.list_all()
+                    )
+                ),
+            )
+            coverage_path = (
+                self._publish_input(
+                    sampler, sampler.version or digest_payload(id(sampler))
+                )
+                if sampler is not None
+                else None
+            )
+        except (OSError, ValueError, pickle.PicklingError) as exc:
+            logger.warning("Timeline worker pool unavailable, building inline: %s", exc)
+            self._release_inputs(path for path in (catalog_path, coverage_path) if path)
+            return []
+
+        if poi_manager is not None:
+            satellite_names = {sat.satellite_id for sat in catalog.list_all()}
+            poi_manager.delete_scoped_pois_by_names(satellite_names)
+
+        dispatched: list[_PendingLeg] = []
+        for leg, route in legs:
+            job = _LegJob(
+                leg=leg,
+                parent_mission_id=parent_mission_id,
+                route_path=self._publish_input(
+                    route, digest_payload(route_payload(route))
+                ),
+                coverage_path=coverage_path,
+                catalog_path=catalog_path,
+                seed_pois=_seed_pois(poi_manager, leg, parent_mission_id),
+            )
+            self._retain_inputs(path for path in (catalog_path, coverage_path) if path)
+            item = _PendingLeg(leg=leg, route=route, job=job)
+            item.handle = pool.apply_async(_run_leg_job, (job,))
+            dispatched.append(item)
+        # Each job took its own references above
+        self._release_inputs(path for path in (catalog_path, coverage_path) if path)
+        logger.info("Dispatched %d leg timelines to worker pool", len(dispatched))
+        return dispatched
+
+    def _collect(
+        self,
+        item: _PendingLeg,
+        poi_manager: POIManager | None,
+        options: dict,
+    ) -> LegTimelineOutcome:
+        """Wait for one job and merge its result into the parent process."""
+        leg = item.leg
+        try:
+            result: _LegJobResult = item.handle.get(timeout=self.job_timeout_seconds)
+        except multiprocessing.TimeoutError:
+            logger.error(
+                "Timeline job for leg %s timed out after %.0fs",
+                leg.id,
+                self.job_timeout_seconds,
+            )
+            # A stuck worker cannot be cancelled individually; recycle the
+            # pool (legs still running in it are rebuilt inline)
+            self.shutdown()
+            return LegTimelineOutcome(
+                leg_id=leg.id,
+                source="worker",
+                error=f"Timed out after {self.job_timeout_seconds:.0f}s",
+            )
+        except Exception as exc:
+            logger.error("Timeline job for leg %s failed: %s", leg.id, exc)
+            return LegTimelineOutcome(leg_id=leg.id, source="worker", error=str(exc))
+
+        if poi_manager is not None:
+            _merge_synced_pois(
+                poi_manager,
+                leg,
+                item.route,
+                item.job.parent_mission_id,
+                result.synced_prefixes,
+                result.pois,
+            )
+        if result.artifacts is not None:
+            # POI sync records refer to the worker's POI manager
+            result.artifacts.poi_syncs = {}
+            get_timeline_artifact_store().put(
+                leg.id, item.job.parent_mission_id, result.artifacts
+            )
+        timeline, summary = store_built_timeline(
+            leg, item.route, (result.timeline, result.summary), **options
+        )
+        return LegTimelineOutcome(
+            leg_id=leg.id,
+            timeline=timeline,
+            summary=summary,
+            source="worker",
+            runtime_ms=result.runtime_ms,
+        )
+
+
+_worker_pool: TimelineWorkerPool | None = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_timeline_worker_pool() -> TimelineWorkerPool:
+    """Return the process-wide timeline worker pool."""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = TimelineWorkerPool()
+        return _worker_pool
+
+
+def shutdown_timeline_worker_pool() -> None:
+    """Stop the process-wide worker pool, if it was started."""
+    global _worker_pool
+    with _worker_pool_lock:
+        pool, _worker_pool = _worker_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _job_input_paths(job: _LegJob) -> list[str]:
+    """Published input files a job reads."""
+    return [
+        path
+        for path in (job.route_path, job.coverage_path, job.catalog_path)
+        if path is not None
+    ]
+
+
+def _seed_pois(
+    poi_manager: POIManager | None, leg: MissionLeg, parent_mission_id: str | None
+) -> list[POI]:
+    """Copy the global POIs and this leg's scoped POIs for a worker build."""
+    if poi_manager is None:
+        return []
+    scope_mission_id = parent_mission_id or leg.id
+    return [
+        poi
+        for poi in poi_manager.list_pois()
+        if (poi.route_id is None and poi.mission_id is None)
+        or (poi.route_id == leg.route_id and poi.mission_id == scope_mission_id)
+    ]
+
+
+def _merge_synced_pois(
+    poi_manager: POIManager,
+    leg: MissionLeg,
+    route: ParsedRoute,
+    parent_mission_id: str | None,
+    synced_prefixes: Iterable[tuple[str, ...]],
+    worker_pois: list[POI],
+) -> None:
+    """Replay the worker's POI sync passes against the real POI manager."""
+    scope_mission_id = parent_mission_id or leg.id
+    for prefixes in dict.fromkeys(synced_prefixes):
+        desired = [poi for poi in worker_pois if poi.name.startswith(prefixes)]
+        current = [
+            poi
+            for poi in poi_manager.list_pois(
+                route_id=leg.route_id, mission_id=scope_mission_id
+            )
+            if poi.name.startswith(prefixes)
+        ]
+        if _poi_signatures(current) == _poi_signatures(desired):
+            continue
+        poi_manager.delete_leg_pois(
+            route_id=leg.route_id,
+            mission_id=scope_mission_id,
+            categories=None,
+            prefixes=prefixes,
+        )
+        for poi in desired:
+            poi_manager.create_poi(
+                POICreate(
+                    name=poi.name,
+                    latitude=poi.latitude,
+                    longitude=poi.longitude,
+                    icon=poi.icon,
+                    category=poi.category,
+                    description=poi.description,
+                    route_id=poi.route_id,
+                    mission_id=poi.mission_id,
+                ),
+                active_route=route,
+            )
+
+
+def _poi_signatures(pois: Iterable[POI]) -> list[tuple]:
+    return sorted(
+        (
+            poi.name,
+            poi.latitude,
+            poi.longitude,
+            poi.icon,
+            poi.category,
+            poi.description or "",
+        )
+        for poi in pois
+    )
+
+
+# --- Worker process side -----------------------------------------------------
+
+_worker_inputs: OrderedDict[str, Any] = OrderedDict()
+_worker_catalog_path: str | None = None
+
+
+class _DetachedPOIManager(POIManager):
+    """In-memory POI manager that records which leg POI groups were re-synced."""
+
+    def __init__(self, pois: Iterable[POI]):
+        super().__init__(pois_file=None)
+        self._pois = {poi.id: poi for poi in pois}
+        self.synced_prefixes: list[tuple[str, ...]] = []
+
+    def delete_leg_pois(
+        self,
+        route_id: str,
+        mission_id: str,
+        categories: set[str] | None = None,
+        prefixes: Sequence[str] | None = None,
+    ) -> int:
+        self.synced_prefixes.append(tuple(prefixes or ()))
+        return super().delete_leg_pois(route_id, mission_id, categories, prefixes)
+
+
+def _load_shared_input(path: str) -> Any:
+    """Unpickle a published input, keeping recently used ones in the worker."""
+    if path in _worker_inputs:
+        _worker_inputs.move_to_end(path)
+        return _worker_inputs[path]
+    with open(path, "rb") as f:
+        value = pickle.load(f)
+    _worker_inputs[path] = value
+    while len(_worker_inputs) > TIMELINE_WORKER_INPUT_CACHE_SIZE:
+        _worker_inputs.popitem(last=False)
+    return value
+
+
+def _run_leg_job(job: _LegJob) -> _LegJobResult:
+    """Build one leg timeline inside a worker process."""
+    global _worker_catalog_path
+    start = time.perf_counter()
+    if job.catalog_path != _worker_catalog_path:
+        set_satellite_catalog(_load_shared_input(job.catalog_path))
+        _worker_catalog_path = job.catalog_path
+
+    route_manager = RouteManager(routes_dir=None)
+    route_manager.add_route(job.leg.route_id, _load_shared_input(job.route_path))
+    sampler = _load_shared_input(job.coverage_path) if job.coverage_path else None
+    poi_manager = _DetachedPOIManager(job.seed_pois)
+
+    timeline, summary = build_mission_timeline(
+        mission=job.leg,
+        route_manager=route_manager,
+        poi_manager=poi_manager,
+        coverage_sampler=sampler,
+        parent_mission_id=job.parent_mission_id,
+    )
+
+    store = get_timeline_artifact_store()
+    artifacts = store.get(job.leg.id, job.parent_mission_id)
+    store.discard(job.leg.id)
+
+    scope_mission_id = job.parent_mission_id or job.leg.id
+    prefixes = KA_POI_NAME_PREFIXES + X_AAR_POI_PREFIXES
+    return _LegJobResult(
+        timeline=timeline,
+        summary=summary,
+        synced_prefixes=poi_manager.synced_prefixes,
+        pois=[
+            poi
+            for poi in poi_manager.list_pois(
+                route_id=job.leg.route_id, mission_id=scope_mission_id
+            )
+            if poi.name.startswith(prefixes)
+        ],
+        artifacts=artifacts,
+        runtime_ms=(time.perf_counter() - start) * 1000.0,
+    )
@@ -0,0 +1,430 @@
+"""Compact binary storage for computed mission leg timelines.
+
+Timelines used to be stored as indented JSON dumps of MissionLegTimeline, so
+every export, active-mission request and Grafana panel refresh re-parsed and
+re-validated the whole structure, including preview samples. This module
+stores them as one binary file per timeline:
+
+- a small JSON header with the timeline's scalar fields, advisories, an
+  interned string table (segment IDs, reason codes, segment metadata,
+  coverage sets) and the layout of the column blocks
+- segment columns: start/end times (epoch microseconds), status and
+  transport state codes, impacted-transport bitmasks, string indexes and
+  reason lists as offset/index arrays
+- sample columns in their own blocks, read only when samples are requested
+
+Files are memory-mapped. Columns are views over the mapping, so a query such
+as "segments overlapping [t0, t1]" reads two time columns and builds models
+only for the matching rows. Rows are turned into models with a single
+pydantic-core validation call per list, with no JSON parsing.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from pydantic import TypeAdapter
+
+from app.mission.models import (
+    MissionLegTimeline,
+    RouteSampleData,
+    TimelineAdvisory,
+    TimelineSegment,
+    TimelineStatus,
+    Transport,
+    TransportState,
+)
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_MAGIC = b"SLTL"
+TIMELINE_FORMAT_VERSION = 1
+# Open timeline files kept mapped between requests
+TIMELINE_FILE_CACHE_SIZE = 32
+
+_PREAMBLE = struct.Struct("<4sIQ")  # magic, version, header length
+_ALIGNMENT = 64
+_STATUSES = list(TimelineStatus)
+_STATES = list(TransportState)
+_TRANSPORTS = list(Transport)
+# Impacted-transport bitmask -> transports
+_IMPACTED = [
+    [transport for bit, transport in enumerate(_TRANSPORTS) if mask & (1 << bit)]
+    for mask in range(1 << len(_TRANSPORTS))
+]
+# Validating whole lists runs in pydantic-core, faster than model_construct
+_SEGMENT_LIST = TypeAdapter(list[TimelineSegment])
+_SAMPLE_LIST = TypeAdapter(list[RouteSampleData])
+
+_cache: OrderedDict[Path, tuple[tuple[int, ...], "TimelineFile"]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _from_micros(values: np.ndarray) -> list[datetime]:
+    return [
+        stamp.replace(tzinfo=timezone.utc)
+        for stamp in np.asarray(values, dtype="datetime64[us]").tolist()
+    ]
+
+
+class _StringTable:
+    """Interns strings to indexes for the file header."""
+
+    def __init__(self):
+        self.strings: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def _ragged(groups: list[list[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """Offsets (n + 1) and flat values for a list of index lists."""
+    offsets = np.zeros(len(groups) + 1, dtype=np.int32)
+    offsets[1:] = np.cumsum([len(group) for group in groups])
+    values = np.fromiter(
+        (value for group in groups for value in group),
+        dtype=np.int32,
+        count=int(offsets[-1]),
+    )
+    return offsets, values
+
+
+def _metadata_key(metadata: dict) -> str:
+    return json.dumps(metadata, sort_keys=True, default=str)
+
+
+def write_timeline_file(path: Path, timeline: MissionLegTimeline) -> Path:
+    """Write a timeline in the binary format, replacing ``path`` atomically.
+
+    Args:
+        path: Destination file
+        timeline: Timeline to store
+
+    Returns:
+        The destination path
+    """
+    strings = _StringTable()
+    segments = timeline.segments
+    columns: dict[str, np.ndarray] = {
+        "segment_start": np.array(
+            [_to_micros(s.start_time) for s in segments], dtype=np.int64
+        ),
+        "segment_end": np.array(
+            [_to_micros(s.end_time) for s in segments], dtype=np.int64
+        ),
+        "segment_status": np.array(
+            [_STATUSES.index(TimelineStatus(s.status)) for s in segments],
+            dtype=np.uint8,
+        ),
+        "segment_states": np.array(
+            [
+                [
+                    _STATES.index(TransportState(state))
+                    for state in (s.x_state, s.ka_state, s.ku_state)
+                ]
+                for s in segments
+            ],
+            dtype=np.uint8,
+        ).reshape(-1),
+        "segment_impacted": np.array(
+            [
+                sum(
+                    1 << _TRANSPORTS.index(Transport(transport))
+                    for transport in s.impacted_transports
+                )
+                for s in segments
+            ],
+            dtype=np.uint8,
+        ),
+        "segment_id": np.array(
+            [strings.intern(s.id) for s in segments], dtype=np.int32
+        ),
+        "segment_metadata": np.array(
+            [strings.intern(_metadata_key(s.metadata)) for s in segments],
+            dtype=np.int32,
+        ),
+    }
+    columns["reason_offsets"], columns["reasons"] = _ragged(
+        [[strings.intern(reason) for reason in s.reasons] for s in segments]
+    )
+
+    samples = timeline.samples
+    if samples is not None:
+        columns["sample_time"] = np.array(
+            [_to_micros(s.timestamp) for s in samples], dtype=np.int64
+        )
+        columns["sample_position"] = np.array(
+            [
+                [
+                    s.latitude,
+                    s.longitude,
+                    np.nan if s.altitude is None else s.altitude,
+                ]
+                for s in samples
+            ],
+            dtype=np.float64,
+        ).reshape(-1)
+        columns["coverage_offsets"], columns["coverage"] = _ragged(
+            [[strings.intern(sat) for sat in s.coverage] for s in samples]
+        )
+
+    blocks = {}
+    offset = 0
+    for name, values in columns.items():
+        blocks[name] = {
+            "dtype": values.dtype.str,
+            "offset": offset,
+            "length": int(values.size),
+        }
+        offset += -(-values.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+    header = json.dumps(
+        {
+            "mission_leg_id": timeline.mission_leg_id,
+            "created_at": timeline.created_at.isoformat(),
+            "statistics": timeline.statistics,
+            "advisories": [a.model_dump(mode="json") for a in timeline.advisories],
+            "segment_count": len(segments),
+            "sample_count": None if samples is None else len(samples),
+            "strings": strings.strings,
+            "blocks": blocks,
+        },
+        default=str,
+    ).encode()
+    data_start = -(-(_PREAMBLE.size + len(header)) // _ALIGNMENT) * _ALIGNMENT
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temp file per writer, so concurrent saves of one leg never
+    # interleave their bytes before the rename
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(
+                _PREAMBLE.pack(TIMELINE_MAGIC, TIMELINE_FORMAT_VERSION, len(header))
+            )
+            handle.write(header)
+            for name, values in columns.items():
+                handle.seek(data_start + blocks[name]["offset"])
+                handle.write(np.ascontiguousarray(values).tobytes())
+            handle.truncate(data_start + offset)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+class TimelineFile:
+    """Lazy, memory-mapped view of a stored timeline."""
+
+    def __init__(self, path: Path):
+        """Map a timeline file and read its header.
+
+        Raises:
+            ValueError: If the file is not a timeline file of this version
+        """
+        self.path = path
+        with open(path, "rb") as handle:
+            magic, version, header_length = _PREAMBLE.unpack(
+                handle.read(_PREAMBLE.size)
+            )
+            if magic != TIMELINE_MAGIC or version != TIMELINE_FORMAT_VERSION:
+                raise ValueError(
+                    f"{path} is not a version {TIMELINE_FORMAT_VERSION} timeline file"
+                )
+            header = json.loads(handle.read(header_length))
+        data_start = -(-(_PREAMBLE.size + header_length) // _ALIGNMENT) * _ALIGNMENT
+
+        self._header = header
+        self._strings: list[str] = header["strings"]
+        self._data = np.memmap(path, dtype=np.uint8, mode="r")
+        self._data_start = data_start
+        self.mission_leg_id: str = header["mission_leg_id"]
+        self.created_at = datetime.fromisoformat(header["created_at"])
+        self.segment_count: int = header["segment_count"]
+        self.sample_count: Optional[int] = header["sample_count"]
+
+    def _column(self, name: str) -> np.ndarray:
+        block = self._header["blocks"][name]
+        dtype = np.dtype(block["dtype"])
+        start = self._data_start + block["offset"]
+        end = start + block["length"] * dtype.itemsize
+        return self._data[start:end].view(dtype)
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        return dict(self._header["statistics"])
+
+    def time_range(self) -> Optional[tuple[datetime, datetime]]:
+        """Start of the first segment and end of the last, or None."""
+        if not self.segment_count:
+            return None
+        start, end = self._column("segment_start"), self._column("segment_end")
+        first, last = _from_micros(np.array([start.min(), end.max()]))
+        return first, last
+
+    def segments(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> list[TimelineSegment]:
+        """Build the segments with indexes in ``[start, stop)``."""
+        rows = np.arange(self.segment_count)[start:stop]
+        return self._build_segments(rows)
+
+    def segments_between(self, t0: datetime, t1: datetime) -> list[TimelineSegment]:
+        """Build the segments overlapping ``[t0, t1]``, in stored order."""
+        starts = self._column("segment_start")
+        ends = self._column("segment_end")
+        rows = np.flatnonzero((starts <= _to_micros(t1)) & (ends >= _to_micros(t0)))
+        return self._build_segments(rows)
+
+    def _build_segments(self, rows: np.ndarray) -> list[TimelineSegment]:
+        if not len(rows):
+            return []
+        strings = self._strings
+        starts = _from_micros(self._column("segment_start")[rows])
+        ends = _from_micros(self._column("segment_end")[rows])
+        statuses = self._column("segment_status")[rows].tolist()
+        states = self._column("segment_states").reshape(-1, 3)[rows].tolist()
+        impacted = self._column("segment_impacted")[rows].tolist()
+        ids = self._column("segment_id")[rows].tolist()
+        metadata = self._column("segment_metadata")[rows].tolist()
+        reason_offsets = self._column("reason_offsets")
+        firsts = reason_offsets[rows].tolist()
+        lasts = reason_offsets[rows + 1].tolist()
+        # One read covering every selected row's reasons
+        base = firsts[0]
+        reasons = self._column("reasons")[base : lasts[-1]].tolist()
+
+        rows_data = []
+        for index in range(len(rows)):
+            first, last = firsts[index] - base, lasts[index] - base
+            x_state, ka_state, ku_state = states[index]
+            rows_data.append(
+                {
+                    "id": strings[ids[index]],
+                    "start_time": starts[index],
+                    "end_time": ends[index],
+                    "status": _STATUSES[statuses[index]],
+                    "x_state": _STATES[x_state],
+                    "ka_state": _STATES[ka_state],
+                    "ku_state": _STATES[ku_state],
+                    "reasons": [strings[i] for i in reasons[first:last]],
+                    "impacted_transports": list(_IMPACTED[impacted[index]]),
+                    "metadata": json.loads(strings[metadata[index]]),
+                }
+            )
+        return _SEGMENT_LIST.validate_python(rows_data)
+
+    def advisories(self) -> list[TimelineAdvisory]:
+        return [TimelineAdvisory(**data) for data in self._header["advisories"]]
+
+    def samples(self) -> Optional[list[RouteSampleData]]:
+        """Build the preview samples, or None if the timeline has none."""
+        if self.sample_count is None:
+            return None
+        strings = self._strings
+        times = _from_micros(self._column("sample_time"))
+        positions = self._column("sample_position").reshape(-1, 3).tolist()
+        offsets = self._column("coverage_offsets").tolist()
+        coverage = self._column("coverage").tolist()
+        return _SAMPLE_LIST.validate_python(
+            [
+                {
+                    "timestamp": times[index],
+                    "latitude": latitude,
+                    "longitude": longitude,
+                    "altitude": None if altitude != altitude else altitude,  # NaN
+                    "coverage": [
+                        strings[i]
+                        for i in coverage[offsets[index] : offsets[index + 1]]
+                    ],
+                }
+                for index, (latitude, longitude, altitude) in enumerate(positions)
+            ]
+        )
+
+    def to_timeline(self, include_samples: bool = True) -> MissionLegTimeline:
+        """Build the full MissionLegTimeline.
+
+        Args:
+            include_samples: Also build the preview samples (if stored)
+        """
+        return MissionLegTimeline.model_construct(
+            mission_leg_id=self.mission_leg_id,
+            created_at=self.created_at,
+            segments=self.segments(),
+            advisories=self.advisories(),
+            statistics=self.statistics,
+            samples=self.samples() if include_samples else None,
+        )
+
+
+def open_timeline_file(path: Path) -> Optional[TimelineFile]:
+    """Open a stored timeline, reusing the mapping while the file is unchanged.
+
+    Args:
+        path: Timeline file path
+
+    Returns:
+        TimelineFile, or None if the file does not exist
+
+    Raises:
+        ValueError: If the file is not a valid timeline file
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    # Saves replace the file, so a new inode means new contents
+    stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached and cached[0] == stamp:
+            _cache.move_to_end(path)
+            return cached[1]
+
+    try:
+        timeline_file = TimelineFile(path)
+    except (struct.error, json.JSONDecodeError, KeyError) as exc:
+        raise ValueError(f"Invalid timeline file {path}: {exc}") from exc
+
+    with _cache_lock:
+        _cache[path] = (stamp, timeline_file)
+        _cache.move_to_end(path)
+        while len(_cache) > TIMELINE_FILE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return timeline_file
+
+
+def forget_timeline_file(path: Path) -> None:
+    """Drop a cached mapping (e.g. before deleting the file)."""
+    with _cache_lock:
+        _cache.pop(path, None)
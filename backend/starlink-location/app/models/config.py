@@ -1,7 +1,7 @@
 """Pydantic configuration models for Starlink simulator."""
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Literal
+from typing import Literal, Optional
 
 
 class RouteConfig(BaseModel):
@@ -163,11 +163,37 @@ class HeadingTrackerConfig(BaseModel):
         return v
 
 
+class ReplayConfig(BaseModel):
+    """Configuration for replaying recorded telemetry (replay mode)."""
+
+    path: Optional[str] = Field(
+        default=None,
+        description="Recording to replay: telemetry CSV export, telemetry JSONL "
+        "or JSONL of captured dish responses",
+    )
+    speed: float = Field(
+        default=1.0,
+        description="Playback speed relative to the recording (1 = real time)",
+    )
+    loop: bool = Field(
+        default=False, description="Restart from the beginning when the recording ends"
+    )
+
+    @field_validator("speed")
+    @classmethod
+    def validate_speed(cls, v: float) -> float:
+        """Ensure playback speed is between 1x and 1000x."""
+        if not 1.0 <= v <= 1000.0:
+            raise ValueError("Replay speed must be between 1 and 1000")
+        return v
+
+
 class SimulationConfig(BaseModel):
     """Main simulation configuration."""
 
-    mode: Literal["simulation", "live"] = Field(
-        default="simulation", description="Operation mode: simulation or live"
+    mode: Literal["simulation", "live", "replay"] = Field(
+        default="simulation",
+        description="Operation mode: simulation, live or replay",
     )
     update_interval_seconds: float = Field(
         default=1.0, description="Interval between metric updates (seconds)"
@@ -190,6 +216,9 @@ class SimulationConfig(BaseModel):
         default_factory=HeadingTrackerConfig,
         description="Heading tracker configuration",
     )
+    replay: ReplayConfig = Field(
+        default_factory=ReplayConfig, description="Telemetry replay configuration"
+    )
 
     @field_validator("update_interval_seconds")
     @classmethod
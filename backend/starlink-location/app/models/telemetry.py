@@ -51,6 +51,29 @@ class EnvironmentalData(BaseModel):
     )
 
 
+class HistoryData(BaseModel):
+    """Rolling aggregates over the dish's per-second history samples."""
+
+    samples: int = Field(..., description="Samples in the rolling window")
+    packet_loss_percent: float = Field(
+        ..., description="Mean packet loss over the window (0-100)"
+    )
+    latency_ms: Optional[float] = Field(
+        default=None,
+        description="Mean latency of window samples with a reply, in milliseconds",
+    )
+    downlink_bytes: float = Field(
+        ..., description="Bytes received since the last history resync"
+    )
+    uplink_bytes: float = Field(
+        ..., description="Bytes sent since the last history resync"
+    )
+    skipped_samples: int = Field(
+        default=0,
+        description="Samples missed between polls and absent from the byte totals",
+    )
+
+
 class TelemetryData(BaseModel):
     """Complete telemetry data from simulator."""
 
@@ -64,3 +87,7 @@ class TelemetryData(BaseModel):
         default_factory=EnvironmentalData,
         description="Environmental and status information",
     )
+    history: Optional[HistoryData] = Field(
+        default=None,
+        description="Dish history aggregates (live mode only)",
+    )
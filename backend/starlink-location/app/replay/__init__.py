@@ -0,0 +1,17 @@
+"""Telemetry replay module.
+
+Plays recorded telemetry (CSV export, JSONL or captured dish responses) back
+through the live metric pipeline on a virtual clock, at up to 1000x.
+"""
+
+from app.replay.coordinator import ReplayCoordinator
+from app.replay.recording import Recording, load_recording
+from app.replay.runner import ReplayStats, run_replay
+
+__all__ = [
+    "Recording",
+    "ReplayCoordinator",
+    "ReplayStats",
+    "load_recording",
+    "run_replay",
+]
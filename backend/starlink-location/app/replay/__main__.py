@@ -0,0 +1,94 @@
+"""Replay a telemetry recording through the metric pipeline.
+
+Runs the same per-tick work as the service's background loop against a
+recording and reports throughput, so a long flight can be reproduced (and
+profiled, e.g. with ``python -m cProfile -m app.replay ...``) in minutes.
+
+Usage (from backend/starlink-location, or in the container):
+    # As fast as possible, following the flight's route
+    python -m app.replay flight.csv --route my-route
+
+    # Paced at 100x
+    python -m app.replay captured-dish.jsonl --speed 100
+"""
+
+import argparse
+import logging
+import sys
+
+from app.models.config import ReplayConfig, SimulationConfig
+from app.replay.coordinator import ReplayCoordinator
+from app.replay.runner import run_replay
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a replay and print its throughput."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.replay",
+        description="Replay recorded telemetry through the metric pipeline.",
+    )
+    parser.add_argument("recording", help="Telemetry CSV export or JSONL recording")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        help="Pace playback at this speed (1-1000); default: as fast as possible",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Recorded seconds per tick (default: 1.0, the service default)",
+    )
+    parser.add_argument("--routes-dir", default="/data/routes")
+    parser.add_argument("--route", help="Route ID to activate for route ETAs")
+    parser.add_argument("--pois", default="/data/pois.json", help="POI file")
+    parser.add_argument("--max-ticks", type=int, help="Stop after this many ticks")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper())
+
+    from app.core.eta_service import initialize_eta_service, shutdown_eta_service
+    from app.services.flight_state import get_flight_state_manager
+    from app.services.poi_manager import POIManager
+    from app.services.route_manager import RouteManager
+
+    config = SimulationConfig(
+        mode="replay",
+        update_interval_seconds=args.interval,
+        replay=ReplayConfig(path=args.recording, speed=args.speed or 1.0),
+    )
+    coordinator = ReplayCoordinator(config)
+    try:
+        get_flight_state_manager().reset()
+        poi_manager = POIManager(args.pois)
+        initialize_eta_service(poi_manager)
+        route_manager = RouteManager(args.routes_dir)
+        route_manager.reload_all_routes()
+        if args.route and not route_manager.activate_route(args.route):
+            print(f"Route not found: {args.route}", file=sys.stderr)
+            return 1
+        coordinator.set_route_manager(route_manager)
+
+        stats = run_replay(
+            coordinator,
+            poi_manager=poi_manager,
+            max_ticks=args.max_ticks,
+            paced=args.speed is not None,
+        )
+    finally:
+        shutdown_eta_service()
+        coordinator.shutdown()
+
+    status = get_flight_state_manager().get_status()
+    print(
+        f"{stats.ticks} ticks, {stats.recorded_seconds:.0f}s recorded in "
+        f"{stats.wall_seconds:.2f}s wall: {stats.ticks_per_second:.1f} ticks/s, "
+        f"{stats.speedup:.0f}x real time"
+    )
+    print(f"Final flight phase: {status.phase.value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
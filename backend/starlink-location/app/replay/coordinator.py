@@ -0,0 +1,253 @@
+"""Coordinator that replays recorded telemetry through the live pipeline."""
+
+import logging
+import time
+from typing import Optional
+
+from app.core import clock
+from app.core.metrics.stage_timing import stage_timer
+from app.models.config import SimulationConfig
+from app.models.telemetry import TelemetryData
+from app.replay.recording import Recording, load_recording
+from app.services.heading_tracker import HeadingTracker
+from app.services.speed_tracker import SpeedTracker
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayCoordinator:
+    """Plays a telemetry recording back on a virtual clock.
+
+    Mirrors the LiveCoordinator interface. Each update() advances the
+    virtual clock by one update interval of recorded time and returns the
+    latest sample at or before it, so the metric updater, flight phase
+    detection, POI ETAs and mission gauges see the same tick cadence as the
+    recorded flight. The clock is installed process-wide (app.core.clock)
+    while the coordinator runs.
+
+    Playback speed only changes how often the caller ticks
+    (tick_interval_seconds), never what a tick sees, so a 1000x replay
+    produces the same metrics as a real-time one.
+    """
+
+    def __init__(self, config: SimulationConfig, recording: Optional[Recording] = None):
+        """
+        Initialize replay coordinator.
+
+        Args:
+            config: Configuration; ``config.replay`` holds the recording path,
+                speed and loop setting
+            recording: Already loaded recording (overrides config.replay.path)
+
+        Raises:
+            ValueError: If configuration is invalid or no recording is given
+            FileNotFoundError: If the configured recording does not exist
+        """
+        if not isinstance(config, SimulationConfig):
+            raise ValueError("config must be a SimulationConfig instance")
+        if recording is None:
+            if not config.replay.path:
+                raise ValueError("Replay mode requires replay.path")
+            recording = load_recording(config.replay.path)
+
+        self.config = config
+        self.recording = recording
+        self.start_time = time.time()
+
+        self.clock = clock.VirtualClock(recording.start)
+        clock.set_clock(self.clock)
+
+        heading_config = config.heading_tracker
+        self.heading_tracker = HeadingTracker(
+            min_distance_meters=heading_config.min_distance_meters,
+            max_age_seconds=heading_config.max_age_seconds,
+        )
+        # Same 120-second smoothing window as the live coordinator
+        self.speed_tracker = SpeedTracker(smoothing_duration_seconds=120.0)
+
+        # Route Manager for route-aware ETAs and arrival detection
+        self.route_manager = None
+
+        self._index = -1  # Sample returned by the last update
+        self._ticks = 0
+        self._finished = False
+        self._last_valid_telemetry: Optional[TelemetryData] = None
+
+        logger.info(
+            f"ReplayCoordinator initialized: {len(recording)} samples over "
+            f"{recording.duration_seconds:.0f}s at {config.replay.speed:g}x"
+        )
+
+    def update(self) -> Optional[TelemetryData]:
+        """
+        Advance the virtual clock by one update interval.
+
+        Returns:
+            TelemetryData of the latest sample at or before the virtual time,
+            or None once the recording has ended (unless looping)
+        """
+        if self._ticks:
+            self.clock.advance(self.config.update_interval_seconds)
+        self._ticks += 1
+
+        if self.clock() > self.recording.end:
+            if not self.config.replay.loop:
+                if not self._finished:
+                    logger.info(f"Replay finished after {self._ticks - 1} ticks")
+                self._finished = True
+                return None
+            self._rewind()
+
+        index = self.recording.index_at(self.clock())
+        if index != self._index or self._last_valid_telemetry is None:
+            self._index = index
+            self._last_valid_telemetry = self._sample_telemetry(index)
+        return self._last_valid_telemetry
+
+    def _sample_telemetry(self, index: int) -> TelemetryData:
+        """Telemetry for one sample, deriving speed and heading if unrecorded."""
+        recording = self.recording
+        telemetry = recording.telemetry(index)
+        position = telemetry.position
+        needs_heading = not recording.has_value("heading_degrees", index)
+        needs_speed = not recording.has_value("speed_knots", index)
+        if needs_heading or needs_speed:
+            with stage_timer("trackers"):
+                if needs_heading:
+                    position.heading = self.heading_tracker.update(
+                        latitude=position.latitude,
+                        longitude=position.longitude,
+                        timestamp=telemetry.timestamp,
+                    )
+                if needs_speed:
+                    position.speed = self.speed_tracker.update(
+                        latitude=position.latitude,
+                        longitude=position.longitude,
+                        timestamp=float(recording.timestamps[index]),
+                    )
+        return telemetry
+
+    def _rewind(self) -> None:
+        """Restart the recording and the flight it contains."""
+        from app.services.flight_state import get_flight_state_manager
+
+        self.clock.set(self.recording.start)
+        self.heading_tracker.reset()
+        self.speed_tracker.reset()
+        self._index = -1
+        self._last_valid_telemetry = None
+        get_flight_state_manager().reset()
+        logger.info("Replay restarted from the beginning of the recording")
+
+    @property
+    def finished(self) -> bool:
+        """Whether the recording has ended (never true when looping)."""
+        return self._finished
+
+    @property
+    def tick_interval_seconds(self) -> float:
+        """Wall-clock seconds between ticks for the configured speed."""
+        return self.config.update_interval_seconds / self.config.replay.speed
+
+    def get_current_telemetry(self) -> TelemetryData:
+        """
+        Get last replayed telemetry without advancing.
+
+        Returns:
+            Last TelemetryData returned by update()
+
+        Raises:
+            RuntimeError: If no telemetry has been replayed yet
+        """
+        if self._last_valid_telemetry is None:
+            raise RuntimeError("No telemetry available. Call update() first.")
+        return self._last_valid_telemetry
+
+    def reset(self) -> None:
+        """Reset coordinator to the start of the recording."""
+        self.start_time = time.time()
+        self.clock.set(self.recording.start)
+        self.heading_tracker.reset()
+        self.speed_tracker.reset()
+        self._index = -1
+        self._ticks = 0
+        self._finished = False
+        self._last_valid_telemetry = None
+
+        logger.info("ReplayCoordinator reset to start of recording")
+
+    def get_uptime_seconds(self) -> float:
+        """
+        Get coordinator uptime in seconds.
+
+        Returns:
+            Wall-clock seconds since the coordinator was created
+        """
+        return time.time() - self.start_time
+
+    @property
+    def mode(self) -> str:
+        """
+        Get the operating mode of this coordinator.
+
+        Returns:
+            String "replay" indicating this is a replay coordinator
+        """
+        return "replay"
+
+    def get_config(self) -> SimulationConfig:
+        """
+        Get current configuration.
+
+        Returns:
+            SimulationConfig instance
+        """
+        return self.config
+
+    def update_config(self, new_config: SimulationConfig) -> None:
+        """
+        Update configuration.
+
+        The recording and virtual clock are kept; speed, loop and update
+        interval changes apply from the next tick.
+
+        Args:
+            new_config: New configuration
+        """
+        self.config = new_config
+
+        heading_config = new_config.heading_tracker
+        self.heading_tracker = HeadingTracker(
+            min_distance_meters=heading_config.min_distance_meters,
+            max_age_seconds=heading_config.max_age_seconds,
+        )
+
+        logger.info(
+            f"ReplayCoordinator configuration updated: "
+            f"speed={new_config.replay.speed:g}x, loop={new_config.replay.loop}"
+        )
+
+    def is_connected(self) -> bool:
+        """
+        Check whether samples are still being replayed.
+
+        Returns:
+            False once the recording has ended, True otherwise
+        """
+        return not self._finished
+
+    def set_route_manager(self, manager) -> None:
+        """
+        Set the RouteManager used for route-aware ETAs.
+
+        Args:
+            manager: RouteManager instance for accessing the active route
+        """
+        self.route_manager = manager
+        logger.info("RouteManager injected into ReplayCoordinator")
+
+    def shutdown(self) -> None:
+        """Restore the wall clock."""
+        if clock.is_virtual():
+            clock.set_clock(None)
+        logger.info("ReplayCoordinator shut down")
@@ -0,0 +1,292 @@
+"""Loading recorded telemetry for replay.
+
+Three formats are accepted:
+
+- ``.csv``: the telemetry CSV export (``/api/export/starlink-csv``)
+- ``.jsonl``: one TelemetryData JSON object per line
+- ``.jsonl``: one captured dish response per line, as
+  ``{"timestamp": ..., "status": {...}, "obstruction": {...}, "location": {...}}``
+  with the dicts returned by starlink_grpc.status_data and location_data
+
+Samples are stored as columns (one float64 array per field) rather than
+TelemetryData objects, so a day-long recording stays a few megabytes.
+"""
+
+import csv
+import json
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from app.api.export.prometheus import EXPORT_METRICS
+from app.models.telemetry import (
+    EnvironmentalData,
+    NetworkData,
+    ObstructionData,
+    PositionData,
+    TelemetryData,
+)
+
+logger = logging.getLogger(__name__)
+
+# Telemetry export columns plus the fields only JSONL recordings carry
+RECORDING_COLUMNS = [column for _, column in EXPORT_METRICS] + [
+    "uptime_seconds",
+    "temperature_celsius",
+]
+
+# Used when a column was never recorded
+_COLUMN_DEFAULTS = {"signal_quality_percent": 100.0}
+# Left as NaN when missing, so the coordinator derives them from position
+_DERIVED_COLUMNS = ("speed_knots", "heading_degrees")
+
+
+@dataclass
+class Recording:
+    """Recorded telemetry, one row per sample in time order.
+
+    Attributes:
+        timestamps: Unix timestamps (seconds), ascending
+        columns: Column name (see RECORDING_COLUMNS) -> values aligned with
+            ``timestamps``. Gaps are filled forward; speed and heading are
+            NaN where they were not recorded.
+    """
+
+    timestamps: np.ndarray
+    columns: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def start(self) -> float:
+        """Timestamp of the first sample."""
+        return float(self.timestamps[0])
+
+    @property
+    def end(self) -> float:
+        """Timestamp of the last sample."""
+        return float(self.timestamps[-1])
+
+    @property
+    def duration_seconds(self) -> float:
+        """Recorded time between the first and last sample."""
+        return self.end - self.start
+
+    def index_at(self, timestamp: float) -> int:
+        """
+        Find the latest sample at or before a time.
+
+        Args:
+            timestamp: Unix timestamp (seconds)
+
+        Returns:
+            Row index (0 for times before the first sample)
+        """
+        return max(0, int(np.searchsorted(self.timestamps, timestamp, "right")) - 1)
+
+    def has_value(self, column: str, index: int) -> bool:
+        """Whether ``column`` was recorded for the sample at ``index``."""
+        return not math.isnan(self.columns[column][index])
+
+    def telemetry(self, index: int) -> TelemetryData:
+        """
+        Build TelemetryData for one sample.
+
+        Args:
+            index: Row index
+
+        Returns:
+            TelemetryData with a UTC timestamp; speed and heading are 0 where
+            they were not recorded
+        """
+        row = {column: float(values[index]) for column, values in self.columns.items()}
+        temperature = row["temperature_celsius"]
+        return TelemetryData(
+            timestamp=datetime.fromtimestamp(self.timestamps[index], timezone.utc),
+            position=PositionData(
+                latitude=row["latitude"],
+                longitude=row["longitude"],
+                altitude=row["altitude_feet"],
+                speed=_or_zero(row["speed_knots"]),
+                heading=_or_zero(row["heading_degrees"]),
+            ),
+            network=NetworkData(
+                latency_ms=row["latency_ms"],
+                throughput_down_mbps=row["throughput_down_mbps"],
+                throughput_up_mbps=row["throughput_up_mbps"],
+                packet_loss_percent=row["packet_loss_percent"],
+            ),
+            obstruction=ObstructionData(obstruction_percent=row["obstruction_percent"]),
+            environmental=EnvironmentalData(
+                signal_quality_percent=row["signal_quality_percent"],
+                uptime_seconds=row["uptime_seconds"],
+                temperature_celsius=(None if math.isnan(temperature) else temperature),
+            ),
+        )
+
+
+def _or_zero(value: float) -> float:
+    return 0.0 if math.isnan(value) else value
+
+
+def _parse_timestamp(value: Union[str, int, float, None]) -> float:
+    """Parse an ISO 8601 string or epoch seconds; naive times are UTC."""
+    if value is None or value == "":
+        raise ValueError("sample has no timestamp")
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _cell(value: Optional[str]) -> float:
+    return float(value) if value not in (None, "") else math.nan
+
+
+def _forward_fill(values: np.ndarray) -> np.ndarray:
+    """Replace NaN with the previous recorded value (leading NaN stay)."""
+    present = ~np.isnan(values)
+    if present.all() or not present.any():
+        return values
+    last = np.where(present, np.arange(len(values)), 0)
+    np.maximum.accumulate(last, out=last)
+    filled = values[last]
+    filled[: np.argmax(present)] = math.nan
+    return filled
+
+
+def _telemetry_row(telemetry: TelemetryData, derived: bool = False) -> list[float]:
+    position = telemetry.position
+    network = telemetry.network
+    environmental = telemetry.environmental
+    temperature = environmental.temperature_celsius
+    return [
+        position.latitude,
+        position.longitude,
+        position.altitude,
+        math.nan if derived else position.speed,
+        math.nan if derived else position.heading,
+        network.latency_ms,
+        network.throughput_down_mbps,
+        network.throughput_up_mbps,
+        network.packet_loss_percent,
+        telemetry.obstruction.obstruction_percent,
+        environmental.signal_quality_percent,
+        environmental.uptime_seconds,
+        math.nan if temperature is None else temperature,
+    ]
+
+
+def _read_csv(path: Path) -> Iterable[tuple[float, list[float]]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = {"timestamp", "latitude", "longitude"} - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"{path} is missing columns: {', '.join(sorted(missing))}")
+        for line_number, record in enumerate(reader, start=2):
+            try:
+                timestamp = _parse_timestamp(record["timestamp"])
+                row = [_cell(record.get(column)) for column in RECORDING_COLUMNS]
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from e
+            yield timestamp, row
+
+
+def _read_jsonl(path: Path) -> Iterable[tuple[float, list[float]]]:
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if "status" in record:
+                    from app.live.client import telemetry_from_dish_data
+
+                    timestamp = _parse_timestamp(record.get("timestamp"))
+                    telemetry = telemetry_from_dish_data(
+                        record["status"],
+                        record.get("obstruction") or {},
+                        record.get("location") or {},
+                        datetime.fromtimestamp(timestamp, timezone.utc),
+                    )
+                    # The dish reports neither speed nor heading
+                    yield timestamp, _telemetry_row(telemetry, derived=True)
+                else:
+                    telemetry = TelemetryData.model_validate(record)
+                    timestamp = _parse_timestamp(record.get("timestamp"))
+                    yield timestamp, _telemetry_row(telemetry)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"{path}:{line_number}: {e}") from e
+
+
+def load_recording(path: Union[str, Path]) -> Recording:
+    """
+    Load a telemetry recording.
+
+    Args:
+        path: ``.csv`` telemetry export or ``.jsonl`` recording
+
+    Returns:
+        Recording sorted by timestamp. Samples without a position are
+        dropped.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the format is unknown, a sample cannot be parsed or
+            the recording has no samples with a position
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Recording not found: {path}")
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        samples = _read_csv(path)
+    elif suffix in (".jsonl", ".ndjson"):
+        samples = _read_jsonl(path)
+    else:
+        raise ValueError(f"Unsupported recording format: {path.suffix or path.name}")
+
+    timestamps: list[float] = []
+    rows: list[list[float]] = []
+    for timestamp, row in samples:
+        timestamps.append(timestamp)
+        rows.append(row)
+
+    values = np.array(rows, dtype=np.float64).reshape(-1, len(RECORDING_COLUMNS))
+    times = np.array(timestamps, dtype=np.float64)
+    # Prometheus export rows can lack a position; they cannot be replayed
+    keep = ~(np.isnan(values[:, 0]) | np.isnan(values[:, 1]))
+    if not keep.any():
+        raise ValueError(f"{path} has no samples with a position")
+    if not keep.all():
+        logger.info(f"Skipped {int((~keep).sum())} samples without a position")
+    order = np.argsort(times[keep], kind="stable")
+    times = times[keep][order]
+    values = values[keep][order]
+
+    columns = {}
+    for i, column in enumerate(RECORDING_COLUMNS):
+        filled = _forward_fill(values[:, i])
+        if column not in _DERIVED_COLUMNS and column != "temperature_celsius":
+            filled = np.where(
+                np.isnan(filled), _COLUMN_DEFAULTS.get(column, 0.0), filled
+            )
+        columns[column] = filled
+
+    logger.info(
+        f"Loaded recording {path.name}: {len(times)} samples over "
+        f"{times[-1] - times[0]:.0f}s"
+    )
+    return Recording(timestamps=times, columns=columns)
@@ -0,0 +1,92 @@
+"""Drive the metric pipeline from a ReplayCoordinator outside the service."""
+
+import time
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+
+from app.replay.coordinator import ReplayCoordinator
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
+    from app.services.poi_manager import POIManager
+
+
+@dataclass
+class ReplayStats:
+    """Throughput of one replay run."""
+
+    ticks: int
+    recorded_seconds: float
+    wall_seconds: float
+
+    @property
+    def ticks_per_second(self) -> float:
+        """Ticks processed per second of wall time."""
+        return self.ticks / self.wall_seconds if self.wall_seconds else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """Recorded seconds replayed per second of wall time."""
+        return self.recorded_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+def run_replay(
+    coordinator: ReplayCoordinator,
+    poi_manager: Optional["POIManager"] = None,
+    max_ticks: Optional[int] = None,
+    paced: bool = False,
+) -> ReplayStats:
+    """
+    Replay a recording through the same steps as the background update loop.
+
+    Each tick runs coordinator.update(), update_metrics_from_telemetry (flight
+    phase transitions, POI ETAs, telemetry gauges) and
+    update_live_mission_metrics, until the recording ends or ``max_ticks``.
+
+    Args:
+        coordinator: Replay coordinator (with a route manager for route ETAs)
+        poi_manager: POI manager for POI ETAs
+        max_ticks: Stop after this many ticks (required when looping)
+        paced: Wait between ticks to hold the configured replay speed;
+            otherwise run as fast as the pipeline allows
+
+    Returns:
+        Ticks processed, recorded time covered and wall time taken
+    """
+    from app.core.metrics import (
+        update_live_mission_metrics,
+        update_metrics_from_telemetry,
+    )
+
+    ticks = 0
+    first_virtual = last_virtual = coordinator.clock()
+    start = time.perf_counter()
+    while max_ticks is None or ticks < max_ticks:
+        tick_start = time.perf_counter()
+        telemetry = coordinator.update()
+        if telemetry is None:
+            break
+        last_virtual = coordinator.clock()
+
+        active_route = (
+            coordinator.route_manager.get_active_route()
+            if coordinator.route_manager
+            else None
+        )
+        update_metrics_from_telemetry(
+            telemetry, coordinator.config, active_route, poi_manager
+        )
+        update_live_mission_metrics()
+        ticks += 1
+
+        if paced:
+            remaining = coordinator.tick_interval_seconds - (
+                time.perf_counter() - tick_start
+            )
+            if remaining > 0:
+                time.sleep(remaining)
+
+    return ReplayStats(
+        ticks=ticks,
+        recorded_seconds=last_virtual - first_virtual,
+        wall_seconds=time.perf_counter() - start,
+    )
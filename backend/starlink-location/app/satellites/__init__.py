@@ -15,10 +15,12 @@ from app.satellites.catalog import (
 from app.satellites.coverage import CoverageEvent, CoverageSampler
 from app.satellites.geometry import (
     azimuth_elevation_from_ecef,
+    azimuth_in_range_mask,
     ecef_from_geodetic,
     geodetic_from_ecef,
     is_in_azimuth_range,
     look_angles,
+    look_angles_batch,
 )
 from app.satellites.kmz_importer import (
     extract_kmz,
@@ -34,8 +36,10 @@ __all__ = [
     "ecef_from_geodetic",
     "geodetic_from_ecef",
     "look_angles",
+    "look_angles_batch",
     "azimuth_elevation_from_ecef",
     "is_in_azimuth_range",
+    "azimuth_in_range_mask",
     "CoverageSampler",
     "CoverageEvent",
     "extract_kmz",
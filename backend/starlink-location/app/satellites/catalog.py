@@ -165,6 +165,12 @@ def get_satellite_catalog() -> SatelliteCatalog:
     return _catalog
 
 
+def set_satellite_catalog(catalog: SatelliteCatalog) -> None:
+    """Replace the global catalog instance (used by timeline worker processes)."""
+    global _catalog
+    _catalog = catalog
+
+
 def _add_default_satellites(catalog: SatelliteCatalog, sat_coverage_dir: Path) -> None:
     """Add default X, Ka, and Ku satellite definitions."""
 
@@ -8,6 +8,7 @@ areas using point-in-polygon testing against GeoJSON footprints.
 # GeoJSON parsing, point-in-polygon algorithms, event detection, and timeline
 # integration. Splitting would obscure the sampling pipeline. Deferred to v0.4.0.
 
+import hashlib
 import json
 import logging
 from dataclasses import dataclass
@@ -77,6 +78,7 @@ class CoverageSampler:
         """
         self.coverage_data = None
         self.satellite_polygons = {}  # satellite_id -> list of polygon rings
+        self.version: Optional[str] = None  # SHA256 of the loaded GeoJSON file
 
         if coverage_geojson_path and coverage_geojson_path.exists():
             self._load_coverage_geojson(coverage_geojson_path)
@@ -91,8 +93,9 @@ class CoverageSampler:
             geojson_path: Path to GeoJSON file
         """
         try:
-            with open(geojson_path, "r") as f:
-                self.coverage_data = json.load(f)
+            raw = geojson_path.read_bytes()
+            self.coverage_data = json.loads(raw)
+            self.version = hashlib.sha256(raw).hexdigest()
 
             # Index polygons by satellite_id from feature properties
             # Store as list of rings to handle MultiPolygon or split regions
@@ -142,6 +145,7 @@ class CoverageSampler:
             logger.error(f"Failed to load coverage GeoJSON: {e}")
             self.coverage_data = None
             self.satellite_polygons = {}
+            self.version = None
 
     def check_coverage_at_point(self, latitude: float, longitude: float) -> List[str]:
         """Check which satellites cover a given point.
@@ -10,6 +10,9 @@ Reference ellipsoid: WGS84
 import math
 from typing import Tuple
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 # WGS84 ellipsoid parameters
 WGS84_SEMI_MAJOR_AXIS = 6378137.0  # meters (a)
 WGS84_ECCENTRICITY_SQUARED = 6.69437999014132e-3  # (e^2)
@@ -227,3 +230,95 @@ def is_in_azimuth_range(azimuth: float, min_azimuth: float, max_azimuth: float)
     else:
         # Wraparound range (e.g., 315-45 crosses 0°)
         return azimuth >= min_azimuth or azimuth <= max_azimuth
+
+
+def look_angles_batch(
+    aircraft_lats_deg: ArrayLike,
+    aircraft_lons_deg: ArrayLike,
+    aircraft_alts_m: ArrayLike,
+    satellite_lons_deg: ArrayLike,
+    satellite_alt_m: float = GEOSTATIONARY_ALTITUDE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized look_angles() over arrays of aircraft/satellite positions.
+
+    All array arguments are broadcast against each other, so a single
+    satellite longitude may be passed as a scalar.
+
+    Args:
+        aircraft_lats_deg: Aircraft latitudes in decimal degrees
+        aircraft_lons_deg: Aircraft longitudes in decimal degrees
+        aircraft_alts_m: Aircraft altitudes in meters above sea level
+        satellite_lons_deg: Satellite longitudes in decimal degrees (equator)
+        satellite_alt_m: Satellite altitude in meters (default: geostationary)
+
+    Returns:
+        Tuple of (azimuths, elevations) float arrays in decimal degrees, using
+        the same conventions as look_angles().
+    """
+    lats, lons, alts, sat_lons = np.broadcast_arrays(
+        np.asarray(aircraft_lats_deg, dtype=float),
+        np.asarray(aircraft_lons_deg, dtype=float),
+        np.asarray(aircraft_alts_m, dtype=float),
+        np.asarray(satellite_lons_deg, dtype=float),
+    )
+
+    lat_rad = np.radians(lats)
+    lon_rad = np.radians(lons)
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    sin_lon = np.sin(lon_rad)
+    cos_lon = np.cos(lon_rad)
+
+    # Observer ECEF (see ecef_from_geodetic)
+    n = WGS84_SEMI_MAJOR_AXIS / np.sqrt(1 - WGS84_ECCENTRICITY_SQUARED * sin_lat**2)
+    obs_x = (n + alts) * cos_lat * cos_lon
+    obs_y = (n + alts) * cos_lat * sin_lon
+    obs_z = (n * (1 - WGS84_ECCENTRICITY_SQUARED) + alts) * sin_lat
+
+    # Satellite ECEF at the equator: N == semi-major axis, z == 0
+    sat_lon_rad = np.radians(sat_lons)
+    sat_radius = WGS84_SEMI_MAJOR_AXIS + satellite_alt_m
+    dx = sat_radius * np.cos(sat_lon_rad) - obs_x
+    dy = sat_radius * np.sin(sat_lon_rad) - obs_y
+    dz = -obs_z
+
+    # ECEF -> SEZ (see azimuth_elevation_from_ecef)
+    south = sin_lat * cos_lon * dx + sin_lat * sin_lon * dy - cos_lat * dz
+    east = -sin_lon * dx + cos_lon * dy
+    zenith = cos_lat * cos_lon * dx + cos_lat * sin_lon * dy + sin_lat * dz
+
+    distance = np.sqrt(south**2 + east**2 + zenith**2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        elevation = np.where(
+            distance == 0,
+            90.0,
+            np.degrees(np.arcsin(np.clip(zenith / distance, -1.0, 1.0))),
+        )
+
+    azimuth = np.degrees(np.arctan2(east, -south))
+    azimuth = np.where(azimuth < 0, azimuth + 360.0, azimuth)
+
+    return azimuth, elevation
+
+
+def azimuth_in_range_mask(
+    azimuths: ArrayLike, min_azimuth: float, max_azimuth: float
+) -> np.ndarray:
+    """Vectorized is_in_azimuth_range() returning a boolean mask.
+
+    Args:
+        azimuths: Azimuths in degrees
+        min_azimuth: Minimum azimuth in degrees
+        max_azimuth: Maximum azimuth in degrees
+
+    Returns:
+        Boolean array, True where the azimuth falls within the range
+        (accounting for 0°/360° wraparound)
+    """
+    azimuths = np.mod(np.asarray(azimuths, dtype=float), 360.0)
+    min_azimuth = min_azimuth % 360.0
+    max_azimuth = max_azimuth % 360.0
+
+    if min_azimuth <= max_azimuth:
+        return (azimuths >= min_azimuth) & (azimuths <= max_azimuth)
+    return (azimuths >= min_azimuth) | (azimuths <= max_azimuth)
@@ -4,7 +4,7 @@ Combines azimuth checks, coverage events, takeoff/landing buffers, and AAR
 windows to produce operator advisories and mission event lists.
 """
 
-# FR-004: File exceeds 300 lines (403 lines) because rule evaluation coordinates
+# FR-004: File exceeds 300 lines (508 lines) because rule evaluation coordinates
 # multiple constraint types (azimuth, coverage, AAR timing, takeoff/landing) with
 # event generation. Splitting would fragment related rule logic. Deferred to v0.4.0.
 
@@ -14,8 +14,16 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+from numpy.typing import ArrayLike
+
 from app.mission.models import Transport
-from app.satellites.geometry import is_in_azimuth_range, look_angles
+from app.satellites.geometry import (
+    azimuth_in_range_mask,
+    is_in_azimuth_range,
+    look_angles,
+    look_angles_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +80,43 @@ class ConstraintConfig:
     elevation_min_degrees: float = 0.0  # Minimum elevation for visibility
 
 
+@dataclass
+class XAzimuthBatchResult:
+    """Per-sample X azimuth evaluation over a whole sample array.
+
+    ``normal_violation`` mirrors evaluate_x_azimuth_window(is_aar_mode=False)
+    and ``aar_violation`` mirrors is_aar_mode=True; both include elevation
+    violations, exactly like the scalar evaluator.
+    """
+
+    absolute_azimuth: np.ndarray
+    relative_azimuth: np.ndarray
+    elevation: np.ndarray
+    elevation_blocked: np.ndarray
+    normal_violation: np.ndarray
+    aar_violation: np.ndarray
+    min_elevation_degrees: float
+
+    def __len__(self) -> int:
+        return int(self.relative_azimuth.shape[0])
+
+    def debug_metadata(self, index: int) -> Dict[str, float | bool | str]:
+        """Build the scalar evaluator's debug metadata for a single sample."""
+        elevation_blocked = bool(self.elevation_blocked[index])
+        debug_metadata: Dict[str, float | bool | str] = {
+            "absolute_azimuth_degrees": float(self.absolute_azimuth[index]),
+            "relative_azimuth_degrees": float(self.relative_azimuth[index]),
+            "elevation_degrees": float(self.elevation[index]),
+            "min_elevation_degrees": self.min_elevation_degrees,
+            "elevation_below_min": elevation_blocked,
+        }
+        if elevation_blocked:
+            debug_metadata["violation_reason"] = "elevation"
+        elif self.normal_violation[index]:
+            debug_metadata["violation_reason"] = "azimuth"
+        return debug_metadata
+
+
 class RuleEngine:
     """Evaluates communication constraints and generates mission events."""
 
@@ -138,6 +183,62 @@ class RuleEngine:
             debug_metadata["violation_reason"] = "azimuth"
         return is_in_forbidden, relative_azimuth, debug_metadata
 
+    def evaluate_x_azimuth_batch(
+        self,
+        aircraft_lats: ArrayLike,
+        aircraft_lons: ArrayLike,
+        aircraft_alts: ArrayLike,
+        satellite_lons: ArrayLike,
+        headings_deg: ArrayLike | None = None,
+    ) -> XAzimuthBatchResult:
+        """Evaluate normal and AAR azimuth constraints for many samples at once.
+
+        Vectorized counterpart of evaluate_x_azimuth_window(); arrays are
+        broadcast against each other.
+
+        Args:
+            aircraft_lats: Aircraft latitudes
+            aircraft_lons: Aircraft longitudes
+            aircraft_alts: Aircraft altitudes in meters
+            satellite_lons: Satellite longitudes (equator, geostationary altitude)
+            headings_deg: Optional aircraft headings; NaN entries are treated as
+                "no heading" and yield absolute azimuths
+
+        Returns:
+            XAzimuthBatchResult with violation masks for both constraint sets
+        """
+        azimuth, elevation = look_angles_batch(
+            aircraft_lats, aircraft_lons, aircraft_alts, satellite_lons
+        )
+        absolute = np.mod(azimuth, 360.0)
+        if headings_deg is None:
+            relative = absolute
+        else:
+            headings = np.broadcast_to(
+                np.asarray(headings_deg, dtype=float), absolute.shape
+            )
+            relative = np.where(
+                np.isnan(headings), absolute, np.mod(absolute - headings, 360.0)
+            )
+
+        elevation_blocked = elevation < self.config.elevation_min_degrees
+        normal_cone = azimuth_in_range_mask(
+            relative, self.config.normal_azimuth_min, self.config.normal_azimuth_max
+        )
+        aar_cone = azimuth_in_range_mask(
+            relative, self.config.aar_azimuth_min, self.config.aar_azimuth_max
+        )
+
+        return XAzimuthBatchResult(
+            absolute_azimuth=azimuth,
+            relative_azimuth=relative,
+            elevation=elevation,
+            elevation_blocked=elevation_blocked,
+            normal_violation=elevation_blocked | normal_cone,
+            aar_violation=elevation_blocked | aar_cone,
+            min_elevation_degrees=self.config.elevation_min_degrees,
+        )
+
     def add_x_transition_events(
         self,
         transition_time: datetime,
@@ -2,11 +2,12 @@
 
 import logging
 import math
-import time
-from collections import deque
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
+from app.core import clock
+from app.services.kinematics import WindowedMean
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,7 +16,7 @@ class ETACalculator:
     Calculate ETA and distance to POIs with speed smoothing.
 
     Features:
-    - Exponential moving average for speed smoothing
+    - Time-windowed running mean for speed smoothing
     - Haversine formula for great-circle distance
     - Support for custom speed update intervals
     - Tracking of passed POIs
@@ -37,11 +38,8 @@ class ETACalculator:
         self.default_speed_knots = default_speed_knots
         self.earth_radius_m = 6371000.0  # Earth's radius in meters
 
-        # Speed smoothing using time-based rolling window
-        # Store tuples of (speed, timestamp) to enable time-based windowing
-        self._speed_history: deque[tuple[float, float]] = (
-            deque()
-        )  # (speed_knots, timestamp)
+        # Speed smoothing using a time-based rolling window (running sum)
+        self._speed_window = WindowedMean(smoothing_duration_seconds)
         self._smoothed_speed: float = default_speed_knots
         self._last_update_time: Optional[datetime] = None
 
@@ -49,7 +47,9 @@ class ETACalculator:
         self._passed_pois: set[str] = set()  # Track POI IDs that have been passed
         self._poi_distance_threshold_m = 100.0  # 100m threshold for "passed"
 
-    def update_speed(self, current_speed_knots: float) -> None:
+    def update_speed(
+        self, current_speed_knots: float, timestamp: Optional[float] = None
+    ) -> None:
         """
         Update current speed and recalculate smoothed speed.
 
@@ -58,27 +58,20 @@ class ETACalculator:
 
         Args:
             current_speed_knots: Current speed in knots
+            timestamp: Sample time in epoch seconds (defaults to clock.time())
         """
-        current_time = time.time()
-        self._speed_history.append((current_speed_knots, current_time))
-
-        # Remove samples older than smoothing window
-        cutoff_time = current_time - self.smoothing_duration_seconds
-        while self._speed_history and self._speed_history[0][1] < cutoff_time:
-            self._speed_history.popleft()
-
-        # Calculate average of samples within window
-        if len(self._speed_history) > 0:
-            self._smoothed_speed = sum(speed for speed, _ in self._speed_history) / len(
-                self._speed_history
-            )
-        else:
-            self._smoothed_speed = self.default_speed_knots
+        current_time = clock.time() if timestamp is None else timestamp
+        smoothed = self._speed_window.add(current_speed_knots, current_time)
+        self._smoothed_speed = (
+            smoothed if smoothed is not None else self.default_speed_knots
+        )
 
-        self._last_update_time = datetime.now(timezone.utc)
+        self._last_update_time = clock.now()
 
         logger.debug(
-            f"Speed updated: raw={current_speed_knots:.1f}kn, smoothed={self._smoothed_speed:.1f}kn, samples={len(self._speed_history)}"
+            f"Speed updated: raw={current_speed_knots:.1f}kn, "
+            f"smoothed={self._smoothed_speed:.1f}kn, "
+            f"samples={len(self._speed_window)}"
         )
 
     def get_smoothed_speed(self) -> float:
@@ -155,7 +148,7 @@ class ETACalculator:
 
     def reset(self) -> None:
         """Reset calculator state."""
-        self._speed_history.clear()
+        self._speed_window.clear()
         self._smoothed_speed = self.default_speed_knots
         self._passed_pois.clear()
         self._last_update_time = None
@@ -184,18 +177,12 @@ class ETACalculator:
         Returns:
             Dictionary with current stats
         """
-        # Calculate window coverage (time from oldest to newest sample)
-        window_coverage_seconds = 0.0
-        if len(self._speed_history) > 1:
-            oldest_time = self._speed_history[0][1]
-            newest_time = self._speed_history[-1][1]
-            window_coverage_seconds = newest_time - oldest_time
-
         return {
             "smoothed_speed_knots": self._smoothed_speed,
-            "speed_samples": len(self._speed_history),
+            "speed_samples": len(self._speed_window),
             "smoothing_window_seconds": self.smoothing_duration_seconds,
-            "current_window_coverage_seconds": window_coverage_seconds,
+            # Time from the oldest to the newest sample
+            "current_window_coverage_seconds": self._speed_window.span_seconds,
             "passed_pois_count": len(self._passed_pois),
             "last_update": (
                 self._last_update_time.isoformat() if self._last_update_time else None
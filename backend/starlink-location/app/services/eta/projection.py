@@ -1,17 +1,19 @@
 """Route-aware ETA projection and calculation with dual-mode support."""
 
-# FR-004: File exceeds 300 lines (500 lines) because ETA projection bridges
+# FR-004: File exceeds 300 lines (589 lines) because ETA projection bridges
 # flight phase detection, route geometry, timing calculations, and mode switching.
 # Refactoring would split related concerns across modules losing coherence.
 # Deferred to v0.4.0.
 
 import logging
 from typing import Optional, TYPE_CHECKING
-from datetime import datetime, timezone
 
+from app.core import clock
 from app.models.poi import POI
 from app.models.flight_status import ETAMode, FlightPhase
 from app.services.eta.calculator import ETACalculator
+from app.services.route_eta.cache import get_eta_cache
+from app.services.route_eta.geometry import get_route_geometry
 
 if TYPE_CHECKING:
     from app.models.route import ParsedRoute, RouteWaypoint
@@ -73,6 +75,8 @@ class ETAProjection:
         is_pre_departure = (
             flight_phase == FlightPhase.PRE_DEPARTURE if flight_phase else False
         )
+        # Nearest route point, found once per call and shared by all POIs
+        route_position: dict[str, int] = {}
 
         for poi in pois:
             distance = self.calculator.calculate_distance(
@@ -88,8 +92,13 @@ class ETAProjection:
             ):
                 if eta_mode == ETAMode.ESTIMATED:
                     # In estimated mode, use speed blending for more accurate ETAs
-                    eta = self._calculate_route_aware_eta_estimated(
-                        current_lat, current_lon, poi, active_route, speed_knots
+                    eta = self._cached_route_aware_eta_estimated(
+                        current_lat,
+                        current_lon,
+                        poi,
+                        active_route,
+                        speed_knots,
+                        route_position,
                     )
                 else:
                     # In anticipated mode, use planned route times
@@ -130,6 +139,81 @@ class ETAProjection:
 
         return metrics
 
+    def _cached_route_aware_eta_estimated(
+        self,
+        current_lat: float,
+        current_lon: float,
+        poi: POI,
+        active_route: "ParsedRoute",
+        current_speed_knots: Optional[float],
+        route_position: dict[str, int],
+    ) -> Optional[float]:
+        """
+        Route-aware estimated ETA, served from the ETA cache when possible.
+
+        Results are keyed by route, POI, along-track position bucket of the
+        nearest route point and speed bucket (see app.services.eta_cache).
+
+        Args:
+            current_lat: Current latitude
+            current_lon: Current longitude
+            poi: POI on the active route
+            active_route: ParsedRoute with timing data
+            current_speed_knots: Current speed (uses smoothed speed if not provided)
+            route_position: Per-call memo of the nearest route point index
+
+        Returns:
+            ETA in seconds, or None to fall back to distance/speed
+        """
+        if (
+            not active_route.timing_profile
+            or not active_route.timing_profile.has_timing_data
+        ):
+            return None
+
+        geometry = get_route_geometry(active_route)
+        if "nearest" not in route_position:
+            route_position["nearest"], _ = geometry.nearest_point(
+                current_lat, current_lon
+            )
+        nearest_index = route_position["nearest"]
+        speed = (
+            current_speed_knots
+            if current_speed_knots is not None
+            else self.calculator._smoothed_speed
+        )
+
+        cache = get_eta_cache()
+        key = cache.make_key(
+            geometry.route_id,
+            geometry.token,
+            geometry.along_track_m(nearest_index),
+            speed,
+            (
+                "poi",
+                poi.id,
+                poi.name,
+                poi.projected_latitude,
+                poi.projected_longitude,
+                poi.projected_route_progress,
+            ),
+            depends_on_pois=True,
+        )
+        (eta,) = cache.get_or_compute(
+            key,
+            lambda: (
+                self._calculate_route_aware_eta_estimated(
+                    current_lat,
+                    current_lon,
+                    poi,
+                    active_route,
+                    speed,
+                    nearest_point_index=nearest_index,
+                ),
+            ),
+        )
+        return eta
+
     def _calculate_route_aware_eta_estimated(
         self,
         current_lat: float,
@@ -137,6 +221,7 @@ class ETAProjection:
         poi: POI,
         active_route: "ParsedRoute",
         current_speed_knots: Optional[float] = None,
+        nearest_point_index: Optional[int] = None,
     ) -> Optional[float]:
         """
         Calculate ETA using segment-based speeds with speed blending (estimated/in-flight mode).
@@ -157,6 +242,7 @@ class ETAProjection:
             poi: POI object whose name should match a waypoint name (or has projection data)
             active_route: ParsedRoute with timing data
             current_speed_knots: Current speed for blending (uses smoothed speed if not provided)
+            nearest_point_index: Route point nearest to the current position, if known
 
         Returns:
             ETA in seconds if route-aware calculation succeeds, None to fall back to distance/speed
@@ -183,6 +269,7 @@ class ETAProjection:
                 matching_waypoint,
                 active_route,
                 current_speed_knots,
+                nearest_point_index,
             )
 
         # If POI is not on route but has projection data, use projection-based calculation
@@ -192,7 +279,12 @@ class ETAProjection:
             and poi.projected_route_progress is not None
         ):
             return self._calculate_off_route_eta_with_projection_estimated(
-                current_lat, current_lon, poi, active_route, current_speed_knots
+                current_lat,
+                current_lon,
+                poi,
+                active_route,
+                current_speed_knots,
+                nearest_point_index,
             )
 
         # If neither on-route nor has projection, return None to fall back to distance/speed
@@ -237,7 +329,7 @@ class ETAProjection:
             return None
 
         try:
-            current_time = datetime.now(timezone.utc)
+            current_time = clock.now()
 
             # First, try to find matching waypoint on route by name
             # This handles explicitly named waypoints in the KML
@@ -290,6 +382,7 @@ class ETAProjection:
         destination_waypoint: "RouteWaypoint",
         active_route: "ParsedRoute",
         current_speed_knots: Optional[float] = None,
+        nearest_point_index: Optional[int] = None,
     ) -> Optional[float]:
         """
         Calculate ETA for a waypoint with speed blending (estimated/in-flight mode).
@@ -305,6 +398,7 @@ class ETAProjection:
             destination_waypoint: Destination waypoint on the route
             active_route: ParsedRoute with timing data
             current_speed_knots: Current speed for blending (uses smoothed speed if not provided)
+            nearest_point_index: Route point nearest to the current position, if known
 
         Returns:
             ETA in seconds if calculation succeeds, None otherwise
@@ -317,16 +411,10 @@ class ETAProjection:
             )
 
             # Find nearest route point to current position
-            nearest_point_index = 0
-            nearest_distance = float("inf")
-
-            for idx, point in enumerate(active_route.points):
-                dist = self.calculator.calculate_distance(
-                    current_lat, current_lon, point.latitude, point.longitude
+            if nearest_point_index is None:
+                nearest_point_index, _ = get_route_geometry(active_route).nearest_point(
+                    current_lat, current_lon
                 )
-                if dist < nearest_distance:
-                    nearest_distance = dist
-                    nearest_point_index = idx
 
             # Calculate remaining distance and time segment by segment
             total_eta_seconds = 0.0
@@ -386,6 +474,7 @@ class ETAProjection:
         poi: POI,
         active_route: "ParsedRoute",
         current_speed_knots: Optional[float] = None,
+        nearest_point_index: Optional[int] = None,
     ) -> Optional[float]:
         """
         Calculate ETA for off-route POI with speed blending (estimated/in-flight mode).
@@ -409,6 +498,7 @@ class ETAProjection:
             poi: POI with projection data (projected_latitude, projected_longitude)
             active_route: ParsedRoute with timing data
             current_speed_knots: Current speed for blending (uses smoothed speed if not provided)
+            nearest_point_index: Route point nearest to the current position, if known
 
         Returns:
             ETA in seconds if calculation succeeds, None otherwise
@@ -421,16 +511,10 @@ class ETAProjection:
             )
 
             # Find nearest route point to current position
-            nearest_point_index = 0
-            nearest_distance = float("inf")
-
-            for idx, point in enumerate(active_route.points):
-                dist = self.calculator.calculate_distance(
-                    current_lat, current_lon, point.latitude, point.longitude
+            if nearest_point_index is None:
+                nearest_point_index, _ = get_route_geometry(active_route).nearest_point(
+                    current_lat, current_lon
                 )
-                if dist < nearest_distance:
-                    nearest_distance = dist
-                    nearest_point_index = idx
 
             # Find which route segment contains the projection point
             projection_segment_index = None
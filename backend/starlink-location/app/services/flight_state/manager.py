@@ -1,6 +1,6 @@
 """Flight state management service with automatic phase detection and transition."""
 
-# FR-004: File exceeds 300 lines (583 lines) because flight state management
+# FR-004: File exceeds 300 lines (594 lines) because flight state management
 # coordinates phase transitions, ETA mode switching, file persistence, and event
 # callbacks. Splitting would fragment related state logic across multiple modules.
 # Deferred to v0.4.0.
@@ -11,6 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Callable, TYPE_CHECKING
 
+from app.core import clock
 from app.models.flight_status import FlightPhase, ETAMode, FlightStatus
 
 if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
@@ -127,7 +128,7 @@ class FlightStateManager:
                 last_arrival_check_time=self._status.last_arrival_check_time,
             )
 
-        now_utc = datetime.now(timezone.utc)
+        now_utc = clock.now()
         departure_utc = _normalize_to_utc(status_copy.departure_time)
         scheduled_departure_utc = _normalize_to_utc(
             status_copy.scheduled_departure_time
@@ -174,7 +175,7 @@ class FlightStateManager:
             True if departure was triggered, False otherwise
         """
         with self._lock:
-            now = datetime.now(timezone.utc)
+            now = clock.now()
             self._status.last_departure_check_time = now
 
             # Only check if in pre-departure phase
@@ -245,7 +246,7 @@ class FlightStateManager:
             True if arrival was triggered, False otherwise
         """
         with self._lock:
-            now = datetime.now(timezone.utc)
+            now = clock.now()
             self._status.last_arrival_check_time = now
 
             # Only check if in flight phase
@@ -315,12 +316,12 @@ class FlightStateManager:
                 new_phase == FlightPhase.IN_FLIGHT
                 and self._status.departure_time is None
             ):
-                self._status.departure_time = datetime.now(timezone.utc)
+                self._status.departure_time = clock.now()
             elif (
                 new_phase == FlightPhase.POST_ARRIVAL
                 and self._status.arrival_time is None
             ):
-                self._status.arrival_time = datetime.now(timezone.utc)
+                self._status.arrival_time = clock.now()
             elif new_phase == FlightPhase.PRE_DEPARTURE:
                 # Manual reset clears arrival tracking
                 self._status.departure_time = None
@@ -485,9 +486,9 @@ class FlightStateManager:
                 logger.debug("Departure trigger ignored: already in-flight")
                 return False
 
-            departure_time = _normalize_to_utc(timestamp) or datetime.now(timezone.utc)
+            departure_time = _normalize_to_utc(timestamp) or clock.now()
             self._status.departure_time = departure_time
-            self._status.last_departure_check_time = datetime.now(timezone.utc)
+            self._status.last_departure_check_time = clock.now()
             self._status.speed_persistence_seconds = 0.0
             self._above_threshold_start_time = None
 
@@ -520,9 +521,9 @@ class FlightStateManager:
                 logger.debug("Arrival trigger ignored: already post-arrival")
                 return False
 
-            arrival_time = _normalize_to_utc(timestamp) or datetime.now(timezone.utc)
+            arrival_time = _normalize_to_utc(timestamp) or clock.now()
             self._status.arrival_time = arrival_time
-            self._status.last_arrival_check_time = datetime.now(timezone.utc)
+            self._status.last_arrival_check_time = clock.now()
             self._arrival_start_time = None
             self._arrival_distance_at_start = None
 
@@ -564,6 +565,12 @@ class FlightStateManager:
 
         # Call registered callbacks
         if old_phase != new_phase:
+            try:
+                from app.services.route_eta.cache import invalidate_phase_etas
+
+                invalidate_phase_etas()
+            except Exception as exc:  # pragma: no cover - defensive guard
+                logger.debug("Failed to invalidate ETA cache on phase change: %s", exc)
             for callback in self._phase_change_callbacks:
                 try:
                     callback(old_phase, new_phase)
@@ -3,6 +3,7 @@
 from typing import Optional, Tuple
 from datetime import datetime
 
+from app.services.kinematics import haversine_m
 from app.simulation.route import calculate_bearing
 
 
@@ -56,6 +57,10 @@ class HeadingTracker:
 
         prev_lat, prev_lon, prev_time = self._previous_position
 
+        # Ignore fixes older than the anchor; they would reverse the bearing
+        if timestamp < prev_time:
+            return self._last_heading
+
         # Check if previous position is too old
         if (timestamp - prev_time).total_seconds() > self.max_age_seconds:
             # Reset tracking with current position
@@ -92,28 +97,7 @@ class HeadingTracker:
         Returns:
             Distance in meters
         """
-        import math
-
-        # Earth radius in meters
-        R = 6371000.0
-
-        # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
+        return haversine_m(lat1, lon1, lat2, lon2)
 
     def reset(self) -> None:
         """Reset tracker state."""
@@ -0,0 +1,232 @@
+"""Streaming kinematics estimators shared by the speed, heading and ETA trackers.
+
+Position and speed updates arrive at up to 10 Hz, and the trackers smooth
+them over a time window (120 s by default). Re-summing or rescanning the
+window on every update makes each update cost grow with the window length.
+The estimators here keep running state instead:
+
+- ``WindowedMean`` keeps a running sum of the samples in the window, so
+  adding a sample and reading the mean are O(1) (amortized over evictions).
+- ``PositionWindow`` keeps GPS fixes with their trigonometry precomputed,
+  so the window's distance is one haversine between its oldest and newest
+  fix.
+
+Both evict samples older than ``newest timestamp - window_seconds``, like the
+deque windows they replace, and give the same results: the mean agrees with
+a full re-sum to within ``MEAN_RELATIVE_TOLERANCE`` (the running sum is
+periodically re-summed exactly to stop rounding drift), and the window
+distance is computed with the same formula on the same fixes.
+
+Timestamps do not have to be ordered. A late sample that still falls inside
+the window is inserted in timestamp order (its cost grows with how late it
+is, not with the window length); a sample older than the window is dropped.
+Duplicate timestamps are kept as separate samples by ``WindowedMean`` and
+replace the earlier fix in ``PositionWindow`` (a re-reported GPS fix).
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Generic, Optional, TypeVar
+
+EARTH_RADIUS_M = 6371000.0
+
+# Agreement between WindowedMean.mean and sum(window) / len(window)
+MEAN_RELATIVE_TOLERANCE = 1e-9
+
+# Minimum evictions between exact re-sums of the running sum
+_RESUM_MIN_EVICTIONS = 64
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class GeoFix:
+    """A GPS fix with the values the haversine formula needs precomputed."""
+
+    latitude: float
+    longitude: float
+    lat_rad: float
+    lon_rad: float
+    cos_lat: float
+
+    @classmethod
+    def from_degrees(cls, latitude: float, longitude: float) -> "GeoFix":
+        """Build a fix from decimal degrees."""
+        lat_rad = math.radians(latitude)
+        return cls(
+            latitude=latitude,
+            longitude=longitude,
+            lat_rad=lat_rad,
+            lon_rad=math.radians(longitude),
+            cos_lat=math.cos(lat_rad),
+        )
+
+    def distance_m(self, other: "GeoFix") -> float:
+        """Great-circle distance to another fix in meters (haversine)."""
+        dlat = other.lat_rad - self.lat_rad
+        dlon = other.lon_rad - self.lon_rad
+        a = (
+            math.sin(dlat / 2) ** 2
+            + self.cos_lat * other.cos_lat * math.sin(dlon / 2) ** 2
+        )
+        return EARTH_RADIUS_M * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in meters.
+
+    Args:
+        lat1: First latitude in decimal degrees
+        lon1: First longitude in decimal degrees
+        lat2: Second latitude in decimal degrees
+        lon2: Second longitude in decimal degrees
+
+    Returns:
+        Distance in meters
+    """
+    return GeoFix.from_degrees(lat1, lon1).distance_m(GeoFix.from_degrees(lat2, lon2))
+
+
+class _TimeWindow(Generic[T]):
+    """Timestamp-ordered samples covering the last ``window_seconds``."""
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self._samples: deque[tuple[float, T]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def span_seconds(self) -> float:
+        """Time from the oldest to the newest sample in the window."""
+        if len(self._samples) < 2:
+            return 0.0
+        return self._samples[-1][0] - self._samples[0][0]
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        self._samples.clear()
+
+    def _insert(self, timestamp: float, item: T) -> bool:
+        """Insert a sample in timestamp order and evict expired samples.
+
+        Returns:
+            False if the sample was already outside the window and dropped
+        """
+        samples = self._samples
+        if not samples or timestamp >= samples[-1][0]:
+            samples.append((timestamp, item))
+            self._added(item)
+            self._evict(timestamp - self.window_seconds)
+            return True
+
+        if timestamp < samples[-1][0] - self.window_seconds:
+            return False
+        # Late sample: walk back from the newest end to its slot
+        position = len(samples) - 1
+        while position > 0 and samples[position - 1][0] > timestamp:
+            position -= 1
+        samples.insert(position, (timestamp, item))
+        self._added(item)
+        return True
+
+    def _evict(self, cutoff: float) -> None:
+        samples = self._samples
+        while samples and samples[0][0] < cutoff:
+            self._removed(samples.popleft()[1])
+
+    def _added(self, item: T) -> None:
+        """Hook called after a sample joins the window."""
+
+    def _removed(self, item: T) -> None:
+        """Hook called after a sample leaves the window."""
+
+
+class WindowedMean(_TimeWindow[float]):
+    """Mean of the values seen in the last ``window_seconds``."""
+
+    def __init__(self, window_seconds: float):
+        super().__init__(window_seconds)
+        self._sum = 0.0
+        self._evictions = 0
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of the samples in the window, or None if it is empty."""
+        if not self._samples:
+            return None
+        return self._sum / len(self._samples)
+
+    def add(self, value: float, timestamp: float) -> Optional[float]:
+        """Add a sample and return the updated mean.
+
+        Args:
+            value: Sample value
+            timestamp: Sample time in seconds (any monotonic or epoch clock)
+
+        Returns:
+            Mean of the window after the update (None if it is empty)
+        """
+        self._insert(timestamp, value)
+        return self.mean
+
+    def clear(self) -> None:
+        """Drop every sample."""
+        super().clear()
+        self._sum = 0.0
+        self._evictions = 0
+
+    def _added(self, item: float) -> None:
+        self._sum += item
+
+    def _removed(self, item: float) -> None:
+        self._sum -= item
+        self._evictions += 1
+        # Re-sum exactly once per window's worth of evictions, which keeps
+        # the rounding error bounded at O(1) amortized cost per update.
+        if self._evictions >= max(len(self._samples), _RESUM_MIN_EVICTIONS):
+            self._sum = math.fsum(value for _, value in self._samples)
+            self._evictions = 0
+
+
+class PositionWindow(_TimeWindow[GeoFix]):
+    """GPS fixes seen in the last ``window_seconds``."""
+
+    def add(self, latitude: float, longitude: float, timestamp: float) -> bool:
+        """Add a fix.
+
+        A fix with the same timestamp as the newest one replaces it.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+            timestamp: Fix time in seconds
+
+        Returns:
+            False if the fix was older than the window and dropped
+        """
+        fix = GeoFix.from_degrees(latitude, longitude)
+        if self._samples and timestamp == self._samples[-1][0]:
+            self._samples[-1] = (timestamp, fix)
+            return True
+        return self._insert(timestamp, fix)
+
+    @property
+    def oldest(self) -> Optional[GeoFix]:
+        """Oldest fix in the window."""
+        return self._samples[0][1] if self._samples else None
+
+    @property
+    def newest(self) -> Optional[GeoFix]:
+        """Newest fix in the window."""
+        return self._samples[-1][1] if self._samples else None
+
+    def distance_m(self) -> float:
+        """Great-circle distance from the oldest to the newest fix in meters."""
+        if len(self._samples) < 2:
+            return 0.0
+        return self._samples[0][1].distance_m(self._samples[-1][1])
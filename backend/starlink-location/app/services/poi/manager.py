@@ -1,6 +1,6 @@
 """POI manager for loading, saving, and managing points of interest."""
 
-# FR-004: File exceeds 300 lines (680 lines) because POI management combines
+# FR-004: File exceeds 300 lines (717 lines) because POI management combines
 # file I/O, locking, JSON parsing, geospatial queries, and in-memory caching
 # that are tightly coupled. Separation would split single responsibility across
 # multiple modules with reduced cohesion. Deferred to v0.4.0.
@@ -8,14 +8,17 @@
 import json
 import logging
 import re
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Iterator, Optional, Sequence
 
 from filelock import FileLock
 
 from app.models.poi import POI, POICreate, POIUpdate
+from app.services.route_eta.cache import invalidate_poi_etas
 
 logger = logging.getLogger(__name__)
 
@@ -32,17 +35,27 @@ class POIManager:
     - Timestamp tracking
     """
 
-    def __init__(self, pois_file: str | Path = "/data/pois.json"):
+    def __init__(self, pois_file: str | Path | None = "/data/pois.json"):
         """
         Initialize POI manager.
 
         Args:
-            pois_file: Path to pois.json file
+            pois_file: Path to pois.json file, or None for an in-memory manager
+                that never reads or writes disk
         """
-        self.pois_file = Path(pois_file)
-        self.lock_file = Path(str(self.pois_file) + ".lock")
+        self.pois_file = Path(pois_file) if pois_file is not None else None
+        self.lock_file = (
+            Path(str(self.pois_file) + ".lock") if self.pois_file is not None else None
+        )
         self._pois: dict[str, POI] = {}
-        self._load_pois()
+        # Serializes batch bookkeeping and writes within this process
+        self._lock = threading.RLock()
+        # batch() depth is per thread: only the thread that opened a batch
+        # has its saves deferred; other threads keep saving immediately
+        self._batch_local = threading.local()
+        self._batch_dirty = False
+        if self.pois_file is not None:
+            self._load_pois()
 
     def _ensure_file_exists(self) -> None:
         """Create pois file if it doesn't exist with empty structure.
@@ -66,8 +79,11 @@ class POIManager:
         """Load POIs from JSON file with file locking.
 
         Reads POIs from the pois section of the JSON file and converts
-        timestamp strings to datetime objects with UTC timezone.
+        timestamp strings to datetime objects with UTC timezone. In-memory
+        managers keep their current POIs.
         """
+        if self.pois_file is None:
+            return
         self._ensure_file_exists()
 
         lock = FileLock(self.lock_file, timeout=5)
@@ -107,14 +123,54 @@ class POIManager:
             except Exception as e:
                 logger.warning(f"Failed to load POI {poi_id}: {e}")
 
+        invalidate_poi_etas()
         logger.info(f"Loaded {len(self._pois)} POIs from {self.pois_file}")
 
+    @property
+    def _batch_depth(self) -> int:
+        """Open batch() blocks in the calling thread."""
+        return getattr(self._batch_local, "depth", 0)
+
+    @contextmanager
+    def batch(self) -> Iterator["POIManager"]:
+        """Defer saving until the block exits, then write all changes at once.
+
+        Every create/update/delete rewrites the whole POI file, so bulk
+        operations (e.g. mission imports) group their changes in a batch to
+        commit them with a single write. Batches may be nested; the outermost
+        one saves. Only saves made by the thread that opened the batch are
+        deferred.
+        """
+        with self._lock:
+            self._batch_local.depth = self._batch_depth + 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_local.depth = self._batch_depth - 1
+                if self._batch_depth == 0 and self._batch_dirty:
+                    self._batch_dirty = False
+                    self._save_pois()
+
     def _save_pois(self) -> None:
         """Save POIs to JSON file with file locking and atomic writes.
 
         Uses atomic write pattern (write to temp file, then rename) to prevent corruption.
-        Preserves route data from existing file structure.
-        """
+        Preserves route data from existing file structure. Inside a batch the
+        write is deferred until the batch exits.
+        """
+        # Every mutation ends here; cached POI ETAs are stale from now on
+        invalidate_poi_etas()
+        with self._lock:
+            if self._batch_depth:
+                self._batch_dirty = True
+                return
+            self._write_pois()
+
+    def _write_pois(self) -> None:
+        """Write every POI to the file (caller holds ``self._lock``)."""
+        if self.pois_file is None:
+            return
         lock = FileLock(self.lock_file, timeout=5)
         try:
             with lock.acquire(timeout=5):
@@ -127,7 +183,7 @@ class POIManager:
 
                 # Update pois section
                 pois_section = {}
-                for poi_id, poi in self._pois.items():
+                for poi_id, poi in list(self._pois.items()):
                     poi_dict = poi.model_dump()
                     # Convert datetime to ISO format for JSON serialization
                     if isinstance(poi_dict.get("created_at"), datetime):
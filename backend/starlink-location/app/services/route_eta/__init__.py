@@ -5,17 +5,25 @@ from app.services.route_eta.calculator import (
     project_point_to_line_segment,
 )
 from app.services.route_eta.cache import (
+    get_eta_cache,
     get_eta_cache_stats,
     get_eta_accuracy_stats,
     clear_eta_cache,
     cleanup_eta_cache,
+    invalidate_route_etas,
+    invalidate_poi_etas,
+    invalidate_phase_etas,
 )
 
 __all__ = [
     "RouteETACalculator",
     "project_point_to_line_segment",
+    "get_eta_cache",
     "get_eta_cache_stats",
     "get_eta_accuracy_stats",
     "clear_eta_cache",
     "cleanup_eta_cache",
+    "invalidate_route_etas",
+    "invalidate_poi_etas",
+    "invalidate_phase_etas",
 ]
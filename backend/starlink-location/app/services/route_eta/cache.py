@@ -1,12 +1,31 @@
 """ETA cache and history tracking for route calculations."""
 
-# Global cache instance (singleton pattern)
+import os
+from typing import Optional
+
 from app.services.eta_cache import ETACache, ETAHistoryTracker
 
-_eta_cache = ETACache(ttl_seconds=5.0)
+ETA_CACHE_TTL_SECONDS = float(os.getenv("ETA_CACHE_TTL_SECONDS", "5"))
+ETA_CACHE_MAX_ENTRIES = int(os.getenv("ETA_CACHE_MAX_ENTRIES", "2048"))
+# Along-track distance and speed that share a cached result
+ETA_CACHE_POSITION_QUANTUM_M = float(os.getenv("ETA_CACHE_POSITION_QUANTUM_M", "250"))
+ETA_CACHE_SPEED_BUCKET_KNOTS = float(os.getenv("ETA_CACHE_SPEED_BUCKET_KNOTS", "1"))
+
+# Global cache instance (singleton pattern)
+_eta_cache = ETACache(
+    ttl_seconds=ETA_CACHE_TTL_SECONDS,
+    max_entries=ETA_CACHE_MAX_ENTRIES,
+    position_quantum_m=ETA_CACHE_POSITION_QUANTUM_M,
+    speed_bucket_knots=ETA_CACHE_SPEED_BUCKET_KNOTS,
+)
 _eta_history = ETAHistoryTracker(max_history=100)
 
 
+def get_eta_cache() -> ETACache:
+    """Get the global ETA result cache."""
+    return _eta_cache
+
+
 def get_eta_cache_stats() -> dict:
     """
     Get statistics about the global ETA cache.
@@ -40,3 +59,36 @@ def cleanup_eta_cache() -> int:
         Number of expired entries removed
     """
     return _eta_cache.cleanup_expired()
+
+
+def invalidate_route_etas(route_id: Optional[str] = None) -> int:
+    """
+    Drop cached ETAs for a route that was reloaded, activated or deactivated.
+
+    Args:
+        route_id: Route identifier, or None for every route
+
+    Returns:
+        Number of entries removed
+    """
+    return _eta_cache.invalidate_route(route_id)
+
+
+def invalidate_poi_etas() -> int:
+    """
+    Drop cached POI ETAs after POIs were created, changed or deleted.
+
+    Returns:
+        Number of entries removed
+    """
+    return _eta_cache.invalidate_pois()
+
+
+def invalidate_phase_etas() -> int:
+    """
+    Drop cached POI ETAs after a flight phase change (the ETA mode may change).
+
+    Returns:
+        Number of entries removed
+    """
+    return _eta_cache.invalidate_pois()
@@ -1,6 +1,6 @@
 """Route ETA calculator for estimating arrival times to waypoints and locations along a route."""
 
-# FR-004: File exceeds 300 lines (600 lines) because ETA calculation involves
+# FR-004: File exceeds 300 lines (605 lines) because ETA calculation involves
 # geometric projections, speed interpolation, timing adjustments, and flight phase
 # state transitions. Refactoring into separate modules would obscure the unified
 # calculation pipeline. Deferred to v0.4.0.
@@ -10,6 +10,8 @@ import logging
 from typing import Optional
 
 from app.models.route import ParsedRoute
+from app.services.route_eta.cache import get_eta_cache
+from app.services.route_eta.geometry import RouteGeometry, get_route_geometry
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +106,14 @@ class RouteETACalculator:
         """
         self.route = parsed_route
         self._validate_route()
+        self._geometry: Optional[RouteGeometry] = None
+
+    @property
+    def geometry(self) -> RouteGeometry:
+        """Precomputed geometry of the route (shared by all calculators)."""
+        if self._geometry is None:
+            self._geometry = get_route_geometry(self.route)
+        return self._geometry
 
     def _validate_route(self) -> None:
         """Validate that route has required data."""
@@ -255,22 +265,7 @@ class RouteETACalculator:
         Returns:
             Tuple of (point_index, distance_to_point_meters)
         """
-        min_distance = float("inf")
-        nearest_index = 0
-
-        for idx, point in enumerate(self.route.points):
-            distance = self._haversine_distance(
-                current_lat,
-                current_lon,
-                point.latitude,
-                point.longitude,
-            )
-
-            if distance < min_distance:
-                min_distance = distance
-                nearest_index = idx
-
-        return nearest_index, min_distance
+        return self.geometry.nearest_point(current_lat, current_lon)
 
     def _get_speed_for_segment(self, point_index: int) -> float:
         """
@@ -327,20 +322,10 @@ class RouteETACalculator:
         if start_index > end_index or start_index >= len(self.route.points):
             return 0.0
 
-        distance = 0.0
-        for i in range(start_index, min(end_index, len(self.route.points) - 1)):
-            p1 = self.route.points[i]
-            p2 = self.route.points[i + 1]
-
-            segment_distance = self._haversine_distance(
-                p1.latitude,
-                p1.longitude,
-                p2.latitude,
-                p2.longitude,
-            )
-            distance += segment_distance
-
-        return distance
+        end_index = min(end_index, len(self.route.points) - 1)
+        return self.geometry.along_track_m(end_index) - self.geometry.along_track_m(
+            start_index
+        )
 
     def _calculate_remaining_duration_from_segments(
         self,
@@ -555,7 +540,7 @@ class RouteETACalculator:
         )
 
         # Calculate progress
-        total_distance = self.route.get_total_distance()
+        total_distance = self.geometry.total_distance_m
         distance_completed = self._calculate_distance_along_route(0, nearest_point_idx)
         distance_remaining = total_distance - distance_completed
 
@@ -569,10 +554,23 @@ class RouteETACalculator:
         if self.route.timing_profile:
             expected_total_duration = self.route.timing_profile.get_total_duration()
 
-        # Calculate remaining duration using segment-aware method if available
+        # Calculate remaining duration using segment-aware method if available.
+        # This walks the rest of the route, so results are cached per
+        # along-track position bucket.
         if not expected_duration_remaining and self.route.timing_profile:
-            expected_duration_remaining = (
-                self._calculate_remaining_duration_from_segments(nearest_point_idx)
+            cache = get_eta_cache()
+            key = cache.make_key(
+                self.geometry.route_id,
+                self.geometry.token,
+                distance_completed,
+                None,
+                "remaining_duration",
+            )
+            (expected_duration_remaining,) = cache.get_or_compute(
+                key,
+                lambda: (
+                    self._calculate_remaining_duration_from_segments(nearest_point_idx),
+                ),
             )
 
         # Calculate average speed if we have total duration
@@ -0,0 +1,134 @@
+"""Precomputed route geometry shared by ETA calculations.
+
+RouteETACalculator and ETAProjection are created per request or per tick,
+and each used to rescan the route point by point to find the aircraft's
+nearest point and to sum distances along the route. RouteGeometry keeps the
+point coordinates as arrays plus cumulative along-track distances, computed
+once per loaded route object. Nearest-point lookups become one vectorized
+pass, and along-track distances become array lookups.
+
+The geometry also gives each route object a unique token. ETA cache keys
+include it, so a reloaded route never serves results computed on an
+earlier version.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import threading
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from app.models.route import ParsedRoute
+
+EARTH_RADIUS_M = 6371000.0
+
+_tokens = itertools.count(1)
+_geometries: dict[int, tuple[weakref.ref, "RouteGeometry"]] = {}
+_geometries_lock = threading.RLock()  # weakref callbacks may fire while held
+
+
+def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in meters (same formula as RouteETACalculator)."""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = math.radians(lon2) - math.radians(lon1)
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
+    )
+    return EARTH_RADIUS_M * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+@dataclass(frozen=True)
+class RouteGeometry:
+    """Point arrays and cumulative distances for one route object."""
+
+    token: int
+    route_id: str
+    lat_rad: np.ndarray
+    lon_rad: np.ndarray
+    cos_lat: np.ndarray
+    # cumulative_m[i] is the distance along the route from point 0 to point i
+    cumulative_m: np.ndarray
+
+    @property
+    def total_distance_m(self) -> float:
+        """Length of the route in meters."""
+        return float(self.cumulative_m[-1]) if len(self.cumulative_m) else 0.0
+
+    def nearest_point(self, lat: float, lon: float) -> tuple[int, float]:
+        """Index of the route point nearest to a position, and its distance.
+
+        Ties resolve to the first point, like a sequential scan.
+        """
+        lat_rad = math.radians(lat)
+        a = (
+            np.sin((self.lat_rad - lat_rad) / 2) ** 2
+            + math.cos(lat_rad)
+            * self.cos_lat
+            * np.sin((self.lon_rad - math.radians(lon)) / 2) ** 2
+        )
+        distances = EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        index = int(np.argmin(distances))
+        return index, float(distances[index])
+
+    def along_track_m(self, point_index: int) -> float:
+        """Distance along the route from the first point to ``point_index``."""
+        return float(self.cumulative_m[point_index])
+
+
+def route_cache_id(route: ParsedRoute) -> str:
+    """Route ID used in ETA cache keys (the KML file name without suffix)."""
+    return Path(route.metadata.file_path).stem
+
+
+def _build_geometry(route: ParsedRoute) -> RouteGeometry:
+    lats = [point.latitude for point in route.points]
+    lons = [point.longitude for point in route.points]
+    cumulative = [0.0]
+    for index in range(len(lats) - 1):
+        cumulative.append(
+            cumulative[-1]
+            + _haversine(lats[index], lons[index], lats[index + 1], lons[index + 1])
+        )
+    lat_rad = np.radians(np.asarray(lats, dtype=np.float64))
+    return RouteGeometry(
+        token=next(_tokens),
+        route_id=route_cache_id(route),
+        lat_rad=lat_rad,
+        lon_rad=np.radians(np.asarray(lons, dtype=np.float64)),
+        cos_lat=np.cos(lat_rad),
+        cumulative_m=np.asarray(cumulative, dtype=np.float64),
+    )
+
+
+def get_route_geometry(route: ParsedRoute) -> RouteGeometry:
+    """Geometry for a route object, built on first use.
+
+    Geometries live as long as their route object. Routes are replaced (not
+    modified) when their KML file is reloaded, so a cached geometry always
+    matches its route.
+    """
+    key = id(route)
+    with _geometries_lock:
+        cached = _geometries.get(key)
+        if cached is not None and cached[0]() is route:
+            return cached[1]
+
+    geometry = _build_geometry(route)
+
+    def _forget(_ref: weakref.ref) -> None:
+        with _geometries_lock:
+            current = _geometries.get(key)
+            if current is not None and current[0] is _ref:
+                del _geometries[key]
+
+    with _geometries_lock:
+        _geometries[key] = (weakref.ref(route, _forget), geometry)
+    return geometry
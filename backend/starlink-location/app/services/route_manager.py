@@ -1,6 +1,6 @@
 """Route manager with file watching for KML route loading and management."""
 
-# FR-004: File exceeds 300 lines (330 lines) because route manager combines
+# FR-004: File exceeds 300 lines (342 lines) because route manager combines
 # file watching, KML parsing, route storage, and active route coordination.
 # Splitting would fragment route lifecycle management. Deferred to v0.4.0.
 
@@ -13,6 +13,7 @@ from watchdog.observers import Observer
 
 from app.models.route import ParsedRoute
 from app.services.kml_parser import KMLParseError, parse_kml_file
+from app.services.route_eta.cache import invalidate_route_etas
 
 logger = logging.getLogger(__name__)
 
@@ -60,9 +61,11 @@ class RouteManager:
     - Handles errors gracefully
     """
 
-    def __init__(self, routes_dir: str | Path = "/data/routes"):
-        self.routes_dir = Path(routes_dir)
-        self.routes_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(self, routes_dir: str | Path | None = "/data/routes"):
+        # routes_dir=None gives an in-memory manager fed through add_route()
+        self.routes_dir = Path(routes_dir) if routes_dir is not None else None
+        if self.routes_dir is not None:
+            self.routes_dir.mkdir(parents=True, exist_ok=True)
 
         self._routes: dict[str, ParsedRoute] = {}
         self._active_route_id: Optional[str] = None
@@ -76,6 +79,9 @@ class RouteManager:
         if self._observer is not None:
             logger.warning("RouteManager is already watching")
             return
+        if self.routes_dir is None:
+            logger.warning("RouteManager has no routes directory to watch")
+            return
 
         # Load existing routes
         self._load_existing_routes()
@@ -101,7 +107,7 @@ class RouteManager:
 
     def _load_existing_routes(self) -> None:
         """Load all existing KML files from routes directory."""
-        if not self.routes_dir.exists():
+        if self.routes_dir is None or not self.routes_dir.exists():
             logger.warning(f"Routes directory does not exist: {self.routes_dir}")
             return
 
@@ -120,6 +126,7 @@ class RouteManager:
         try:
             parsed_route = parse_kml_file(file_path)
             self._routes[route_id] = parsed_route
+            invalidate_route_etas(route_id)
             # Clear any previous error for this route
             if route_id in self._errors:
                 del self._errors[route_id]
@@ -154,6 +161,7 @@ class RouteManager:
         available even if filesystem watchers miss an event.
         """
         self._routes[route_id] = parsed_route
+        invalidate_route_etas(route_id)
         if route_id in self._errors:
             del self._errors[route_id]
         logger.info(
@@ -169,6 +177,7 @@ class RouteManager:
         """
         if route_id in self._routes:
             del self._routes[route_id]
+            invalidate_route_etas(route_id)
             logger.info(f"Removed route: {route_id}")
 
         if route_id in self._errors:
@@ -249,6 +258,7 @@ class RouteManager:
             return False
 
         self._active_route_id = route_id
+        invalidate_route_etas(route_id)
         logger.info(f"Activated route: {route_id}")
 
         try:
@@ -274,6 +284,7 @@ class RouteManager:
             if self._active_route_id == route_id:
                 logger.info(f"Deactivated route: {route_id}")
                 self._active_route_id = None
+                invalidate_route_etas(route_id)
                 try:
                     from app.services.flight_state import (
                         get_flight_state_manager,
@@ -292,6 +303,7 @@ class RouteManager:
             # Deactivate current active route
             if self._active_route_id:
                 logger.info(f"Deactivated route: {self._active_route_id}")
+                invalidate_route_etas(self._active_route_id)
                 try:
                     from app.services.flight_state import (
                         get_flight_state_manager,
@@ -324,6 +336,7 @@ class RouteManager:
         self._routes.clear()
         self._errors.clear()
         self._active_route_id = None
+        invalidate_route_etas()
         self._load_existing_routes()
         logger.info("Reloaded all routes from disk")
         try:
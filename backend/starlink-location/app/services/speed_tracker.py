@@ -1,10 +1,10 @@
 """Speed tracker for calculating speed from GPS position updates."""
 
 import logging
-import math
 import time
-from collections import deque
-from typing import Optional, Tuple
+from typing import Optional
+
+from app.services.kinematics import PositionWindow, haversine_m
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +17,9 @@ class SpeedTracker:
     since the Starlink API does not provide speed directly.
 
     Uses a time-based rolling window to smooth speed calculations over
-    a configurable duration (default: 120 seconds = 2 minutes).
+    a configurable duration (default: 120 seconds = 2 minutes). The window
+    is a PositionWindow, so each update costs the same however many fixes
+    the window holds.
     """
 
     def __init__(
@@ -36,8 +38,8 @@ class SpeedTracker:
         self.smoothing_duration_seconds = smoothing_duration_seconds
         self.min_distance_meters = min_distance_meters
 
-        # Store position updates: (latitude, longitude, timestamp)
-        self._position_history: deque[Tuple[float, float, float]] = deque()
+        # Position updates within the smoothing window
+        self._positions = PositionWindow(smoothing_duration_seconds)
         self._last_speed: float = 0.0
 
     def update(
@@ -58,27 +60,16 @@ class SpeedTracker:
         if timestamp is None:
             timestamp = time.time()
 
-        # Add current position to history
-        self._position_history.append((latitude, longitude, timestamp))
-
-        # Remove positions older than smoothing window
-        cutoff_time = timestamp - self.smoothing_duration_seconds
-        while self._position_history and self._position_history[0][2] < cutoff_time:
-            self._position_history.popleft()
+        # Add current position; expired and late fixes are handled by the window
+        self._positions.add(latitude, longitude, timestamp)
 
         # Calculate speed from oldest to newest position in window
-        if len(self._position_history) < 2:
+        if len(self._positions) < 2:
             # Not enough data for speed calculation
             return self._last_speed
 
-        oldest_lat, oldest_lon, oldest_time = self._position_history[0]
-        newest_lat, newest_lon, newest_time = self._position_history[-1]
-
-        # Calculate distance and time delta
-        distance_meters = self._calculate_distance(
-            oldest_lat, oldest_lon, newest_lat, newest_lon
-        )
-        time_delta_seconds = newest_time - oldest_time
+        distance_meters = self._positions.distance_m()
+        time_delta_seconds = self._positions.span_seconds
 
         # Avoid division by zero and very small time deltas
         if time_delta_seconds < 0.1:
@@ -94,7 +85,7 @@ class SpeedTracker:
             logger.debug(
                 f"Speed calculated: {speed_knots:.2f}kn "
                 f"({distance_meters:.1f}m in {time_delta_seconds:.1f}s, "
-                f"window: {len(self._position_history)} samples)"
+                f"window: {len(self._positions)} samples)"
             )
         else:
             # Not enough movement - return last speed
@@ -120,30 +111,11 @@ class SpeedTracker:
         Returns:
             Distance in meters
         """
-        # Earth radius in meters
-        R = 6371000.0
-
-        # Convert to radians
-        lat1_rad = math.radians(lat1)
-        lon1_rad = math.radians(lon1)
-        lat2_rad = math.radians(lat2)
-        lon2_rad = math.radians(lon2)
-
-        # Haversine formula
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
-
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2
-        )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
+        return haversine_m(lat1, lon1, lat2, lon2)
 
     def reset(self) -> None:
         """Reset tracker state."""
-        self._position_history.clear()
+        self._positions.clear()
         self._last_speed = 0.0
         logger.info("Speed tracker reset")
 
@@ -158,15 +130,9 @@ class SpeedTracker:
         Returns:
             Dictionary with current stats
         """
-        window_coverage_seconds = 0.0
-        if len(self._position_history) > 1:
-            oldest_time = self._position_history[0][2]
-            newest_time = self._position_history[-1][2]
-            window_coverage_seconds = newest_time - oldest_time
-
         return {
             "speed_knots": self._last_speed,
-            "position_samples": len(self._position_history),
+            "position_samples": len(self._positions),
             "smoothing_window_seconds": self.smoothing_duration_seconds,
-            "current_window_coverage_seconds": window_coverage_seconds,
+            "current_window_coverage_seconds": self._positions.span_seconds,
         }
@@ -1,6 +1,6 @@
 """Simulation coordinator for orchestrating all simulators."""
 
-# FR-004: File exceeds 300 lines (307 lines) because coordinator orchestrates
+# FR-004: File exceeds 300 lines (314 lines) because coordinator orchestrates
 # position, telemetry, and environmental simulators with shared state and timing.
 # Splitting would fragment simulation lifecycle. Deferred to v0.4.0.
 
@@ -22,6 +22,8 @@ from app.simulation.kml_follower import KMLRouteFollower
 from app.core.metrics import (
     starlink_route_progress_percent,
     starlink_current_waypoint_index,
+    stage_timer,
+    track_labels,
 )
 
 logger = logging.getLogger(__name__)
@@ -140,7 +142,7 @@ class SimulationCoordinator:
         progress_percent = progress * 100.0
 
         # Update metrics with route name label
-        starlink_route_progress_percent.labels(route_name=route_name).set(
+        track_labels(starlink_route_progress_percent, route_name=route_name).set(
             progress_percent
         )
 
@@ -148,7 +150,7 @@ class SimulationCoordinator:
         total_points = self.position_sim.route_follower.get_point_count()
         waypoint_index = min(int(progress * (total_points - 1)), total_points - 1)
 
-        starlink_current_waypoint_index.labels(route_name=route_name).set(
+        track_labels(starlink_current_waypoint_index, route_name=route_name).set(
             waypoint_index
         )
 
@@ -184,11 +186,12 @@ class SimulationCoordinator:
         else:
             # No route timing data - use GPS-based speed calculation
             # This is for live mode or untimed routes
-            speed = self.speed_tracker.update(
-                latitude=position_data.latitude,
-                longitude=position_data.longitude,
-                timestamp=time.time(),
-            )
+            with stage_timer("trackers"):
+                speed = self.speed_tracker.update(
+                    latitude=position_data.latitude,
+                    longitude=position_data.longitude,
+                    timestamp=time.time(),
+                )
             # Update position with calculated speed
             position_data.speed = speed
 
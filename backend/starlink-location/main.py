@@ -13,11 +13,13 @@ from fastapi.staticfiles import StaticFiles
 
 from app.api import (
     config,
+    debug,
     export,
     flight_status,
     geojson,
     gps,
     health,
+    jobs,
     metrics,
     pois,
     routes,
@@ -30,10 +32,16 @@ from app.mission import (
 )
 from app.satellites import routes as satellite_routes
 from app.core.config import ConfigManager
+from app.api.export.prometheus import close_prometheus_client
 from app.core.eta_service import initialize_eta_service, shutdown_eta_service
+from app.core.jobs import shutdown_job_manager
+from app.mission.exporter import preload_exporters
+from app.mission.package.render_pool import shutdown_export_render_pool
+from app.mission.timeline_pool import shutdown_timeline_worker_pool
 from app.core.logging import setup_logging, get_logger
 from app.core.metrics import set_service_info
 from app.live.coordinator import LiveCoordinator
+from app.replay.coordinator import ReplayCoordinator
 from app.simulation.coordinator import SimulationCoordinator
 from app.services.poi_manager import POIManager
 from app.services.route_manager import RouteManager
@@ -51,6 +59,14 @@ _background_updates_enabled = os.getenv(
     "STARLINK_DISABLE_BACKGROUND_TASKS", "0"
 ).lower() not in {"1", "true", "yes"}
 
+# Optional warm-up: import the export renderer (matplotlib, cartopy, pandas,
+# python-pptx) in a worker thread after startup instead of on the first export
+_export_preload_enabled = os.getenv("EXPORT_PRELOAD", "0").lower() in {
+    "1",
+    "true",
+    "yes",
+}
+
 setup_logging(level=log_level, json_format=json_logs, log_file=log_file)
 logger = get_logger(__name__)
 
@@ -59,11 +75,28 @@ _coordinator: SimulationCoordinator = None
 _background_task = None
 _simulation_config = None
 _route_manager: RouteManager = None
+_export_preload_task = None
+
+
+async def _preload_export_renderer():
+    """Import the export renderer off the event loop."""
+    try:
+        seconds = await asyncio.to_thread(preload_exporters)
+        logger.info_json(
+            "Export renderer preloaded",
+            extra_fields={"seconds": round(seconds, 3)},
+        )
+    except Exception as e:
+        logger.warning_json(
+            "Export renderer preload failed; exports will load it on first use",
+            extra_fields={"error": str(e)},
+        )
 
 
 async def startup_event():
     """Initialize application on startup."""
     global _coordinator, _background_task, _simulation_config, _route_manager
+    global _export_preload_task
 
     try:
         logger.info_json("Initializing Starlink Location Backend")
@@ -93,6 +126,12 @@ async def startup_event():
             set_service_info(version="0.2.0", mode="live")
             # Register Starlink client with GPS module for GPS config API
             gps.set_starlink_client(_coordinator.client)
+        elif _simulation_config.mode == "replay":
+            # Initialize ReplayCoordinator to play back recorded telemetry
+            logger.info_json("Initializing ReplayCoordinator for replay mode")
+            _coordinator = ReplayCoordinator(_simulation_config)
+            logger.info_json("ReplayCoordinator initialized successfully")
+            set_service_info(version="0.2.0", mode="replay")
         else:
             # Initialize SimulationCoordinator for simulation mode
             logger.info_json("Initializing SimulationCoordinator for simulation mode")
@@ -156,9 +195,12 @@ async def startup_event():
             # metrics_export.set_poi_manager(poi_manager)
 
             # Inject RouteManager into SimulationCoordinator (Phase 5 feature)
-            if isinstance(_coordinator, SimulationCoordinator):
+            # and ReplayCoordinator (route-aware ETAs for the recorded flight)
+            if isinstance(_coordinator, (SimulationCoordinator, ReplayCoordinator)):
                 _coordinator.set_route_manager(_route_manager)
-                logger.info_json("RouteManager injected into SimulationCoordinator")
+                logger.info_json(
+                    f"RouteManager injected into {type(_coordinator).__name__}"
+                )
 
             logger.info_json("Route Manager initialized successfully")
         except Exception as e:
@@ -234,11 +276,10 @@ async def startup_event():
             )
 
         # Log active mode prominently
-        mode_description = (
-            "Real Starlink terminal data"
-            if active_mode == "live"
-            else "Simulated telemetry"
-        )
+        mode_description = {
+            "live": "Real Starlink terminal data",
+            "replay": "Recorded telemetry replay",
+        }.get(active_mode, "Simulated telemetry")
         logger.info_json(
             f"Starlink Location Backend operating in {active_mode.upper()} mode",
             extra_fields={
@@ -256,6 +297,9 @@ async def startup_event():
                 "Background update task disabled via STARLINK_DISABLE_BACKGROUND_TASKS"
             )
 
+        if _export_preload_enabled:
+            _export_preload_task = asyncio.create_task(_preload_export_renderer())
+
         logger.info_json("Starlink Location Backend ready")
     except Exception as e:
         logger.error_json(
@@ -285,6 +329,19 @@ async def shutdown_event():
         logger.info_json("Shutting down ETA service")
         shutdown_eta_service()
 
+        # Cancel background jobs and stop timeline/export worker processes
+        shutdown_job_manager()
+        shutdown_timeline_worker_pool()
+        shutdown_export_render_pool()
+        await close_prometheus_client()
+
+        # Release the route directory watcher (one inotify instance per startup)
+        if _route_manager:
+            _route_manager.stop_watching()
+
+        if isinstance(_coordinator, ReplayCoordinator):
+            _coordinator.shutdown()
+
         logger.info_json("Shutdown complete")
     except Exception as e:
         logger.error_json(
@@ -296,16 +353,31 @@ async def _background_update_loop(poi_manager=None):
     """Background task that updates simulator every interval."""
     global _coordinator, _simulation_config
 
+    from app.core.metrics import (
+        stage_timer,
+        starlink_tick_lag_seconds,
+        starlink_tick_overruns_total,
+    )
+
     update_count = 0
     error_count = 0
+    # When the current tick was due to start (perf_counter seconds)
+    scheduled_start = None
 
     try:
         logger.info_json("Background update loop started")
 
         while True:
             try:
+                tick_start = time.perf_counter()
+                if scheduled_start is not None:
+                    starlink_tick_lag_seconds.observe(
+                        max(0.0, tick_start - scheduled_start)
+                    )
+
                 if _coordinator:
-                    telemetry = _coordinator.update()
+                    with stage_timer("coordinator_update"):
+                        telemetry = _coordinator.update()
                     update_count += 1
 
                     # Only update metrics if telemetry is available
@@ -377,8 +449,24 @@ async def _background_update_loop(poi_manager=None):
                                 },
                             )
 
-                # Sleep for configured update interval
-                await asyncio.sleep(_simulation_config.update_interval_seconds)
+                    # Mission gauges follow the plan, not the dish, so they
+                    # refresh even while disconnected
+                    from app.core.metrics import update_live_mission_metrics
+
+                    with stage_timer("mission_metrics"):
+                        update_live_mission_metrics()
+
+                # Sleep for configured update interval (shorter when a
+                # replay runs faster than real time)
+                interval = getattr(
+                    _coordinator,
+                    "tick_interval_seconds",
+                    _simulation_config.update_interval_seconds,
+                )
+                if time.perf_counter() - tick_start > interval:
+                    starlink_tick_overruns_total.inc()
+                scheduled_start = time.perf_counter() + interval
+                await asyncio.sleep(interval)
 
             except Exception as e:
                 error_count += 1
@@ -397,6 +485,7 @@ async def _background_update_loop(poi_manager=None):
                 simulation_errors_total.inc()
 
                 # Continue running on error with backoff
+                scheduled_start = time.perf_counter() + 1.0
                 await asyncio.sleep(1.0)
 
     except asyncio.CancelledError:
@@ -488,10 +577,12 @@ app.include_router(pois.router, tags=["POIs"])
 app.include_router(routes.router, tags=["Routes"])
 app.include_router(mission_routes.router, tags=["Missions"])
 app.include_router(mission_routes_v2.router, tags=["Missions V2"])
+app.include_router(jobs.router, tags=["Jobs"])
 app.include_router(satellite_routes.router, tags=["Satellites"])
 app.include_router(export.router, tags=["Export"])
 app.include_router(gps.router, tags=["GPS"])
 app.include_router(ui.router, tags=["UI"])
+app.include_router(debug.router, tags=["Debug"])
 
 
 @app.get("/")
@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import MagicMock
 
 os.environ.setdefault("STARLINK_DISABLE_BACKGROUND_TASKS", "1")
+os.environ.setdefault("EXPORT_IMAGE_CACHE_DIR", "/tmp/test_data/export_image_cache")
 
 # Ensure /data directories exist for RouteManager and Missions
 Path("/tmp/test_data/routes").mkdir(parents=True, exist_ok=True)
@@ -22,36 +23,18 @@ original_route_init = route_manager_module.RouteManager.__init__
 
 
 def patched_route_init(self, routes_dir="/tmp/test_data/routes"):
-    self.routes_dir = Path(routes_dir)
-    self.routes_dir.mkdir(parents=True, exist_ok=True)
-    self._routes = {}
-    self._active_route_id = None
-    self._observer = None
-    self._errors = {}
+    original_route_init(self, routes_dir)
 
 
 route_manager_module.RouteManager.__init__ = patched_route_init
 
 import app.services.poi_manager as poi_manager_module  # noqa: E402
-import json  # noqa: E402
 
 original_poi_init = poi_manager_module.POIManager.__init__
 
 
 def patched_poi_init(self, pois_file="/tmp/test_data/pois.json"):
-    self.pois_file = Path(pois_file)
-    self.pois_file.parent.mkdir(parents=True, exist_ok=True)
-    self.lock_file = str(self.pois_file) + ".lock"
-    self._pois = {}
-    self._logger = poi_manager_module.logger
-
-    # Ensure file exists with initial structure
-    if not self.pois_file.exists():
-        with open(self.pois_file, "w") as f:
-            json.dump({"pois": {}, "routes": {}}, f, indent=2)
-
-    # Call the original _load_pois to properly load from the file
-    self._load_pois()
+    original_poi_init(self, pois_file)
 
 
 poi_manager_module.POIManager.__init__ = patched_poi_init
@@ -233,10 +216,8 @@ def reset_prometheus_registry():
         from app.core import metrics
         from prometheus_client.core import Gauge
 
-        # Reset the custom position collector data
-        metrics._current_position["latitude"] = 0.0
-        metrics._current_position["longitude"] = 0.0
-        metrics._current_position["altitude"] = 0.0
+        # Reset the per-tick metrics snapshot (position, telemetry, POI ETAs)
+        metrics.reset_metrics_snapshot()
 
         # Get the registry and iterate through all collectors
         # Find all Gauge collectors and reset their values
@@ -286,15 +267,24 @@ def _clean_directory(directory: Path):
 def isolate_mission_storage():
     """Force mission storage to use a temp directory with full cleanup."""
     from app.mission import storage
+    from app.mission.exporter.image_cache import get_image_cache
+    from app.mission.timeline_builder.incremental import get_timeline_artifact_store
+    from app.mission.timeline_cache import get_timeline_cache
 
     original_dir = storage.MISSIONS_DIR
     storage.MISSIONS_DIR = TEST_MISSIONS_DIR
     storage.ensure_missions_directory()
     _clean_directory(TEST_MISSIONS_DIR)
+    get_timeline_cache().clear()
+    get_timeline_artifact_store().clear()
+    get_image_cache().clear()
 
     yield
 
     _clean_directory(TEST_MISSIONS_DIR)
+    get_timeline_cache().clear()
+    get_timeline_artifact_store().clear()
+    get_image_cache().clear()
     storage.MISSIONS_DIR = original_dir
 
 
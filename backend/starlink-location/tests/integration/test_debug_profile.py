@@ -0,0 +1,36 @@
+"""Integration tests for the live profiling endpoint."""
+
+import pytest
+
+
+@pytest.fixture
+def profile_enabled(monkeypatch):
+    """Turn on the profiling endpoint, which is off by default."""
+    monkeypatch.setattr("app.api.debug.PROFILE_ENDPOINT_ENABLED", True)
+
+
+def test_profile_disabled_by_default(client):
+    response = client.get("/api/debug/profile", params={"seconds": 0.1})
+
+    assert response.status_code == 404
+
+
+def test_profile_returns_collapsed_stacks(client, profile_enabled):
+    response = client.get(
+        "/api/debug/profile",
+        params={"seconds": 0.2, "interval_ms": 5, "include_idle": True},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert int(response.headers["X-Profile-Samples"]) > 0
+    for line in response.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack
+        assert int(count) > 0
+
+
+def test_profile_duration_is_bounded(client, profile_enabled):
+    response = client.get("/api/debug/profile", params={"seconds": 3600})
+
+    assert response.status_code == 422
@@ -0,0 +1,143 @@
+"""Integration tests for background mission export/import jobs."""
+
+import io
+import time
+import zipfile
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from app.mission.models import Mission
+from main import app
+
+
+def _wait_for_job(client: TestClient, job_id: str, timeout: float = 10.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/v2/jobs/{job_id}").json()
+        if job["status"] in ("succeeded", "failed", "cancelled"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Share one app instance across the module (startup is comparatively costly)."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def mission(client: TestClient):
+    mission = Mission(id=f"job-mission-{uuid4().hex[:8]}", name="Job Mission", legs=[])
+    response = client.post("/api/v2/missions", json=mission.model_dump(mode="json"))
+    assert response.status_code == 201
+    return mission
+
+
+class TestExportJobs:
+    """POST /api/v2/missions/{id}/export/jobs and the job endpoints."""
+
+    def test_export_job_reports_progress_and_serves_zip(
+        self, client: TestClient, mission
+    ):
+        def fake_export(mission_id, route_manager, poi_manager, progress=None):
+            progress(0.5, "Exporting leg 1 of 1")
+            return io.BytesIO(b"PK-fake-zip")
+
+        with patch(
+            "app.mission.routes_v2.export_mission_package", side_effect=fake_export
+        ):
+            response = client.post(f"/api/v2/missions/{mission.id}/export/jobs")
+            assert response.status_code == 202
+            job = _wait_for_job(client, response.json()["job_id"])
+
+        assert job["status"] == "succeeded"
+        assert job["kind"] == "mission_export"
+        assert job["metadata"] == {"mission_id": mission.id}
+        assert "Exporting leg 1 of 1" in [event["message"] for event in job["events"]]
+
+        result = client.get(f"/api/v2/jobs/{job['job_id']}/result")
+        assert result.status_code == 200
+        assert result.headers["content-type"] == "application/zip"
+        assert result.content == b"PK-fake-zip"
+
+    def test_export_job_for_unknown_mission_returns_404(self, client: TestClient):
+        response = client.post("/api/v2/missions/does-not-exist/export/jobs")
+        assert response.status_code == 404
+
+    def test_failed_job_result_returns_conflict(self, client: TestClient, mission):
+        with patch(
+            "app.mission.routes_v2.export_mission_package",
+            side_effect=RuntimeError("renderer crashed"),
+        ):
+            response = client.post(f"/api/v2/missions/{mission.id}/export/jobs")
+            job = _wait_for_job(client, response.json()["job_id"])
+
+        assert job["status"] == "failed"
+        assert "renderer crashed" in job["error"]
+        result = client.get(f"/api/v2/jobs/{job['job_id']}/result")
+        assert result.status_code == 409
+        assert client.delete(f"/api/v2/jobs/{job['job_id']}").status_code == 409
+
+    def test_unknown_job_returns_404(self, client: TestClient):
+        assert client.get("/api/v2/jobs/missing").status_code == 404
+        assert client.delete("/api/v2/jobs/missing").status_code == 404
+
+
+class TestImportJobs:
+    """POST /api/v2/missions/import/jobs."""
+
+    def test_import_job_returns_import_result(self, client: TestClient):
+        mission = Mission(id=f"imported-{uuid4().hex[:8]}", name="Imported", legs=[])
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("mission.json", mission.model_dump_json())
+
+        response = client.post(
+            "/api/v2/missions/import/jobs",
+            files={"file": ("mission.zip", buffer.getvalue(), "application/zip")},
+        )
+        assert response.status_code == 202
+        job = _wait_for_job(client, response.json()["job_id"])
+
+        assert job["status"] == "succeeded"
+        assert job["counters"]["legs"] == 0
+        assert job["metadata"]["size_bytes"] == len(buffer.getvalue())
+        result = client.get(f"/api/v2/jobs/{job['job_id']}/result").json()
+        assert result["mission_id"] == mission.id
+        assert client.get(f"/api/v2/missions/{mission.id}").status_code == 200
+
+        timeline_job = _wait_for_job(client, result["timeline_job_id"])
+        assert timeline_job["kind"] == "mission_timelines"
+        assert timeline_job["status"] == "succeeded"
+
+    def test_import_job_with_mismatched_manifest_fails(self, client: TestClient):
+        mission = Mission(id=f"imported-{uuid4().hex[:8]}", name="Imported", legs=[])
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("mission.json", mission.model_dump_json())
+            zf.writestr("manifest.json", '{"mission_id": "someone-else"}')
+
+        response = client.post(
+            "/api/v2/missions/import/jobs",
+            files={"file": ("mission.zip", buffer.getvalue(), "application/zip")},
+        )
+        job = _wait_for_job(client, response.json()["job_id"])
+
+        assert job["status"] == "failed"
+        assert "Manifest is for mission someone-else" in job["error"]
+        assert client.get(f"/api/v2/missions/{mission.id}").status_code == 404
+
+    def test_import_job_with_invalid_zip_fails(self, client: TestClient):
+        response = client.post(
+            "/api/v2/missions/import/jobs",
+            files={"file": ("mission.zip", b"not a zip", "application/zip")},
+        )
+        job = _wait_for_job(client, response.json()["job_id"])
+
+        assert job["status"] == "failed"
+        assert "Invalid zip file" in job["error"]
@@ -0,0 +1,114 @@
+"""Synthetic-load benchmark harness.
+
+Generates large synthetic inputs (50k-point KML routes, 10k POIs, a 20-leg
+mission, dense Ka coverage polygons) and measures p50/p99 latency and peak
+RSS of the hot paths: one background tick, one /metrics scrape, POI CRUD at
+scale, build_mission_timeline and export_mission_package. Everything runs
+offline; each scenario runs in a fresh process.
+
+Usage (from backend/starlink-location):
+    # Record a baseline
+    python -m tests.performance.synthetic_load --output baseline.json
+
+    # Compare a later run, failing on >20% regressions
+    python -m tests.performance.synthetic_load --compare baseline.json
+
+    # Quick run of two scenarios at reduced size
+    python -m tests.performance.synthetic_load --scale smoke -s tick -s scrape
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+from pathlib import Path
+
+from tests.performance.synthetic_load.runner import (
+    compare,
+    format_results,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+from tests.performance.synthetic_load.scenarios import SCALES, SCENARIOS
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the harness; exit status 1 when a regression is found."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.performance.synthetic_load",
+        description="Benchmark hot paths against synthetic large inputs.",
+    )
+    parser.add_argument("--scale", choices=sorted(SCALES), default="full")
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Scenario to run (repeatable; default: all)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    for field in ("route_points", "poi_count", "leg_count", "iterations"):
+        parser.add_argument(
+            f"--{field.replace('_', '-')}",
+            type=int,
+            dest=field,
+            help=f"Override the scale's {field}",
+        )
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--compare", type=Path, help="Baseline results JSON")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression (default: 0.2 = 20%%)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run scenarios in this process (faster, but RSS is cumulative)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_results(args.compare) if args.compare else None
+    overrides = {
+        field: getattr(args, field)
+        for field in ("route_points", "poi_count", "leg_count", "iterations")
+        if getattr(args, field) is not None
+    }
+    scale = dataclasses.replace(SCALES[args.scale], **overrides)
+
+    # Keep exports in the measured process and out of the live data directory
+    os.environ.setdefault("EXPORT_WORKERS", "1")
+    os.environ.setdefault("STARLINK_DISABLE_BACKGROUND_TASKS", "1")
+
+    document = run_benchmarks(
+        args.scenario or list(SCENARIOS),
+        scale,
+        seed=args.seed,
+        isolated=not args.in_process,
+    )
+    print(format_results(document, baseline))
+    if args.output:
+        write_results(document, args.output)
+        print(f"\nResults written to {args.output}")
+
+    if baseline is None:
+        return 0
+    regressions = compare(document, baseline, threshold=args.threshold)
+    for regression in regressions:
+        if regression.metric == "failed":
+            print(f"REGRESSION {regression.series} failed (passed in baseline)")
+            continue
+        print(
+            f"REGRESSION {regression.series} {regression.metric}: "
+            f"{regression.baseline:g} -> {regression.current:g} "
+            f"({regression.change:+.1%})"
+        )
+    if not regressions:
+        print(f"\nNo regressions above {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""Seeded generators for large synthetic inputs.
+
+Everything is generated locally from a seed, so two runs with the same scale
+and seed build byte-identical routes, POIs, missions and coverage files.
+"""
+
+import json
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from app.mission.models import Mission, MissionLeg, TransportConfig, XTransition
+from app.models.poi import POICreate
+
+FIRST_DEPARTURE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+LEG_DURATION = timedelta(hours=6)
+LEG_SPACING = timedelta(hours=8)
+# Timed waypoints per route (departure and arrival included)
+ROUTE_WAYPOINTS = 20
+KA_SATELLITES = ("AOR", "POR", "IOR")
+
+
+def route_endpoints(leg_index: int) -> tuple[tuple[float, float], tuple[float, float]]:
+    """(lat, lon) of the departure and arrival of a synthetic leg."""
+    start = (30.0 + (leg_index % 5) * 2.0, -125.0 + (leg_index % 4) * 3.0)
+    end = (start[0] + 12.0, start[1] + 45.0)
+    return start, end
+
+
+def _route_coordinates(
+    point_count: int, leg_index: int, rng: random.Random
+) -> list[tuple[float, float]]:
+    (lat0, lon0), (lat1, lon1) = route_endpoints(leg_index)
+    coords = []
+    for i in range(point_count):
+        f = i / (point_count - 1)
+        # Gentle weave so the track crosses coverage edges more than once
+        weave = 1.5 * math.sin(f * math.pi * 6)
+        lat = lat0 + (lat1 - lat0) * f + weave + rng.uniform(-0.002, 0.002)
+        lon = lon0 + (lon1 - lon0) * f + rng.uniform(-0.002, 0.002)
+        coords.append((lat, lon))
+    coords[0], coords[-1] = (lat0, lon0), (lat1, lon1)
+    return coords
+
+
+def _airport_codes(leg_index: int) -> tuple[str, str]:
+    # Route timing needs letter-only codes in the name ("Flight Plan DAA-RAA")
+    suffix = chr(65 + leg_index // 26 % 26) + chr(65 + leg_index % 26)
+    return f"D{suffix}", f"R{suffix}"
+
+
+def _waypoint_placemark(name: str, lat: float, lon: float, when: datetime) -> str:
+    stamp = when.strftime("%Y-%m-%d %H:%M:%S")
+    return (
+        "<Placemark>"
+        f"<name>{escape(name)}</name>"
+        f"<description>{escape(name)}\n Time Over Waypoint: {stamp}Z</description>"
+        "<styleUrl>#destWaypointIcon</styleUrl>"
+        f"<Point><coordinates>{lon:.6f},{lat:.6f}</coordinates></Point>"
+        "</Placemark>"
+    )
+
+
+def synthetic_route_kml(point_count: int, leg_index: int = 0, seed: int = 0) -> str:
+    """
+    KML flight plan with one long track and timed waypoints.
+
+    Args:
+        point_count: Coordinates in the route track
+        leg_index: Leg number (varies the geography and departure time)
+        seed: Random seed for the track jitter
+
+    Returns:
+        KML document text, parseable by parse_kml_file
+    """
+    rng = random.Random(seed * 1000 + leg_index)
+    coords = _route_coordinates(max(point_count, 2), leg_index, rng)
+    departure_code, arrival_code = _airport_codes(leg_index)
+    departure = FIRST_DEPARTURE + leg_index * LEG_SPACING
+
+    placemarks = []
+    step = (len(coords) - 1) / (ROUTE_WAYPOINTS - 1)
+    for n in range(ROUTE_WAYPOINTS):
+        index = round(n * step)
+        if n == 0:
+            name = departure_code
+        elif n == ROUTE_WAYPOINTS - 1:
+            name = arrival_code
+        else:
+            name = f"WP{n:02d}"
+        when = departure + LEG_DURATION * (index / (len(coords) - 1))
+        placemarks.append(_waypoint_placemark(name, *coords[index], when))
+
+    track = "\n".join(f"{lon:.6f},{lat:.6f}" for lat, lon in coords)
+    placemarks.append(
+        "<Placemark><name>Route</name>"
+        "<Style><LineStyle><color>ffddad05</color></LineStyle></Style><LineString>"
+        f"<coordinates>{track}</coordinates>"
+        "</LineString></Placemark>"
+    )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+        f"<name>Flight Plan {departure_code}-{arrival_code}</name>"
+        '<Style id="destWaypointIcon"><IconStyle><scale>0.75</scale></IconStyle>'
+        "</Style>" + "".join(placemarks) + "</Document></kml>\n"
+    )
+
+
+def write_synthetic_routes(
+    routes_dir: Path, leg_count: int, point_count: int, seed: int = 0
+) -> list[str]:
+    """Write one KML per leg and return the route IDs (file stems)."""
+    routes_dir.mkdir(parents=True, exist_ok=True)
+    route_ids = []
+    for leg_index in range(leg_count):
+        route_id = f"synthetic-leg-{leg_index:02d}"
+        (routes_dir / f"{route_id}.kml").write_text(
+            synthetic_route_kml(point_count, leg_index, seed), encoding="utf-8"
+        )
+        route_ids.append(route_id)
+    return route_ids
+
+
+def synthetic_pois(count: int, seed: int = 0) -> list[POICreate]:
+    """Global POIs scattered over the region the synthetic legs fly through."""
+    rng = random.Random(seed)
+    categories = ("airport", "waypoint", "landmark", "fuel", "")
+    return [
+        POICreate(
+            name=f"Synthetic POI {i:05d}",
+            latitude=rng.uniform(25.0, 55.0),
+            longitude=rng.uniform(-130.0, -70.0),
+            category=categories[i % len(categories)] or None,
+        )
+        for i in range(count)
+    ]
+
+
+def _polygon_ring(
+    center: tuple[float, float], radius: float, vertices: int, rng: random.Random
+) -> list[list[float]]:
+    ring = []
+    for i in range(vertices):
+        angle = 2 * math.pi * i / vertices
+        r = radius * (1 + rng.uniform(-0.02, 0.02))
+        lat = max(-89.0, min(89.0, center[0] + r * math.sin(angle)))
+        ring.append([center[1] + r * math.cos(angle), lat])
+    ring.append(ring[0])
+    return ring
+
+
+def synthetic_coverage_geojson(vertices: int, seed: int = 0) -> dict:
+    """
+    Ka coverage with a dense polygon per satellite.
+
+    AOR and POR overlap along the synthetic routes, so tracks enter and leave
+    coverage several times; IOR lies elsewhere and is never entered.
+
+    Args:
+        vertices: Vertices per coverage polygon
+        seed: Random seed for the edge jitter
+
+    Returns:
+        GeoJSON FeatureCollection in the CommKa layout
+    """
+    rng = random.Random(seed)
+    centers = {
+        "AOR": ((38.0, -75.0), 22.0),
+        "POR": ((38.0, -125.0), 24.0),
+        "IOR": ((-10.0, 75.0), 30.0),
+    }
+    features = []
+    for satellite_id in KA_SATELLITES:
+        center, radius = centers[satellite_id]
+        features.append(
+            {
+                "type": "Feature",
+                "properties": {
+                    "satellite_id": satellite_id,
+                    "coverage_region": satellite_id,
+                },
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [_polygon_ring(center, radius, vertices, rng)],
+                },
+            }
+        )
+    return {"type": "FeatureCollection", "features": features}
+
+
+def write_synthetic_coverage(path: Path, vertices: int, seed: int = 0) -> Path:
+    """Write synthetic coverage GeoJSON and return its path."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(synthetic_coverage_geojson(vertices, seed)))
+    return path
+
+
+def synthetic_leg(leg_id: str, route_id: str, leg_index: int) -> MissionLeg:
+    """Mission leg with X transitions part way along its route."""
+    (lat0, lon0), (lat1, lon1) = route_endpoints(leg_index)
+    transitions = [
+        XTransition(
+            id=f"{leg_id}-x{n}",
+            latitude=lat0 + (lat1 - lat0) * f,
+            longitude=lon0 + (lon1 - lon0) * f,
+            target_satellite_id="X-1",
+        )
+        for n, f in enumerate((0.33, 0.66))
+    ]
+    return MissionLeg(
+        id=leg_id,
+        name=f"Synthetic Leg {leg_index:02d}",
+        route_id=route_id,
+        transports=TransportConfig(
+            initial_x_satellite_id="X-1",
+            initial_ka_satellite_ids=list(KA_SATELLITES),
+            x_transitions=transitions,
+        ),
+    )
+
+
+def synthetic_mission(mission_id: str, route_ids: list[str]) -> Mission:
+    """Mission with one leg per route."""
+    return Mission(
+        id=mission_id,
+        name="Synthetic Load Mission",
+        legs=[
+            synthetic_leg(f"{mission_id}-leg-{index:02d}", route_id, index)
+            for index, route_id in enumerate(route_ids)
+        ],
+    )
@@ -0,0 +1,248 @@
+"""Run scenarios, summarize them and compare against a baseline."""
+
+import contextlib
+import json
+import logging
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+from tests.performance.synthetic_load.scenarios import (
+    SCENARIOS,
+    LoadScale,
+    Workload,
+)
+
+logger = logging.getLogger(__name__)
+
+RESULTS_SCHEMA = 1
+# Metrics checked by compare(); lower is better for all of them
+COMPARED_METRICS = ("p50_ms", "p99_ms", "peak_rss_mb")
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Linear-interpolated percentile of ``samples`` (q in 0-100)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return math.nan
+    rank = (len(ordered) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS; export workers count too
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return peak / divisor
+
+
+def run_scenario(name: str, scale: LoadScale, seed: int = 0) -> dict:
+    """
+    Run one scenario in the current process.
+
+    Args:
+        name: Scenario name (key of SCENARIOS)
+        scale: Input sizes and iteration counts
+        seed: Seed for the synthetic inputs
+
+    Returns:
+        Summary per series: sample count, p50/p99/mean/max in milliseconds
+        and the process peak RSS in MiB
+    """
+    scenario = SCENARIOS[name]
+    with tempfile.TemporaryDirectory(prefix=f"synthetic-load-{name}-") as scratch:
+        with contextlib.chdir(scratch):
+            workload = Workload(
+                scale, Path(scratch), seed, scenario.legs or scale.leg_count
+            )
+            samples = scenario.run(workload)
+
+    peak_rss_mb = round(_peak_rss_mb(), 1)
+    return {
+        series: {
+            "samples": len(durations),
+            "p50_ms": round(percentile(durations, 50) * 1000, 3),
+            "p99_ms": round(percentile(durations, 99) * 1000, 3),
+            "mean_ms": round(sum(durations) / len(durations) * 1000, 3),
+            "max_ms": round(max(durations) * 1000, 3),
+            "peak_rss_mb": peak_rss_mb,
+        }
+        for series, durations in samples.items()
+        if durations
+    }
+
+
+def _isolated_scenario(name: str, scale: LoadScale, seed: int) -> dict:
+    logging.basicConfig(level=logging.WARNING, force=True)
+    return run_scenario(name, scale, seed)
+
+
+def run_benchmarks(
+    scenarios: Iterable[str],
+    scale: LoadScale,
+    seed: int = 0,
+    isolated: bool = True,
+) -> dict:
+    """
+    Run scenarios and collect a results document.
+
+    Args:
+        scenarios: Scenario names, run in order
+        scale: Input sizes and iteration counts
+        seed: Seed for the synthetic inputs
+        isolated: Run each scenario in a fresh spawned process, so peak RSS
+            and warm caches do not leak between scenarios
+
+    Returns:
+        Results document (see write_results). Scenarios that raise or whose
+        process dies (e.g. out of memory) are listed under "failed".
+    """
+    results: dict[str, dict] = {}
+    failed: dict[str, str] = {}
+    for name in scenarios:
+        try:
+            if isolated:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    summary = pool.submit(
+                        _isolated_scenario, name, scale, seed
+                    ).result()
+            else:
+                summary = run_scenario(name, scale, seed)
+        except BrokenProcessPool:
+            failed[name] = "benchmark process died (out of memory?)"
+        except Exception as e:
+            failed[name] = f"{type(e).__name__}: {e}"
+        else:
+            results.update(summary)
+            continue
+        logger.error(f"Scenario {name} failed: {failed[name]}")
+
+    return {
+        "schema": RESULTS_SCHEMA,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "scale": asdict(scale),
+        "seed": seed,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+        "failed": failed,
+    }
+
+
+def write_results(document: dict, path: Path) -> None:
+    """Write a results document as JSON (usable as a later baseline)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+def load_results(path: Path) -> dict:
+    """Read a results document written by write_results."""
+    document = json.loads(path.read_text())
+    if document.get("schema") != RESULTS_SCHEMA:
+        raise ValueError(f"{path} has unsupported schema {document.get('schema')}")
+    return document
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that got worse than the baseline allows."""
+
+    series: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change (0.25 = 25% worse)."""
+        return self.current / self.baseline - 1 if self.baseline else math.inf
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    threshold: float = 0.2,
+    min_delta_ms: float = 0.5,
+) -> list[Regression]:
+    """
+    Flag metrics that regressed by more than ``threshold``.
+
+    Series missing from either document are skipped, except that a scenario
+    that failed now but not in the baseline is a regression of its own
+    (metric "failed"). Latency changes smaller than ``min_delta_ms`` are
+    ignored as timer noise.
+
+    Args:
+        current: Results document of this run
+        baseline: Results document to compare against
+        threshold: Allowed relative increase (0.2 = 20%)
+        min_delta_ms: Smallest absolute latency increase that can regress
+
+    Returns:
+        Regressions, in series order
+
+    Raises:
+        ValueError: If the documents were produced at different scales
+    """
+    if current["scale"] != baseline["scale"]:
+        raise ValueError(
+            f"Baseline scale {baseline['scale']['name']} does not match "
+            f"{current['scale']['name']}"
+        )
+
+    regressions = [
+        Regression(name, "failed", 0, 1)
+        for name in sorted(current.get("failed", {}))
+        if name not in baseline.get("failed", {})
+    ]
+    for series in sorted(current["results"]):
+        before: Optional[dict] = baseline["results"].get(series)
+        if before is None:
+            continue
+        after = current["results"][series]
+        for metric in COMPARED_METRICS:
+            old, new = before[metric], after[metric]
+            if metric.endswith("_ms") and new - old < min_delta_ms:
+                continue
+            if new > old * (1 + threshold):
+                regressions.append(Regression(series, metric, old, new))
+    return regressions
+
+
+def format_results(document: dict, baseline: Optional[dict] = None) -> str:
+    """Human-readable results table, with baseline values when given."""
+    lines = [
+        f"{'series':<14}{'n':>5}{'p50 ms':>12}{'p99 ms':>12}{'peak MiB':>11}"
+        + ("   p50 vs baseline" if baseline else "")
+    ]
+    for series, row in sorted(document["results"].items()):
+        line = (
+            f"{series:<14}{row['samples']:>5}{row['p50_ms']:>12.3f}"
+            f"{row['p99_ms']:>12.3f}{row['peak_rss_mb']:>11.1f}"
+        )
+        before = (baseline or {}).get("results", {}).get(series)
+        if before and before["p50_ms"]:
+            line += f"   {row['p50_ms'] / before['p50_ms'] - 1:+.1%}"
+        lines.append(line)
+    for name, reason in sorted(document.get("failed", {}).items()):
+        lines.append(f"{name:<14}FAILED: {reason}")
+    return "\n".join(lines)
@@ -0,0 +1,264 @@
+"""Benchmark scenarios over a synthetic workload.
+
+A scenario builds the part of the workload it needs, warms up, then returns
+per-operation latency samples (seconds) keyed by series name. Scenarios run
+with the current directory set to a scratch directory, so the app's
+relative ``data/`` paths (missions, timelines, image cache) land there.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from app.models.config import SimulationConfig
+from app.models.poi import POICreate, POIUpdate
+from app.services.poi_manager import POIManager
+from app.services.route_manager import RouteManager
+
+from tests.performance.synthetic_load.generators import (
+    synthetic_mission,
+    synthetic_pois,
+    write_synthetic_coverage,
+    write_synthetic_routes,
+)
+
+logger = logging.getLogger(__name__)
+
+Samples = dict[str, list[float]]
+
+
+@dataclass(frozen=True)
+class LoadScale:
+    """Size of the synthetic inputs and how often each operation runs."""
+
+    name: str
+    route_points: int
+    poi_count: int
+    leg_count: int
+    coverage_vertices: int
+    iterations: int
+    export_iterations: int
+    warmup: int = 2
+
+
+SCALES = {
+    "full": LoadScale(
+        name="full",
+        route_points=50_000,
+        poi_count=10_000,
+        leg_count=20,
+        coverage_vertices=5_000,
+        iterations=30,
+        export_iterations=3,
+    ),
+    "smoke": LoadScale(
+        name="smoke",
+        route_points=500,
+        poi_count=50,
+        leg_count=2,
+        coverage_vertices=100,
+        iterations=3,
+        export_iterations=1,
+        warmup=1,
+    ),
+}
+
+
+class Workload:
+    """Managers loaded with synthetic routes and POIs."""
+
+    def __init__(self, scale: LoadScale, root: Path, seed: int, leg_count: int):
+        self.scale = scale
+        self.root = root
+        self.route_ids = write_synthetic_routes(
+            root / "routes", leg_count, scale.route_points, seed
+        )
+        self.route_manager = RouteManager(root / "routes")
+        self.route_manager.reload_all_routes()
+
+        self.poi_manager = POIManager(root / "pois.json")
+        with self.poi_manager.batch():
+            for poi in synthetic_pois(scale.poi_count, seed):
+                self.poi_manager.create_poi(poi)
+
+        self.coverage_path = write_synthetic_coverage(
+            root / "coverage.geojson", scale.coverage_vertices, seed
+        )
+        self.mission = synthetic_mission("synthetic-load", self.route_ids)
+
+
+def _measure(operation: Callable[[], object], count: int) -> list[float]:
+    durations = []
+    for _ in range(count):
+        start = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _start_flight(workload: Workload, config: SimulationConfig):
+    """Coordinator following the first route, as the background loop runs it."""
+    from app.core.eta_service import initialize_eta_service
+    from app.simulation.coordinator import SimulationCoordinator
+
+    initialize_eta_service(workload.poi_manager)
+    workload.route_manager.activate_route(workload.route_ids[0])
+    coordinator = SimulationCoordinator(config)
+    coordinator.set_route_manager(workload.route_manager)
+    return coordinator
+
+
+def _tick_operation(workload: Workload) -> Callable[[], None]:
+    from app.core.metrics import update_live_mission_metrics
+    from app.core.metrics import update_metrics_from_telemetry
+
+    config = SimulationConfig()
+    coordinator = _start_flight(workload, config)
+
+    def tick() -> None:
+        telemetry = coordinator.update()
+        update_metrics_from_telemetry(
+            telemetry,
+            config,
+            workload.route_manager.get_active_route(),
+            workload.poi_manager,
+        )
+        update_live_mission_metrics()
+
+    return tick
+
+
+def run_tick(workload: Workload) -> Samples:
+    """One background update tick with every POI and the active route."""
+    tick = _tick_operation(workload)
+    _measure(tick, workload.scale.warmup)
+    return {"tick": _measure(tick, workload.scale.iterations)}
+
+
+def run_scrape(workload: Workload) -> Samples:
+    """One /metrics scrape after a tick has populated the registry."""
+    from app.api import metrics as metrics_api
+
+    _tick_operation(workload)()
+    loop = asyncio.new_event_loop()
+    try:
+
+        def scrape() -> None:
+            loop.run_until_complete(
+                metrics_api.metrics(
+                    route_manager=workload.route_manager,
+                    poi_manager=workload.poi_manager,
+                )
+            )
+
+        _measure(scrape, workload.scale.warmup)
+        return {"scrape": _measure(scrape, workload.scale.iterations)}
+    finally:
+        loop.close()
+
+
+def run_poi_crud(workload: Workload) -> Samples:
+    """Create, update and delete one POI next to all the others."""
+    manager = workload.poi_manager
+    samples: Samples = {"poi_create": [], "poi_update": [], "poi_delete": []}
+    for i in range(workload.scale.iterations):
+        start = time.perf_counter()
+        poi = manager.create_poi(
+            POICreate(name=f"Bench POI {i}", latitude=40.0, longitude=-100.0)
+        )
+        samples["poi_create"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        manager.update_poi(poi.id, POIUpdate(name=f"Bench POI {i} (moved)"))
+        samples["poi_update"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        manager.delete_poi(poi.id)
+        samples["poi_delete"].append(time.perf_counter() - start)
+    return samples
+
+
+def _build_leg(workload: Workload, leg, sampler, suffix: str = ""):
+    from app.mission.timeline_service import build_mission_timeline
+
+    if suffix:
+        # A fresh ID misses the timeline artifact store, so the build is cold
+        leg = leg.model_copy(update={"id": f"{leg.id}-{suffix}"})
+    return build_mission_timeline(
+        mission=leg,
+        route_manager=workload.route_manager,
+        poi_manager=workload.poi_manager,
+        coverage_sampler=sampler,
+        parent_mission_id=workload.mission.id,
+    )
+
+
+def run_timeline(workload: Workload) -> Samples:
+    """Cold build_mission_timeline for every leg of the mission."""
+    from app.satellites.coverage import CoverageSampler
+
+    sampler = CoverageSampler(workload.coverage_path)
+    legs = workload.mission.legs
+    for n in range(workload.scale.warmup):
+        _build_leg(workload, legs[0], sampler, suffix=f"warmup{n}")
+    durations = []
+    for leg in legs:
+        start = time.perf_counter()
+        _build_leg(workload, leg, sampler, suffix="bench")
+        durations.append(time.perf_counter() - start)
+    return {"timeline": durations}
+
+
+def _flat_basemap(style, west, east, south, north, width_px, height_px):
+    # Natural Earth layers would need a download; a flat background keeps the
+    # export offline while still exercising tiling, drawing and encoding
+    return np.full((height_px, width_px, 3), 235, dtype=np.uint8)
+
+
+def run_export(workload: Workload) -> Samples:
+    """export_mission_package for the whole mission, image cache cleared."""
+    from app.mission import storage
+    from app.mission.exporter import basemap
+    from app.mission.exporter.image_cache import get_image_cache
+    from app.mission.package.__main__ import export_mission_package
+    from app.satellites.coverage import CoverageSampler
+
+    basemap._basemap_cache = basemap.BasemapTileCache(
+        tile_dir=None, renderer=_flat_basemap
+    )
+    storage.save_mission_v2(workload.mission)
+    sampler = CoverageSampler(workload.coverage_path)
+    for leg in workload.mission.legs:
+        timeline, _ = _build_leg(workload, leg, sampler)
+        storage.save_mission_timeline(leg.id, timeline)
+
+    def export() -> None:
+        get_image_cache().clear()
+        package = export_mission_package(
+            workload.mission.id, workload.route_manager, workload.poi_manager
+        )
+        package.close()
+
+    return {"export": _measure(export, workload.scale.export_iterations)}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A benchmark and how many synthetic legs its workload needs."""
+
+    run: Callable[[Workload], Samples]
+    legs: Optional[int] = None  # None = scale.leg_count
+
+
+SCENARIOS = {
+    "tick": Scenario(run_tick, legs=1),
+    "scrape": Scenario(run_scrape, legs=1),
+    "poi_crud": Scenario(run_poi_crud, legs=1),
+    "timeline": Scenario(run_timeline),
+    "export": Scenario(run_export),
+}
@@ -0,0 +1,83 @@
+"""Import-time budget for the service entry point.
+
+Imports ``main`` in a fresh interpreter and checks that startup leaves the
+export renderer (matplotlib, cartopy, pandas, python-pptx, openpyxl)
+unloaded and stays within an import time and RSS budget. The budgets are
+loose enough for a slow CI machine; loading the renderer at startup roughly
+doubles both.
+
+Run with:
+    pytest tests/performance/test_import_budget.py -v -s
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "2.0"))
+RSS_BUDGET_MB = float(os.getenv("IMPORT_RSS_BUDGET_MB", "130"))
+
+HEAVY_MODULES = ["matplotlib", "cartopy", "pandas", "pptx", "openpyxl"]
+
+_PROBE = """
+import json, sys, time
+import psutil
+start = time.perf_counter()
+import main
+seconds = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+rss_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+after_import = {{"seconds": seconds, "heavy": heavy, "rss_mb": rss_mb}}
+
+from app.mission.exporter import exporters_loaded, preload_exporters
+after_import["loaded_before_preload"] = exporters_loaded()
+preload_exporters()
+after_import["loaded_after_preload"] = exporters_loaded()
+print(json.dumps(after_import))
+"""
+
+
+@pytest.fixture(scope="module")
+def startup_profile():
+    """Import main in a clean interpreter and report what it cost."""
+    env = dict(os.environ, STARLINK_DISABLE_BACKGROUND_TASKS="1")
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(heavy=HEAVY_MODULES)],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+    )
+    profile = json.loads(result.stdout.strip().splitlines()[-1])
+    print(
+        f"\nimport main: {profile['seconds']:.2f}s, " f"RSS {profile['rss_mb']:.0f} MB"
+    )
+    return profile
+
+
+def test_startup_does_not_import_export_renderer(startup_profile):
+    """Plotting and document libraries load on first export, not at startup."""
+    assert startup_profile["heavy"] == []
+    assert startup_profile["loaded_before_preload"] is False
+
+
+def test_preload_imports_export_renderer(startup_profile):
+    """The warm-up hook loads the renderer ahead of the first export."""
+    assert startup_profile["loaded_after_preload"] is True
+
+
+def test_startup_import_time_under_budget(startup_profile):
+    """Importing main stays under the startup time budget."""
+    assert startup_profile["seconds"] < IMPORT_BUDGET_SECONDS
+
+
+def test_startup_rss_under_budget(startup_profile):
+    """Baseline RSS after importing main stays under the memory budget."""
+    assert startup_profile["rss_mb"] < RSS_BUDGET_MB
@@ -0,0 +1,73 @@
+"""Microbenchmark for the streaming kinematics estimators.
+
+Feeds 10 Hz updates through windows from 2 minutes to 200 minutes long and
+checks that the per-update cost stays flat as the window grows (the deque
+re-sum it replaced grew linearly with the window).
+
+Run with:
+    pytest tests/performance/test_kinematics_benchmark.py -v -s
+"""
+
+import time
+
+from app.services.eta.calculator import ETACalculator
+from app.services.speed_tracker import SpeedTracker
+
+UPDATE_HZ = 10
+WINDOW_SECONDS = (120.0, 1200.0, 12000.0)
+MEASURED_UPDATES = 5000
+# Largest allowed per-update cost ratio between the longest and shortest window
+MAX_COST_RATIO = 3.0
+
+
+def _per_update_seconds(update, window_seconds: float) -> float:
+    """Best-of-three per-update cost once the window is full."""
+    interval = 1.0 / UPDATE_HZ
+    warmup = int(window_seconds * UPDATE_HZ)
+    for index in range(warmup):
+        update(index, index * interval)
+
+    best = float("inf")
+    step = warmup
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(MEASURED_UPDATES):
+            update(step, step * interval)
+            step += 1
+        best = min(best, (time.perf_counter() - start) / MEASURED_UPDATES)
+    return best
+
+
+def _speed_smoothing(window_seconds: float):
+    calculator = ETACalculator(smoothing_duration_seconds=window_seconds)
+    return lambda step, timestamp: calculator.update_speed(
+        300.0 + step % 7, timestamp=timestamp
+    )
+
+
+def _gps_speed(window_seconds: float):
+    tracker = SpeedTracker(smoothing_duration_seconds=window_seconds)
+    return lambda step, timestamp: tracker.update(
+        40.0 + step * 1e-5, -100.0 + step * 1e-5, timestamp
+    )
+
+
+def _assert_flat(name: str, factory) -> None:
+    costs = {
+        window: _per_update_seconds(factory(window), window)
+        for window in WINDOW_SECONDS
+    }
+    for window, cost in costs.items():
+        print(f"{name}: window {window:>7.0f}s -> {cost * 1e6:.2f} µs/update")
+    ratio = costs[WINDOW_SECONDS[-1]] / costs[WINDOW_SECONDS[0]]
+    assert ratio < MAX_COST_RATIO, f"{name} per-update cost grew {ratio:.1f}x"
+
+
+def test_speed_smoothing_cost_is_flat():
+    """ETACalculator.update_speed does not slow down with longer windows."""
+    _assert_flat("ETACalculator.update_speed", _speed_smoothing)
+
+
+def test_gps_speed_cost_is_flat():
+    """SpeedTracker.update does not slow down with longer windows."""
+    _assert_flat("SpeedTracker.update", _gps_speed)
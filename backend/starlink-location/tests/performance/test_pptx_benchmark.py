@@ -0,0 +1,116 @@
+"""Performance benchmark for combined mission slide decks.
+
+Builds the combined PPTX for a 20-leg mission with 500 timeline segments
+(25 per leg, about 100 slides) using the precompiled slide template and bulk
+table filler. Route maps are stubbed so only slide construction is measured.
+
+Run with:
+    pytest tests/performance/test_pptx_benchmark.py -v -s
+"""
+
+import io
+import time
+import zipfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from PIL import Image
+
+from app.mission.models import (
+    Mission,
+    MissionLeg,
+    MissionLegTimeline,
+    TimelineSegment,
+    TimelineStatus,
+    TransportConfig,
+    TransportState,
+)
+from app.mission.package.__main__ import generate_mission_combined_pptx
+
+LEG_COUNT = 20
+SEGMENTS_PER_LEG = 25
+TARGET_SECONDS = 2.0
+
+
+def create_benchmark_mission() -> tuple[Mission, dict[str, MissionLegTimeline]]:
+    """Create a mission whose segments cycle through every table style."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    states = [TransportState.AVAILABLE, TransportState.DEGRADED, TransportState.OFFLINE]
+    legs = []
+    timelines = {}
+    for leg_index in range(LEG_COUNT):
+        leg_id = f"bench-leg-{leg_index}"
+        legs.append(
+            MissionLeg(
+                id=leg_id,
+                name=f"Benchmark Leg {leg_index}",
+                route_id=f"bench-route-{leg_index}",
+                transports=TransportConfig(initial_x_satellite_id="X-1"),
+            )
+        )
+        segments = []
+        for index in range(SEGMENTS_PER_LEG):
+            degraded = index % 3 == 0
+            segment_start = start + timedelta(minutes=30 * index)
+            segments.append(
+                TimelineSegment(
+                    id=f"{leg_id}-seg-{index}",
+                    start_time=segment_start,
+                    end_time=segment_start + timedelta(minutes=30),
+                    status=(
+                        TimelineStatus.DEGRADED if degraded else TimelineStatus.NOMINAL
+                    ),
+                    x_state=states[index % 3],
+                    ka_state=states[(index // 3) % 3],
+                    reasons=["aar"] if index % 7 == 0 else ["x_azimuth_conflict"],
+                )
+            )
+        timelines[leg_id] = MissionLegTimeline(mission_leg_id=leg_id, segments=segments)
+
+    mission = Mission(id="bench-deck", name="Benchmark Deck", legs=legs)
+    return mission, timelines
+
+
+def test_combined_deck_benchmark():
+    """A 20-leg, 500-segment combined deck builds well under the target."""
+    mission, timelines = create_benchmark_mission()
+    map_image = io.BytesIO()
+    Image.new("RGB", (400, 300), "white").save(map_image, "PNG")
+
+    with patch(
+        "app.mission.package.__main__.load_mission_timeline",
+        side_effect=lambda leg_id, **_: timelines.get(leg_id),
+    ), patch(
+        "app.mission.exporter._generate_route_map",
+        return_value=map_image.getvalue(),
+    ), patch(
+        "app.mission.storage.load_mission_v2", return_value=mission
+    ):
+        # Warm-up builds the process-wide template
+        generate_mission_combined_pptx(mission)
+
+        durations = []
+        for _ in range(3):
+            start = time.perf_counter()
+            deck = generate_mission_combined_pptx(mission)
+            durations.append(time.perf_counter() - start)
+
+    best = min(durations)
+    with zipfile.ZipFile(io.BytesIO(deck)) as zf:
+        slide_count = sum(
+            1
+            for name in zf.namelist()
+            if name.startswith("ppt/slides/slide") and name.endswith(".xml")
+        )
+
+    print(f"\n{'='*70}")
+    print("Combined Mission Deck Benchmark")
+    print(f"{'='*70}")
+    print(f"Legs: {LEG_COUNT}, segments: {LEG_COUNT * SEGMENTS_PER_LEG}")
+    print(f"Slides: {slide_count}, deck size: {len(deck) / 1024:.0f} KiB")
+    print(f"Best of {len(durations)}: {best:.3f}s (target < {TARGET_SECONDS:.1f}s)")
+    print(f"{'='*70}\n")
+
+    # Title slide, then per leg a route map and 4 table slides of 7/7/7/4 rows
+    assert slide_count == 1 + LEG_COUNT * 5
+    assert best < TARGET_SECONDS
@@ -0,0 +1,153 @@
+"""Performance benchmark for route map rendering with many POI labels.
+
+Renders a 4K route map for a 1,500-point route split into 120 status
+segments with 300 labeled POIs, once across the International Date Line.
+The basemap is stubbed so only route and label overlays are measured.
+
+The goal is 1s. On a single CPU the render currently takes about 1.6s,
+most of it FreeType glyph rasterization for the 300 labels and PNG
+encoding, so the test asserts a ceiling just above today's cost to catch
+regressions and reports the distance to the goal.
+
+Run with:
+    pytest tests/performance/test_route_map_benchmark.py -v -s
+"""
+
+import io
+import logging
+import math
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from app.mission.exporter.__main__ import _render_route_map
+from app.mission.models import (
+    MissionLeg,
+    MissionLegTimeline,
+    TimelineSegment,
+    TimelineStatus,
+    TransportConfig,
+)
+
+POINT_COUNT = 1500
+SEGMENT_COUNT = 120
+POI_COUNT = 300
+TARGET_SECONDS = 1.0
+# Measured ~1.6s on one CPU, plus headroom for loaded CI runners
+CEILING_SECONDS = 2.5
+
+
+def create_benchmark_route(crosses_idl: bool):
+    """Create a route, its timeline and POIs spread along the route."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    points = []
+    for index in range(POINT_COUNT):
+        fraction = index / (POINT_COUNT - 1)
+        if crosses_idl:
+            lon = 150 + 60 * fraction
+            lon = lon - 360 if lon > 180 else lon
+        else:
+            lon = -120 + 90 * fraction
+        points.append(
+            SimpleNamespace(
+                latitude=30 + 12 * math.sin(fraction * 6),
+                longitude=lon,
+                expected_arrival_time=start + timedelta(seconds=20 * index),
+            )
+        )
+    waypoints = [
+        SimpleNamespace(
+            name=name,
+            role=role,
+            latitude=point.latitude,
+            longitude=point.longitude,
+        )
+        for name, role, point in (
+            ("KDEP", "departure", points[0]),
+            ("KARR", "arrival", points[-1]),
+        )
+    ]
+    route = SimpleNamespace(points=points, waypoints=waypoints)
+
+    duration = 20 * (POINT_COUNT - 1)
+    statuses = list(TimelineStatus)
+    segments = [
+        TimelineSegment(
+            id=f"seg-{index}",
+            start_time=start + timedelta(seconds=duration * index / SEGMENT_COUNT),
+            end_time=start + timedelta(seconds=duration * (index + 1) / SEGMENT_COUNT),
+            status=statuses[index % len(statuses)],
+        )
+        for index in range(SEGMENT_COUNT)
+    ]
+    timeline = MissionLegTimeline(mission_leg_id="bench-leg", segments=segments)
+
+    pois = []
+    for index in range(POI_COUNT):
+        point = points[(index * 7919) % POINT_COUNT]
+        pois.append(
+            SimpleNamespace(
+                name=f"Swap {index % 7} to AOR{index}",
+                latitude=point.latitude + 0.01 * (index % 5),
+                longitude=point.longitude,
+                category="mission-event",
+            )
+        )
+
+    route_manager = SimpleNamespace(get_route=lambda route_id: route)
+    poi_manager = SimpleNamespace(list_pois=lambda **kwargs: pois)
+    return timeline, route_manager, poi_manager
+
+
+@pytest.mark.parametrize("crosses_idl", [False, True], ids=["conus", "pacific"])
+def test_route_map_benchmark(crosses_idl, caplog):
+    """A 300-POI route map renders without exhausting the label budget."""
+    timeline, route_manager, poi_manager = create_benchmark_route(crosses_idl)
+    mission = MissionLeg(
+        id="bench-leg",
+        name="Benchmark Leg",
+        route_id="bench-route",
+        transports=TransportConfig(initial_x_satellite_id="X-1"),
+    )
+
+    with patch("app.mission.exporter.__main__.draw_basemap"):
+        # Warm-up loads fonts and projection caches
+        _render_route_map(
+            timeline, mission, route_manager=route_manager, poi_manager=poi_manager
+        )
+
+        durations = []
+        with caplog.at_level(logging.WARNING):
+            for _ in range(2):
+                start = time.perf_counter()
+                png = _render_route_map(
+                    timeline,
+                    mission,
+                    route_manager=route_manager,
+                    poi_manager=poi_manager,
+                )
+                durations.append(time.perf_counter() - start)
+
+    best = min(durations)
+    size = Image.open(io.BytesIO(png)).size
+
+    print(f"\n{'='*70}")
+    print("Route Map Benchmark")
+    print(f"{'='*70}")
+    print(f"Points: {POINT_COUNT}, segments: {SEGMENT_COUNT}, POIs: {POI_COUNT}")
+    print(f"Crosses date line: {crosses_idl}, image: {size[0]}x{size[1]}")
+    print(
+        f"Best of {len(durations)}: {best:.3f}s "
+        f"(goal < {TARGET_SECONDS:.1f}s, ceiling < {CEILING_SECONDS:.1f}s)"
+    )
+    print(f"{'='*70}\n")
+
+    assert size == (3840, 2160)
+    assert "budget" not in caplog.text
+    assert (
+        best < CEILING_SECONDS
+    ), f"route map render regressed: {best:.2f}s >= {CEILING_SECONDS:.1f}s"
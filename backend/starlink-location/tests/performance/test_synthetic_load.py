@@ -0,0 +1,86 @@
+"""Smoke test for the synthetic-load benchmark harness.
+
+Runs every scenario at the "smoke" scale and checks the baseline
+comparison. Full-size runs are done from the command line:
+
+    python -m tests.performance.synthetic_load --output baseline.json
+"""
+
+import copy
+
+import pytest
+
+from tests.performance.synthetic_load.generators import synthetic_route_kml
+from tests.performance.synthetic_load.runner import (
+    compare,
+    load_results,
+    percentile,
+    run_benchmarks,
+    write_results,
+)
+from tests.performance.synthetic_load.scenarios import SCALES, SCENARIOS
+
+
+@pytest.fixture(scope="module")
+def smoke_results():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("EXPORT_WORKERS", "1")
+        return run_benchmarks(list(SCENARIOS), SCALES["smoke"])
+
+
+def test_every_scenario_reports_latency_and_memory(smoke_results):
+    assert smoke_results["failed"] == {}
+    assert set(smoke_results["results"]) == {
+        "tick",
+        "scrape",
+        "poi_create",
+        "poi_update",
+        "poi_delete",
+        "timeline",
+        "export",
+    }
+    for row in smoke_results["results"].values():
+        assert row["samples"] >= 1
+        assert 0 < row["p50_ms"] <= row["p99_ms"] <= row["max_ms"]
+        assert row["peak_rss_mb"] > 0
+
+
+def test_results_round_trip_as_baseline(smoke_results, tmp_path):
+    path = tmp_path / "baseline.json"
+    write_results(smoke_results, path)
+
+    assert compare(smoke_results, load_results(path)) == []
+
+
+def test_compare_flags_regressions_above_threshold(smoke_results):
+    slower = copy.deepcopy(smoke_results)
+    slower["results"]["tick"]["p99_ms"] = slower["results"]["tick"]["p99_ms"] * 2 + 5
+    slower["results"]["timeline"]["p50_ms"] *= 1.05
+    slower["failed"] = {"export": "benchmark process died (out of memory?)"}
+
+    regressions = compare(slower, smoke_results, threshold=0.2)
+
+    assert {(r.series, r.metric) for r in regressions} == {
+        ("export", "failed"),
+        ("tick", "p99_ms"),
+    }
+
+
+def test_compare_rejects_other_scales(smoke_results):
+    other = copy.deepcopy(smoke_results)
+    other["scale"]["route_points"] *= 2
+
+    with pytest.raises(ValueError):
+        compare(other, smoke_results)
+
+
+def test_generators_are_reproducible():
+    assert synthetic_route_kml(1000, 3, seed=7) == synthetic_route_kml(1000, 3, seed=7)
+    assert synthetic_route_kml(1000, 3, seed=7) != synthetic_route_kml(1000, 3, seed=8)
+
+
+def test_percentile_interpolates():
+    samples = [4.0, 1.0, 3.0, 2.0]
+
+    assert percentile(samples, 50) == 2.5
+    assert percentile(samples, 100) == 4.0
@@ -0,0 +1,180 @@
+"""Tests for the pre-rendered basemap tile cache."""
+
+import os
+
+import numpy as np
+import pytest
+
+from app.mission.exporter.basemap import (
+    BASEMAP_TILE_DIR,
+    BasemapTileCache,
+    draw_basemap,
+)
+
+
+def _pattern(lons, lats):
+    """Encode whole-degree longitude/latitude into red/green channels."""
+    lon_grid, lat_grid = np.meshgrid(lons, lats)
+    red = np.floor((lon_grid + 180.0) % 360.0).astype(np.uint16) % 256
+    green = np.floor(lat_grid + 90.0).astype(np.uint16) % 256
+    return np.stack([red, green, np.zeros_like(red)], axis=-1).astype(np.uint8)
+
+
+class FakeRenderer:
+    """Renders the coordinate pattern instead of Natural Earth layers."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, style, west, east, south, north, width, height):
+        self.calls.append((west, east, south, north, width, height))
+        res = (east - west) / width
+        lons = west + (np.arange(width) + 0.5) * res
+        lats = north - (np.arange(height) + 0.5) * res
+        return _pattern(lons, lats)
+
+
+def _expected(image, extent):
+    west, east, south, north = extent
+    res = (east - west) / image.shape[1]
+    lons = west + (np.arange(image.shape[1]) + 0.5) * res
+    lats = north - (np.arange(image.shape[0]) + 0.5) * res
+    return _pattern(lons, lats)
+
+
+@pytest.fixture
+def renderer():
+    return FakeRenderer()
+
+
+@pytest.fixture
+def cache(renderer, tmp_path):
+    return BasemapTileCache(tile_dir=tmp_path, tile_size=64, renderer=renderer)
+
+
+class TestBasemapTileCache:
+    """Tiles are rendered once, then mosaicked and cropped per map."""
+
+    def test_compose_covers_window_with_matching_pixels(self, cache):
+        image, extent = cache.compose(-100.0, -60.0, 20.0, 45.0, 40.0 / 400)
+
+        west, east, south, north = extent
+        assert west <= -100.0 and east >= -60.0
+        assert south <= 20.0 and north >= 45.0
+        assert east - west < 40.0 + 2 * (40.0 / 400)
+        assert np.mean(image == _expected(image, extent)) > 0.999
+
+    def test_repeat_compose_reuses_tiles(self, cache, renderer):
+        cache.compose(-100.0, -60.0, 20.0, 45.0, 0.1)
+        calls = len(renderer.calls)
+        cache.compose(-95.0, -65.0, 25.0, 40.0, 0.1)
+
+        assert len(renderer.calls) == calls
+        assert cache.stats()["memory_hits"] > 0
+
+    def test_missing_tiles_render_in_one_batch(self, cache, renderer):
+        cache.compose(-100.0, -60.0, 20.0, 45.0, 0.1)
+        assert len(renderer.calls) == 1
+
+    def test_tiles_persist_to_disk(self, cache, renderer, tmp_path):
+        first, _ = cache.compose(10.0, 30.0, -10.0, 5.0, 0.1)
+
+        reloaded = BasemapTileCache(
+            tile_dir=tmp_path, tile_size=64, renderer=FakeRenderer()
+        )
+        second, _ = reloaded.compose(10.0, 30.0, -10.0, 5.0, 0.1)
+
+        assert reloaded.renderer.calls == []
+        assert reloaded.stats()["disk_hits"] > 0
+        np.testing.assert_array_equal(first, second)
+
+    def test_disk_usage_bounded_by_lru_eviction(self, renderer, tmp_path):
+        probe = BasemapTileCache(
+            tile_dir=tmp_path / "probe", tile_size=64, renderer=renderer
+        )
+        probe.compose(10.0, 30.0, -10.0, 5.0, 0.1)
+        limit = probe.stats()["disk_bytes"] // 2
+        cache = BasemapTileCache(
+            tile_dir=tmp_path / "tiles",
+            tile_size=64,
+            renderer=renderer,
+            max_disk_bytes=limit,
+        )
+        cache.compose(10.0, 30.0, -10.0, 5.0, 0.1)
+        cache.compose(-100.0, -60.0, 20.0, 45.0, 0.1)
+
+        stats = cache.stats()
+        on_disk = sum(p.stat().st_size for p in (tmp_path / "tiles").rglob("*.png"))
+        assert stats["disk_evictions"] > 0
+        assert on_disk == stats["disk_bytes"] <= limit
+
+    def test_zero_disk_limit_keeps_tiles_in_memory(self, renderer, tmp_path):
+        cache = BasemapTileCache(
+            tile_dir=tmp_path, tile_size=64, renderer=renderer, max_disk_bytes=0
+        )
+        cache.compose(10.0, 30.0, -10.0, 5.0, 0.1)
+
+        assert list(tmp_path.rglob("*.png")) == []
+        assert cache.stats()["memory_tiles"] > 0
+
+    @pytest.mark.skipif(
+        "BASEMAP_TILE_DIR" in os.environ, reason="tile dir set by environment"
+    )
+    def test_default_tile_dir_does_not_depend_on_cwd(self):
+        assert BASEMAP_TILE_DIR.is_absolute()
+        assert BASEMAP_TILE_DIR.parent.name == "data"
+        assert (BASEMAP_TILE_DIR.parents[1] / "app").is_dir()
+
+    def test_window_across_antimeridian_wraps(self, cache):
+        image, extent = cache.compose(170.0, 200.0, -20.0, 10.0, 0.1)
+
+        assert extent[0] <= 170.0 and extent[1] >= 200.0
+        assert np.mean(image == _expected(image, extent)) > 0.999
+
+    def test_polar_window_is_clamped(self, cache):
+        image, extent = cache.compose(-180.0, 180.0, -100.0, 95.0, 1.0)
+
+        assert extent[2] >= -90.0 - 1.0 and extent[3] <= 90.0 + 1.0
+        assert image.shape[1] >= 360
+
+    def test_level_tracks_pixel_density(self, cache):
+        coarse = cache.level_for(0.5)
+        fine = cache.level_for(0.01)
+
+        assert fine > coarse
+        assert cache.degrees_per_pixel(fine) <= 0.01 * 1.25
+
+
+class TestDrawBasemap:
+    """draw_basemap composites the raster without changing the map extent."""
+
+    def test_draws_raster_below_overlays_north_up(self, cache):
+        import cartopy.crs as ccrs
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        projection = ccrs.PlateCarree(central_longitude=-80.0)
+        fig = plt.figure(figsize=(4, 2), dpi=100)
+        ax = fig.add_axes([0, 0, 1, 1], projection=projection)
+        ax.set_extent([-20.0, 20.0, 20.0, 40.0], crs=projection)
+        try:
+            artist = draw_basemap(
+                ax, -80.0, -100.0, -60.0, 20.0, 40.0, 400, cache=cache
+            )
+            fig.canvas.draw()
+            pixels = np.asarray(fig.canvas.buffer_rgba())
+
+            assert artist.get_zorder() == 0
+            np.testing.assert_allclose(
+                ax.get_extent(crs=projection), [-20.0, 20.0, 20.0, 40.0], atol=1e-6
+            )
+            # Red encodes longitude, green latitude: west→east and north→south
+            top_left, bottom_right = pixels[5, 5], pixels[-5, -5]
+            assert abs(int(top_left[0]) - 80) <= 1
+            assert abs(int(top_left[1]) - 129) <= 1
+            assert abs(int(bottom_right[0]) - 119) <= 1
+            assert abs(int(bottom_right[1]) - 110) <= 1
+        finally:
+            plt.close(fig)
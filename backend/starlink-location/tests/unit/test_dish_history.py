@@ -0,0 +1,221 @@
+"""Unit tests for incremental dish history ingestion.
+
+A fake dish stands in for the gRPC endpoint: it keeps a ring buffer and a
+sample counter like the real history response, and the real
+starlink_grpc.history_bulk_data parses it.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.live.client import StarlinkClient
+from app.live.history import DishHistory
+
+
+class FakeDish:
+    """Fake Starlink dish with a history ring buffer and sample counter."""
+
+    def __init__(self, buffer_size: int = 30):
+        self.buffer_size = buffer_size
+        self.current = 0
+        self.uptime = 0.0
+        self.drop = [0.0] * buffer_size
+        self.latency = [0.0] * buffer_size
+        self.downlink = [0.0] * buffer_size
+        self.uplink = [0.0] * buffer_size
+
+    def write(self, count, drop=0.0, latency=30.0, downlink=8e6, uplink=8e5):
+        """Write ``count`` one-second samples."""
+        for _ in range(count):
+            slot = self.current % self.buffer_size
+            self.drop[slot] = drop
+            self.latency[slot] = latency
+            self.downlink[slot] = downlink
+            self.uplink[slot] = uplink
+            self.current += 1
+            self.uptime += 1.0
+
+    def reboot(self):
+        """Restart the dish: counter and uptime start again from 0."""
+        self.current = 0
+        self.uptime = 0.0
+
+    def get_history(self, context=None):
+        return SimpleNamespace(
+            current=self.current,
+            pop_ping_drop_rate=list(self.drop),
+            pop_ping_latency_ms=list(self.latency),
+            downlink_throughput_bps=list(self.downlink),
+            uplink_throughput_bps=list(self.uplink),
+            power_in=[0.0] * self.buffer_size,
+        )
+
+    def status_data(self, context=None):
+        return {"uptime": self.uptime}, {}, {}
+
+    def location_data(self, context=None):
+        return {"latitude": 40.0, "longitude": -74.0, "altitude": 10.0}
+
+
+@pytest.fixture
+def dish():
+    """Fake dish patched in for the gRPC calls the client makes."""
+    fake = FakeDish()
+    with patch("app.live.client.starlink_grpc.ChannelContext", MagicMock()), patch(
+        "app.live.client.starlink_grpc.get_history", fake.get_history
+    ), patch("app.live.client.starlink_grpc.status_data", fake.status_data), patch(
+        "app.live.client.starlink_grpc.location_data", fake.location_data
+    ):
+        yield fake
+
+
+class TestDishHistory:
+    """Test rolling aggregates over ingested samples."""
+
+    def test_window_must_be_positive(self):
+        with pytest.raises(ValueError):
+            DishHistory(window_samples=0)
+
+    def test_empty_summary(self):
+        summary = DishHistory().summary()
+        assert summary.end_counter is None
+        assert summary.samples == 0
+        assert summary.ping_drop_rate == 0.0
+        assert summary.ping_latency_ms is None
+
+    def test_rolling_window_matches_full_recompute(self):
+        history = DishHistory(window_samples=4)
+        drops = [0.0, 0.5, 1.0, 0.0, 0.25, 0.0, 0.75]
+        latencies = [20.0, 30.0, None, 40.0, 50.0, 60.0, 70.0]
+        for counter, (drop, latency) in enumerate(zip(drops, latencies), start=1):
+            history.ingest(
+                {"samples": 1, "end_counter": counter},
+                {"pop_ping_drop_rate": [drop], "pop_ping_latency_ms": [latency]},
+            )
+
+        summary = history.summary()
+        assert summary.samples == 4
+        assert summary.ping_drop_rate == pytest.approx(sum(drops[-4:]) / 4)
+        assert summary.ping_latency_ms == pytest.approx((40.0 + 50.0 + 60.0 + 70.0) / 4)
+
+    def test_counter_going_backwards_resyncs(self):
+        history = DishHistory(window_samples=4)
+        history.ingest(
+            {"samples": 2, "end_counter": 100},
+            {"pop_ping_drop_rate": [1.0, 1.0], "downlink_throughput_bps": [8, 8]},
+        )
+        history.ingest(
+            {"samples": 1, "end_counter": 1},
+            {"pop_ping_drop_rate": [0.0], "downlink_throughput_bps": [16]},
+        )
+
+        summary = history.summary()
+        assert history.resyncs == 1
+        assert summary.end_counter == 1
+        assert summary.samples == 1
+        assert summary.ping_drop_rate == 0.0
+        assert summary.downlink_bytes == pytest.approx(2.0)
+
+    def test_gap_longer_than_window_counts_skipped_samples(self):
+        history = DishHistory(window_samples=4)
+        history.ingest(
+            {"samples": 2, "end_counter": 10},
+            {"pop_ping_drop_rate": [0.0, 0.0], "downlink_throughput_bps": [8, 8]},
+        )
+        # 10 samples written since the last poll, only the last 4 parsed
+        history.ingest(
+            {"samples": 4, "end_counter": 20},
+            {"pop_ping_drop_rate": [0.0] * 4, "downlink_throughput_bps": [8] * 4},
+        )
+
+        summary = history.summary()
+        assert summary.skipped_samples == 6
+        # Bytes cover only the ingested samples
+        assert summary.downlink_bytes == pytest.approx(6.0)
+
+
+class TestClientHistoryPolling:
+    """Test the live client against a fake dish."""
+
+    def test_polls_only_new_samples(self, dish):
+        dish.write(25)
+        client = StarlinkClient()
+
+        # First poll: one window of the most recent samples
+        client.get_telemetry()
+        assert client.history.end_counter == 25
+        assert client.get_history_summary().samples == client.history.window_samples
+
+        dish.write(3, drop=1.0)
+        assert client.poll_history() == 3
+        assert client.poll_history() == 0
+        assert client.history.end_counter == 28
+
+    def test_aggregates_follow_recent_samples(self, dish):
+        client = StarlinkClient()
+        dish.write(10, drop=0.0, latency=20.0, downlink=8e6, uplink=8e5)
+        client.get_telemetry()
+        dish.write(5, drop=1.0, latency=99.0)
+        client.get_telemetry()
+
+        summary = client.get_history_summary()
+        assert summary.ping_drop_rate == pytest.approx(0.5)
+        # Fully dropped samples have no latency
+        assert summary.ping_latency_ms == pytest.approx(20.0)
+        assert summary.downlink_bytes == pytest.approx(15 * 1e6)
+        assert summary.uplink_bytes == pytest.approx(15 * 1e5)
+
+    def test_long_gap_parses_at_most_one_window(self, dish):
+        client = StarlinkClient()
+        dish.write(5)
+        client.get_telemetry()
+
+        dish.write(dish.buffer_size * 3)
+        assert client.poll_history() == client.history.window_samples
+        assert client.get_history_summary().skipped_samples == (
+            dish.buffer_size * 3 - client.history.window_samples
+        )
+
+    def test_telemetry_carries_history(self, dish):
+        client = StarlinkClient()
+        dish.write(10, drop=0.5, latency=40.0, downlink=8e6, uplink=8e5)
+
+        telemetry = client.get_telemetry()
+
+        assert telemetry.history.samples == 10
+        assert telemetry.history.packet_loss_percent == pytest.approx(50.0)
+        assert telemetry.history.latency_ms == pytest.approx(40.0)
+        assert telemetry.history.downlink_bytes == pytest.approx(10 * 1e6)
+        assert telemetry.history.skipped_samples == 0
+
+    def test_reboot_with_lower_counter_resyncs(self, dish):
+        client = StarlinkClient()
+        dish.write(20, drop=1.0)
+        client.get_telemetry()
+
+        dish.reboot()
+        dish.write(3, drop=0.0)
+        client.get_telemetry()
+
+        summary = client.get_history_summary()
+        assert summary.end_counter == 3
+        assert summary.samples == 3
+        assert summary.ping_drop_rate == 0.0
+
+    def test_reboot_detected_by_uptime(self, dish):
+        client = StarlinkClient()
+        dish.uptime = 3600.0
+        dish.write(5, drop=1.0)
+        client.get_telemetry()
+
+        # Rebooted and wrote more samples than before the reboot
+        dish.reboot()
+        dish.write(8, drop=0.0)
+        client.get_telemetry()
+
+        summary = client.get_history_summary()
+        assert summary.end_counter == 8
+        assert summary.ping_drop_rate == 0.0
+        assert summary.downlink_bytes == pytest.approx(8 * 1e6)
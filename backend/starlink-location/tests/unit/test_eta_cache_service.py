@@ -7,16 +7,9 @@ import pytest
 from app.services.eta_cache import ETACache, ETAHistoryTracker
 
 
-def _cache_key_args():
-    """Helper returning consistent key args."""
-    return (
-        "route-123",
-        40.12345,
-        -73.98765,
-        40.54321,
-        -74.12345,
-        152.34,
-    )
+def _key(cache, along_track_m=1_000.0, speed=152.34, route_id="route-123"):
+    """Helper returning a key for a waypoint ETA."""
+    return cache.make_key(route_id, 1, along_track_m, speed, ("waypoint", 2))
 
 
 def test_cache_hit_and_expiration(monkeypatch):
@@ -25,30 +18,23 @@ def test_cache_hit_and_expiration(monkeypatch):
     monkeypatch.setattr("app.services.eta_cache.time.time", lambda: base_time)
     cache = ETACache(ttl_seconds=0.5)
 
-    cache.set(*_cache_key_args(), value={"eta_seconds": 123})
-    assert cache.get(*_cache_key_args()) == {"eta_seconds": 123}
+    cache.set(_key(cache), value={"eta_seconds": 123})
+    assert cache.get(_key(cache)) == {"eta_seconds": 123}
 
     # Advance beyond TTL to force eviction on next access.
     monkeypatch.setattr("app.services.eta_cache.time.time", lambda: base_time + 0.6)
-    assert cache.get(*_cache_key_args()) is None
-
-
-def test_cache_key_rounding():
-    """Coordinates close within rounding precision should reuse the same cache entry."""
-    cache = ETACache(ttl_seconds=5)
-    args = ("route-xyz", 40.121, -73.989, 40.551, -74.111, 150.0)
-    cache.set(*args, value={"eta": 10})
-
-    # Adjust lat/lon/speed within rounding tolerance (0.01 for coords, 0.1 for speed)
-    adjusted_args = (
-        "route-xyz",
-        40.124,  # rounds to 40.12
-        -73.986,  # rounds to -73.99
-        40.547,  # rounds to 40.55
-        -74.114,  # rounds to -74.11
-        150.04,  # rounds to 150.0
-    )
-    assert cache.get(*adjusted_args) == {"eta": 10}
+    assert cache.get(_key(cache)) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_cache_key_quantization():
+    """Positions and speeds within the same bucket should share a cache entry."""
+    cache = ETACache(ttl_seconds=5, position_quantum_m=250.0, speed_bucket_knots=1.0)
+    cache.set(_key(cache, along_track_m=1_010.0, speed=150.0), {"eta": 10})
+
+    assert cache.get(_key(cache, along_track_m=1_240.0, speed=150.4)) == {"eta": 10}
+    assert cache.get(_key(cache, along_track_m=1_260.0, speed=150.0)) is None
+    assert cache.get(_key(cache, along_track_m=1_010.0, speed=151.0)) is None
 
 
 def test_cleanup_and_stats(monkeypatch):
@@ -57,16 +43,66 @@ def test_cleanup_and_stats(monkeypatch):
     monkeypatch.setattr("app.services.eta_cache.time.time", lambda: base_time)
     cache = ETACache(ttl_seconds=1.0)
 
-    cache.set(*_cache_key_args(), value={"eta": 1})
+    cache.set(_key(cache), value={"eta": 1})
     # Advance time slightly before storing the second entry so it is newer.
     monkeypatch.setattr("app.services.eta_cache.time.time", lambda: base_time + 0.25)
-    cache.set("route-999", 10.0, 20.0, 11.0, 21.0, 120.0, {"eta": 2})
+    cache.set(_key(cache, route_id="route-999"), {"eta": 2})
 
     # Advance time so first entry expires while second stays valid.
     monkeypatch.setattr("app.services.eta_cache.time.time", lambda: base_time + 1.2)
     removed = cache.cleanup_expired()
     assert removed == 1
-    assert cache.stats()["cached_entries"] == 1
+    stats = cache.stats()
+    assert stats["cached_entries"] == 1
+    assert stats["memory_bytes"] > 0
+
+
+def test_cache_is_bounded_lru():
+    """The least recently used entry is evicted once the cache is full."""
+    cache = ETACache(max_entries=2)
+    first, second, third = (
+        _key(cache, along_track_m=position) for position in (0, 1_000, 2_000)
+    )
+    cache.set(first, 1)
+    cache.set(second, 2)
+    assert cache.get(first) == 1  # first is now most recently used
+    cache.set(third, 3)
+
+    assert cache.get(second) is None
+    assert cache.get(first) == 1
+    stats = cache.stats()
+    assert stats["cached_entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hit_ratio"] == pytest.approx(2 / 3)
+
+
+def test_route_invalidation_only_drops_that_route():
+    """Invalidating a route keeps other routes' entries."""
+    cache = ETACache()
+    cache.set(_key(cache, route_id="a"), 1)
+    cache.set(_key(cache, route_id="b"), 2)
+    stale_key = _key(cache, route_id="a")
+
+    assert cache.invalidate_route("a") == 1
+
+    assert cache.get(_key(cache, route_id="b")) == 2
+    # A result computed before the invalidation is never served
+    cache.set(stale_key, 1)
+    assert cache.get(_key(cache, route_id="a")) is None
+
+
+def test_poi_invalidation_keeps_route_only_entries():
+    """POI changes drop POI ETAs but not route progress results."""
+    cache = ETACache()
+    poi_key = cache.make_key("r", 1, 0.0, 100.0, ("poi", "p1"), depends_on_pois=True)
+    route_key = cache.make_key("r", 1, 0.0, None, "remaining_duration")
+    cache.set(poi_key, 1)
+    cache.set(route_key, 2)
+
+    assert cache.invalidate_pois() == 1
+
+    assert cache.get(poi_key) is None
+    assert cache.get(route_key) == 2
 
 
 def test_eta_history_tracks_accuracy():
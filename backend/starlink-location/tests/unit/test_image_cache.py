@@ -0,0 +1,164 @@
+"""Tests for the persistent rendered image cache."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.mission.exporter import _generate_route_map
+from app.mission.exporter.image_cache import RenderedImageCache, get_image_cache
+from app.mission.models import MissionLegTimeline
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RenderedImageCache(tmp_path, max_bytes=1024)
+
+
+class Renderer:
+    """Counts renders and returns distinct PNG-like payloads."""
+
+    def __init__(self, size: int = 100):
+        self.size = size
+        self.calls = 0
+
+    def __call__(self) -> bytes:
+        self.calls += 1
+        return bytes([self.calls % 256]) * self.size
+
+
+class TestRenderedImageCache:
+    """Content-keyed lookup, persistence and LRU eviction."""
+
+    def test_unchanged_payload_is_served_from_cache(self, cache):
+        render = Renderer()
+        first = cache.get_or_render("route_map", {"route": [1, 2]}, render)
+        second = cache.get_or_render("route_map", {"route": [1, 2]}, render)
+
+        assert first == second
+        assert render.calls == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["by_kind"]["route_map"] == {"hits": 1, "misses": 1}
+
+    def test_changed_payload_renders_again(self, cache):
+        render = Renderer()
+        cache.get_or_render("route_map", {"pois": ["AAR Start"]}, render)
+        cache.get_or_render("route_map", {"pois": ["AAR Start", "AAR End"]}, render)
+
+        assert render.calls == 2
+
+    def test_images_persist_across_instances(self, cache, tmp_path):
+        cache.get_or_render("timeline_chart", {"segments": []}, Renderer())
+
+        reopened = RenderedImageCache(tmp_path, max_bytes=1024)
+        render = Renderer()
+        reopened.get_or_render("timeline_chart", {"segments": []}, render)
+
+        assert render.calls == 0
+        assert reopened.stats()["entries"] == 1
+
+    def test_least_recently_used_images_are_evicted(self, cache, tmp_path):
+        for index in range(3):
+            cache.get_or_render("route_map", {"n": index}, Renderer(size=300))
+        # Touch the oldest so the second-oldest is evicted next
+        cache.get_or_render("route_map", {"n": 0}, Renderer(size=300))
+        cache.get_or_render("route_map", {"n": 3}, Renderer(size=300))
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 1024
+        assert stats["evictions"] == 1
+        assert len(list(tmp_path.glob("*.png"))) == stats["entries"] == 3
+
+        render = Renderer(size=300)
+        cache.get_or_render("route_map", {"n": 0}, render)
+        assert render.calls == 0
+        cache.get_or_render("route_map", {"n": 1}, render)
+        assert render.calls == 1
+
+    def test_zero_budget_disables_caching(self, tmp_path):
+        cache = RenderedImageCache(tmp_path, max_bytes=0)
+        render = Renderer()
+        cache.get_or_render("route_map", {}, render)
+        cache.get_or_render("route_map", {}, render)
+
+        assert render.calls == 2
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestRouteMapCaching:
+    """_generate_route_map keys on route geometry, POIs and timeline."""
+
+    @pytest.fixture
+    def inputs(self):
+        route = SimpleNamespace(
+            points=[
+                SimpleNamespace(
+                    latitude=40.0, longitude=-75.0, expected_arrival_time=None
+                ),
+                SimpleNamespace(
+                    latitude=45.0, longitude=-60.0, expected_arrival_time=None
+                ),
+            ],
+            waypoints=[],
+        )
+        route_manager = MagicMock()
+        route_manager.get_route.return_value = route
+        pois = [
+            SimpleNamespace(
+                name="AAR Start",
+                latitude=42.0,
+                longitude=-70.0,
+                category="mission-event",
+            )
+        ]
+        poi_manager = MagicMock()
+        poi_manager.list_pois.side_effect = lambda **kwargs: list(pois)
+        leg = SimpleNamespace(id="leg-1", route_id="route-1", transports=None)
+        timeline = MissionLegTimeline(mission_leg_id="leg-1")
+        return SimpleNamespace(
+            route=route,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+            pois=pois,
+            leg=leg,
+            timeline=timeline,
+        )
+
+    def _generate(self, inputs):
+        return _generate_route_map(
+            inputs.timeline,
+            inputs.leg,
+            parent_mission_id="mission-1",
+            route_manager=inputs.route_manager,
+            poi_manager=inputs.poi_manager,
+        )
+
+    def test_repeat_export_skips_rendering(self, inputs):
+        with patch(
+            "app.mission.exporter.__main__._render_route_map", return_value=b"png"
+        ) as render:
+            assert self._generate(inputs) == b"png"
+            assert self._generate(inputs) == b"png"
+
+        assert render.call_count == 1
+        assert get_image_cache().stats()["by_kind"]["route_map"]["hits"] == 1
+
+    def test_poi_or_route_change_renders_fresh_map(self, inputs):
+        with patch(
+            "app.mission.exporter.__main__._render_route_map", return_value=b"png"
+        ) as render:
+            self._generate(inputs)
+            inputs.pois.append(
+                SimpleNamespace(
+                    name="AAR End",
+                    latitude=43.0,
+                    longitude=-65.0,
+                    category="mission-event",
+                )
+            )
+            self._generate(inputs)
+            inputs.route.points[1].latitude = 46.0
+            self._generate(inputs)
+
+        assert render.call_count == 3
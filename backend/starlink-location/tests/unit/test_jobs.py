@@ -0,0 +1,153 @@
+"""Tests for the in-process background job manager."""
+
+import threading
+
+import pytest
+
+from app.core.jobs import JobManager, JobStatus
+
+
+@pytest.fixture
+def manager():
+    job_manager = JobManager(max_workers=1, result_ttl_seconds=60)
+    yield job_manager
+    job_manager.shutdown()
+
+
+class TestJobManager:
+    """Job lifecycle, progress, cancellation and retention."""
+
+    def test_successful_job_records_progress_and_result(self, manager):
+        def work(context):
+            context.report(0.25, "Quarter")
+            context.report(0.75, "Three quarters")
+            return {"answer": 42}
+
+        job = manager.wait(manager.submit("test", work).id, timeout=5)
+
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.progress == 1.0
+        assert job.result == {"answer": 42}
+        assert [event.message for event in job.events] == ["Quarter", "Three quarters"]
+        assert job.to_dict()["has_result"] is True
+
+    def test_counters_are_merged_and_reported(self, manager):
+        def work(context):
+            context.update_counters(routes_total=3, routes_imported=0)
+            context.update_counters(routes_imported=2)
+
+        job = manager.wait(manager.submit("test", work).id, timeout=5)
+
+        assert job.to_dict()["counters"] == {"routes_total": 3, "routes_imported": 2}
+
+    def test_failed_job_records_error(self, manager):
+        def work(context):
+            raise ValueError("bad package")
+
+        job = manager.wait(manager.submit("test", work).id, timeout=5)
+
+        assert job.status == JobStatus.FAILED
+        assert job.error == "ValueError: bad package"
+
+    def test_running_job_stops_at_next_progress_report(self, manager):
+        started = threading.Event()
+        release = threading.Event()
+
+        def work(context):
+            started.set()
+            release.wait(5)
+            context.report(0.5, "Halfway")
+            return "unreachable"
+
+        job = manager.submit("test", work)
+        assert started.wait(5)
+        assert manager.cancel(job.id) is True
+        release.set()
+        manager.wait(job.id, timeout=5)
+
+        assert job.status == JobStatus.CANCELLED
+        assert job.result is None
+        assert manager.cancel(job.id) is False
+
+    def test_queued_job_is_cancelled_before_start(self, manager):
+        release = threading.Event()
+        calls = []
+        blocker = manager.submit("test", lambda context: release.wait(5))
+        queued = manager.submit("test", lambda context: calls.append("ran"))
+
+        assert queued.status == JobStatus.QUEUED
+        assert manager.cancel(queued.id) is True
+        release.set()
+        manager.wait(blocker.id, timeout=5)
+
+        assert queued.status == JobStatus.CANCELLED
+        assert calls == []
+
+    def test_on_finish_runs_for_every_terminal_state(self, manager):
+        release = threading.Event()
+        finished = []
+
+        def record(job):
+            finished.append((job.id, job.status))
+
+        blocker = manager.submit("test", lambda context: release.wait(5))
+        succeeded = manager.submit("test", lambda context: 1, on_finish=record)
+        failed = manager.submit("test", lambda context: 1 / 0, on_finish=record)
+        queued = manager.submit("test", lambda context: 1, on_finish=record)
+        assert manager.cancel(queued.id) is True
+        release.set()
+        for job in (blocker, succeeded, failed):
+            manager.wait(job.id, timeout=5)
+
+        assert sorted(finished) == sorted(
+            [
+                (succeeded.id, JobStatus.SUCCEEDED),
+                (failed.id, JobStatus.FAILED),
+                (queued.id, JobStatus.CANCELLED),
+            ]
+        )
+
+    def test_shutdown_finishes_queued_jobs(self):
+        manager = JobManager(max_workers=1, result_ttl_seconds=60)
+        release = threading.Event()
+        finished = []
+        manager.submit("test", lambda context: release.wait(5))
+        queued = manager.submit(
+            "test", lambda context: 1, on_finish=lambda job: finished.append(job.id)
+        )
+
+        manager.shutdown()
+        release.set()
+
+        assert queued.status == JobStatus.CANCELLED
+        assert finished == [queued.id]
+
+    def test_expired_jobs_and_result_files_are_purged(self, tmp_path):
+        manager = JobManager(max_workers=1, result_ttl_seconds=0)
+        result_file = tmp_path / "result.zip"
+
+        def work(context):
+            result_file.write_bytes(b"zip")
+            context.set_result_file(result_file, "application/zip")
+            return {}
+
+        job = manager.submit("test", work)
+        manager.wait(job.id, timeout=5)
+        try:
+            assert manager.get(job.id) is None
+            assert not result_file.exists()
+        finally:
+            manager.shutdown()
+
+    def test_retention_limit_drops_oldest_finished_jobs(self):
+        manager = JobManager(max_workers=1, result_ttl_seconds=60, max_jobs=2)
+        try:
+            ids = []
+            for index in range(3):
+                ids.append(manager.submit("test", lambda context, i=index: i).id)
+                manager.wait(ids[-1], timeout=5)
+            manager.purge_expired()
+
+            assert [job.id for job in manager.list_jobs()] == ids[:0:-1]
+        finally:
+            manager.shutdown()
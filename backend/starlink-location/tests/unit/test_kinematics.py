@@ -0,0 +1,163 @@
+"""Tests for the streaming kinematics estimators and the trackers using them."""
+
+import math
+import random
+from collections import deque
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.eta.calculator import ETACalculator
+from app.services.heading_tracker import HeadingTracker
+from app.services.kinematics import (
+    MEAN_RELATIVE_TOLERANCE,
+    PositionWindow,
+    WindowedMean,
+    haversine_m,
+)
+from app.services.speed_tracker import SpeedTracker
+
+WINDOW_SECONDS = 120.0
+
+
+def _reference_mean(samples, window_seconds):
+    """The deque re-sum that ETACalculator.update_speed used to run."""
+    history = deque()
+    means = []
+    for value, timestamp in samples:
+        history.append((value, timestamp))
+        cutoff = timestamp - window_seconds
+        while history and history[0][1] < cutoff:
+            history.popleft()
+        means.append(sum(v for v, _ in history) / len(history))
+    return means
+
+
+def _reference_speed(fixes, window_seconds):
+    """The deque oldest-to-newest speed that SpeedTracker.update used to run."""
+    history = deque()
+    speeds = []
+    last = 0.0
+    for lat, lon, timestamp in fixes:
+        history.append((lat, lon, timestamp))
+        while history and history[0][2] < timestamp - window_seconds:
+            history.popleft()
+        if len(history) >= 2:
+            distance = haversine_m(*history[0][:2], *history[-1][:2])
+            elapsed = history[-1][2] - history[0][2]
+            if elapsed >= 0.1 and distance >= 10.0:
+                last = distance / elapsed / 1852.0 * 3600.0
+        speeds.append(last)
+    return speeds
+
+
+class TestWindowedMean:
+    """Running mean over a time window."""
+
+    def test_matches_full_resum_over_long_stream(self):
+        rng = random.Random(7)
+        samples = [(400 + rng.gauss(0, 40), i * 0.1) for i in range(20_000)]
+        window = WindowedMean(WINDOW_SECONDS)
+
+        means = [window.add(value, timestamp) for value, timestamp in samples]
+
+        for actual, expected in zip(means, _reference_mean(samples, WINDOW_SECONDS)):
+            assert actual == pytest.approx(expected, rel=MEAN_RELATIVE_TOLERANCE)
+        assert len(window) == 1201
+
+    def test_late_samples_are_inserted_in_order(self):
+        window = WindowedMean(10.0)
+        for timestamp in (0.0, 2.0, 4.0, 6.0):
+            window.add(100.0, timestamp)
+
+        window.add(200.0, 3.0)
+        # Evicting everything before t=5 must take the late sample with it
+        window.add(100.0, 15.0)
+
+        assert len(window) == 2
+        assert window.mean == pytest.approx(100.0)
+
+    def test_samples_older_than_the_window_are_dropped(self):
+        window = WindowedMean(10.0)
+        window.add(100.0, 50.0)
+
+        assert window.add(999.0, 30.0) == pytest.approx(100.0)
+        assert len(window) == 1
+
+    def test_duplicate_timestamps_are_separate_samples(self):
+        window = WindowedMean(10.0)
+        window.add(100.0, 1.0)
+        window.add(200.0, 1.0)
+
+        assert window.mean == pytest.approx(150.0)
+        assert window.span_seconds == 0.0
+
+
+class TestPositionWindow:
+    """GPS fixes over a time window."""
+
+    def test_duplicate_timestamp_replaces_the_fix(self):
+        window = PositionWindow(60.0)
+        window.add(40.0, -74.0, 0.0)
+        window.add(40.0, -73.0, 10.0)
+        window.add(40.0, -73.5, 10.0)
+
+        assert len(window) == 2
+        assert window.newest.longitude == -73.5
+        assert window.distance_m() == pytest.approx(haversine_m(40, -74, 40, -73.5))
+
+    def test_late_fix_older_than_oldest_becomes_oldest(self):
+        window = PositionWindow(60.0)
+        window.add(40.0, -74.0, 10.0)
+        window.add(40.0, -73.0, 20.0)
+        window.add(41.0, -74.0, 5.0)
+
+        assert window.oldest.latitude == 41.0
+        assert window.span_seconds == 15.0
+
+
+class TestTrackers:
+    """The trackers give the same results as their old deque windows."""
+
+    def test_speed_tracker_matches_reference(self):
+        rng = random.Random(3)
+        fixes = []
+        lat, lon = 40.0, -100.0
+        for index in range(3000):
+            lat += 0.0004 + rng.gauss(0, 0.00005)
+            lon += 0.0003
+            fixes.append((lat, lon, index * 0.1))
+        tracker = SpeedTracker(smoothing_duration_seconds=WINDOW_SECONDS)
+
+        speeds = [tracker.update(*fix) for fix in fixes]
+
+        assert speeds == _reference_speed(fixes, WINDOW_SECONDS)
+        coverage = tracker.get_stats()["current_window_coverage_seconds"]
+        assert coverage == pytest.approx(WINDOW_SECONDS, abs=0.1)
+
+    def test_eta_calculator_smoothing_matches_reference(self):
+        calculator = ETACalculator(smoothing_duration_seconds=WINDOW_SECONDS)
+        samples = [
+            (300.0 + math.sin(i / 50) * 30, 1000.0 + i * 0.1) for i in range(5000)
+        ]
+
+        for speed, timestamp in samples:
+            calculator.update_speed(speed, timestamp=timestamp)
+
+        expected = _reference_mean(samples, WINDOW_SECONDS)[-1]
+        assert calculator.get_smoothed_speed() == pytest.approx(
+            expected, rel=MEAN_RELATIVE_TOLERANCE
+        )
+        assert calculator.get_stats()["speed_samples"] == 1201
+
+    def test_heading_tracker_ignores_out_of_order_fixes(self):
+        tracker = HeadingTracker(min_distance_meters=10.0, max_age_seconds=30.0)
+        start = datetime(2025, 1, 1, 12, 0, 0)
+        tracker.update(40.0, -74.0, start)
+        heading = tracker.update(40.01, -74.0, start + timedelta(seconds=5))
+
+        # A stale fix from behind the anchor would otherwise flip the bearing
+        late = tracker.update(40.0, -74.0, start + timedelta(seconds=2))
+
+        assert heading == pytest.approx(0.0, abs=0.01)
+        assert late == heading
@@ -0,0 +1,121 @@
+"""Tests for route polylines and grid-based label placement."""
+
+import matplotlib.pyplot as plt
+import pytest
+
+from app.mission.exporter.map_overlays import (
+    RoutePolylines,
+    leader_segments,
+    place_labels,
+    split_at_idl,
+)
+
+
+def _overlap(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class TestSplitAtIdl:
+    """Segments crossing ±180° are split at the date line."""
+
+    def test_short_segment_is_unchanged(self):
+        assert split_at_idl(10, 20, 30, 25) == [((10, 20), (30, 25))]
+
+    def test_eastbound_crossing_is_split(self):
+        pieces = split_at_idl(170, 10, -170, 20)
+
+        assert pieces == [((170, 10), (180, 15.0)), ((-180, 15.0), (-170, 20))]
+
+    def test_westbound_crossing_is_split(self):
+        first, second = split_at_idl(-175, 0, 175, 10)
+
+        assert first[1][0] == -180 and second[0][0] == 180
+        assert first[1][1] == pytest.approx(5.0)
+
+
+class TestRoutePolylines:
+    """Contiguous same-colored pieces merge into one polyline."""
+
+    def test_contiguous_pieces_merge_until_color_changes(self):
+        lines = RoutePolylines()
+        lines.add_segment(0, 0, 1, 1, "green")
+        lines.add_segment(1, 1, 2, 2, "green")
+        lines.add_segment(2, 2, 3, 3, "red")
+
+        collection = lines.to_collection(linewidth=1.5)
+
+        assert len(lines) == 2
+        assert [len(path.vertices) for path in collection.get_paths()] == [3, 2]
+        assert collection.get_linewidth()[0] == 1.5
+        plt.close("all")
+
+    def test_date_line_crossing_starts_a_new_polyline(self):
+        lines = RoutePolylines()
+        lines.add_segment(170, 0, 179, 0, "green")
+        lines.add_segment(179, 0, -179, 0, "green")
+        lines.add_segment(-179, 0, -170, 0, "green")
+
+        paths = lines.to_collection().get_paths()
+
+        assert len(paths) == 2
+        assert paths[0].vertices[-1][0] == 180
+        assert paths[1].vertices[0][0] == -180
+        assert paths[1].vertices[-1][0] == -170
+
+
+class TestPlaceLabels:
+    """Greedy placement avoids overlaps and stays in bounds."""
+
+    def test_crowded_labels_do_not_overlap(self):
+        anchors = [(500.0 + 3 * index, 500.0) for index in range(12)]
+        sizes = [(80.0, 16.0)] * len(anchors)
+        obstacles = [(495.0, 495.0, 540.0, 505.0)]
+
+        placements = place_labels(
+            anchors, sizes, (0, 0, 1000, 1000), obstacles=obstacles
+        )
+
+        boxes = [placement.box for placement in placements]
+        for index, box in enumerate(boxes):
+            assert not _overlap(box, obstacles[0])
+            assert all(not _overlap(box, other) for other in boxes[index + 1 :])
+        assert not placements[0].displaced
+        assert any(placement.displaced for placement in placements)
+
+    def test_labels_near_edges_stay_in_bounds(self):
+        bounds = (0, 0, 200, 100)
+        anchors = [(0.0, 0.0), (200.0, 100.0), (100.0, 50.0)]
+        sizes = [(150.0, 40.0)] * len(anchors)
+
+        placements = place_labels(anchors, sizes, bounds)
+
+        for placement in placements:
+            x0, y0, x1, y1 = placement.box
+            assert x0 >= 0 and y0 >= 0 and x1 <= 200 and y1 <= 100
+
+    def test_exhausted_budget_places_remaining_labels_unchecked(self, caplog):
+        anchors = [(100.0, 100.0)] * 5
+        sizes = [(40.0, 10.0)] * 5
+
+        placements = place_labels(anchors, sizes, (0, 0, 1000, 1000), budget_seconds=-1)
+
+        assert len({placement.box for placement in placements}) == 1
+        assert "budget" in caplog.text
+
+    def test_no_anchors(self):
+        assert place_labels([], [], (0, 0, 10, 10)) == []
+
+
+class TestLeaderSegments:
+    """Leaders are a shortened shaft plus an open arrowhead at the marker."""
+
+    def test_shaft_and_head_geometry(self):
+        shaft, head = leader_segments(
+            (0.0, 0.0), (10.0, 0.0), shrink=1, head_length=2, head_width=1
+        )
+
+        assert shaft == [(1.0, 0.0), (9.0, 0.0)]
+        assert head == [(7.0, 1.0), (9.0, 0.0), (7.0, -1.0)]
+
+    def test_ends_closer_than_shrink_draw_nothing(self):
+        assert leader_segments((0, 0), (1, 0), 1, 2, 1) == []
@@ -0,0 +1,179 @@
+"""Tests for the per-tick metrics snapshot and its collector."""
+
+import math
+from datetime import datetime
+
+from prometheus_client import CollectorRegistry, Histogram, generate_latest
+
+from app.core.metrics import (
+    REGISTRY,
+    PoiMetric,
+    clear_telemetry_metrics,
+    get_metrics_snapshot,
+    publish_poi_metrics,
+    update_metrics_from_telemetry,
+)
+from app.core.metrics.snapshot import (
+    SNAPSHOT_HISTOGRAMS,
+    SnapshotCollector,
+    begin_metrics_snapshot,
+    publish_metrics_snapshot,
+)
+from app.models.telemetry import (
+    EnvironmentalData,
+    HistoryData,
+    NetworkData,
+    ObstructionData,
+    PositionData,
+    TelemetryData,
+)
+
+
+def _telemetry(latitude=40.0, latency_ms=55.0):
+    return TelemetryData(
+        timestamp=datetime.now(),
+        position=PositionData(
+            latitude=latitude,
+            longitude=-100.0,
+            altitude=35000.0,
+            speed=450.0,
+            heading=90.0,
+        ),
+        network=NetworkData(
+            latency_ms=latency_ms,
+            throughput_down_mbps=180.0,
+            throughput_up_mbps=25.0,
+            packet_loss_percent=0.5,
+        ),
+        obstruction=ObstructionData(obstruction_percent=3.0),
+        environmental=EnvironmentalData(
+            signal_quality_percent=90.0, uptime_seconds=3600.0
+        ),
+    )
+
+
+def _value(metric, /, **labels):
+    return REGISTRY.get_sample_value(metric, labels)
+
+
+class TestSnapshotPublishing:
+    """One snapshot per tick, exported at scrape time."""
+
+    def test_tick_publishes_one_snapshot(self):
+        before = get_metrics_snapshot()
+
+        update_metrics_from_telemetry(_telemetry(latitude=41.5))
+
+        snapshot = get_metrics_snapshot()
+        assert snapshot is not before
+        assert snapshot.position[0] == 41.5
+        assert _value("starlink_dish_latitude_degrees") == 41.5
+        assert _value("starlink_aircraft_position", dimension="latitude") == 41.5
+        assert _value("starlink_network_latency_ms_current") == 55.0
+
+    def test_dish_history_published_when_present(self):
+        telemetry = _telemetry()
+        telemetry.history = HistoryData(
+            samples=10,
+            packet_loss_percent=12.5,
+            latency_ms=None,
+            downlink_bytes=4.0e6,
+            uplink_bytes=5.0e5,
+            skipped_samples=3,
+        )
+
+        update_metrics_from_telemetry(telemetry)
+
+        assert _value("starlink_network_packet_loss_percent_window") == 12.5
+        assert math.isnan(_value("starlink_network_latency_ms_window"))
+        assert _value("starlink_network_download_bytes") == 4.0e6
+        assert _value("starlink_network_upload_bytes") == 5.0e5
+        assert _value("starlink_network_history_skipped_samples") == 3
+
+    def test_histograms_match_prometheus_client(self):
+        reference = Histogram(
+            "starlink_network_latency_ms",
+            SNAPSHOT_HISTOGRAMS["starlink_network_latency_ms"][0],
+            labelnames=["mode", "status"],
+            buckets=SNAPSHOT_HISTOGRAMS["starlink_network_latency_ms"][1],
+            registry=CollectorRegistry(),
+        )
+        for latency in (15.0, 20.0, 61.0, 150.0, 900.0):
+            builder = begin_metrics_snapshot()
+            builder.observe("starlink_network_latency_ms", ("sim", "ok"), latency)
+            publish_metrics_snapshot(builder)
+            reference.labels(mode="sim", status="ok").observe(latency)
+
+        expected = {
+            (sample.name, sample.labels.get("le")): sample.value
+            for metric in reference.collect()
+            for sample in metric.samples
+            if not sample.name.endswith("_created")
+        }
+        actual = {
+            (sample.name, sample.labels.get("le")): sample.value
+            for metric in SnapshotCollector().collect()
+            if metric.name == "starlink_network_latency_ms"
+            for sample in metric.samples
+            if sample.labels.get("mode") == "sim"
+        }
+        assert actual == expected
+
+    def test_scrape_sees_a_single_tick(self):
+        update_metrics_from_telemetry(_telemetry(latitude=10.0, latency_ms=30.0))
+        families = SnapshotCollector().collect()
+        first = next(families)
+
+        # A tick published mid-scrape does not leak into the rest of it
+        update_metrics_from_telemetry(_telemetry(latitude=20.0, latency_ms=90.0))
+        rest = {family.name: family for family in families}
+
+        assert first.samples[0].value == 10.0
+        latency = rest["starlink_network_latency_ms_current"].samples[0].value
+        assert latency == 30.0
+
+    def test_disconnect_clears_dish_gauges_only(self):
+        update_metrics_from_telemetry(_telemetry())
+        phase = _value("starlink_flight_phase")
+
+        clear_telemetry_metrics()
+
+        assert math.isnan(_value("starlink_dish_latitude_degrees"))
+        assert math.isnan(_value("starlink_aircraft_position", dimension="altitude"))
+        assert _value("starlink_flight_phase") == phase
+        assert _value("starlink_uptime_seconds") == 3600.0
+
+    def test_poi_series_follow_the_latest_set(self):
+        publish_poi_metrics(
+            [
+                PoiMetric("Alpha", "fuel", "estimated", 1000.0, 60.0),
+                PoiMetric("Bravo", "", "estimated", 2000.0, None),
+            ]
+        )
+        labels = {"category": "fuel", "eta_type": "estimated"}
+        assert _value("starlink_eta_poi_seconds", name="Alpha", **labels) == 60.0
+        assert (
+            _value(
+                "starlink_distance_to_poi_meters",
+                name="Bravo",
+                category="",
+                eta_type="estimated",
+            )
+            == 2000.0
+        )
+        # No usable speed: distance only
+        assert (
+            _value(
+                "starlink_eta_poi_seconds",
+                name="Bravo",
+                category="",
+                eta_type="estimated",
+            )
+            is None
+        )
+
+        publish_poi_metrics([PoiMetric("Charlie", "", "estimated", 5.0, 1.0)])
+
+        output = generate_latest(REGISTRY).decode()
+        assert 'name="Alpha"' not in output
+        assert 'name="Charlie"' in output
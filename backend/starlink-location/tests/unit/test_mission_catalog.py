@@ -0,0 +1,188 @@
+"""Tests for the mission catalog index."""
+
+import json
+import shutil
+from unittest.mock import patch
+
+import pytest
+
+from app.mission import storage
+from app.mission.catalog import CATALOG_FILENAME
+from app.mission.models import Mission, MissionLeg, TransportConfig
+from app.mission.storage import (
+    delete_mission,
+    delete_mission_v2,
+    get_active_mission_ids,
+    get_mission_catalog,
+    list_mission_summaries_v2,
+    list_missions,
+    rebuild_mission_catalog,
+    save_mission,
+    save_mission_v2,
+)
+
+
+@pytest.fixture
+def missions_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.mission.storage.MISSIONS_DIR", tmp_path)
+    return tmp_path
+
+
+def _leg(mission_id, active=False, route_id="route-a"):
+    return MissionLeg(
+        id=mission_id,
+        name=f"Leg {mission_id}",
+        route_id=route_id,
+        transports=TransportConfig(initial_x_satellite_id="X-1"),
+        is_active=active,
+    )
+
+
+def _mission(mission_id, leg_ids=("leg-1", "leg-2")):
+    return Mission(
+        id=mission_id,
+        name=f"Mission {mission_id}",
+        description="Catalog test",
+        metadata={"owner": "ops"},
+        legs=[_leg(leg_id) for leg_id in leg_ids],
+    )
+
+
+class TestMissionCatalog:
+    """Saves and deletes keep the catalog in step with the mission files."""
+
+    def test_listing_reads_only_the_catalog(self, missions_dir):
+        save_mission(_leg("b-mission", route_id="route-b"))
+        save_mission(_leg("a-mission", active=True))
+
+        with patch("app.mission.storage.json.load") as json_load:
+            missions = list_missions()
+            active = get_active_mission_ids()
+
+        json_load.assert_not_called()
+        assert [m["id"] for m in missions] == ["a-mission", "b-mission"]
+        assert missions[1]["route_id"] == "route-b"
+        assert missions[0]["is_active"] is True
+        assert active == ["a-mission"]
+
+    def test_resave_updates_row(self, missions_dir):
+        leg = _leg("mission-1", active=True)
+        save_mission(leg)
+        leg.is_active = False
+        save_mission(leg)
+
+        row = get_mission_catalog().get("legs", "mission-1")
+
+        assert row["is_active"] is False
+        assert row["checksum"] == storage.compute_mission_checksum(leg)
+        assert get_active_mission_ids() == []
+
+    def test_delete_removes_rows(self, missions_dir):
+        save_mission(_leg("mission-1"))
+        save_mission_v2(_mission("multi"))
+
+        assert delete_mission("mission-1")
+        assert delete_mission_v2("multi")
+
+        assert list_missions() == []
+        assert list_mission_summaries_v2() == []
+        assert not (missions_dir / "multi").exists()
+
+    def test_v2_summaries_have_metadata_and_leg_stubs(self, missions_dir):
+        save_mission_v2(_mission("multi"))
+
+        with patch("app.mission.storage.json.load") as json_load:
+            (summary,) = list_mission_summaries_v2()
+
+        json_load.assert_not_called()
+        assert summary.name == "Mission multi"
+        assert summary.metadata == {"owner": "ops"}
+        assert [leg.id for leg in summary.legs] == ["leg-1", "leg-2"]
+
+    def test_missing_catalog_is_rebuilt_from_files(self, missions_dir):
+        save_mission(_leg("mission-1", active=True))
+        save_mission_v2(_mission("multi", leg_ids=("leg-1",)))
+        (missions_dir / CATALOG_FILENAME).unlink()
+
+        assert [m["id"] for m in list_missions()] == ["mission-1"]
+        assert [m.id for m in list_mission_summaries_v2()] == ["multi"]
+        assert get_active_mission_ids() == ["mission-1"]
+
+    def test_corrupt_catalog_is_rebuilt(self, missions_dir):
+        save_mission(_leg("mission-1"))
+        (missions_dir / CATALOG_FILENAME).write_text("{not json")
+
+        assert [m["id"] for m in list_missions()] == ["mission-1"]
+        data = json.loads((missions_dir / CATALOG_FILENAME).read_text())
+        assert "mission-1" in data["legs"]
+
+    def test_rebuild_picks_up_external_changes(self, missions_dir):
+        save_mission(_leg("mission-1"))
+        extra = _leg("copied-in")
+        (missions_dir / "copied-in.json").write_text(extra.model_dump_json())
+
+        assert rebuild_mission_catalog() == 2
+        assert [m["id"] for m in list_missions()] == ["copied-in", "mission-1"]
+
+    def test_missions_copied_in_are_indexed(self, missions_dir, tmp_path_factory):
+        outside = tmp_path_factory.mktemp("outside")
+        save_mission_v2(_mission("copied"))
+        shutil.move(str(missions_dir / "copied"), str(outside / "copied"))
+        save_mission(_leg("mission-1"))
+        assert [m["id"] for m in list_missions()] == ["mission-1"]
+        assert list_mission_summaries_v2() == []
+
+        extra = _leg("copied-in", active=True)
+        (missions_dir / "copied-in.json").write_text(extra.model_dump_json())
+        shutil.move(str(outside / "copied"), str(missions_dir / "copied"))
+
+        assert [m["id"] for m in list_missions()] == ["copied-in", "mission-1"]
+        assert get_active_mission_ids() == ["copied-in"]
+        assert [m.id for m in list_mission_summaries_v2()] == ["copied"]
+
+    def test_missions_removed_externally_are_dropped(self, missions_dir):
+        save_mission(_leg("mission-1"))
+        save_mission(_leg("mission-2"))
+        assert len(list_missions()) == 2
+
+        (missions_dir / "mission-2.json").unlink()
+
+        assert [m["id"] for m in list_missions()] == ["mission-1"]
+
+    def test_lookup_miss_rescans_directory(self, missions_dir):
+        save_mission(_leg("mission-1"))
+        catalog = get_mission_catalog()
+        catalog.entries("legs")
+        extra = _leg("copied-in")
+        (missions_dir / "copied-in.json").write_text(extra.model_dump_json())
+        # Pretend the directory change was not noticed
+        catalog._dir_stamp = catalog._missions_dir_stamp()
+
+        assert [m["id"] for m in list_missions()] == ["mission-1"]
+        assert catalog.get("legs", "copied-in")["name"] == "Leg copied-in"
+
+    def test_drift_is_reconciled_on_startup(self, missions_dir):
+        save_mission(_leg("mission-1"))
+        extra = _leg("copied-in")
+        (missions_dir / "copied-in.json").write_text(extra.model_dump_json())
+        # A new process starts with the stale catalog file
+        storage._catalogs.clear()
+
+        assert [m["id"] for m in list_missions()] == ["copied-in", "mission-1"]
+        data = json.loads((missions_dir / CATALOG_FILENAME).read_text())
+        assert "copied-in" in data["legs"]
+        assert "copied-in" in data["files"]["legs"]
+
+    def test_failed_save_invalidates_catalog(self, missions_dir):
+        save_mission(_leg("mission-1"))
+
+        with patch(
+            "app.mission.storage.compute_mission_checksum",
+            side_effect=OSError("disk full"),
+        ):
+            with pytest.raises(OSError):
+                save_mission(_leg("mission-2"))
+
+        assert not (missions_dir / CATALOG_FILENAME).exists()
+        # The half-saved mission file is picked up by the rebuild
+        assert [m["id"] for m in list_missions()] == ["mission-1", "mission-2"]
@@ -0,0 +1,278 @@
+"""Tests for the streaming mission package importer."""
+
+import io
+import json
+import zipfile
+from unittest.mock import patch
+
+import pytest
+from fastapi import UploadFile
+
+from app.mission.models import Mission, MissionLeg, TransportConfig
+from app.mission.package import (
+    ImportPackageError,
+    UploadTooLargeError,
+    import_mission_package,
+    read_package,
+    spool_upload,
+)
+from app.models.poi import POICreate
+from app.services.poi_manager import POIManager
+from app.services.route_manager import RouteManager
+
+ROUTE_KML = """<?xml version="1.0" encoding="UTF-8"?>
+<kml xmlns="http://www.opengis.net/kml/2.2">
+  <Document>
+    <name>Imported Route</name>
+    <Placemark>
+      <LineString>
+        <coordinates>
+          -74.0060,40.7128,100
+          -74.0070,40.7138,110
+        </coordinates>
+      </LineString>
+    </Placemark>
+  </Document>
+</kml>"""
+
+
+@pytest.fixture
+def mission():
+    leg = MissionLeg(
+        id="leg-1",
+        name="Leg 1",
+        route_id="route-a",
+        transports=TransportConfig(initial_x_satellite_id="X-1"),
+    )
+    return Mission(id="import-mission", name="Import Mission", legs=[leg])
+
+
+def _package(mission, extra=None, manifest=None):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        zf.writestr("mission.json", mission.model_dump_json())
+        for name, content in (extra or {}).items():
+            zf.writestr(name, content)
+        if manifest is not None:
+            zf.writestr("manifest.json", json.dumps(manifest))
+    return buffer.getvalue()
+
+
+def _pois(*pois):
+    return json.dumps({"pois": list(pois)})
+
+
+class TestSpoolUpload:
+    """Uploads are copied to disk in chunks under a size limit."""
+
+    async def test_upload_is_written_in_chunks(self, tmp_path):
+        upload = UploadFile(io.BytesIO(b"x" * 2500), filename="mission.zip")
+        destination = tmp_path / "upload.zip"
+
+        with patch.object(upload, "read", wraps=upload.read) as read:
+            written = await spool_upload(upload, destination, chunk_size=1000)
+
+        assert written == 2500
+        assert destination.read_bytes() == b"x" * 2500
+        assert [call.args[0] for call in read.call_args_list] == [1000] * 4
+
+    async def test_oversized_upload_is_rejected_and_removed(self, tmp_path):
+        upload = UploadFile(io.BytesIO(b"x" * 2500), filename="mission.zip")
+        destination = tmp_path / "upload.zip"
+
+        with pytest.raises(UploadTooLargeError):
+            await spool_upload(upload, destination, max_bytes=2000, chunk_size=1000)
+
+        assert not destination.exists()
+
+
+class TestReadPackage:
+    """Packages are validated before anything is imported."""
+
+    def _read(self, data):
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            return read_package(zf)
+
+    def test_missing_mission_json(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("routes/a.kml", ROUTE_KML)
+
+        with pytest.raises(ImportPackageError, match="missing mission.json"):
+            self._read(buffer.getvalue())
+
+    def test_invalid_mission_json(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("mission.json", json.dumps({"name": "No ID"}))
+
+        with pytest.raises(ImportPackageError, match="Invalid mission.json"):
+            self._read(buffer.getvalue())
+
+    def test_manifest_files_must_be_present(self, mission):
+        manifest = {
+            "mission_id": mission.id,
+            "file_structure": {"routes": ["routes/route-a.kml", "routes/b.kml"]},
+        }
+        data = _package(mission, {"routes/route-a.kml": ROUTE_KML}, manifest)
+
+        with pytest.raises(ImportPackageError, match="routes/b.kml"):
+            self._read(data)
+
+    def test_manifest_must_match_mission(self, mission):
+        data = _package(mission, manifest={"mission_id": "other"})
+
+        with pytest.raises(ImportPackageError, match="Manifest is for mission other"):
+            self._read(data)
+
+    def test_directory_traversal_is_rejected(self, mission):
+        data = _package(mission, {"routes/../../evil.kml": ROUTE_KML})
+
+        with pytest.raises(ImportPackageError, match="directory traversal"):
+            self._read(data)
+
+    def test_contents_are_listed(self, mission):
+        data = _package(
+            mission,
+            {
+                "routes/route-a.kml": ROUTE_KML,
+                "pois/leg-1.json": _pois(),
+                "pois/satellites.json": _pois(),
+            },
+            manifest={"mission_id": mission.id, "file_structure": {}},
+        )
+
+        contents = self._read(data)
+
+        assert contents.mission.id == mission.id
+        assert contents.route_files == ["routes/route-a.kml"]
+        assert contents.poi_files == ["pois/leg-1.json"]
+        assert contents.has_satellites
+
+
+class TestImportMissionPackage:
+    """Routes are parsed and registered, POIs are written in one batch."""
+
+    @pytest.fixture
+    def managers(self, tmp_path):
+        route_manager = RouteManager(routes_dir=tmp_path / "routes")
+        poi_manager = POIManager(pois_file=tmp_path / "pois.json")
+        poi_manager.create_poi(
+            POICreate(name="X-1", latitude=0, longitude=-100.0, category="satellite")
+        )
+        poi_manager.create_poi(
+            POICreate(name="X-2", latitude=0, longitude=10.0, category="satellite")
+        )
+        return route_manager, poi_manager
+
+    def test_import_registers_routes_and_batches_pois(
+        self, tmp_path, mission, managers
+    ):
+        route_manager, poi_manager = managers
+        satellite = {"name": "X-1", "latitude": 0, "longitude": -95.0}
+        data = _package(
+            mission,
+            {
+                "routes/route-a.kml": ROUTE_KML,
+                "routes/broken.kml": "<kml><Document>",
+                "pois/satellites.json": _pois(
+                    {**satellite, "id": "x-1", "category": "satellite"},
+                    {
+                        "id": "x-2",
+                        "name": "X-2",
+                        "latitude": 0,
+                        "longitude": 10.0,
+                        "category": "satellite",
+                    },
+                    {
+                        "id": "x-3",
+                        "name": "X-3",
+                        "latitude": 0,
+                        "longitude": 50.0,
+                        "category": "satellite",
+                    },
+                ),
+                "pois/leg-1.json": _pois(
+                    *[
+                        {
+                            "id": f"poi-{index}",
+                            "name": f"POI {index}",
+                            "latitude": 40.0,
+                            "longitude": -74.0,
+                            "mission_id": mission.id,
+                        }
+                        for index in range(5)
+                    ],
+                    {**satellite, "id": "dup", "category": "satellite"},
+                ),
+            },
+        )
+        zip_path = tmp_path / "upload.zip"
+        zip_path.write_bytes(data)
+        counters = {}
+        stages = []
+        save_depths = []
+        save_pois = poi_manager._save_pois
+
+        def record_save():
+            save_depths.append(poi_manager._batch_depth)
+            save_pois()
+
+        with patch(
+            "app.mission.package.importer.save_mission_v2"
+        ) as save_mission, patch.object(
+            poi_manager, "_save_pois", side_effect=record_save
+        ):
+            result = import_mission_package(
+                zip_path,
+                tmp_path / "scratch",
+                route_manager,
+                poi_manager,
+                progress=lambda fraction, message: stages.append(message),
+                counters=counters.update,
+            )
+
+        save_mission.assert_called_once()
+        assert result["mission_id"] == mission.id
+        assert result["routes_imported"] == 1
+        assert route_manager.get_route("route-a") is not None
+        assert (tmp_path / "routes" / "route-a.kml").exists()
+        assert not (tmp_path / "routes" / "broken.kml").exists()
+        assert any("broken.kml" in warning for warning in result["warnings"])
+
+        assert result["pois_imported"] == 5
+        assert result["satellites_imported"] == 1
+        assert result["satellites_updated"] == 1
+        # Seven creates/updates, written to the POI file once
+        assert len(save_depths) == 8 and save_depths.count(0) == 1
+        assert len(POIManager(pois_file=tmp_path / "pois.json").list_pois()) == 8
+
+        assert counters == {
+            "legs": 1,
+            "routes_total": 2,
+            "routes_imported": 1,
+            "pois_total": 5,
+            "satellites_total": 3,
+            "pois_imported": 5,
+            "satellites_imported": 1,
+            "satellites_updated": 1,
+        }
+        assert stages[0] == "Validating package"
+
+    def test_invalid_package_writes_nothing(self, tmp_path, managers):
+        route_manager, poi_manager = managers
+        zip_path = tmp_path / "upload.zip"
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("mission.json", "{not json")
+            zf.writestr("routes/route-a.kml", ROUTE_KML)
+        zip_path.write_bytes(buffer.getvalue())
+
+        with patch("app.mission.package.importer.save_mission_v2") as save_mission:
+            with pytest.raises(ImportPackageError):
+                import_mission_package(
+                    zip_path, tmp_path / "scratch", route_manager, poi_manager
+                )
+
+        save_mission.assert_not_called()
+        assert route_manager.get_route("route-a") is None
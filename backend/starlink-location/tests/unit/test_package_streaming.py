@@ -0,0 +1,84 @@
+"""Tests for the streaming mission package writer."""
+
+import io
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from app.mission.models import Mission, MissionLeg, TransportConfig
+from app.mission.package import (
+    ExportPackageError,
+    export_mission_package,
+    stream_mission_package,
+)
+
+
+@pytest.fixture
+def mission():
+    legs = [
+        MissionLeg(
+            id=f"leg-{index}",
+            name=f"Leg {index}",
+            route_id=f"route-{index}",
+            transports=TransportConfig(initial_x_satellite_id="X-1"),
+        )
+        for index in range(2)
+    ]
+    return Mission(id="stream-mission", name="Stream Mission", legs=legs)
+
+
+@pytest.fixture
+def stored_mission(mission):
+    with patch("app.mission.package.__main__.load_mission_v2", return_value=mission):
+        yield mission
+
+
+class TestStreamMissionPackage:
+    """Entries are emitted as they are written, manifest last."""
+
+    def test_mission_data_is_sent_before_rendering_starts(self, stored_mission):
+        with patch(
+            "app.mission.package.__main__._ensure_leg_timelines"
+        ) as ensure_timelines:
+            chunks = stream_mission_package(stored_mission.id, None, None)
+            first = next(chunks)
+
+            assert ensure_timelines.call_count == 0
+            assert first.startswith(b"PK")
+            assert b"mission.json" in first
+            rest = list(chunks)
+
+        assert ensure_timelines.call_count == 1
+        with zipfile.ZipFile(io.BytesIO(first + b"".join(rest))) as zf:
+            assert zf.testzip() is None
+            assert zf.namelist()[0] == "mission.json"
+            assert zf.namelist()[-1] == "manifest.json"
+
+    def test_compressed_formats_are_stored(self, stored_mission):
+        archive = b"".join(stream_mission_package(stored_mission.id, None, None))
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+            types = {info.filename: info.compress_type for info in zf.infolist()}
+
+        assert types["exports/mission/mission-slides.pptx"] == zipfile.ZIP_STORED
+        assert types["exports/mission/mission-timeline.csv"] == zipfile.ZIP_DEFLATED
+        assert types["mission.json"] == zipfile.ZIP_DEFLATED
+        assert types["manifest.json"] == zipfile.ZIP_DEFLATED
+
+    def test_missing_mission_fails_before_streaming(self):
+        with patch("app.mission.package.__main__.load_mission_v2", return_value=None):
+            with pytest.raises(ExportPackageError):
+                stream_mission_package("missing", None, None)
+
+    def test_export_mission_package_matches_stream_layout(self, stored_mission):
+        zip_file = export_mission_package(stored_mission.id, None, None)
+        try:
+            with zipfile.ZipFile(zip_file) as zf:
+                names = zf.namelist()
+        finally:
+            zip_file.close()
+
+        assert names[0] == "mission.json"
+        assert names[-1] == "manifest.json"
+        assert "legs/leg-1.json" in names
@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
@@ -382,6 +383,15 @@ class TestPOIManager:
         assert "routes" in data
         assert len(data["pois"]) == 0
 
+    def test_in_memory_manager(self):
+        """pois_file=None keeps POIs in memory without reading or writing disk."""
+        manager = POIManager(pois_file=None)
+        manager.create_poi(POICreate(name="A", latitude=1.0, longitude=1.0))
+        manager.reload_pois()
+
+        assert manager.pois_file is None
+        assert [poi.id for poi in manager.list_pois()] == ["a"]
+
     def test_coordinates_validation(self, poi_manager):
         """Test creating POI with extreme coordinates."""
         # Valid extreme coordinates should work
@@ -420,3 +430,36 @@ class TestPOIManager:
         )
         poi = poi_manager.create_poi(poi_create)
         assert "x-band-beam-swap" in poi.id
+
+    def test_batch_writes_file_once(self, poi_manager, temp_pois_file):
+        """Changes inside a batch are saved together when it exits."""
+        with poi_manager.batch():
+            with poi_manager.batch():
+                poi_manager.create_poi(POICreate(name="A", latitude=1.0, longitude=1.0))
+            poi_manager.create_poi(POICreate(name="B", latitude=2.0, longitude=2.0))
+
+            on_disk = json.loads(temp_pois_file.read_text())["pois"]
+            assert on_disk == {}
+
+        on_disk = json.loads(temp_pois_file.read_text())["pois"]
+        assert set(on_disk) == {"a", "b"}
+
+    def test_batch_defers_only_the_opening_thread(self, poi_manager, temp_pois_file):
+        """Saves from other threads are not held back by an open batch."""
+        with poi_manager.batch():
+            poi_manager.create_poi(POICreate(name="A", latitude=1.0, longitude=1.0))
+
+            worker = threading.Thread(
+                target=poi_manager.create_poi,
+                args=(POICreate(name="B", latitude=2.0, longitude=2.0),),
+            )
+            worker.start()
+            worker.join()
+
+            on_disk = json.loads(temp_pois_file.read_text())["pois"]
+            assert "b" in on_disk
+            assert poi_manager._batch_depth == 1
+
+        assert poi_manager._batch_depth == 0
+        on_disk = json.loads(temp_pois_file.read_text())["pois"]
+        assert set(on_disk) == {"a", "b"}
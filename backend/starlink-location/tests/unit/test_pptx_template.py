@@ -0,0 +1,181 @@
+"""Tests for the precompiled PPTX slide template and bulk table filler."""
+
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from app.mission.exporter.pptx_builder import _add_timeline_table
+from app.mission.exporter.pptx_template import (
+    CONTENT_LAYOUT_NAME,
+    TITLE_LAYOUT_NAME,
+    CellStyle,
+    SlideTemplate,
+    add_styled_table,
+)
+from app.mission.exporter.transport_utils import STATE_COLUMNS
+
+COLUMNS = [
+    "Segment #",
+    "Status",
+    "Start Time",
+    "End Time",
+    "Duration",
+    *STATE_COLUMNS,
+    "Reasons",
+]
+
+
+@pytest.fixture
+def template(tmp_path):
+    logo = tmp_path / "logo.png"
+    Image.new("RGBA", (64, 32), (212, 175, 55, 255)).save(logo)
+    return SlideTemplate(logo_path=logo)
+
+
+def _roundtrip(prs):
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+class TestSlideTemplate:
+    """Chrome lives on branded layouts; text boxes are cloned per slide."""
+
+    def test_chrome_is_on_layouts_and_logo_embedded_once(self, template):
+        prs = template.new_presentation()
+        template.add_title_slide(prs, "Mission", "m-1", 3, "Org")
+        for index in range(5):
+            template.add_content_slide(prs, f"Slide {index}", "Footer")
+
+        data = _roundtrip(prs)
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            media = [name for name in zf.namelist() if name.startswith("ppt/media/")]
+        assert len(media) == 1
+
+        reopened = Presentation(io.BytesIO(data))
+        assert reopened.slide_width == Inches(10)
+        layouts = {slide.slide_layout.name for slide in reopened.slides}
+        assert layouts == {TITLE_LAYOUT_NAME, CONTENT_LAYOUT_NAME}
+        content_layout = reopened.slides[1].slide_layout
+        assert [shape.name for shape in content_layout.shapes] == [
+            "Header Bar",
+            "Footer Bar",
+            "Logo",
+        ]
+        logo = content_layout.shapes[2]
+        assert logo.height == Inches(0.5) and logo.width == Inches(1.0)
+
+    def test_title_slide_text(self, template):
+        prs = template.new_presentation()
+        slide = template.add_title_slide(prs, "Mission A&B", "m-1", 1, "Org")
+
+        texts = [shape.text_frame.text for shape in slide.shapes]
+        assert texts == ["Mission A&B", "Mission ID: m-1", "1 Leg | Org"]
+        title_font = slide.shapes[0].text_frame.paragraphs[0].font
+        assert title_font.bold and title_font.size.pt == 28
+
+    def test_content_slide_clones_styled_title_and_footer(self, template):
+        prs = template.new_presentation()
+        slide = template.add_content_slide(prs, "Leg 1 - Timeline", "Org\nDetails")
+
+        title, footer = slide.shapes
+        assert title.text_frame.text == "Leg 1 - Timeline"
+        assert title.text_frame.paragraphs[0].font.size.pt == 24
+        assert footer.text_frame.text == "Org\nDetails"
+        assert str(footer.text_frame.paragraphs[0].font.color.rgb) == "FFFFFF"
+        assert len({shape.shape_id for shape in slide.shapes}) == 2
+
+    def test_plain_presentation_gets_chrome_per_slide(self, template):
+        prs = Presentation()
+        slide = template.add_content_slide(
+            prs, "Title", "Footer", logo_path=template.logo_path
+        )
+
+        assert len(slide.shapes) == 5  # two bars, logo, title, footer
+
+
+class TestStyledTables:
+    """Bulk-written tables match the proxy-styled layout."""
+
+    def test_text_is_escaped(self):
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        rows = [
+            [("A<B>&C", CellStyle(fill="3366B2", bold=True, color="FFFFFF"))],
+            [("line\x07one\nline two", CellStyle(fill="FFFFFF"))],
+        ]
+        add_styled_table(slide, rows, 0, 0, [Inches(2)], Inches(1))
+
+        table = Presentation(io.BytesIO(_roundtrip(prs))).slides[0].shapes[0].table
+        assert table.cell(0, 0).text == "A<B>&C"
+        assert table.cell(1, 0).text == "line_x0007_one\nline two"
+        assert table.rows[0].height == Inches(0.5)
+
+    def test_timeline_status_coloring(self):
+        chunk = pd.DataFrame(
+            [
+                {
+                    "Segment #": 1,
+                    "Status": "NOMINAL",
+                    "Start Time": "T1",
+                    "End Time": "T2",
+                    "Duration": "1h",
+                    STATE_COLUMNS[0]: "Degraded",
+                    STATE_COLUMNS[1]: "Offline",
+                    STATE_COLUMNS[2]: "Available",
+                    "Reasons": "x_azimuth_conflict",
+                },
+                {
+                    "Segment #": 2,
+                    "Status": "NOMINAL",
+                    "Start Time": "T2",
+                    "End Time": "T3",
+                    "Duration": "1h",
+                    STATE_COLUMNS[0]: "Available",
+                    STATE_COLUMNS[1]: "Available",
+                    STATE_COLUMNS[2]: "Available",
+                    "Reasons": "AAR window",
+                },
+                {
+                    "Segment #": 3,
+                    "Status": "DEGRADED",
+                    "Start Time": "T3",
+                    "End Time": "T4",
+                    "Duration": "1h",
+                    STATE_COLUMNS[0]: "Warning",
+                    STATE_COLUMNS[1]: "Available",
+                    STATE_COLUMNS[2]: "Available",
+                    "Reasons": "",
+                },
+            ]
+        )
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        _add_timeline_table(slide, chunk, COLUMNS)
+
+        table = slide.shapes[0].table
+
+        def fill(row, col):
+            return str(table.cell(row, col).fill.fore_color.rgb)
+
+        assert table.cell(0, 0).text == ""
+        assert table.cell(0, 1).text == "Status"
+        assert fill(0, 1) == "3366B2"
+        # Two bad transports: critical
+        assert table.cell(1, 1).text == "CRITICAL"
+        assert fill(1, 1) == "DC2626"
+        assert (fill(1, 5), fill(1, 6), fill(1, 7)) == ("FFFFCC", "FFCCCC", "FFFFFF")
+        # AAR reason: safety of flight
+        assert table.cell(2, 1).text == "SOF"
+        assert fill(2, 1) == "0284C7"
+        assert fill(2, 2) == "F0F0F0"
+        assert table.cell(2, 1).text_frame.paragraphs[0].font.bold
+        # Single degraded transport
+        assert table.cell(3, 1).text == "DEGRADED"
+        assert fill(3, 1) == "EA580C"
+        assert table.cell(3, 0).text_frame.paragraphs[0].font.size.pt == 8
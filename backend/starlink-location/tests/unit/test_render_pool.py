@@ -0,0 +1,117 @@
+"""Tests for parallel export rendering."""
+
+import time
+import zipfile
+from io import BytesIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.mission.models import Mission, MissionLeg, MissionLegTimeline
+from app.mission.package.__main__ import _add_per_leg_exports_to_zip
+from app.mission.package.render_pool import ExportRenderPool
+from app.models.poi import POI
+
+
+def _slow_square(value: int) -> int:
+    """Later tasks finish first, so ordering comes from the pool, not timing."""
+    if value < 0:
+        raise ValueError(f"negative input {value}")
+    time.sleep(0.05 * (4 - value))
+    return value * value
+
+
+class TestExportRenderPool:
+    """Ordered results from worker processes, with inline fallback."""
+
+    def test_worker_results_are_yielded_in_task_order(self):
+        pool = ExportRenderPool(max_workers=2, task_timeout_seconds=120)
+        try:
+            outcomes = list(pool.run_ordered(_slow_square, [1, 2, -1, 3]))
+        finally:
+            pool.shutdown()
+
+        assert [task for task, _, _ in outcomes] == [1, 2, -1, 3]
+        assert [result for _, result, _ in outcomes] == [1, 4, None, 9]
+        assert "negative input -1" in str(outcomes[2][2])
+
+    def test_single_task_renders_inline(self):
+        pool = ExportRenderPool(max_workers=2)
+        outcomes = list(pool.run_ordered(_slow_square, [3]))
+
+        assert outcomes == [(3, 9, None)]
+        assert pool._pool is None
+
+
+class TestPerLegExports:
+    """_add_per_leg_exports_to_zip renders from route/POI snapshots."""
+
+    @pytest.fixture
+    def mission(self):
+        legs = [
+            MissionLeg(
+                id=f"leg-{index}",
+                name=f"Leg {index}",
+                route_id=f"route-{index}",
+                transports={"initial_x_satellite_id": "X-1"},
+            )
+            for index in range(3)
+        ]
+        return Mission(id="mission-1", name="Mission", legs=legs)
+
+    def test_files_are_written_in_leg_order(self, mission):
+        routes = {f"route-{index}": object() for index in range(3)}
+        route_manager = SimpleNamespace(get_route=routes.get)
+        poi = POI(
+            id="poi-1",
+            name="AAR Start",
+            latitude=1.0,
+            longitude=2.0,
+            category="mission-event",
+            route_id="route-1",
+            mission_id="mission-1",
+        )
+        poi_manager = SimpleNamespace(
+            list_pois=lambda route_id=None, mission_id=None: (
+                [poi] if route_id == "route-1" else []
+            )
+        )
+        seen = {}
+
+        def fake_export(export_format, mission, timeline, **kwargs):
+            if "poi_manager" in kwargs:
+                seen[mission.id] = kwargs["poi_manager"].list_pois(
+                    route_id=mission.route_id, mission_id="mission-1"
+                )
+            content = f"{mission.id}-{export_format.value}".encode()
+            return SimpleNamespace(content=content)
+
+        manifest = {"per_leg_exports": []}
+        buffer = BytesIO()
+        with patch(
+            "app.mission.package.__main__.load_mission_timeline",
+            side_effect=lambda leg_id, **_: MissionLegTimeline(mission_leg_id=leg_id),
+        ), patch(
+            "app.mission.package.__main__.generate_timeline_export",
+            side_effect=fake_export,
+        ), patch(
+            "app.mission.package.__main__.get_export_render_pool",
+            return_value=ExportRenderPool(max_workers=1),
+        ), zipfile.ZipFile(
+            buffer, "w"
+        ) as zf:
+            _add_per_leg_exports_to_zip(
+                zf, mission, route_manager, poi_manager, manifest
+            )
+
+        expected = [
+            f"exports/legs/leg-{index}/{name}"
+            for index in range(3)
+            for name in ("timeline.csv", "slides.pptx")
+        ]
+        assert manifest["per_leg_exports"] == expected
+        with zipfile.ZipFile(buffer) as zf:
+            assert zf.namelist() == expected
+            assert zf.read("exports/legs/leg-2/slides.pptx") == b"leg-2-pptx"
+        assert seen == {"leg-0": [], "leg-1": [poi], "leg-2": []}
@@ -0,0 +1,267 @@
+"""Unit tests for telemetry replay: recordings, ReplayCoordinator and runner."""
+
+import csv
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.export.csv_export import CSV_COLUMNS
+from app.core import clock
+from app.models.config import ReplayConfig, SimulationConfig
+from app.models.flight_status import FlightPhase
+from app.replay import ReplayCoordinator, load_recording, run_replay
+from app.replay.__main__ import main as replay_main
+from app.services.flight_state import get_flight_state_manager
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _dish_record(seconds: int, latitude: float) -> dict:
+    return {
+        "timestamp": (START + timedelta(seconds=seconds)).isoformat(),
+        "status": {
+            "pop_ping_latency_ms": 35.0,
+            "downlink_throughput_bps": 120e6,
+            "uplink_throughput_bps": 15e6,
+            "pop_ping_drop_rate": 0.01,
+            "uptime": 1000 + seconds,
+        },
+        "obstruction": {"fraction_obstructed": 0.02},
+        "location": {"latitude": latitude, "longitude": -100.0, "altitude": 3000.0},
+    }
+
+
+@pytest.fixture
+def dish_recording(tmp_path):
+    """Two minutes of captured dish responses, climbing north at ~290 knots."""
+    path = tmp_path / "dish.jsonl"
+    with open(path, "w") as f:
+        for second in range(120):
+            f.write(json.dumps(_dish_record(second, 40.0 + second * 0.0014)) + "\n")
+    return path
+
+
+@pytest.fixture
+def replay_state():
+    """Restore the wall clock and flight state after each test."""
+    get_flight_state_manager().reset()
+    yield
+    clock.set_clock(None)
+    get_flight_state_manager().reset()
+
+
+def _config(path=None, **replay) -> SimulationConfig:
+    return SimulationConfig(
+        mode="replay", replay=ReplayConfig(path=str(path) if path else None, **replay)
+    )
+
+
+class TestRecordings:
+    """Test loading the supported recording formats."""
+
+    def test_dish_capture_jsonl(self, dish_recording):
+        recording = load_recording(dish_recording)
+
+        assert len(recording) == 120
+        assert recording.start == START.timestamp()
+        assert recording.duration_seconds == 119
+        telemetry = recording.telemetry(0)
+        assert telemetry.network.throughput_down_mbps == pytest.approx(120.0)
+        assert telemetry.network.packet_loss_percent == pytest.approx(1.0)
+        assert telemetry.obstruction.obstruction_percent == pytest.approx(2.0)
+        assert telemetry.position.altitude == pytest.approx(3000.0 * 3.28084)
+        # The dish reports neither, so the coordinator derives them
+        assert not recording.has_value("speed_knots", 0)
+        assert not recording.has_value("heading_degrees", 0)
+
+    def test_telemetry_jsonl(self, tmp_path):
+        path = tmp_path / "telemetry.jsonl"
+        lines = []
+        for second in (10, 0):  # Out of order on purpose
+            lines.append(
+                json.dumps(
+                    {
+                        "timestamp": (START + timedelta(seconds=second)).isoformat(),
+                        "position": {
+                            "latitude": 41.0,
+                            "longitude": -90.0,
+                            "altitude": 35000.0,
+                            "speed": 450.0 + second,
+                            "heading": 90.0,
+                        },
+                        "network": {
+                            "latency_ms": 40.0,
+                            "throughput_down_mbps": 100.0,
+                            "throughput_up_mbps": 10.0,
+                            "packet_loss_percent": 0.0,
+                        },
+                        "obstruction": {"obstruction_percent": 1.0},
+                    }
+                )
+            )
+        path.write_text("\n".join(lines) + "\n\n")
+
+        recording = load_recording(path)
+
+        assert list(recording.timestamps) == [
+            START.timestamp(),
+            START.timestamp() + 10,
+        ]
+        assert recording.telemetry(1).position.speed == 460.0
+        assert recording.has_value("speed_knots", 0)
+
+    def test_csv_export_fills_gaps_and_drops_rows_without_position(self, tmp_path):
+        path = tmp_path / "export.csv"
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_COLUMNS)
+            row = dict.fromkeys(CSV_COLUMNS, "")
+            samples = ((0, "30", "40"), (15, "", "40.1"), (30, "50", ""))
+            for second, latency, latitude in samples:
+                row.update(
+                    timestamp=(START + timedelta(seconds=second))
+                    .replace(tzinfo=None)
+                    .isoformat()
+                    + "Z",
+                    latitude=latitude,
+                    longitude="-100",
+                    speed_knots="300",
+                    latency_ms=latency,
+                )
+                writer.writerow(row[column] for column in CSV_COLUMNS)
+
+        recording = load_recording(path)
+
+        assert len(recording) == 2
+        assert list(recording.columns["latency_ms"]) == [30.0, 30.0]
+        assert recording.telemetry(1).environmental.signal_quality_percent == 100.0
+        assert recording.telemetry(1).environmental.temperature_celsius is None
+
+    def test_rejects_unknown_format_and_bad_samples(self, tmp_path):
+        unknown = tmp_path / "flight.txt"
+        unknown.write_text("")
+        with pytest.raises(ValueError, match="Unsupported"):
+            load_recording(unknown)
+
+        bad = tmp_path / "bad.jsonl"
+        bad.write_text(json.dumps({"status": {}, "location": {}}) + "\n")
+        with pytest.raises(ValueError, match="bad.jsonl:1"):
+            load_recording(bad)
+
+
+class TestReplayCoordinator:
+    """Test virtual-clock playback."""
+
+    def test_ticks_advance_virtual_clock_by_update_interval(
+        self, tmp_path, replay_state
+    ):
+        path = tmp_path / "sparse.jsonl"
+        path.write_text(
+            "".join(
+                json.dumps(_dish_record(second, 40.0 + second * 0.01)) + "\n"
+                for second in (0, 5, 10)
+            )
+        )
+        coordinator = ReplayCoordinator(_config(path, speed=1000))
+
+        samples = [coordinator.update() for _ in range(11)]
+
+        assert clock.is_virtual()
+        assert clock.time() == START.timestamp() + 10
+        assert samples[0] is samples[4]
+        assert samples[5].timestamp == START + timedelta(seconds=5)
+        assert samples[10].timestamp == START + timedelta(seconds=10)
+        assert coordinator.tick_interval_seconds == pytest.approx(0.001)
+
+        coordinator.shutdown()
+        assert not clock.is_virtual()
+
+    def test_end_of_recording(self, dish_recording, replay_state):
+        coordinator = ReplayCoordinator(_config(dish_recording))
+
+        for _ in range(120):
+            assert coordinator.update() is not None
+        assert coordinator.update() is None
+        assert coordinator.finished
+        assert not coordinator.is_connected()
+        assert coordinator.mode == "replay"
+
+    def test_loop_restarts_recording(self, dish_recording, replay_state):
+        coordinator = ReplayCoordinator(_config(dish_recording, loop=True))
+
+        first = coordinator.update()
+        for _ in range(119):
+            coordinator.update()
+        again = coordinator.update()
+
+        assert again.timestamp == first.timestamp
+        assert not coordinator.finished
+
+    def test_derives_speed_and_heading_from_positions(
+        self, dish_recording, replay_state
+    ):
+        coordinator = ReplayCoordinator(_config(dish_recording))
+
+        for _ in range(30):
+            telemetry = coordinator.update()
+
+        # 0.0014 degrees of latitude per second is about 300 knots due north
+        assert telemetry.position.speed == pytest.approx(302, rel=0.05)
+        assert telemetry.position.heading == pytest.approx(0.0, abs=1.0)
+
+    def test_requires_recording(self, replay_state):
+        with pytest.raises(ValueError, match="replay.path"):
+            ReplayCoordinator(_config())
+
+    def test_speed_limits(self):
+        with pytest.raises(ValidationError):
+            ReplayConfig(speed=0.5)
+        with pytest.raises(ValidationError):
+            ReplayConfig(speed=1001)
+
+
+class TestRunReplay:
+    """Test driving the metric pipeline from a recording."""
+
+    def test_flight_phase_follows_recorded_time(self, dish_recording, replay_state):
+        coordinator = ReplayCoordinator(_config(dish_recording))
+
+        stats = run_replay(coordinator)
+
+        status = get_flight_state_manager().get_status()
+        assert status.phase == FlightPhase.IN_FLIGHT
+        # Departure needs 10 recorded seconds above 50 knots, not wall seconds
+        departure = status.departure_time.timestamp() - START.timestamp()
+        assert 10 <= departure <= 20
+        assert stats.ticks == 120
+        assert stats.recorded_seconds == 119
+        assert stats.speedup > 1
+        coordinator.shutdown()
+
+    def test_max_ticks(self, dish_recording, replay_state):
+        coordinator = ReplayCoordinator(_config(dish_recording, loop=True))
+
+        stats = run_replay(coordinator, max_ticks=250)
+
+        assert stats.ticks == 250
+        assert stats.ticks_per_second > 0
+        coordinator.shutdown()
+
+    def test_command_line(self, dish_recording, tmp_path, replay_state, capsys):
+        exit_code = replay_main(
+            [
+                str(dish_recording),
+                "--routes-dir",
+                str(tmp_path / "routes"),
+                "--pois",
+                str(tmp_path / "pois.json"),
+            ]
+        )
+
+        assert exit_code == 0
+        output = capsys.readouterr().out
+        assert "120 ticks, 119s recorded" in output
+        assert "Final flight phase: in_flight" in output
+        assert not clock.is_virtual()
@@ -11,11 +11,20 @@ from app.models.route import (
     RouteTimingProfile,
     RouteWaypoint,
 )
+from app.models.flight_status import ETAMode
+from app.models.poi import POI
+from app.services.eta.projection import ETAProjection
+from app.services.eta_calculator import ETACalculator
+from app.services.route_eta import (
+    get_eta_cache_stats,
+    invalidate_poi_etas,
+)
 from app.services.route_eta_calculator import (
     RouteETACalculator,
     clear_eta_cache,
     cleanup_eta_cache,
 )
+from app.services.route_manager import RouteManager
 
 
 def _build_sample_route() -> ParsedRoute:
@@ -169,3 +178,80 @@ def test_cache_is_cleared_between_runs():
     clear_eta_cache()
     # Subsequent cleanup should remove nothing.
     assert cleanup_eta_cache() == 0
+
+
+def test_route_progress_reuses_cached_remaining_duration(monkeypatch):
+    """Progress within the same along-track bucket reuses the cached segment walk."""
+    clear_eta_cache()
+    route = _build_sample_route()
+    calls = []
+    original = RouteETACalculator._calculate_remaining_duration_from_segments
+
+    def counting(self, start_index):
+        calls.append(start_index)
+        return original(self, start_index)
+
+    monkeypatch.setattr(
+        RouteETACalculator, "_calculate_remaining_duration_from_segments", counting
+    )
+
+    first = RouteETACalculator(route).get_route_progress(40.55, -75.0)
+    second = RouteETACalculator(route).get_route_progress(40.56, -75.0)
+
+    assert len(calls) == 1
+    assert (
+        second["expected_duration_remaining_seconds"]
+        == first["expected_duration_remaining_seconds"]
+    )
+    assert get_eta_cache_stats()["hits"] >= 1
+
+
+def test_estimated_poi_etas_are_cached_until_pois_change(monkeypatch):
+    """Route-aware POI ETAs are computed once per position and speed bucket."""
+    clear_eta_cache()
+    route = _build_sample_route()
+    poi = POI(
+        id="poi-arrival",
+        name="Arrival",
+        latitude=41.0,
+        longitude=-75.0,
+        route_id=route.metadata.file_path,
+    )
+    calls = []
+    original = ETAProjection._calculate_route_aware_eta_estimated
+
+    def counting(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ETAProjection, "_calculate_route_aware_eta_estimated", counting)
+    calculator = ETACalculator()
+
+    def eta(lat, speed=200.0):
+        metrics = calculator.calculate_poi_metrics(
+            lat, -75.0, [poi], speed, active_route=route, eta_mode=ETAMode.ESTIMATED
+        )
+        return metrics["poi-arrival"]["eta_seconds"]
+
+    first = eta(40.1)
+    assert eta(40.1001, speed=200.2) == first
+    assert len(calls) == 1
+
+    invalidate_poi_etas()
+    eta(40.1)
+    eta(40.1, speed=260.0)
+    assert len(calls) == 3
+
+
+def test_route_activation_invalidates_route_etas(tmp_path):
+    """Activating a route drops its cached results."""
+    clear_eta_cache()
+    manager = RouteManager(routes_dir=tmp_path)
+    route = _build_sample_route()
+    manager.add_route("test-route", route)
+    RouteETACalculator(route).get_route_progress(40.55, -75.0)
+    assert get_eta_cache_stats()["cached_entries"] == 1
+
+    manager.activate_route("test-route")
+
+    assert get_eta_cache_stats()["cached_entries"] == 0
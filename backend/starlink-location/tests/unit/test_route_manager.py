@@ -80,6 +80,15 @@ class TestRouteManager:
         assert len(route_manager.list_routes()) == 0
         assert route_manager.get_active_route() is None
 
+    def test_in_memory_manager_has_no_directory(self):
+        """routes_dir=None gives a manager that never touches disk."""
+        route_manager = RouteManager(routes_dir=None)
+        route_manager.start_watching()
+
+        assert route_manager.routes_dir is None
+        assert route_manager._observer is None
+        assert route_manager.list_routes() == {}
+
     def test_load_existing_routes(self, temp_routes_dir):
         """Test loading existing routes on startup."""
         # Create KML files before initializing manager
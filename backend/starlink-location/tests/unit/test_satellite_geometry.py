@@ -7,14 +7,18 @@ against known reference values.
 import math
 
 
+import numpy as np
+
 from app.satellites.geometry import (
     GEOSTATIONARY_ALTITUDE,
     WGS84_SEMI_MAJOR_AXIS,
     azimuth_elevation_from_ecef,
+    azimuth_in_range_mask,
     ecef_from_geodetic,
     geodetic_from_ecef,
     is_in_azimuth_range,
     look_angles,
+    look_angles_batch,
 )
 
 
@@ -294,6 +298,45 @@ class TestGeometryEdgeCases:
         assert GEOSTATIONARY_ALTITUDE < 36000000  # < 36,000 km
 
 
+class TestBatchLookAngles:
+    """Test vectorized look angles against the scalar implementation."""
+
+    def test_batch_matches_scalar(self):
+        """Batch results should match look_angles() sample for sample."""
+        lats = np.linspace(-80.0, 80.0, 41)
+        lons = np.linspace(-179.0, 179.0, 41)
+        alts = np.linspace(0.0, 12000.0, 41)
+        sat_lons = np.linspace(-150.0, 150.0, 41)
+
+        azimuths, elevations = look_angles_batch(lats, lons, alts, sat_lons)
+
+        for idx in range(len(lats)):
+            expected_az, expected_el = look_angles(
+                lats[idx], lons[idx], alts[idx], sat_lons[idx]
+            )
+            assert abs(azimuths[idx] - expected_az) < 1e-6
+            assert abs(elevations[idx] - expected_el) < 1e-6
+
+    def test_batch_broadcasts_scalar_satellite(self):
+        """A single satellite longitude should broadcast across all samples."""
+        azimuths, elevations = look_angles_batch(
+            [0.0, 45.0], [0.0, 0.0], [0.0, 0.0], 0.0
+        )
+
+        assert azimuths.shape == (2,)
+        assert elevations[0] > 89.0
+        assert abs(azimuths[1] - 180.0) < 1.0
+
+    def test_azimuth_in_range_mask_matches_scalar(self):
+        """Mask should agree with is_in_azimuth_range, including wraparound."""
+        azimuths = np.arange(0.0, 360.0, 7.5)
+
+        for min_az, max_az in ((135.0, 225.0), (315.0, 45.0)):
+            mask = azimuth_in_range_mask(azimuths, min_az, max_az)
+            expected = [is_in_azimuth_range(az, min_az, max_az) for az in azimuths]
+            assert mask.tolist() == expected
+
+
 class TestPerformance:
     """Test performance characteristics of calculations."""
 
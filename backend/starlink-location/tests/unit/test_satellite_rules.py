@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 
+import numpy as np
 import pytest
 
 from app.mission.models import Transport
@@ -442,3 +443,66 @@ class TestRuleEngine:
         assert is_violation is True
         assert debug["violation_reason"] == "elevation"
         assert debug["elevation_below_min"] is True
+
+
+class TestRuleEngineBatch:
+    """Test vectorized X azimuth evaluation."""
+
+    def test_batch_matches_scalar_evaluation(self):
+        """Batch masks should match per-sample evaluate_x_azimuth_window."""
+        engine = RuleEngine()
+        lats = np.linspace(-60.0, 70.0, 27)
+        lons = np.linspace(-170.0, 170.0, 27)
+        alts = np.full(27, 10000.0)
+        headings = np.linspace(0.0, 350.0, 27)
+
+        result = engine.evaluate_x_azimuth_batch(
+            lats, lons, alts, -30.0, headings_deg=headings
+        )
+
+        for idx in range(len(lats)):
+            for is_aar, mask in (
+                (False, result.normal_violation),
+                (True, result.aar_violation),
+            ):
+                violation, relative, debug = engine.evaluate_x_azimuth_window(
+                    aircraft_lat=float(lats[idx]),
+                    aircraft_lon=float(lons[idx]),
+                    aircraft_alt=float(alts[idx]),
+                    satellite_lon=-30.0,
+                    timestamp=datetime.utcnow(),
+                    heading_deg=float(headings[idx]),
+                    is_aar_mode=is_aar,
+                )
+                assert bool(mask[idx]) is violation
+                assert result.relative_azimuth[idx] == pytest.approx(relative)
+                if not is_aar:
+                    assert result.debug_metadata(idx).get(
+                        "violation_reason"
+                    ) == debug.get("violation_reason")
+
+    def test_batch_nan_heading_uses_absolute_azimuth(self):
+        """Missing headings should fall back to absolute azimuth."""
+        engine = RuleEngine()
+
+        result = engine.evaluate_x_azimuth_batch(
+            [45.0], [0.0], [0.0], 0.0, headings_deg=[np.nan]
+        )
+
+        assert result.relative_azimuth[0] == pytest.approx(result.absolute_azimuth[0])
+        assert bool(result.normal_violation[0]) is True  # due south, aft cone
+        assert len(result) == 1
+
+    def test_batch_elevation_violation_metadata(self):
+        """Samples below the minimum elevation flag both constraint masks."""
+        engine = RuleEngine(ConstraintConfig(elevation_min_degrees=10.0))
+
+        # Satellite on the far side of the planet from the aircraft
+        result = engine.evaluate_x_azimuth_batch([0.0], [0.0], [0.0], 180.0)
+
+        assert bool(result.elevation_blocked[0]) is True
+        assert bool(result.normal_violation[0]) is True
+        assert bool(result.aar_violation[0]) is True
+        debug = result.debug_metadata(0)
+        assert debug["violation_reason"] == "elevation"
+        assert debug["elevation_below_min"] is True
@@ -0,0 +1,157 @@
+"""Tests for Prometheus series lifecycle management."""
+
+import pytest
+from prometheus_client import CollectorRegistry, Gauge, generate_latest
+
+from app.core.metrics import (
+    REGISTRY,
+    SeriesRegistry,
+    starlink_route_progress_percent,
+    track_labels,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def prometheus_registry():
+    return CollectorRegistry()
+
+
+@pytest.fixture
+def gauge(prometheus_registry):
+    return Gauge(
+        "test_poi_gauge",
+        "POI gauge for tests",
+        labelnames=["name", "category"],
+        registry=prometheus_registry,
+    )
+
+
+@pytest.fixture
+def series(clock, gauge):
+    registry = SeriesRegistry(horizon_seconds=600, max_series=3, clock=clock)
+    registry.manage(gauge)
+    return registry
+
+
+def _label_sets(gauge):
+    return {
+        sample.labels["name"] for metric in gauge.collect() for sample in metric.samples
+    }
+
+
+def _evictions(reason):
+    return (
+        REGISTRY.get_sample_value(
+            "starlink_metrics_series_evictions_total",
+            {"metric": "test_poi_gauge", "reason": reason},
+        )
+        or 0
+    )
+
+
+class TestSeriesRegistry:
+    """Series are capped, aged out and dropped when no longer written."""
+
+    def test_cap_evicts_least_recently_written(self, series, gauge):
+        before = _evictions("cap")
+        for name in ("a", "b", "c"):
+            series.labels(gauge, name=name, category="x").set(1)
+        series.labels(gauge, name="a", category="x").set(2)
+
+        series.labels(gauge, name="d", category="x").set(1)
+
+        assert _label_sets(gauge) == {"a", "c", "d"}
+        assert series.series_count(gauge) == 3
+        assert _evictions("cap") == before + 1
+
+    def test_series_not_written_within_horizon_are_removed(self, series, gauge, clock):
+        series.labels(gauge, name="old", category="x").set(1)
+        clock.now = 400
+        series.labels(gauge, name="recent", category="x").set(1)
+        clock.now = 700
+
+        assert series.sweep() == 1
+        assert _label_sets(gauge) == {"recent"}
+
+    def test_writes_sweep_stale_series_periodically(self, series, gauge, clock):
+        series.labels(gauge, name="old", category="x").set(1)
+        clock.now = 1000
+
+        series.labels(gauge, name="new", category="x").set(1)
+
+        assert _label_sets(gauge) == {"new"}
+
+    def test_generation_drops_series_not_rewritten(self, series, gauge):
+        with series.generation(gauge):
+            series.labels(gauge, name="a", category="x").set(1)
+            series.labels(gauge, name="b", category="x").set(1)
+
+        with series.generation(gauge):
+            series.labels(gauge, name="b", category="x").set(2)
+
+        assert _label_sets(gauge) == {"b"}
+        assert _evictions("generation") >= 1
+
+    def test_failed_generation_removes_nothing(self, series, gauge):
+        series.labels(gauge, name="a", category="x").set(1)
+
+        with pytest.raises(RuntimeError):
+            with series.generation(gauge):
+                raise RuntimeError("ETA update failed")
+
+        assert _label_sets(gauge) == {"a"}
+
+    def test_unmanaged_metrics_pass_through(self, series):
+        other = Gauge(
+            "test_other", "Unmanaged", labelnames=["k"], registry=CollectorRegistry()
+        )
+
+        series.labels(other, k="v").set(5)
+
+        assert other.labels(k="v")._value.get() == 5
+
+    def test_payload_stays_bounded_over_multi_day_flight(
+        self, clock, gauge, prometheus_registry
+    ):
+        registry = SeriesRegistry(horizon_seconds=900, max_series=500, clock=clock)
+        registry.manage(gauge)
+        live = [f"poi-{i:05d}" for i in range(50)]
+        sizes = []
+
+        # Three days of one-minute passes, renaming a POI on every pass
+        for minute in range(3 * 24 * 60):
+            clock.now = minute * 60.0
+            live[minute % len(live)] = f"poi-{minute + 50:05d}"
+            with registry.generation(gauge):
+                for name in live:
+                    registry.labels(gauge, name=name, category="x").set(minute)
+            if minute % 360 == 0:
+                sizes.append(len(generate_latest(prometheus_registry)))
+
+        assert registry.series_count(gauge) == len(live)
+        assert max(sizes) <= sizes[0] * 1.1
+
+
+def test_global_registry_manages_route_gauges():
+    track_labels(starlink_route_progress_percent, route_name="Probe").set(1)
+
+    assert (
+        REGISTRY.get_sample_value(
+            "starlink_metrics_series_active",
+            {"metric": "starlink_route_progress_percent"},
+        )
+        >= 1
+    )
@@ -0,0 +1,139 @@
+"""Tests for tick stage timers and the sampling profiler."""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from app.core.metrics import (
+    REGISTRY,
+    set_stage_timing_enabled,
+    stage_timer,
+    update_metrics_from_telemetry,
+)
+from app.core.profiler import ProfilerBusyError, SamplingProfiler
+from app.models.telemetry import (
+    EnvironmentalData,
+    NetworkData,
+    ObstructionData,
+    PositionData,
+    TelemetryData,
+)
+
+
+def _stage_count(stage):
+    return (
+        REGISTRY.get_sample_value(
+            "starlink_tick_stage_duration_seconds_count", {"stage": stage}
+        )
+        or 0
+    )
+
+
+@pytest.fixture
+def timing_enabled():
+    set_stage_timing_enabled(True)
+    yield
+    set_stage_timing_enabled(True)
+
+
+class TestStageTimer:
+    """Stage durations are observed per stage and skipped when disabled."""
+
+    def test_records_stage_duration(self, timing_enabled):
+        before = _stage_count("eta_metrics")
+        total = REGISTRY.get_sample_value(
+            "starlink_tick_stage_duration_seconds_sum", {"stage": "eta_metrics"}
+        )
+
+        with stage_timer("eta_metrics"):
+            time.sleep(0.01)
+
+        assert _stage_count("eta_metrics") == before + 1
+        assert (
+            REGISTRY.get_sample_value(
+                "starlink_tick_stage_duration_seconds_sum", {"stage": "eta_metrics"}
+            )
+            - total
+            >= 0.01
+        )
+
+    def test_disabled_timer_records_nothing(self, timing_enabled):
+        set_stage_timing_enabled(False)
+        before = _stage_count("metrics_publish")
+
+        with stage_timer("metrics_publish"):
+            pass
+
+        assert _stage_count("metrics_publish") == before
+
+    def test_timer_records_when_stage_raises(self, timing_enabled):
+        before = _stage_count("flight_state")
+
+        with pytest.raises(ValueError):
+            with stage_timer("flight_state"):
+                raise ValueError("boom")
+
+        assert _stage_count("flight_state") == before + 1
+
+    def test_telemetry_update_times_its_stages(self, timing_enabled):
+        telemetry = TelemetryData(
+            timestamp=datetime.now(),
+            position=PositionData(
+                latitude=40.0, longitude=-100.0, altitude=35000.0, speed=450.0
+            ),
+            network=NetworkData(
+                latency_ms=50.0,
+                throughput_down_mbps=150.0,
+                throughput_up_mbps=20.0,
+                packet_loss_percent=0.0,
+            ),
+            obstruction=ObstructionData(obstruction_percent=1.0),
+            environmental=EnvironmentalData(uptime_seconds=60.0),
+        )
+        stages = ("flight_state", "eta_metrics", "metrics_publish")
+        before = {stage: _stage_count(stage) for stage in stages}
+
+        update_metrics_from_telemetry(telemetry)
+
+        for stage, count in before.items():
+            assert _stage_count(stage) == count + 1
+
+
+def _busy_loop(stop):
+    while not stop.is_set():
+        sum(range(200))
+
+
+class TestSamplingProfiler:
+    """Collapsed stacks from a bounded profile."""
+
+    def test_collapsed_stacks_include_busy_thread(self):
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy")
+        worker.start()
+        try:
+            result = SamplingProfiler().run(0.2, interval_seconds=0.005)
+        finally:
+            stop.set()
+            worker.join()
+
+        assert result.samples > 0
+        lines = result.collapsed().splitlines()
+        busy = [line for line in lines if "_busy_loop" in line]
+        assert busy
+        stack, count = busy[0].rsplit(" ", 1)
+        assert stack.startswith("busy;")
+        assert int(count) > 0
+
+    def test_one_profile_at_a_time(self):
+        profiler = SamplingProfiler()
+        runner = threading.Thread(target=profiler.run, args=(0.3,))
+        runner.start()
+        time.sleep(0.05)
+        try:
+            with pytest.raises(ProfilerBusyError):
+                profiler.run(0.01)
+        finally:
+            runner.join()
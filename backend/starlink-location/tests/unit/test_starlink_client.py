@@ -333,7 +333,7 @@ class TestStarlinkClientHistoryStats:
 class TestStarlinkClientTelemetry:
     """Test comprehensive telemetry retrieval."""
 
-    @patch("app.live.client.starlink_grpc.history_stats")
+    @patch("app.live.client.starlink_grpc.history_bulk_data")
     @patch("app.live.client.starlink_grpc.location_data")
     @patch("app.live.client.starlink_grpc.status_data")
     @patch("app.live.client.starlink_grpc.ChannelContext")
@@ -369,8 +369,8 @@ class TestStarlinkClientTelemetry:
         }
         mock_location.return_value = location_dict
 
-        # Mock history stats
-        mock_history.return_value = ({}, {}, {}, {}, {}, {}, {})
+        # Mock history samples
+        mock_history.return_value = ({"samples": 0, "end_counter": 0}, {})
 
         client = StarlinkClient()
         telemetry = client.get_telemetry()
@@ -388,7 +388,7 @@ class TestStarlinkClientTelemetry:
         assert telemetry.environmental.uptime_seconds == pytest.approx(3600.0)
         assert telemetry.environmental.temperature_celsius == pytest.approx(35.0)
 
-    @patch("app.live.client.starlink_grpc.history_stats")
+    @patch("app.live.client.starlink_grpc.history_bulk_data")
     @patch("app.live.client.starlink_grpc.location_data")
     @patch("app.live.client.starlink_grpc.status_data")
     @patch("app.live.client.starlink_grpc.ChannelContext")
@@ -416,7 +416,7 @@ class TestStarlinkClientTelemetry:
         location_dict = {"latitude": None, "longitude": None, "altitude": 0.0}
         mock_location.return_value = location_dict
 
-        mock_history.return_value = ({}, {}, {}, {}, {}, {}, {})
+        mock_history.return_value = ({"samples": 0, "end_counter": 0}, {})
 
         client = StarlinkClient()
         telemetry = client.get_telemetry()
@@ -424,7 +424,7 @@ class TestStarlinkClientTelemetry:
         assert telemetry.position.latitude == pytest.approx(0.0)
         assert telemetry.position.longitude == pytest.approx(0.0)
 
-    @patch("app.live.client.starlink_grpc.history_stats")
+    @patch("app.live.client.starlink_grpc.history_bulk_data")
     @patch("app.live.client.starlink_grpc.location_data")
     @patch("app.live.client.starlink_grpc.status_data")
     @patch("app.live.client.starlink_grpc.ChannelContext")
@@ -446,7 +446,7 @@ class TestStarlinkClientTelemetry:
         with pytest.raises(starlink_grpc.GrpcError):
             client.get_telemetry()
 
-    @patch("app.live.client.starlink_grpc.history_stats")
+    @patch("app.live.client.starlink_grpc.history_bulk_data")
     @patch("app.live.client.starlink_grpc.location_data")
     @patch("app.live.client.starlink_grpc.status_data")
     @patch("app.live.client.starlink_grpc.ChannelContext")
@@ -470,7 +470,7 @@ class TestStarlinkClientTelemetry:
             "altitude": 100.0,
         }
         mock_location.return_value = location_dict
-        mock_history.return_value = ({}, {}, {}, {}, {}, {}, {})
+        mock_history.return_value = ({"samples": 0, "end_counter": 0}, {})
 
         client = StarlinkClient()
         telemetry = client.get_telemetry()
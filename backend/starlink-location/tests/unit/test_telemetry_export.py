@@ -0,0 +1,205 @@
+"""Tests for chunked, concurrent Prometheus telemetry export."""
+
+import csv
+import io
+import logging
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+import pytest
+
+from app.api.export import prometheus
+from app.api.export.csv_export import CSV_COLUMNS, format_timestamps
+from app.api.export.prometheus import (
+    EXPORT_METRICS,
+    chunk_time_range,
+    iter_metric_windows,
+)
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakePrometheus:
+    """query_range handler enforcing Prometheus' 11,000-point limit."""
+
+    def __init__(self, sample_every=1, failing=()):
+        self.sample_every = sample_every
+        self.failing = set(failing)
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        metric = params["query"]
+        start, end = float(params["start"]), float(params["end"])
+        step = int(params["step"].rstrip("s"))
+        self.requests.append((metric, start, end))
+
+        points = int((end - start) // step) + 1
+        if points > 11000:
+            return httpx.Response(
+                400, json={"status": "error", "error": "exceeded maximum resolution"}
+            )
+        if metric in self.failing:
+            return httpx.Response(503, json={"status": "error"})
+
+        offset = [name for name, _ in EXPORT_METRICS].index(metric)
+        timestamps = [start + index * step for index in range(points)]
+        values = [
+            [ts, str(ts + offset)] for ts in timestamps if ts % self.sample_every == 0
+        ]
+        result = [{"metric": {}, "values": values}] if values else []
+        return httpx.Response(
+            200, json={"status": "success", "data": {"result": result}}
+        )
+
+
+@pytest.fixture
+def fake_prometheus():
+    handler = FakePrometheus()
+
+    def client():
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), base_url="http://prometheus"
+        )
+
+    with patch.object(prometheus, "get_prometheus_client", side_effect=client):
+        yield handler
+
+
+async def _collect(windows):
+    return [window async for window in windows]
+
+
+class TestChunkTimeRange:
+    """Windows stay on the step grid and under the point limit."""
+
+    def test_range_is_split_without_overlap(self):
+        windows = chunk_time_range(0, 25000, 1, max_points=10000)
+
+        assert windows == [(0, 9999), (10000, 19999), (20000, 25000)]
+
+    def test_short_range_is_one_window(self):
+        assert chunk_time_range(100, 160, 10) == [(100, 160)]
+
+    def test_end_before_start(self):
+        assert chunk_time_range(10, 0, 1) == []
+
+
+class TestIterMetricWindows:
+    """Metrics are queried per window and merged into columns."""
+
+    async def test_long_range_is_chunked_and_merged(self, fake_prometheus):
+        end = START + timedelta(seconds=25000)
+
+        windows = await _collect(iter_metric_windows(START, end, 1, max_points=10000))
+
+        assert [len(window) for window in windows] == [10000, 10000, 5001]
+        assert len(fake_prometheus.requests) == 3 * len(EXPORT_METRICS)
+        timestamps = np.concatenate([window.timestamps for window in windows])
+        assert np.all(np.diff(timestamps) == 1)
+        assert timestamps[0] == START.timestamp()
+        first = windows[0]
+        assert first.columns["latitude"][0] == START.timestamp()
+        assert first.columns["longitude"][0] == START.timestamp() + 1
+
+    async def test_failed_metric_leaves_column_empty(self, fake_prometheus, caplog):
+        fake_prometheus.failing = {"starlink_dish_latitude_degrees"}
+        end = START + timedelta(seconds=60)
+
+        with caplog.at_level(logging.WARNING):
+            (window,) = await _collect(iter_metric_windows(START, end, 10))
+
+        assert len(window) == 7
+        assert np.all(np.isnan(window.columns["latitude"]))
+        assert not np.any(np.isnan(window.columns["longitude"]))
+        assert "starlink_dish_latitude_degrees" in caplog.text
+
+    async def test_sparse_metrics_keep_only_sampled_rows(self, fake_prometheus):
+        fake_prometheus.sample_every = 4
+        end = START + timedelta(seconds=20)
+
+        (window,) = await _collect(iter_metric_windows(START, end, 1))
+
+        assert len(window) == 6
+        assert np.all(window.timestamps % 4 == 0)
+
+
+class TestFormatTimestamps:
+    """Timestamps match datetime.isoformat() with a Z suffix."""
+
+    def test_whole_and_fractional_seconds(self):
+        ts = START.timestamp()
+
+        assert format_timestamps(np.array([ts])) == ["2025-01-01T00:00:00Z"]
+        assert format_timestamps(np.array([ts + 0.5])) == [
+            "2025-01-01T00:00:00.500000Z"
+        ]
+
+
+class TestStarlinkCsvEndpoint:
+    """The CSV endpoint streams merged rows."""
+
+    def test_csv_is_streamed(self, client, fake_prometheus):
+        response = client.get(
+            "/api/export/starlink-csv",
+            params={
+                "start": START.isoformat(),
+                "end": (START + timedelta(minutes=1)).isoformat(),
+                "step": 10,
+            },
+        )
+
+        assert response.status_code == 200
+        assert "starlink-export-20250101-000000" in (
+            response.headers["content-disposition"]
+        )
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert rows[0] == CSV_COLUMNS
+        assert len(rows) == 8
+        assert rows[1][0] == "2025-01-01T00:00:00Z"
+        assert float(rows[1][1]) == START.timestamp()
+
+    def test_empty_range_is_404(self, client, fake_prometheus):
+        fake_prometheus.failing = {metric for metric, _ in EXPORT_METRICS}
+
+        response = client.get(
+            "/api/export/starlink-csv",
+            params={
+                "start": START.isoformat(),
+                "end": (START + timedelta(minutes=1)).isoformat(),
+            },
+        )
+
+        assert response.status_code == 404
+
+    def test_parquet_without_pyarrow_is_501(self, client, fake_prometheus):
+        with patch.dict("sys.modules", {"pyarrow.parquet": None}):
+            response = client.get(
+                "/api/export/starlink-parquet",
+                params={
+                    "start": START.isoformat(),
+                    "end": (START + timedelta(minutes=1)).isoformat(),
+                },
+            )
+
+        assert response.status_code == 501
+
+
+def test_parquet_export_round_trips(client, fake_prometheus):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    response = client.get(
+        "/api/export/starlink-parquet",
+        params={
+            "start": START.isoformat(),
+            "end": (START + timedelta(minutes=1)).isoformat(),
+            "step": 10,
+        },
+    )
+
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.column_names == CSV_COLUMNS
+    assert table.num_rows == 7
@@ -0,0 +1,248 @@
+"""Tests for the content-addressed mission timeline cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.mission.models import (
+    KaOutage,
+    MissionLeg,
+    TransportConfig,
+    XTransition,
+)
+from app.mission.storage import load_mission_timeline_meta
+from app.mission.timeline_cache import get_or_build_timeline, get_timeline_cache
+from app.mission.timeline_service import build_mission_timeline
+from app.models.route import (
+    ParsedRoute,
+    RouteMetadata,
+    RoutePoint,
+    RouteTimingProfile,
+)
+from app.models.poi import POICreate, POIUpdate
+from app.services.poi_manager import POIManager
+from app.services.route_manager import RouteManager
+
+DEPARTURE = datetime(2025, 11, 16, 10, 0, tzinfo=timezone.utc)
+
+
+def _route(offset: float = 0.0) -> ParsedRoute:
+    points = [
+        RoutePoint(
+            latitude=40.0 + i * 0.5 + offset,
+            longitude=-100.0 + i * 0.5,
+            altitude=10000.0,
+            sequence=i,
+        )
+        for i in range(10)
+    ]
+    return ParsedRoute(
+        metadata=RouteMetadata(
+            name="Cache Test Route",
+            file_path="/tmp/cache-test-route.kml",
+            point_count=len(points),
+        ),
+        points=points,
+        waypoints=[],
+        timing_profile=RouteTimingProfile(
+            departure_time=DEPARTURE,
+            arrival_time=DEPARTURE + timedelta(hours=2),
+            has_timing_data=True,
+        ),
+    )
+
+
+@pytest.fixture
+def route_manager():
+    manager = RouteManager()
+    manager._routes["cache-route"] = _route()
+    return manager
+
+
+@pytest.fixture
+def leg():
+    return MissionLeg(
+        id="cache-leg",
+        name="Cache Leg",
+        route_id="cache-route",
+        transports=TransportConfig(initial_x_satellite_id="X-1"),
+    )
+
+
+def _get(leg, route_manager, calls, save=None, force=False):
+    def build():
+        calls.append(leg.id)
+        return build_mission_timeline(leg, route_manager)
+
+    return get_or_build_timeline(
+        leg,
+        route_manager.get_route(leg.route_id),
+        build,
+        save=save,
+        force=force,
+    )
+
+
+class TestTimelineCache:
+    """Cache hit/miss behaviour and recompute reasons."""
+
+    def test_unchanged_inputs_hit_cache(self, leg, route_manager):
+        calls = []
+        first, _ = _get(leg, route_manager, calls)
+        second, summary = _get(leg, route_manager, calls)
+
+        assert calls == [leg.id]
+        assert second.segments == first.segments
+        assert summary.mission_start == DEPARTURE
+        report = get_timeline_cache().last_report(leg.id)
+        assert report.cache_hit is True
+        assert report.source == "memory"
+
+    def test_name_change_does_not_recompute(self, leg, route_manager):
+        calls = []
+        _get(leg, route_manager, calls)
+        renamed = leg.model_copy(update={"name": "Renamed", "is_active": True})
+        _get(renamed, route_manager, calls)
+
+        assert calls == [leg.id]
+
+    def test_transport_change_reports_changed_input(self, leg, route_manager):
+        calls = []
+        _get(leg, route_manager, calls)
+        edited = leg.model_copy(deep=True)
+        edited.transports.ka_outages = [
+            KaOutage(
+                id="outage-1",
+                start_time=DEPARTURE + timedelta(minutes=30),
+                duration_seconds=600,
+            )
+        ]
+        _get(edited, route_manager, calls)
+
+        assert len(calls) == 2
+        report = get_timeline_cache().last_report(leg.id)
+        assert report.cache_hit is False
+        assert report.reason == "inputs_changed"
+        assert report.changed_inputs == ["transports"]
+
+    def test_route_and_departure_changes_detected(self, leg, route_manager):
+        calls = []
+        _get(leg, route_manager, calls)
+
+        route_manager._routes["cache-route"] = _route(offset=1.0)
+        shifted = leg.model_copy(
+            update={"adjusted_departure_time": DEPARTURE + timedelta(hours=1)}
+        )
+        _get(shifted, route_manager, calls)
+
+        report = get_timeline_cache().last_report(leg.id)
+        assert report.changed_inputs == ["adjusted_departure_time", "route"]
+
+    def test_force_bypasses_cache(self, leg, route_manager):
+        calls = []
+        _get(leg, route_manager, calls)
+        _get(leg, route_manager, calls, force=True)
+
+        assert len(calls) == 2
+        assert get_timeline_cache().last_report(leg.id).reason == "forced"
+
+    def test_persisted_timeline_served_after_memory_clear(self, leg, route_manager):
+        from app.mission.storage import save_mission_timeline
+
+        calls = []
+        _get(leg, route_manager, calls, save=save_mission_timeline)
+        assert load_mission_timeline_meta(leg.id)["cache_key"]
+
+        get_timeline_cache().clear()
+        _, summary = _get(leg, route_manager, calls, save=save_mission_timeline)
+
+        assert calls == [leg.id]
+        assert summary.mission_end == DEPARTURE + timedelta(hours=2)
+        assert get_timeline_cache().last_report(leg.id).source == "disk"
+
+    def test_missing_synced_pois_trigger_rebuild(self, leg, route_manager, tmp_path):
+        poi_manager = POIManager(pois_file=tmp_path / "pois.json")
+        leg.transports.x_transitions = [
+            XTransition(
+                id="x-handoff",
+                latitude=42.0,
+                longitude=-98.0,
+                target_satellite_id="X-2",
+            )
+        ]
+        route = route_manager.get_route(leg.route_id)
+        calls = []
+
+        def build():
+            calls.append(leg.id)
+            return build_mission_timeline(leg, route_manager, poi_manager)
+
+        get_or_build_timeline(leg, route, build, poi_manager=poi_manager)
+        get_or_build_timeline(leg, route, build, poi_manager=poi_manager)
+        assert calls == [leg.id]
+
+        synced = poi_manager.list_pois(route_id="cache-route", mission_id=leg.id)
+        assert synced
+        poi_manager.delete_poi(synced[0].id)
+
+        get_or_build_timeline(leg, route, build, poi_manager=poi_manager)
+
+        assert len(calls) == 2
+        report = get_timeline_cache().last_report(leg.id)
+        assert report.reason == "pois_missing"
+        assert report.changed_inputs == ["synced_pois"]
+
+    def test_satellite_poi_move_reports_changed_longitudes(
+        self, leg, route_manager, tmp_path
+    ):
+        poi_manager = POIManager(pois_file=tmp_path / "pois.json")
+        satellite = poi_manager.create_poi(
+            POICreate(name="X-Custom", latitude=0.0, longitude=-60.0)
+        )
+        leg.transports.initial_x_satellite_id = "X-Custom"
+        route = route_manager.get_route(leg.route_id)
+        calls = []
+
+        def build():
+            calls.append(leg.id)
+            return build_mission_timeline(leg, route_manager, poi_manager)
+
+        get_or_build_timeline(leg, route, build, poi_manager=poi_manager)
+        get_or_build_timeline(leg, route, build, poi_manager=poi_manager)
+        assert calls == [leg.id]
+
+        poi_manager.update_poi(satellite.id, POIUpdate(longitude=-30.0))
+        get_or_build_timeline(leg, route, build, poi_manager=poi_manager)
+
+        assert len(calls) == 2
+        report = get_timeline_cache().last_report(leg.id)
+        assert report.reason == "inputs_changed"
+        assert report.changed_inputs == ["satellite_longitudes"]
+
+    def test_uncacheable_route_always_builds(self, leg, route_manager):
+        calls = []
+
+        def build():
+            calls.append(leg.id)
+            return build_mission_timeline(leg, route_manager)
+
+        get_or_build_timeline(leg, None, build)
+        get_or_build_timeline(leg, None, build)
+
+        assert len(calls) == 2
+        assert get_timeline_cache().last_report(leg.id).reason == "uncacheable"
+
+    def test_concurrent_lookups_count_every_request(self, leg, route_manager):
+        calls = []
+        _get(leg, route_manager, calls)
+        cache = get_timeline_cache()
+        before = cache.stats()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: _get(leg, route_manager, calls), range(32)))
+
+        stats = cache.stats()
+        assert calls == [leg.id]
+        assert stats["hits"] - before["hits"] == 32
+        assert stats["misses"] == before["misses"]
@@ -0,0 +1,201 @@
+"""Tests for incremental timeline recomputation."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.mission.models import (
+    AARWindow,
+    KaOutage,
+    MissionLeg,
+    TransportConfig,
+    XTransition,
+)
+from app.mission.timeline_builder.incremental import get_timeline_artifact_store
+from app.mission.timeline_service import build_mission_timeline
+from app.models.route import (
+    ParsedRoute,
+    RouteMetadata,
+    RoutePoint,
+    RouteTimingProfile,
+    RouteWaypoint,
+)
+from app.services.poi_manager import POIManager
+from app.services.route_manager import RouteManager
+
+DEPARTURE = datetime(2025, 11, 16, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def route_manager():
+    points = [
+        RoutePoint(
+            latitude=30.0 + i * 0.8,
+            longitude=-120.0 + i * 3.0,
+            altitude=10000.0,
+            sequence=i,
+        )
+        for i in range(40)
+    ]
+    waypoints = [
+        RouteWaypoint(
+            name=f"WP{i}",
+            latitude=points[i * 5].latitude,
+            longitude=points[i * 5].longitude,
+            order=i,
+        )
+        for i in range(8)
+    ]
+    manager = RouteManager()
+    manager._routes["incremental-route"] = ParsedRoute(
+        metadata=RouteMetadata(
+            name="Incremental Route",
+            file_path="/tmp/incremental-route.kml",
+            point_count=len(points),
+        ),
+        points=points,
+        waypoints=waypoints,
+        timing_profile=RouteTimingProfile(
+            departure_time=DEPARTURE,
+            arrival_time=DEPARTURE + timedelta(hours=12),
+            has_timing_data=True,
+        ),
+    )
+    return manager
+
+
+@pytest.fixture
+def leg():
+    return MissionLeg(
+        id="incremental-leg",
+        name="Incremental Leg",
+        route_id="incremental-route",
+        transports=TransportConfig(initial_x_satellite_id="X-1"),
+    )
+
+
+def _comparable(result):
+    timeline, summary = result
+    return (
+        [segment.model_dump(mode="json") for segment in timeline.segments],
+        timeline.statistics,
+        summary.degraded_seconds,
+        summary.critical_seconds,
+        summary.next_conflict_seconds,
+        summary.transport_states,
+        summary.sample_count,
+    )
+
+
+def _fresh(leg, route_manager, poi_manager=None):
+    get_timeline_artifact_store().clear()
+    return build_mission_timeline(leg, route_manager, poi_manager)
+
+
+class TestIncrementalTimeline:
+    """Edits recompute only the affected event sources."""
+
+    def test_ka_outage_edit_reuses_other_sources(self, leg, route_manager):
+        build_mission_timeline(leg, route_manager)
+        first = get_timeline_artifact_store().get(leg.id)
+
+        leg.transports.ka_outages.append(
+            KaOutage(
+                id="outage-1",
+                start_time=DEPARTURE + timedelta(hours=2),
+                duration_seconds=900,
+            )
+        )
+        incremental = build_mission_timeline(leg, route_manager)
+        artifacts = get_timeline_artifact_store().get(leg.id)
+
+        assert artifacts.samples is first.samples
+        assert artifacts.recomputed_sources == ["ka_outages"]
+        assert "x_azimuth" in artifacts.reused_sources
+        assert _comparable(incremental) == _comparable(_fresh(leg, route_manager))
+
+    def test_x_transition_edit_recomputes_dependent_sources(self, leg, route_manager):
+        build_mission_timeline(leg, route_manager)
+        leg.transports.x_transitions.append(
+            XTransition(
+                id="handoff",
+                latitude=45.0,
+                longitude=-70.0,
+                target_satellite_id="X-2",
+            )
+        )
+        incremental = build_mission_timeline(leg, route_manager)
+        artifacts = get_timeline_artifact_store().get(leg.id)
+
+        assert artifacts.recomputed_sources == ["x_transitions", "x_azimuth"]
+        assert _comparable(incremental) == _comparable(_fresh(leg, route_manager))
+
+    def test_aar_window_edit_matches_full_rebuild(self, leg, route_manager):
+        build_mission_timeline(leg, route_manager)
+        leg.transports.aar_windows.append(
+            AARWindow(id="aar-1", start_waypoint_name="WP2", end_waypoint_name="WP4")
+        )
+        incremental = build_mission_timeline(leg, route_manager)
+        artifacts = get_timeline_artifact_store().get(leg.id)
+
+        assert "aar_windows" in artifacts.recomputed_sources
+        assert "ka_coverage" in artifacts.reused_sources
+        assert _comparable(incremental) == _comparable(_fresh(leg, route_manager))
+
+    def test_departure_shift_resamples_route(self, leg, route_manager):
+        build_mission_timeline(leg, route_manager)
+        first = get_timeline_artifact_store().get(leg.id)
+
+        leg.adjusted_departure_time = DEPARTURE + timedelta(minutes=45)
+        build_mission_timeline(leg, route_manager)
+        artifacts = get_timeline_artifact_store().get(leg.id)
+
+        assert artifacts.geometry_key != first.geometry_key
+        assert artifacts.samples is not first.samples
+        assert {"takeoff_landing", "ka_coverage", "x_azimuth"} <= set(
+            artifacts.recomputed_sources
+        )
+        assert "ka_outages" in artifacts.reused_sources
+
+    def test_unchanged_poi_sync_is_skipped(self, leg, route_manager, tmp_path):
+        poi_manager = POIManager(pois_file=tmp_path / "pois.json")
+        leg.transports.x_transitions.append(
+            XTransition(
+                id="handoff",
+                latitude=45.0,
+                longitude=-70.0,
+                target_satellite_id="X-2",
+            )
+        )
+        build_mission_timeline(leg, route_manager, poi_manager)
+        before = {poi.id for poi in poi_manager.list_pois()}
+
+        leg.transports.ka_outages.append(
+            KaOutage(
+                id="outage-1",
+                start_time=DEPARTURE + timedelta(hours=2),
+                duration_seconds=900,
+            )
+        )
+        build_mission_timeline(leg, route_manager, poi_manager)
+
+        assert {poi.id for poi in poi_manager.list_pois()} == before
+
+    def test_deleted_pois_are_resynced(self, leg, route_manager, tmp_path):
+        poi_manager = POIManager(pois_file=tmp_path / "pois.json")
+        leg.transports.x_transitions.append(
+            XTransition(
+                id="handoff",
+                latitude=45.0,
+                longitude=-70.0,
+                target_satellite_id="X-2",
+            )
+        )
+        build_mission_timeline(leg, route_manager, poi_manager)
+        for poi in poi_manager.list_pois(mission_id=leg.id):
+            poi_manager.delete_poi(poi.id)
+
+        build_mission_timeline(leg, route_manager, poi_manager)
+
+        names = [poi.name for poi in poi_manager.list_pois(mission_id=leg.id)]
+        assert "X-Band\nSwap" in names
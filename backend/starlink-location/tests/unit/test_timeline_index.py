@@ -0,0 +1,192 @@
+"""Tests for the timeline interval index and live mission gauges."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.metrics import REGISTRY, update_live_mission_metrics
+from app.mission.models import (
+    MissionLeg,
+    MissionLegTimeline,
+    TimelineSegment,
+    TimelineStatus,
+    Transport,
+    TransportConfig,
+    TransportState,
+)
+from app.mission.storage import (
+    delete_mission_timeline,
+    get_mission_timeline_index,
+    save_mission,
+    save_mission_timeline,
+)
+from app.mission.timeline_index import (
+    compile_timeline_index,
+    drop_timeline_index,
+    get_timeline_index,
+    mission_offset_seconds,
+)
+from app.models.flight_status import FlightPhase, FlightStatus
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+# (status, x_state) for consecutive 10-minute segments
+PLAN = [
+    (TimelineStatus.NOMINAL, TransportState.AVAILABLE),
+    (TimelineStatus.DEGRADED, TransportState.OFFLINE),
+    (TimelineStatus.CRITICAL, TransportState.OFFLINE),
+    (TimelineStatus.NOMINAL, TransportState.AVAILABLE),
+    (TimelineStatus.DEGRADED, TransportState.DEGRADED),
+]
+
+
+@pytest.fixture
+def missions_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.mission.storage.MISSIONS_DIR", tmp_path)
+    drop_timeline_index()
+    yield tmp_path
+    drop_timeline_index()
+
+
+def _timeline():
+    return MissionLegTimeline(
+        mission_leg_id="leg-1",
+        created_at=START,
+        segments=[
+            TimelineSegment(
+                id=f"seg-{index}",
+                start_time=START + timedelta(minutes=10 * index),
+                end_time=START + timedelta(minutes=10 * (index + 1)),
+                status=status,
+                x_state=x_state,
+            )
+            for index, (status, x_state) in enumerate(PLAN)
+        ],
+    )
+
+
+def _gauge(name, **labels):
+    return REGISTRY.get_sample_value(name, labels)
+
+
+class TestTimelineIndex:
+    """Lookups against the compiled index."""
+
+    def test_states_follow_the_segments(self):
+        index = compile_timeline_index("leg-1", _timeline())
+
+        assert index.states_at(0)[Transport.X] == 0
+        assert index.states_at(600)[Transport.X] == 2
+        assert index.states_at(2500)[Transport.X] == 1
+        # Before departure and after the end, the nearest segment applies
+        assert index.states_at(-100)[Transport.X] == 0
+        assert index.states_at(10_000)[Transport.X] == 1
+        assert index.duration_seconds == 3000
+
+    def test_next_conflict_countdown(self):
+        index = compile_timeline_index("leg-1", _timeline())
+
+        # Adjacent degraded and critical segments form one conflict
+        assert index.conflict_starts == (600.0, 2400.0)
+        assert index.conflict_ends == (1800.0, 3000.0)
+        assert index.next_conflict_seconds(-60) == 660
+        assert index.next_conflict_seconds(100) == 500
+        assert index.next_conflict_seconds(1200) == 0
+        assert index.next_conflict_seconds(1800) == 600
+        assert index.next_conflict_seconds(3000) == -1
+
+    def test_empty_timeline(self):
+        index = compile_timeline_index(
+            "empty", MissionLegTimeline(mission_leg_id="empty", created_at=START)
+        )
+
+        assert index.states_at(0) == {}
+        assert index.next_conflict_seconds(0) == -1
+
+
+class TestMissionOffset:
+    """Mission-relative time comes from the flight status."""
+
+    def test_actual_departure_wins(self):
+        status = FlightStatus(
+            phase=FlightPhase.IN_FLIGHT,
+            departure_time=START,
+            scheduled_departure_time=START - timedelta(hours=1),
+        )
+
+        offset = mission_offset_seconds(status, START + timedelta(minutes=5))
+
+        assert offset == 300
+
+    def test_scheduled_departure_counts_down(self):
+        status = FlightStatus(scheduled_departure_time=START)
+
+        assert mission_offset_seconds(status, START - timedelta(minutes=2)) == -120
+
+    def test_no_departure_holds_at_start(self):
+        assert mission_offset_seconds(FlightStatus(), START) == 0
+
+
+class TestStoredIndex:
+    """Indexes are compiled when timelines are stored."""
+
+    def test_save_compiles_and_delete_drops(self, missions_dir):
+        save_mission_timeline("leg-1", _timeline())
+
+        assert get_timeline_index("leg-1").conflict_starts == (600.0, 2400.0)
+
+        delete_mission_timeline("leg-1")
+
+        assert get_timeline_index("leg-1") is None
+        assert get_mission_timeline_index("leg-1") is None
+
+    def test_index_is_rebuilt_from_disk_once(self, missions_dir):
+        save_mission_timeline("leg-1", _timeline())
+        drop_timeline_index()
+
+        first = get_mission_timeline_index("leg-1")
+
+        assert first.starts[-1] == 2400
+        with patch("app.mission.storage.load_mission_timeline") as load:
+            assert get_mission_timeline_index("leg-1") is first
+        load.assert_not_called()
+
+
+class TestLiveMissionMetrics:
+    """Gauges are refreshed from the index on every tick."""
+
+    def test_gauges_track_mission_time(self, missions_dir):
+        save_mission(
+            MissionLeg(
+                id="live-leg",
+                name="Live",
+                route_id="route-1",
+                transports=TransportConfig(initial_x_satellite_id="X-1"),
+                is_active=True,
+            )
+        )
+        save_mission_timeline("live-leg", _timeline())
+        manager = MagicMock()
+        manager.get_status.return_value = FlightStatus(
+            phase=FlightPhase.IN_FLIGHT, departure_time=START
+        )
+
+        with patch(
+            "app.services.flight_state.get_flight_state_manager",
+            return_value=manager,
+        ), patch("app.mission.storage.load_mission_timeline") as load:
+            update_live_mission_metrics(START + timedelta(minutes=5))
+            assert _gauge("mission_next_conflict_seconds", mission_id="live-leg") == 300
+            assert (
+                _gauge("mission_comm_state", mission_id="live-leg", transport="X") == 0
+            )
+
+            update_live_mission_metrics(START + timedelta(minutes=15))
+            assert _gauge("mission_next_conflict_seconds", mission_id="live-leg") == 0
+            assert (
+                _gauge("mission_comm_state", mission_id="live-leg", transport="X") == 2
+            )
+
+        load.assert_not_called()
+        assert _gauge("mission_phase_state", mission_id="live-leg") == 1
@@ -0,0 +1,266 @@
+"""Tests for the multi-leg timeline worker pool."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.mission.models import AARWindow, MissionLeg, TransportConfig, XTransition
+from app.mission.timeline_builder.incremental import get_timeline_artifact_store
+from app.mission.timeline_cache import get_timeline_cache
+from app.mission.timeline_pool import TimelineWorkerPool
+from app.mission.timeline_service import build_mission_timeline
+from app.models.route import (
+    ParsedRoute,
+    RouteMetadata,
+    RoutePoint,
+    RouteTimingProfile,
+    RouteWaypoint,
+)
+from app.services.poi_manager import POIManager
+from app.services.route_manager import RouteManager
+
+DEPARTURE = datetime(2025, 11, 16, 10, 0, tzinfo=timezone.utc)
+MISSION_ID = "pool-mission"
+
+
+def _route(offset: float) -> ParsedRoute:
+    points = [
+        RoutePoint(
+            latitude=30.0 + i * 0.5 - offset,
+            longitude=-110.0 + i * 2.0 + offset,
+            altitude=10000.0,
+            sequence=i,
+        )
+        for i in range(20)
+    ]
+    return ParsedRoute(
+        metadata=RouteMetadata(
+            name=f"Pool Route {offset}",
+            file_path="/tmp/pool-route.kml",
+            point_count=len(points),
+        ),
+        points=points,
+        waypoints=[
+            RouteWaypoint(
+                name=f"WP{i}",
+                latitude=points[i * 4].latitude,
+                longitude=points[i * 4].longitude,
+                order=i,
+            )
+            for i in range(5)
+        ],
+        timing_profile=RouteTimingProfile(
+            departure_time=DEPARTURE,
+            arrival_time=DEPARTURE + timedelta(hours=3),
+            has_timing_data=True,
+        ),
+    )
+
+
+@pytest.fixture
+def route_manager(tmp_path):
+    manager = RouteManager(routes_dir=tmp_path / "routes")
+    for idx in range(3):
+        manager.add_route(f"pool-route-{idx}", _route(float(idx)))
+    return manager
+
+
+@pytest.fixture
+def legs():
+    return [
+        MissionLeg(
+            id=f"pool-leg-{idx}",
+            name=f"Pool Leg {idx}",
+            route_id=f"pool-route-{idx}",
+            transports=TransportConfig(
+                initial_x_satellite_id="X-1",
+                x_transitions=[
+                    XTransition(
+                        id="handoff",
+                        latitude=33.0,
+                        longitude=-95.0,
+                        target_satellite_id="X-2",
+                    )
+                ],
+                aar_windows=[
+                    AARWindow(
+                        id="aar", start_waypoint_name="WP1", end_waypoint_name="WP2"
+                    )
+                ],
+            ),
+        )
+        for idx in range(3)
+    ]
+
+
+@pytest.fixture
+def pool():
+    worker_pool = TimelineWorkerPool(max_workers=2, job_timeout_seconds=120)
+    yield worker_pool
+    worker_pool.shutdown()
+
+
+def _inline_builder(route_manager, poi_manager, calls=None):
+    def build(leg):
+        if calls is not None:
+            calls.append(leg.id)
+        return build_mission_timeline(
+            mission=leg,
+            route_manager=route_manager,
+            poi_manager=poi_manager,
+            parent_mission_id=MISSION_ID,
+        )
+
+    return build
+
+
+def _poi_state(poi_manager):
+    return sorted(
+        (poi.name, poi.latitude, poi.longitude, poi.route_id, poi.mission_id)
+        for poi in poi_manager.list_pois()
+    )
+
+
+def _segments(timeline):
+    return [segment.model_dump(mode="json") for segment in timeline.segments]
+
+
+class TestTimelineWorkerPool:
+    """Parallel leg builds match serial builds, including side effects."""
+
+    def test_parallel_build_matches_serial(self, pool, legs, route_manager, tmp_path):
+        serial_pois = POIManager(pois_file=tmp_path / "serial.json")
+        serial = [_inline_builder(route_manager, serial_pois)(leg)[0] for leg in legs]
+        get_timeline_artifact_store().clear()
+
+        pooled_pois = POIManager(pois_file=tmp_path / "pooled.json")
+        calls = []
+        outcomes = pool.build_legs(
+            legs,
+            route_manager,
+            pooled_pois,
+            _inline_builder(route_manager, pooled_pois, calls),
+            parent_mission_id=MISSION_ID,
+            persist=False,
+        )
+
+        assert calls == []
+        assert [outcome.source for outcome in outcomes] == ["worker"] * 3
+        assert all(outcome.ok for outcome in outcomes)
+        for expected, outcome in zip(serial, outcomes):
+            assert _segments(outcome.timeline) == _segments(expected)
+        assert _poi_state(pooled_pois) == _poi_state(serial_pois)
+        assert get_timeline_artifact_store().get(legs[0].id, MISSION_ID) is not None
+
+    def test_unchanged_legs_served_from_cache(self, pool, legs, route_manager):
+        pool.build_legs(
+            legs,
+            route_manager,
+            None,
+            _inline_builder(route_manager, None),
+            parent_mission_id=MISSION_ID,
+        )
+        calls = []
+        outcomes = pool.build_legs(
+            legs,
+            route_manager,
+            None,
+            _inline_builder(route_manager, None, calls),
+            parent_mission_id=MISSION_ID,
+        )
+
+        assert calls == []
+        assert {outcome.source for outcome in outcomes} == {"cache"}
+        assert get_timeline_cache().last_report(legs[0].id).cache_hit is True
+
+    def test_single_leg_builds_inline(self, pool, legs, route_manager):
+        calls = []
+        outcomes = pool.build_legs(
+            legs[:1],
+            route_manager,
+            None,
+            _inline_builder(route_manager, None, calls),
+            parent_mission_id=MISSION_ID,
+        )
+
+        assert calls == [legs[0].id]
+        assert outcomes[0].source == "inline"
+        assert pool._pool is None
+
+    def test_unknown_route_reports_build_error(self, pool, route_manager):
+        leg = MissionLeg(
+            id="no-route",
+            name="No Route",
+            route_id="missing-route",
+            transports=TransportConfig(initial_x_satellite_id="X-1"),
+        )
+        outcomes = pool.build_legs(
+            [leg],
+            route_manager,
+            None,
+            _inline_builder(route_manager, None),
+            parent_mission_id=MISSION_ID,
+        )
+
+        assert len(outcomes) == 1
+        assert not outcomes[0].ok
+        assert "missing-route" in outcomes[0].error
+
+    def test_job_timeout_fails_only_that_leg(self, legs, route_manager):
+        worker_pool = TimelineWorkerPool(max_workers=2, job_timeout_seconds=0.001)
+        calls = []
+        try:
+            outcomes = worker_pool.build_legs(
+                legs,
+                route_manager,
+                None,
+                _inline_builder(route_manager, None, calls),
+                parent_mission_id=MISSION_ID,
+                persist=False,
+            )
+        finally:
+            worker_pool.shutdown()
+
+        assert not outcomes[0].ok
+        assert outcomes[0].error.startswith("Timed out")
+        # Legs lost with the recycled pool are rebuilt inline
+        assert all(outcome.ok for outcome in outcomes[1:])
+        assert calls == [leg.id for leg in legs[1:]]
+        assert worker_pool._pool is None
+
+    def test_inputs_published_privately_and_removed(self, pool, legs, route_manager):
+        pool.build_legs(
+            legs,
+            route_manager,
+            None,
+            _inline_builder(route_manager, None),
+            parent_mission_id=MISSION_ID,
+            persist=False,
+            force=True,
+        )
+        input_dir = pool._input_dir
+        assert input_dir is not None
+        assert input_dir.stat().st_mode & 0o777 == 0o700
+        assert list(input_dir.glob("ParsedRoute-*.pickle"))
+
+        pool.shutdown()
+        assert not input_dir.exists()
+
+    def test_superseded_inputs_are_removed(self, pool, legs, route_manager):
+        for offset in (0.0, 1.0, 2.0):
+            for idx in range(3):
+                route_manager.add_route(f"pool-route-{idx}", _route(offset + idx * 0.1))
+            pool.build_legs(
+                legs,
+                route_manager,
+                None,
+                _inline_builder(route_manager, None),
+                parent_mission_id=MISSION_ID,
+                persist=False,
+                force=True,
+            )
+
+        # Only the latest value of each input type outlives its batch
+        assert len(list(pool._input_dir.glob("ParsedRoute-*.pickle"))) == 1
+        assert len(list(pool._input_dir.iterdir())) == len(pool._published)
+        assert pool._input_refs == {}
@@ -0,0 +1,196 @@
+"""Tests for the binary mission timeline format."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.mission.models import (
+    MissionLegTimeline,
+    RouteSampleData,
+    TimelineAdvisory,
+    TimelineSegment,
+    TimelineStatus,
+    Transport,
+    TransportState,
+)
+from app.mission.storage import (
+    delete_mission_timeline,
+    get_mission_legacy_timeline_path,
+    get_mission_timeline_path,
+    load_mission_timeline,
+    open_mission_timeline,
+    save_mission_timeline,
+)
+from app.mission.timeline_store import open_timeline_file
+
+START = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def missions_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("app.mission.storage.MISSIONS_DIR", tmp_path)
+    return tmp_path
+
+
+def _timeline(segment_count=6, with_samples=True):
+    segments = []
+    for index in range(segment_count):
+        degraded = index % 3 == 1
+        x_state = TransportState.OFFLINE if degraded else TransportState.AVAILABLE
+        segments.append(
+            TimelineSegment(
+                id=f"seg-{index}",
+                start_time=START + timedelta(minutes=10 * index),
+                end_time=START + timedelta(minutes=10 * (index + 1)),
+                status=TimelineStatus.DEGRADED if degraded else TimelineStatus.NOMINAL,
+                x_state=x_state,
+                ka_state=TransportState.DEGRADED,
+                reasons=["x_azimuth_conflict", "ka_coverage_gap"] if degraded else [],
+                impacted_transports=[Transport.X, Transport.KU] if degraded else [],
+                metadata={"satellites": {"X": "X-1", "Ka": ["AOR", "POR"]}},
+            )
+        )
+    samples = None
+    if with_samples:
+        samples = [
+            RouteSampleData(
+                timestamp=START + timedelta(seconds=60 * index),
+                latitude=40.0 + index,
+                longitude=-74.0,
+                altitude=None if index == 0 else 1000.0 * index,
+                coverage=["AOR"] if index % 2 else [],
+            )
+            for index in range(4)
+        ]
+    return MissionLegTimeline(
+        mission_leg_id="leg-1",
+        created_at=START,
+        segments=segments,
+        advisories=[
+            TimelineAdvisory(
+                id="adv-1",
+                timestamp=START,
+                event_type="transition",
+                transport=Transport.X,
+                message="Disable X",
+                metadata={"satellite": "X-1"},
+            )
+        ],
+        statistics={"total_duration_seconds": 3600, "degraded_seconds": 1200},
+        samples=samples,
+    )
+
+
+class TestTimelineStore:
+    """Timelines round-trip through the binary format."""
+
+    def test_round_trip(self, missions_dir):
+        timeline = _timeline()
+
+        path = save_mission_timeline("leg-1", timeline)
+        loaded = load_mission_timeline("leg-1")
+
+        assert path.suffix == ".bin"
+        assert loaded.model_dump() == timeline.model_dump()
+        assert loaded.model_dump(mode="json") == timeline.model_dump(mode="json")
+
+    def test_samples_are_optional(self, missions_dir):
+        save_mission_timeline("leg-1", _timeline())
+        save_mission_timeline("leg-2", _timeline(with_samples=False))
+
+        assert load_mission_timeline("leg-1", include_samples=False).samples is None
+        assert load_mission_timeline("leg-2").samples is None
+
+    def test_empty_timeline(self, missions_dir):
+        timeline = MissionLegTimeline(mission_leg_id="empty", created_at=START)
+        save_mission_timeline("empty", timeline)
+
+        timeline_file = open_mission_timeline("empty")
+
+        assert timeline_file.time_range() is None
+        assert load_mission_timeline("empty").model_dump() == timeline.model_dump()
+
+    def test_segments_between_builds_only_overlapping_segments(self, missions_dir):
+        save_mission_timeline("leg-1", _timeline(segment_count=100))
+        timeline_file = open_mission_timeline("leg-1")
+
+        window = timeline_file.segments_between(
+            START + timedelta(minutes=25), START + timedelta(minutes=45)
+        )
+
+        assert [segment.id for segment in window] == ["seg-2", "seg-3", "seg-4"]
+        assert timeline_file.segment_count == 100
+        assert timeline_file.time_range() == (
+            START,
+            START + timedelta(minutes=1000),
+        )
+
+    def test_binary_file_is_smaller_than_json(self, missions_dir):
+        timeline = _timeline(segment_count=500)
+        path = save_mission_timeline("leg-1", timeline)
+
+        legacy_size = len(
+            json.dumps(timeline.model_dump(), indent=2, default=str).encode()
+        )
+
+        assert path.stat().st_size < legacy_size / 4
+
+    def test_open_reuses_mapping_until_file_changes(self, missions_dir):
+        save_mission_timeline("leg-1", _timeline())
+        first = open_mission_timeline("leg-1")
+
+        assert open_mission_timeline("leg-1") is first
+
+        save_mission_timeline("leg-1", _timeline(segment_count=2))
+        reopened = open_mission_timeline("leg-1")
+
+        assert reopened is not first
+        assert reopened.segment_count == 2
+
+    def test_invalid_file_raises_value_error(self, missions_dir):
+        path = get_mission_timeline_path("leg-1")
+        path.write_bytes(b"not a timeline")
+
+        with pytest.raises(ValueError):
+            open_timeline_file(path)
+
+
+class TestLegacyTimelineMigration:
+    """JSON timelines are converted on first access."""
+
+    def test_json_timeline_is_migrated(self, missions_dir):
+        timeline = _timeline()
+        legacy_path = get_mission_legacy_timeline_path("leg-1")
+        legacy_path.write_text(json.dumps(timeline.model_dump(), indent=2, default=str))
+
+        loaded = load_mission_timeline("leg-1")
+
+        assert loaded.model_dump() == timeline.model_dump()
+        assert not legacy_path.exists()
+        assert get_mission_timeline_path("leg-1").exists()
+
+    def test_delete_removes_both_formats(self, missions_dir):
+        save_mission_timeline("leg-1", _timeline())
+        get_mission_legacy_timeline_path("leg-1").write_text("{}")
+
+        delete_mission_timeline("leg-1")
+
+        assert load_mission_timeline("leg-1") is None
+        assert not get_mission_legacy_timeline_path("leg-1").exists()
+
+    def test_concurrent_saves_leave_one_complete_file(self, missions_dir):
+        timelines = [_timeline(segment_count=count) for count in range(2, 10)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda timeline: save_mission_timeline("leg-1", timeline),
+                    timelines,
+                )
+            )
+
+        loaded = load_mission_timeline("leg-1")
+        assert loaded.model_dump() in [t.model_dump() for t in timelines]
+        assert not list(missions_dir.rglob("*.tmp"))